@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+State Codec Benchmark
+
+SAGE_STATE_FORMAT(json / compact / binary)별로 상태 파일 한 개의 비용을 계량한다.
+역할 수를 늘린 합성 상태(role_results / role_inputs / branch_loops가 역할 수에
+비례)를 만들어 다음을 측정한다:
+  - bytes: 인코딩된 크기
+  - encode: ChainState.to_dict() → codec.encode
+  - read: read_state_file (파일 읽기 + 전체 디코딩 + ChainState)
+  - peek: read_state_fields(status, current_phase, pending_roles) - 훅 / 감독 루프 경로
+
+사용법:
+  python benchmarks/bench_codec.py
+  python benchmarks/bench_codec.py --roles 10,100,1000 --iterations 2000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+PEEK_FIELDS = ("status", "current_phase", "pending_roles")
+
+
+def synthetic_state(roles: int):
+    from sage_loop.cli import orchestrator as orch
+
+    names = [f"codec-{i:04d}" for i in range(roles)]
+    state = orch.ChainState(
+        session_id="sage-bench00codec", task="상태 인코딩 벤치마크", chain_name="CODEC",
+        phases=[{"index": i, "roles": [name], "is_parallel": False, "max_concurrency": 0, "stagger_ms": 0}
+                for i, name in enumerate(names)],
+        status=orch.ChainStatus.RUNNING.value, current_phase=roles - 1,
+        completed_phases=list(range(roles - 1)), pending_roles=[names[-1]],
+        started_at="2026-01-01T00:00:00",
+    )
+    for i, name in enumerate(names[:-1]):
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        state.role_results[name] = {"hash": digest, "size": 256 + i, "z": False}
+        state.role_inputs[f"{i}:{name}"] = digest[:32]
+    state.role_started_at[names[-1]] = time.time()
+    return state
+
+
+def timed(fn, iterations: int) -> float:
+    """1회 평균 (µs)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) * 1e6 / iterations
+
+
+def run(fmt: str, roles: int, iterations: int, directory: Path) -> dict:
+    from sage_loop import codec
+    from sage_loop.cli import orchestrator as orch
+
+    state = synthetic_state(roles)
+    path = directory / f"sage_state_codec-{fmt}-{roles}.json"
+    data = codec.encode(state.to_dict(), fmt)
+    path.write_bytes(data)
+    assert orch.read_state_file(path).to_dict() == state.to_dict()
+    return {
+        "format": fmt,
+        "roles": roles,
+        "bytes": len(data),
+        "encode_us": round(timed(lambda: codec.encode(state.to_dict(), fmt), iterations), 2),
+        "read_us": round(timed(lambda: orch.read_state_file(path), iterations), 2),
+        "peek_us": round(timed(lambda: orch.read_state_fields(path, PEEK_FIELDS), iterations), 2),
+    }
+
+
+def main() -> None:
+    from sage_loop import codec
+
+    parser = argparse.ArgumentParser(description="Sage state codec benchmark")
+    parser.add_argument("--formats", default=",".join(codec.FORMATS), help="비교할 형식 (기본: json,compact,binary)")
+    parser.add_argument("--roles", default="14,100,1000", help="상태의 역할 수 목록 (기본: 14,100,1000)")
+    parser.add_argument("--iterations", type=int, default=500, help="측정 반복 수 (기본: 500)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in codec.FORMATS]
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(unknown)}")
+    levels = [int(n) for n in args.roles.split(",") if n.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="sage-codec-") as tmp:
+        os.environ["SAGE_STATE_DIR"] = tmp
+        runs = [run(fmt, roles, args.iterations, Path(tmp)) for roles in levels for fmt in formats]
+    summary = {"iterations": args.iterations, "runs": runs}
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'FORMAT':<9}{'ROLES':>6}{'BYTES':>9}{'ENCODE_US':>11}{'READ_US':>10}{'PEEK_US':>10}")
+        for r in runs:
+            print(f"{r['format']:<9}{r['roles']:>6}{r['bytes']:>9}{r['encode_us']:>11}"
+                  f"{r['read_us']:>10}{r['peek_us']:>10}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
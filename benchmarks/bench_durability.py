@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Durability Mode Benchmark
+
+SAGE_DURABILITY 모드(none / rename / full)별로 상태 기록 비용을 계량한다.
+
+  --sessions shared    N개 프로세스가 한 세션의 병렬 페이즈 역할을 각자 순서대로 완료
+                       (같은 상태 파일 - full 모드에서 동시 완료가 fsync를 공유하는
+                       group commit 효과와 락 경합이 함께 드러남)
+  --sessions separate  프로세스마다 자기 체인 (락 경합 없이 기록 비용만)
+
+보고 항목:
+  - throughput: 초당 완료 수 (벽시계 기준)
+  - latency: complete_role_atomic 호출 시간 분포 (락 재시도 포함, p50/p99)
+  - fsyncs / commits: full 모드에서 실제 fsync한 commit(leader) 수 / 전체 commit 수
+  - lock errors: 재시도한 LOCK_ERROR 수
+
+tmpfs에서는 fsync가 사실상 무비용이므로 디스크 디렉토리를 --dir로 지정한다.
+
+사용법:
+  python benchmarks/bench_durability.py
+  python benchmarks/bench_durability.py --dir /var/tmp/sage-bench --procs 1,8,32
+  python benchmarks/bench_durability.py --modes rename,full --per-proc 50 --json
+  python benchmarks/bench_durability.py --sessions separate --procs 1,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+CLOSER_ROLE = "closer"
+MODES = ("none", "rename", "full")
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round((len(values) - 1) * pct / 100.0)))
+    return values[k]
+
+
+def synthetic_config(roles: int) -> tuple[dict, list[str]]:
+    """병렬 역할 N개 + 후속 역할 1개 (동시 실행 제한 없음)"""
+    names = [f"durable-{i:04d}" for i in range(roles)]
+    return {"chains": {"DURABLE": {"roles": [names, CLOSER_ROLE]}}}, names
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def _worker(roles: list[str], config: dict, barrier, queue, result_bytes: int, own_chain: bool) -> None:
+    from sage_loop import durability
+    from sage_loop.cli import orchestrator as orch
+
+    if own_chain:
+        orch.start_chain("durability", config, force_chain="DURABLE")
+    stats = durability.COMMIT_STATS
+    base = (stats.commits, stats.leaders, stats.fsync_total)  # fork 전 부모 누적분 제외
+    barrier.wait()
+    latencies = []
+    lock_errors = 0
+    for role in roles:
+        result = f"pass ({role}) ".ljust(result_bytes, "x")
+        t0 = time.perf_counter()
+        while True:
+            try:
+                orch.complete_role_atomic([role], {role: result}, config)
+                break
+            except RuntimeError:
+                lock_errors += 1
+        latencies.append(time.perf_counter() - t0)
+
+    if own_chain:
+        orch.clear_state()
+    queue.put({
+        "latencies": latencies,
+        "lock_errors": lock_errors,
+        "commits": stats.commits - base[0],
+        "fsyncs": stats.leaders - base[1],
+        "fsync_s": stats.fsync_total - base[2],
+    })
+
+
+# =============================================================================
+# Run
+# =============================================================================
+
+def run(mode: str, procs: int, per_proc: int, result_bytes: int, shared: bool) -> dict:
+    from sage_loop.cli import orchestrator as orch
+
+    os.environ["SAGE_DURABILITY"] = mode
+    if shared:
+        config, roles = synthetic_config(procs * per_proc)
+        state = orch.start_chain("durability", config, force_chain="DURABLE")
+        assigned = [roles[i::procs] for i in range(procs)]
+    else:
+        config, roles = synthetic_config(per_proc)
+        assigned = [roles] * procs
+
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(procs)
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(assigned[i], config, barrier, queue, result_bytes, not shared))
+               for i in range(procs)]
+    started = time.perf_counter()
+    for p in workers:
+        p.start()
+    reports = [queue.get() for _ in workers]
+    wall = time.perf_counter() - started
+    for p in workers:
+        p.join()
+
+    if shared:
+        final = orch.load_state_unsafe()
+        recorded = sum(1 for role in roles if final and role in final.role_results)
+        orch.clear_state()
+        orch.clear_session(state.session_id)
+    else:
+        recorded = sum(len(r["latencies"]) for r in reports)  # 세션별 검증은 생략
+
+    latencies_ms = [t * 1000.0 for r in reports for t in r["latencies"]]
+    completions = len(latencies_ms)
+    fsyncs = sum(r["fsyncs"] for r in reports)
+    return {
+        "mode": mode,
+        "sessions": "shared" if shared else "separate",
+        "processes": procs,
+        "completions": completions,
+        "recorded": recorded,
+        "wall_s": round(wall, 4),
+        "throughput": round(completions / wall, 1) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+            "max": round(max(latencies_ms), 3) if latencies_ms else 0.0,
+        },
+        "commits": sum(r["commits"] for r in reports),
+        "fsyncs": fsyncs,
+        "fsync_ms_avg": round(sum(r["fsync_s"] for r in reports) * 1000.0 / fsyncs, 3) if fsyncs else 0.0,
+        "lock_errors": sum(r["lock_errors"] for r in reports),
+    }
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage state durability mode benchmark")
+    parser.add_argument("--modes", default=",".join(MODES), help="비교할 모드 (기본: none,rename,full)")
+    parser.add_argument("--procs", default="1,4,16", help="동시 완료 프로세스 수 목록 (기본: 1,4,16)")
+    parser.add_argument("--sessions", choices=["shared", "separate"], default="shared",
+                        help="한 세션을 공유 (group commit + 락 경합) / 프로세스별 세션 (기본: shared)")
+    parser.add_argument("--per-proc", type=int, default=20, help="프로세스당 완료 수 (기본: 20)")
+    parser.add_argument("--result-bytes", type=int, default=256, help="역할 결과 크기 (기본: 256)")
+    parser.add_argument("--dir", help="상태 디렉토리 (기본: 임시 디렉토리, tmpfs면 fsync 비용이 드러나지 않음)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(unknown)}")
+    levels = [int(n) for n in args.procs.split(",") if n.strip()]
+
+    if args.dir:
+        Path(args.dir).mkdir(parents=True, exist_ok=True)
+    os.environ["SAGE_STATE_DIR"] = tempfile.mkdtemp(prefix="sage-durability-", dir=args.dir)
+    os.environ.pop("SAGE_SESSION_ID", None)
+    os.environ["SAGE_MEMO"] = "off"  # 같은 결과가 캐시 적중으로 완료되지 않도록
+
+    shared = args.sessions == "shared"
+    runs = [run(mode, procs, args.per_proc, args.result_bytes, shared) for mode in modes for procs in levels]
+    summary = {"state_dir": os.environ["SAGE_STATE_DIR"], "sessions": args.sessions, "per_proc": args.per_proc,
+               "result_bytes": args.result_bytes, "runs": runs}
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"STATE_DIR: {summary['state_dir']} ({args.sessions} sessions, {args.per_proc} completions/proc)")
+        print(f"{'MODE':<8}{'PROCS':>6}{'OPS/S':>10}{'P50_MS':>10}{'P99_MS':>10}"
+              f"{'FSYNCS':>8}{'COMMITS':>9}{'LOCK_ERR':>10}{'LOST':>6}")
+        for r in runs:
+            print(f"{r['mode']:<8}{r['processes']:>6}{r['throughput']:>10}{r['latency_ms']['p50']:>10}"
+                  f"{r['latency_ms']['p99']:>10}{r['fsyncs']:>8}{r['commits']:>9}{r['lock_errors']:>10}"
+                  f"{r['completions'] - r['recorded']:>6}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
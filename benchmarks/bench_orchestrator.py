@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Orchestrator End-to-End Benchmark
+
+config.yaml의 모든 체인을 start_chain → complete_role_atomic으로 끝까지
+구동하며 다음을 측정한다:
+  - completions/s (전체 처리량)
+  - 전이 지연 p50/p99 (complete 호출 1회 기준)
+  - 락 실패 (LOCK_ERROR) 횟수
+  - 상태 파일 기록 바이트
+
+모드:
+  inproc: 세션마다 워커 프로세스 1개가 모듈 함수를 직접 호출
+  cli:    세션마다 sage-orchestrator 서브프로세스를 호출
+
+병렬 페이즈의 역할은 스레드(inproc) / 동시 서브프로세스(cli)로 동시에
+완료시켜 실제 훅 환경과 같은 락 경합을 재현한다.
+
+사용법:
+  python benchmarks/bench_orchestrator.py                         # 전체 매트릭스
+  python benchmarks/bench_orchestrator.py --mode inproc --levels 1,8,64
+  python benchmarks/bench_orchestrator.py --chains QUICK --baseline benchmarks/results/base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+DEFAULT_LEVELS = "1,2,4,8,16,32,64"
+MAX_STEPS = 500
+MAX_LOCK_RETRIES = 20
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round((len(values) - 1) * pct / 100.0)))
+    return values[k]
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def new_metrics() -> dict:
+    return {"completions": 0, "latencies": [], "lock_failures": 0,
+            "state_bytes": 0, "chains": 0, "outcomes": {}}
+
+
+def merge_metrics(total: dict, part: dict) -> None:
+    total["completions"] += part["completions"]
+    total["latencies"].extend(part["latencies"])
+    total["lock_failures"] += part["lock_failures"]
+    total["state_bytes"] += part["state_bytes"]
+    total["chains"] += part["chains"]
+    for k, v in part["outcomes"].items():
+        total["outcomes"][k] = total["outcomes"].get(k, 0) + v
+
+
+# =============================================================================
+# In-process Driver
+# =============================================================================
+
+def _inproc_worker(args: tuple) -> dict:
+    """워커 프로세스: 체인을 끝까지 구동"""
+    chain_name, worker_id, repeat, runner = args
+    from sage_loop.cli import orchestrator as orch
+
+    config = orch.load_config()
+    metrics = new_metrics()
+
+    for n in range(repeat):
+        session_key = f"{worker_id}-{n}"
+        state = orch.start_chain(f"bench {chain_name}", config, force_chain=chain_name)
+        state_path = orch.get_state_path()
+        metrics["state_bytes"] += state_path.stat().st_size
+        attempts: dict[str, int] = {}
+
+        def complete(role: str):
+            attempt = attempts.get(role, 0)
+            attempts[role] = attempt + 1
+            result = runner.run(session_key, role, chain_name, config, attempt)
+            for _ in range(MAX_LOCK_RETRIES):
+                t0 = time.perf_counter()
+                try:
+                    new_state = orch.complete_role_atomic([role], {role: result}, config)
+                except RuntimeError:
+                    metrics["lock_failures"] += 1
+                    continue
+                metrics["latencies"].append(time.perf_counter() - t0)
+                metrics["completions"] += 1
+                if state_path.exists():
+                    metrics["state_bytes"] += state_path.stat().st_size
+                return new_state
+            return None
+
+        steps = 0
+        while not orch.is_terminal(state) and state.pending_roles and steps < MAX_STEPS:
+            roles = list(state.pending_roles)
+            steps += len(roles)
+            if len(roles) > 1:
+                with ThreadPoolExecutor(max_workers=len(roles)) as pool:
+                    states = [s for s in pool.map(complete, roles) if s is not None]
+            else:
+                states = [s for s in [complete(roles[0])] if s is not None]
+            terminal = [s for s in states if orch.is_terminal(s)]
+            if terminal:
+                state = terminal[0]
+            else:
+                state = orch.load_state_unsafe() or state
+
+        metrics["chains"] += 1
+        metrics["outcomes"][state.status] = metrics["outcomes"].get(state.status, 0) + 1
+        # 종료 후에는 세션 포인터가 지워지므로 경로로 직접 정리
+        state_path.unlink(missing_ok=True)
+        state_path.with_suffix(".lock").unlink(missing_ok=True)
+
+    return metrics
+
+
+# =============================================================================
+# CLI Driver
+# =============================================================================
+
+def _cli(args: list[str], env: dict) -> tuple[str, float]:
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-m", "sage_loop.cli.orchestrator", *args],
+                         env=env, capture_output=True, text=True)
+    return out.stdout, time.perf_counter() - t0
+
+
+def _cli_worker(args: tuple) -> dict:
+    """워커 프로세스: CLI 서브프로세스로 체인 구동"""
+    chain_name, worker_id, repeat, runner = args
+    from sage_loop.cli import orchestrator as orch
+
+    config = orch.load_config()
+    metrics = new_metrics()
+    base_env = dict(os.environ)
+    base_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), base_env.get("PYTHONPATH")]))
+
+    for n in range(repeat):
+        session_key = f"{worker_id}-{n}"
+        env = dict(base_env)
+        env.pop("SAGE_SESSION_ID", None)
+        out, _ = _cli(["--chain", chain_name, f"bench {chain_name}"], env)
+        session_id = next(line.split(": ", 1)[1] for line in out.splitlines()
+                          if line.startswith("SESSION: "))
+        env["SAGE_SESSION_ID"] = session_id
+        state_path = orch.STATE_DIR / f"sage_state_{session_id}.json"
+        metrics["state_bytes"] += state_path.stat().st_size
+        attempts: dict[str, int] = {}
+
+        def complete(role: str) -> None:
+            attempt = attempts.get(role, 0)
+            attempts[role] = attempt + 1
+            result = runner.run(session_key, role, chain_name, config, attempt)
+            for _ in range(MAX_LOCK_RETRIES):
+                out, elapsed = _cli(["--complete", role, "--result", result], env)
+                if out.startswith("LOCK_ERROR"):
+                    metrics["lock_failures"] += 1
+                    continue
+                metrics["latencies"].append(elapsed)
+                metrics["completions"] += 1
+                if state_path.exists():
+                    metrics["state_bytes"] += state_path.stat().st_size
+                return
+
+        state = orch.ChainState.from_dict(json.loads(state_path.read_text()))
+        steps = 0
+        while not orch.is_terminal(state) and state.pending_roles and steps < MAX_STEPS:
+            roles = list(state.pending_roles)
+            steps += len(roles)
+            with ThreadPoolExecutor(max_workers=len(roles)) as pool:
+                list(pool.map(complete, roles))
+            state = orch.ChainState.from_dict(json.loads(state_path.read_text()))
+
+        metrics["chains"] += 1
+        metrics["outcomes"][state.status] = metrics["outcomes"].get(state.status, 0) + 1
+        state_path.unlink(missing_ok=True)
+        state_path.with_suffix(".lock").unlink(missing_ok=True)
+
+    return metrics
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def run_case(mode: str, chain_name: str, concurrency: int, repeat: int, runner) -> dict:
+    worker = _inproc_worker if mode == "inproc" else _cli_worker
+    ctx = multiprocessing.get_context("fork")
+    jobs = [(chain_name, i, repeat, runner) for i in range(concurrency)]
+
+    t0 = time.perf_counter()
+    with ctx.Pool(processes=concurrency) as pool:
+        parts = pool.map(worker, jobs)
+    wall = time.perf_counter() - t0
+
+    total = new_metrics()
+    for part in parts:
+        merge_metrics(total, part)
+
+    lat_ms = [x * 1000.0 for x in total["latencies"]]
+    return {
+        "mode": mode,
+        "chain": chain_name,
+        "concurrency": concurrency,
+        "chains": total["chains"],
+        "completions": total["completions"],
+        "wall_s": round(wall, 4),
+        "completions_per_s": round(total["completions"] / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(lat_ms, 50), 3),
+            "p99": round(percentile(lat_ms, 99), 3),
+            "max": round(max(lat_ms), 3) if lat_ms else 0.0,
+        },
+        "lock_failures": total["lock_failures"],
+        "state_bytes_written": total["state_bytes"],
+        "outcomes": total["outcomes"],
+    }
+
+
+def compare(results: list[dict], baseline_path: Path) -> None:
+    """기준 결과와 비교 출력"""
+    baseline = json.loads(baseline_path.read_text())
+    index = {(r["mode"], r["chain"], r["concurrency"]): r for r in baseline.get("results", [])}
+    print(f"\nCOMPARE: {baseline_path} ({baseline.get('meta', {}).get('git_rev', '?')})")
+    for r in results:
+        base = index.get((r["mode"], r["chain"], r["concurrency"]))
+        if not base:
+            continue
+        tput = r["completions_per_s"] / base["completions_per_s"] if base["completions_per_s"] else 0.0
+        p99 = r["latency_ms"]["p99"] / base["latency_ms"]["p99"] if base["latency_ms"]["p99"] else 0.0
+        print(f"  {r['mode']:6} {r['chain']:8} c={r['concurrency']:<3} "
+              f"throughput x{tput:.2f}  p99 x{p99:.2f}  "
+              f"lock_failures {base['lock_failures']} -> {r['lock_failures']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage orchestrator end-to-end benchmark")
+    parser.add_argument("--mode", choices=["inproc", "cli", "all"], default="all",
+                        help="구동 방식 (기본: all)")
+    parser.add_argument("--chains", help="체인 목록 (쉼표 구분, 기본: config.yaml 전체)")
+    parser.add_argument("--levels", default=DEFAULT_LEVELS,
+                        help=f"동시 세션 수 목록 (기본: {DEFAULT_LEVELS})")
+    parser.add_argument("--repeat", type=int, default=1, help="워커당 체인 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="mock 역할 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="mock 역할 지연 변동 폭")
+    parser.add_argument("--verdict", action="append",
+                        help='판정 확률 "role:branch=0.2" / "role:exit=0.01" (반복 가능)')
+    parser.add_argument("--seed", type=int, default=0, help="mock 시드")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+
+    args = parser.parse_args()
+
+    # 격리된 상태 디렉토리 (sage_loop import 전에 설정)
+    state_dir = tempfile.mkdtemp(prefix="sage-bench-")
+    os.environ["SAGE_STATE_DIR"] = state_dir
+    os.environ.pop("SAGE_SESSION_ID", None)
+    os.environ["SAGE_MEMO"] = "off"  # 같은 작업 반복이 결과 캐시 적중으로 짧아지지 않도록
+
+    from sage_loop.cli.orchestrator import load_config
+    from mock_runner import MockRoleRunner, parse_verdicts
+
+    config = load_config()
+    chains = args.chains.split(",") if args.chains else list(config.get("chains", {}))
+    levels = [int(x) for x in args.levels.split(",")]
+    modes = ["inproc", "cli"] if args.mode == "all" else [args.mode]
+    runner = MockRoleRunner(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                            verdicts=parse_verdicts(args.verdict), seed=args.seed)
+
+    results = []
+    for mode in modes:
+        for chain_name in chains:
+            for level in levels:
+                r = run_case(mode, chain_name, level, args.repeat, runner)
+                results.append(r)
+                print(f"{mode:6} {chain_name:8} c={level:<3} "
+                      f"{r['completions_per_s']:>9.1f} compl/s  "
+                      f"p99={r['latency_ms']['p99']:>8.2f}ms  "
+                      f"lock_fail={r['lock_failures']:<4} "
+                      f"bytes={r['state_bytes_written']}")
+
+    report = {
+        "meta": {
+            "benchmark": "orchestrator",
+            "timestamp": datetime.now().isoformat(),
+            "git_rev": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": vars(args),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        out_path = Path(args.output)
+    else:
+        out_path = ROOT / "benchmarks" / "results" / f"orchestrator_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\nSAVED: {out_path}")
+
+    if args.baseline:
+        compare(results, Path(args.baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+State Snapshot Benchmark
+
+훅이 상태의 hot 필드(status / current_phase / pending_roles)를 읽는 방법별 비용을
+비교한다 (SAGE_SNAPSHOT, snapshot.py):
+
+  file-json      read_state_file - JSON 상태 파일 전체 디코딩 (기존 경로)
+  fields-json    read_fields - JSON 상태 파일 (전체 파싱 후 필드 선택)
+  fields-binary  read_fields - 바이너리 상태 파일 (헤더 + 필드 구간 pread)
+  snap-cold      스냅샷을 매번 새로 매핑 (짧게 사는 훅 프로세스의 첫 읽기)
+  snap-warm      매핑을 재사용 (감독 루프 같은 상주 프로세스)
+
+--readers N 을 주면 기록자 1개가 상태를 계속 갱신하는 동안 N개 프로세스가
+스냅샷을 읽어 seqlock 재시도 / 상태 파일 fallback / 필드 간 불일치를 센다.
+(기록자는 current_phase와 pending_roles 길이, exit_reason을 항상 같은 값으로 쓴다.)
+
+사용법:
+  python benchmarks/bench_snapshot.py
+  python benchmarks/bench_snapshot.py --roles 14,1000 --iterations 5000
+  python benchmarks/bench_snapshot.py --readers 4 --seconds 2 --dir /dev/shm --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+HOT = ("status", "current_phase", "pending_roles")
+
+
+def timed(fn, iterations: int) -> float:
+    """1회 평균 (µs)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) * 1e6 / iterations
+
+
+def write(state, path: Path, fmt: str) -> None:
+    from sage_loop.cli import orchestrator as orch
+
+    os.environ["SAGE_STATE_FORMAT"] = fmt
+    orch.write_state_file(path, state)
+
+
+# =============================================================================
+# Read cost
+# =============================================================================
+
+def measure(roles: int, iterations: int, directory: Path) -> list[dict]:
+    from bench_codec import synthetic_state
+    from sage_loop import codec, snapshot
+    from sage_loop.cli import orchestrator as orch
+
+    state = synthetic_state(roles)
+    json_path = directory / f"sage_state_snapjson-{roles}.json"
+    bin_path = directory / f"sage_state_snapbin-{roles}.json"
+    write(state, json_path, "json")
+    write(state, bin_path, "binary")
+    shared = snapshot.snapshot_for(bin_path)
+    expected = {name: getattr(state, name) for name in HOT}
+    warm = snapshot.SnapshotReader(shared, bin_path)
+    assert warm.fields(HOT) == expected
+
+    def cold():
+        reader = snapshot.SnapshotReader(shared, bin_path)
+        try:
+            return reader.fields(HOT)
+        finally:
+            reader.close()
+
+    methods = {
+        "file-json": lambda: orch.read_state_file(json_path),
+        "fields-json": lambda: codec.read_fields(json_path, HOT),
+        "fields-binary": lambda: codec.read_fields(bin_path, HOT),
+        "snap-cold": cold,
+        "snap-warm": lambda: warm.fields(HOT),
+    }
+    state_bytes = json_path.stat().st_size
+    return [{"roles": roles, "method": name, "state_bytes": state_bytes,
+             "read_us": round(timed(fn, iterations), 2)} for name, fn in methods.items()]
+
+
+# =============================================================================
+# Concurrent readers
+# =============================================================================
+
+def _writer(path: str, roles: int, stop, counter) -> None:
+    from bench_codec import synthetic_state
+    from sage_loop.cli import orchestrator as orch
+
+    os.environ["SAGE_STATE_FORMAT"] = "binary"
+    state = synthetic_state(roles)
+    n = 0
+    while not stop.is_set():
+        n += 1
+        state.current_phase = n
+        state.pending_roles = [f"codec-{i:04d}" for i in range(n % 7 + 1)]
+        state.exit_reason = f"{n}:{len(state.pending_roles)}"
+        orch.write_state_file(Path(path), state)
+    counter.value = n
+
+
+def _reader(path: str, seconds: float, queue) -> None:
+    from sage_loop import snapshot
+
+    state_path = Path(path)
+    reader = snapshot.SnapshotReader(snapshot.snapshot_for(state_path), state_path)
+    reads = fallbacks = inconsistent = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        found = reader.fields(("current_phase", "pending_roles", "exit_reason"))
+        reads += 1
+        if found is None:
+            fallbacks += 1
+            continue
+        if found["exit_reason"] != f"{found['current_phase']}:{len(found['pending_roles'])}":
+            inconsistent += 1
+    queue.put({"reads": reads, "fallbacks": fallbacks, "inconsistent": inconsistent,
+               "retries": reader.retries})
+
+
+def concurrent(readers: int, seconds: float, roles: int, directory: Path) -> dict:
+    from bench_codec import synthetic_state
+
+    path = directory / "sage_state_snapconcurrent.json"
+    state = synthetic_state(roles)
+    state.exit_reason = f"{state.current_phase}:{len(state.pending_roles)}"
+    write(state, path, "binary")
+    ctx = multiprocessing.get_context("fork")
+    stop, counter, queue = ctx.Event(), ctx.Value("q", 0), ctx.Queue()
+    writer = ctx.Process(target=_writer, args=(str(path), roles, stop, counter))
+    procs = [ctx.Process(target=_reader, args=(str(path), seconds, queue)) for _ in range(readers)]
+    writer.start()
+    for p in procs:
+        p.start()
+    reports = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    stop.set()
+    writer.join()
+    total = {key: sum(r[key] for r in reports) for key in ("reads", "fallbacks", "inconsistent", "retries")}
+    return {"readers": readers, "seconds": seconds, "roles": roles, "writes": counter.value, **total,
+            "reads_per_s": round(total["reads"] / seconds, 1)}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage state snapshot benchmark")
+    parser.add_argument("--roles", default="14,100,1000", help="상태의 역할 수 목록 (기본: 14,100,1000)")
+    parser.add_argument("--iterations", type=int, default=2000, help="측정 반복 수 (기본: 2000)")
+    parser.add_argument("--readers", type=int, default=0, help="동시 읽기 프로세스 수 (0이면 생략)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="동시 읽기 시간 (기본: 1)")
+    parser.add_argument("--dir", help="상태 / 스냅샷 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+    levels = [int(n) for n in args.roles.split(",") if n.strip()]
+
+    if args.dir:
+        Path(args.dir).mkdir(parents=True, exist_ok=True)
+    directory = Path(tempfile.mkdtemp(prefix="sage-snapshot-", dir=args.dir))
+    os.environ["SAGE_STATE_DIR"] = str(directory)
+    os.environ["SAGE_SNAPSHOT"] = "state"
+    os.environ["SAGE_DURABILITY"] = "rename"  # 읽기 비용만 비교
+    os.environ["SAGE_CHECKPOINT"] = "off"
+
+    runs = [row for roles in levels for row in measure(roles, args.iterations, directory)]
+    summary = {"dir": str(directory), "iterations": args.iterations, "runs": runs}
+    if args.readers:
+        summary["concurrent"] = concurrent(args.readers, args.seconds, levels[-1], directory)
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"DIR: {directory} ({args.iterations} reads each)")
+        print(f"{'ROLES':>6}{'STATE_BYTES':>13}  {'METHOD':<15}{'READ_US':>10}")
+        for r in runs:
+            print(f"{r['roles']:>6}{r['state_bytes']:>13}  {r['method']:<15}{r['read_us']:>10}")
+        c = summary.get("concurrent")
+        if c:
+            print(f"CONCURRENT: {c['readers']} readers × {c['seconds']}s, {c['writes']} writes, "
+                  f"{c['reads_per_s']} reads/s, retries {c['retries']}, fallbacks {c['fallbacks']}, "
+                  f"inconsistent {c['inconsistent']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+State Watch Benchmark
+
+phase 변화를 알아채는 방법별 비용을 비교한다 (SAGE_WATCH, watch.py):
+
+  status-cli   sage-orchestrator --status 1회 (인터프리터 시작 + 상태 파일 파싱)
+               - 래퍼가 폴링할 때 매 주기마다 드는 비용
+  inotify      대기 프로세스가 기록 후 깨어나기까지의 지연
+  fifo         〃 (write_state_file의 notify()로 깨움)
+  poll         〃 (POLL_INTERVAL마다 stat)
+
+notify_us는 대기자가 없을 때 write_state_file이 notify()에 쓰는 시간이다.
+
+사용법:
+  python benchmarks/bench_watch.py
+  python benchmarks/bench_watch.py --rounds 50 --status-runs 10 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+MODES = ("inotify", "fifo", "poll")
+
+
+def status_cli(runs: int, env: dict) -> float:
+    """--status 1회 평균 (ms)"""
+    cmd = [sys.executable, "-m", "sage_loop.cli.orchestrator", "--status"]
+    started = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - started) * 1e3 / runs
+
+
+def _waiter(path: str, mode: str, rounds: int, ready, woke) -> None:
+    from sage_loop import watch
+
+    state_path = Path(path)
+    with watch.Watcher(state_path, mode) as watcher:
+        for _ in range(rounds):
+            version = watch.state_version(state_path)
+            ready.set()
+            watcher.wait(version, timeout=5)
+            woke.value = time.perf_counter()
+            ready.clear()
+
+
+def wake_latency(mode: str, rounds: int, directory: Path) -> dict:
+    from bench_codec import synthetic_state
+    from sage_loop.cli import orchestrator as orch
+
+    path = directory / f"sage_state_watch-{mode}.json"
+    state = synthetic_state(14)
+    orch.write_state_file(path, state)
+    ctx = multiprocessing.get_context("fork")
+    ready, woke = ctx.Event(), ctx.Value("d", 0.0)
+    proc = ctx.Process(target=_waiter, args=(str(path), mode, rounds, ready, woke))
+    proc.start()
+    latencies = []
+    for n in range(rounds):
+        ready.wait(5)
+        time.sleep(0.01)  # 대기자가 select에 들어가도록
+        woke.value = 0.0
+        state.current_phase = n
+        written = time.perf_counter()
+        orch.write_state_file(path, state)
+        while not woke.value:
+            time.sleep(0.0002)
+        latencies.append((woke.value - written) * 1e6)
+    proc.join()
+    return {"mode": mode, "rounds": rounds,
+            "wake_us_p50": round(statistics.median(latencies), 1),
+            "wake_us_max": round(max(latencies), 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage state watch benchmark")
+    parser.add_argument("--rounds", type=int, default=20, help="모드별 기록 / 깨어남 횟수 (기본: 20)")
+    parser.add_argument("--status-runs", type=int, default=5, help="--status 실행 횟수 (기본: 5)")
+    parser.add_argument("--dir", help="상태 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+    if args.dir:
+        Path(args.dir).mkdir(parents=True, exist_ok=True)
+    directory = Path(tempfile.mkdtemp(prefix="sage-watch-", dir=args.dir))
+    os.environ["SAGE_STATE_DIR"] = str(directory)
+    os.environ["SAGE_DURABILITY"] = "rename"  # 알림 지연만 비교
+    os.environ["SAGE_CHECKPOINT"] = "off"
+
+    from bench_codec import synthetic_state
+    from sage_loop import watch
+    from sage_loop.cli import orchestrator as orch
+
+    state = synthetic_state(14)
+    orch.write_state_file(directory / "sage_state_watch-cli.json", state)
+    env = {**os.environ, "SAGE_SESSION_ID": "watch-cli", "SAGE_EVENTS": "off",
+           "PYTHONPATH": str(ROOT / "src")}
+    notify_path = directory / "sage_state_watch-none.json"
+    started = time.perf_counter()
+    for _ in range(10000):
+        watch.notify(notify_path)
+    notify_us = (time.perf_counter() - started) * 1e6 / 10000
+    summary = {
+        "dir": str(directory),
+        "status_cli_ms": round(status_cli(args.status_runs, env), 1),
+        "notify_us": round(notify_us, 2),
+        "runs": [wake_latency(mode, args.rounds, directory) for mode in MODES],
+    }
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"DIR: {directory}")
+        print(f"STATUS_CLI: {summary['status_cli_ms']} ms per poll")
+        print(f"NOTIFY (no watchers): {summary['notify_us']} µs per write")
+        print(f"{'MODE':<10}{'WAKE_P50_US':>13}{'WAKE_MAX_US':>13}")
+        for r in summary["runs"]:
+            print(f"{r['mode']:<10}{r['wake_us_p50']:>13}{r['wake_us_max']:>13}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
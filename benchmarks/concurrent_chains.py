@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Concurrent Chains Harness
+
+N개 체인을 한 호스트에서 동시에 CLI로 구동한다. 각 워커는 SAGE_SESSION_ID
+없이 네임스페이스 세션 포인터(registry.py)에만 의존하므로, 포인터가 서로
+덮어쓰이면 다른 체인의 상태를 보거나 완료하게 된다.
+
+보고 항목:
+  - approved: 끝까지 승인된 체인 수
+  - clobbered: --status가 자기 세션이 아닌 세션을 보여준 횟수
+  - errors: ERROR / LOCK_ERROR로 끝난 호출 수
+  - leftover pointers: 체인 종료 후 남은 세션 포인터 수
+
+격리 방식 (--isolation):
+  namespace  워커마다 SAGE_NAMESPACE=bench-{i}
+  cwd        워커마다 별도 프로젝트 디렉토리 (.git 표식)에서 실행
+  global     모든 워커가 단일 포인터 공유 (기존 동작, 덮어쓰기 재현용)
+
+사용법:
+  python benchmarks/concurrent_chains.py --chains 50
+  python benchmarks/concurrent_chains.py --chains 50 --isolation cwd --json
+  python benchmarks/concurrent_chains.py --chains 8 --isolation global
+
+종료 코드: 모든 체인이 승인되고 덮어쓰기/오류/잔여 포인터가 없으면 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+MAX_STEPS = 64
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def _cli(args: list[str], env: dict, cwd: str) -> str:
+    proc = subprocess.run([sys.executable, "-m", "sage_loop.cli.orchestrator", *args],
+                          env=env, cwd=cwd, capture_output=True, text=True)
+    return proc.stdout
+
+
+def _field(out: str, name: str) -> str:
+    prefix = f"{name}: "
+    return next((line[len(prefix):] for line in out.splitlines() if line.startswith(prefix)), "")
+
+
+def _pending(status: str) -> list[str]:
+    for name in ("PENDING_PARALLEL", "NEXT_PARALLEL", "NEXT"):
+        value = _field(status, name)
+        if value:
+            return [r.strip() for r in value.split(",")]
+    return []
+
+
+def run_worker(index: int, chain: str, isolation: str, base_env: dict, barrier, queue) -> None:
+    """체인 1개를 시작부터 종료까지 CLI로 구동"""
+    env = dict(base_env)
+    cwd = str(ROOT)
+    if isolation == "namespace":
+        env["SAGE_NAMESPACE"] = f"bench-{index}"
+    elif isolation == "cwd":
+        cwd = tempfile.mkdtemp(prefix=f"sage-proj-{index}-")
+        os.mkdir(os.path.join(cwd, ".git"))
+        env["SAGE_NAMESPACE"] = "cwd"
+    else:
+        env["SAGE_NAMESPACE"] = "global"
+
+    report = {"index": index, "session": "", "outcome": "", "clobbered": 0, "errors": 0, "steps": 0}
+    barrier.wait()
+    t0 = time.perf_counter()
+    report["session"] = _field(_cli(["--chain", chain, f"concurrent {index}"], env, cwd), "SESSION")
+
+    for _ in range(MAX_STEPS):
+        status = _cli(["--status"], env, cwd)
+        if _field(status, "SESSION") != report["session"]:
+            report["clobbered"] += 1
+            report["outcome"] = _field(status, "STATUS") or "lost"
+            break
+        roles = _pending(status)
+        if not roles:
+            report["outcome"] = _field(status, "STATUS")
+            break
+        out = _cli(["--complete", ",".join(roles)], env, cwd)
+        report["steps"] += 1
+        if out.startswith(("ERROR", "LOCK_ERROR")):
+            report["errors"] += 1
+        if out.startswith(("APPROVED", "REJECTED")):
+            report["outcome"] = out.split(":", 1)[0].lower()
+            break
+
+    report["wall_s"] = round(time.perf_counter() - t0, 3)
+    queue.put(report)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def run_chains(chains: int, chain: str = "QUICK", isolation: str = "namespace") -> tuple[dict, list[dict]]:
+    """체인 chains개를 동시에 구동 → (요약, 체인별 보고) - tests/test_concurrent_chains.py도 사용"""
+    state_dir = tempfile.mkdtemp(prefix="sage-concurrent-")
+    base_env = dict(os.environ)
+    base_env.pop("SAGE_SESSION_ID", None)
+    base_env["SAGE_STATE_DIR"] = state_dir
+    base_env["SAGE_MEMO"] = "off"  # 같은 작업 반복이 결과 캐시 적중으로 짧아지지 않도록
+    base_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), base_env.get("PYTHONPATH")]))
+
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(chains)
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=run_worker, args=(i, chain, isolation, base_env, barrier, queue))
+               for i in range(chains)]
+
+    t0 = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    reports = sorted((queue.get() for _ in workers), key=lambda r: r["index"])
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - t0
+
+    from sage_loop.registry import list_current
+
+    sessions = [r["session"] for r in reports]
+    summary = {
+        "chains": chains,
+        "chain": chain,
+        "isolation": isolation,
+        "approved": sum(1 for r in reports if r["outcome"] == "approved"),
+        "clobbered": sum(r["clobbered"] for r in reports),
+        "errors": sum(r["errors"] for r in reports),
+        "distinct_sessions": len(set(filter(None, sessions))),
+        "leftover_pointers": len(list_current(Path(state_dir))),
+        "wall_s": round(wall, 3),
+        "chain_wall_s_max": max((r["wall_s"] for r in reports), default=0.0),
+    }
+    return summary, reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage concurrent multi-chain harness")
+    parser.add_argument("--chains", type=int, default=50, help="동시 체인 수 (기본: 50)")
+    parser.add_argument("--chain", default="QUICK", help="구동할 체인 (기본: QUICK)")
+    parser.add_argument("--isolation", choices=["namespace", "cwd", "global"], default="namespace",
+                        help="워커 간 세션 포인터 격리 방식 (기본: namespace)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+    summary, reports = run_chains(args.chains, args.chain, args.isolation)
+    ok = (summary["approved"] == args.chains and not summary["clobbered"]
+          and not summary["errors"] and not summary["leftover_pointers"])
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"TARGET: {args.chains} x {args.chain} (isolation={args.isolation})")
+        print(f"APPROVED: {summary['approved']}/{args.chains}")
+        print(f"DISTINCT_SESSIONS: {summary['distinct_sessions']}")
+        print(f"CLOBBERED: {summary['clobbered']}")
+        print(f"ERRORS: {summary['errors']}")
+        print(f"LEFTOVER_POINTERS: {summary['leftover_pointers']}")
+        print(f"WALL_S: {summary['wall_s']} (slowest chain {summary['chain_wall_s_max']})")
+        print(f"RESULT: {'OK' if ok else 'FAIL'}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"summary": summary, "chains": reports},
+                                                ensure_ascii=False, indent=2))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
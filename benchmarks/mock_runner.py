@@ -0,0 +1,70 @@
+"""
+Mock Role Runner - 결정적 역할 실행기 (벤치마크용)
+
+실제 모델 호출 대신 설정된 지연 후 결과 텍스트를 반환한다.
+같은 (seed, session, role, attempt) 조합은 항상 같은 지연/판정을 만든다.
+판정 텍스트는 sage_loop.cli.simulate.build_result를 그대로 사용하므로
+체인 설정의 분기/종료 키워드와 일치한다.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sage_loop.cli.simulate import build_result
+
+
+@dataclass
+class MockRoleRunner:
+    """결정적 mock 역할 실행기
+
+    Attributes:
+        latency_ms: 역할당 기본 지연 (밀리초)
+        jitter_ms: 지연 변동 폭 (±, 밀리초)
+        verdicts: 역할별 분기/종료 확률 ({"sagawon": {"branch": 0.2}})
+        seed: 기본 시드
+    """
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    verdicts: dict = field(default_factory=dict)
+    seed: int = 0
+
+    def _rng(self, session_key: str, role: str, attempt: int) -> random.Random:
+        key = f"{self.seed}:{session_key}:{role}:{attempt}".encode()
+        return random.Random(zlib.crc32(key))
+
+    def latency(self, session_key: str, role: str, attempt: int = 0) -> float:
+        """역할 지연 (초)"""
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        rng = self._rng(session_key, role, attempt)
+        ms = self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, ms) / 1000.0
+
+    def run(self, session_key: str, role: str, chain_name: str, config: dict,
+            attempt: int = 0, sleep: bool = True) -> str:
+        """역할 실행 (지연 후 결과 텍스트 반환)"""
+        delay = self.latency(session_key, role, attempt)
+        if sleep and delay:
+            time.sleep(delay)
+        rng = self._rng(session_key, role, attempt)
+        return build_result(role, chain_name, config, self.verdicts, rng)
+
+
+def parse_verdicts(specs: Optional[list[str]]) -> dict:
+    """CLI 판정 사양 파싱
+
+    형식: "role:kind=prob" (예: "sagawon:branch=0.2", "saheonbu:exit=0.01")
+    """
+    verdicts: dict = {}
+    for spec in specs or []:
+        role, _, rest = spec.partition(":")
+        kind, _, prob = rest.partition("=")
+        if not role or kind not in ("branch", "exit") or not prob:
+            raise ValueError(f"Invalid verdict spec: {spec}")
+        verdicts.setdefault(role, {})[kind] = float(prob)
+    return verdicts
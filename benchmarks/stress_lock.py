@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Lock-Contention Stress Harness
+
+병렬 페이즈의 역할 N개를 N개 프로세스가 같은 순간(배리어)에 완료시켜
+atomic_state_update의 fcntl.flock + 재시도 설계를 계량한다.
+
+보고 항목:
+  - lost updates: 완료를 시도했지만 상태에 기록되지 않은 역할 수
+  - lock errors: LOCK_ERROR (RuntimeError)로 끝난 호출 수
+  - retries: 락 획득까지의 재시도 횟수 합
+  - lock wait: 락 대기 시간 분포 (p50/p90/p99/max)
+  - final-state correctness: 페이즈 전진 여부 + pending/completed 집합 일관성
+
+사용법:
+  python benchmarks/stress_lock.py --procs 6 --rounds 50
+  python benchmarks/stress_lock.py --procs 32 --hold-ms 5 --json
+  python benchmarks/stress_lock.py --phase FULL:2 --retry 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+CLOSER_ROLE = "closer"
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round((len(values) - 1) * pct / 100.0)))
+    return values[k]
+
+
+def synthetic_config(procs: int) -> tuple[dict, str, list[str]]:
+    """N개 병렬 역할 + 후속 역할 1개로 구성된 체인"""
+    roles = [f"stress-{i:03d}" for i in range(procs)]
+    config = {"chains": {"STRESS": {"roles": [roles, CLOSER_ROLE]}}}
+    return config, "STRESS", roles
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def _worker(role: str, config: dict, barrier, queue, retry: int, hold: float) -> None:
+    from sage_loop.cli import orchestrator as orch
+
+    def do_complete(state):
+        if hold:
+            time.sleep(hold)  # 임계 구역을 넓혀 경합 재현
+        return orch._complete_role_impl(state, [role], {role: f"pass ({role})"}, config)
+
+    barrier.wait()
+    attempts = 0
+    waits = []
+    ok = False
+    error = ""
+    t0 = time.perf_counter()
+    for _ in range(retry + 1):
+        try:
+            if hold:
+                orch.atomic_state_update(do_complete)
+            else:
+                orch.complete_role_atomic([role], {role: f"pass ({role})"}, config)
+            ok = True
+        except RuntimeError as e:
+            error = f"LOCK_ERROR: {e}"
+        except ValueError as e:
+            error = f"ERROR: {e}"
+        attempts += orch.LOCK_STATS.last_attempts
+        waits.append(orch.LOCK_STATS.last_wait)
+        if ok or error.startswith("ERROR"):
+            break
+
+    queue.put({
+        "role": role,
+        "ok": ok,
+        "error": "" if ok else error,
+        "attempts": attempts,
+        "lock_waits": waits,
+        "elapsed": time.perf_counter() - t0,
+    })
+
+
+# =============================================================================
+# Round
+# =============================================================================
+
+def prepare_state(config: dict, chain_name: str, phase_index: int):
+    """체인 시작 후 대상 페이즈까지 순차 진행"""
+    from sage_loop.cli import orchestrator as orch
+
+    state = orch.start_chain("stress", config, force_chain=chain_name)
+    while state.current_phase < phase_index and not orch.is_terminal(state):
+        roles = list(state.pending_roles)
+        state = orch.complete_role_atomic(roles, {r: "pass" for r in roles}, config)
+    if state.current_phase != phase_index:
+        raise ValueError(f"Could not reach phase {phase_index + 1} of {chain_name}")
+    return state
+
+
+def run_round(config: dict, chain_name: str, phase_index: int, retry: int, hold: float) -> dict:
+    from sage_loop.cli import orchestrator as orch
+
+    state = prepare_state(config, chain_name, phase_index)
+    roles = list(state.pending_roles)
+    state_path = orch.get_state_path()
+
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(len(roles))
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(r, config, barrier, queue, retry, hold)) for r in roles]
+    for p in procs:
+        p.start()
+    reports = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    final = orch.load_state_unsafe()
+    recorded = {r for r in roles if final and r in final.role_results}
+    reported_ok = {r["role"] for r in reports if r["ok"]}
+    lost = sorted(set(roles) - recorded)
+
+    expected_next = (orch.split_phase_roles(orch.PhaseItem(**state.phases[phase_index + 1]))[0]
+                     if phase_index + 1 < len(state.phases) else [])
+    pending = set(final.pending_roles) if final else set()
+    queued = set(final.queued_roles) if final else set()
+    done = set(final.completed_parallel) if final else set()
+    phase_roles = set(orch.PhaseItem(**state.phases[phase_index]).roles)
+    advanced = bool(final) and final.current_phase == phase_index + 1 and sorted(final.pending_roles) == sorted(expected_next)
+    consistent = bool(final) and (advanced or (pending | queued | done == phase_roles
+                                               and not pending & done and not queued & (pending | done)))
+
+    state_path.unlink(missing_ok=True)
+    state_path.with_suffix(".lock").unlink(missing_ok=True)
+
+    return {
+        "processes": len(roles),
+        "lost_updates": len(lost),
+        "lost_roles": lost,
+        "silent_losses": len(reported_ok - recorded),  # 성공 보고했으나 미기록
+        "lock_errors": sum(1 for r in reports if r["error"].startswith("LOCK_ERROR")),
+        "retries": sum(max(0, r["attempts"] - 1) for r in reports),
+        "lock_waits": [w for r in reports for w in r["lock_waits"]],
+        "phase_advanced": advanced,
+        "consistent": consistent,
+    }
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage state lock contention stress harness")
+    parser.add_argument("--procs", type=int, default=6, help="동시 완료 프로세스 수 (기본: 6)")
+    parser.add_argument("--rounds", type=int, default=20, help="반복 횟수 (기본: 20)")
+    parser.add_argument("--phase", help='실제 체인 페이즈 사용 "CHAIN:PHASE" (예: FULL:2, 1-based)')
+    parser.add_argument("--retry", type=int, default=0,
+                        help="LOCK_ERROR 후 호출 재시도 횟수 (기본: 0 = stop-hook과 동일)")
+    parser.add_argument("--hold-ms", type=float, default=0.0, help="임계 구역 인위 지연")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+
+    os.environ["SAGE_STATE_DIR"] = tempfile.mkdtemp(prefix="sage-stress-")
+    os.environ.pop("SAGE_SESSION_ID", None)
+    os.environ["SAGE_MEMO"] = "off"  # 완료 → 다음 역할 기대값이 캐시 적중으로 바뀌지 않도록
+
+    from sage_loop.cli.orchestrator import load_config
+
+    if args.phase:
+        chain_name, _, idx = args.phase.partition(":")
+        config = load_config()
+        phase_index = int(idx or 1) - 1
+    else:
+        config, chain_name, _ = synthetic_config(args.procs)
+        phase_index = 0
+
+    rounds = [run_round(config, chain_name, phase_index, args.retry, args.hold_ms / 1000.0)
+              for _ in range(args.rounds)]
+
+    waits_ms = [w * 1000.0 for r in rounds for w in r["lock_waits"]]
+    attempted = sum(r["processes"] for r in rounds)
+    summary = {
+        "chain": chain_name,
+        "phase": phase_index + 1,
+        "processes": rounds[0]["processes"] if rounds else 0,
+        "rounds": len(rounds),
+        "retry": args.retry,
+        "hold_ms": args.hold_ms,
+        "completions_attempted": attempted,
+        "lost_updates": sum(r["lost_updates"] for r in rounds),
+        "lost_rate": round(sum(r["lost_updates"] for r in rounds) / attempted, 4) if attempted else 0.0,
+        "silent_losses": sum(r["silent_losses"] for r in rounds),
+        "lock_errors": sum(r["lock_errors"] for r in rounds),
+        "retries": sum(r["retries"] for r in rounds),
+        "lock_wait_ms": {
+            "p50": round(percentile(waits_ms, 50), 3),
+            "p90": round(percentile(waits_ms, 90), 3),
+            "p99": round(percentile(waits_ms, 99), 3),
+            "max": round(max(waits_ms), 3) if waits_ms else 0.0,
+        },
+        "rounds_advanced": sum(1 for r in rounds if r["phase_advanced"]),
+        "rounds_consistent": sum(1 for r in rounds if r["consistent"]),
+    }
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(f"TARGET: {chain_name} phase {summary['phase']} x{summary['processes']} procs, "
+              f"{summary['rounds']} rounds (retry={args.retry}, hold={args.hold_ms}ms)")
+        print(f"LOST_UPDATES: {summary['lost_updates']}/{attempted} ({summary['lost_rate']:.1%})")
+        print(f"SILENT_LOSSES: {summary['silent_losses']}")
+        print(f"LOCK_ERRORS: {summary['lock_errors']}")
+        print(f"RETRIES: {summary['retries']}")
+        w = summary["lock_wait_ms"]
+        print(f"LOCK_WAIT_MS: p50={w['p50']} p90={w['p90']} p99={w['p99']} max={w['max']}")
+        print(f"PHASE_ADVANCED: {summary['rounds_advanced']}/{summary['rounds']}")
+        print(f"CONSISTENT: {summary['rounds_consistent']}/{summary['rounds']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"summary": summary, "rounds": rounds},
+                                                ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ Circuit Breaker - 무한 루프 방지 안전장치
 
 연속 오류나 과도한 루프 감지 시 체인 중단
 Stop hook에서 호출됨
+
+sage_loop가 설치되어 있으면 sage_loop.breaker(역할별 슬라이딩 윈도우 오류율,
+적응형 cooldown 후 half-open 복구)에 위임하고, 없으면 고정 횟수 기준으로 동작한다.
 """
 
 import json
@@ -12,6 +15,17 @@ import sys
 import time
 from pathlib import Path
 
+try:
+    from sage_loop.events import emit as emit_event
+except ImportError:  # sage_loop 미설치 환경에서도 훅은 동작해야 함
+    def emit_event(ev, session_id="", level="basic", **fields):
+        pass
+
+try:
+    from sage_loop import breaker
+except ImportError:
+    breaker = None
+
 # 상태 파일 경로
 STATE_DIR = Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
 SESSION_ID = os.environ.get("SAGE_SESSION_ID", "")
@@ -52,8 +66,12 @@ def save_breaker_state(state):
     breaker_file.write_text(json.dumps(state, ensure_ascii=False, indent=2))
 
 
-def record_error(error_msg=""):
+def record_error(error_msg="", role=""):
     """오류 기록"""
+    if breaker is not None:
+        breaker.record_error(SESSION_ID, error_msg, role, STATE_DIR)
+        return
+
     state = load_breaker_state()
     state["consecutive_errors"] += 1
     state["last_error_time"] = time.time()
@@ -62,8 +80,11 @@ def record_error(error_msg=""):
     if state["consecutive_errors"] >= MAX_CONSECUTIVE_ERRORS:
         state["tripped"] = True
         state["trip_reason"] = f"연속 오류 {state['consecutive_errors']}회"
+        emit_event("breaker_trip", SESSION_ID, reason=state["trip_reason"])
 
     save_breaker_state(state)
+    emit_event("error", SESSION_ID, kind="role", message=error_msg[:500],
+               consecutive=state["consecutive_errors"], tripped=state["tripped"])
 
 
 def record_role_loop(role):
@@ -73,15 +94,27 @@ def record_role_loop(role):
     counts[role] = counts.get(role, 0) + 1
     state["role_loop_counts"] = counts
 
+    if breaker is not None:
+        # 과도한 루프는 그 역할의 오류로 윈도우에 넣음 (영구 트립 대신 cooldown 후 복구)
+        save_breaker_state(state)
+        if counts[role] >= MAX_LOOPS_PER_ROLE:
+            breaker.record_error(SESSION_ID, f"역할 '{role}' 루프 {counts[role]}회", role, STATE_DIR)
+        return
+
     if counts[role] >= MAX_LOOPS_PER_ROLE:
         state["tripped"] = True
         state["trip_reason"] = f"역할 '{role}' 루프 {counts[role]}회"
+        emit_event("breaker_trip", SESSION_ID, reason=state["trip_reason"], role=role)
 
     save_breaker_state(state)
 
 
-def record_success():
+def record_success(role=""):
     """성공 기록 (오류 카운터 리셋)"""
+    if breaker is not None:
+        breaker.record_success(SESSION_ID, [role] if role else None, STATE_DIR)
+        return
+
     state = load_breaker_state()
     state["consecutive_errors"] = 0
     state["last_error"] = None
@@ -90,6 +123,9 @@ def record_success():
 
 def is_circuit_open():
     """Circuit이 열려있는지 (중단 필요) 확인"""
+    if breaker is not None:
+        return breaker.is_open(SESSION_ID, state_dir=STATE_DIR)
+
     state = load_breaker_state()
 
     # 이미 트립됨
@@ -109,12 +145,16 @@ def is_circuit_open():
 def reset_breaker():
     """Circuit breaker 리셋"""
     breaker_file = get_breaker_file()
-    if breaker_file.exists():
-        breaker_file.unlink()
+    for path in (breaker_file, breaker_file.with_suffix(".ring")):  # .ring: sage_loop.breaker 회로
+        if path.exists():
+            path.unlink()
 
 
 def get_status():
     """상태 정보 반환"""
+    if breaker is not None:
+        return breaker.status(SESSION_ID, STATE_DIR)
+
     state = load_breaker_state()
     return {
         "tripped": state.get("tripped", False),
@@ -128,11 +168,20 @@ def main():
     """메인: circuit이 닫혀있으면 exit 0, 열려있으면 exit 1"""
     if is_circuit_open():
         status = get_status()
+        emit_event("breaker_check", SESSION_ID, open=True, reason=status.get("trip_reason"),
+                   consecutive_errors=status.get("consecutive_errors", 0))
         print(f"Circuit OPEN: {status.get('trip_reason', 'Unknown')}", file=sys.stderr)
         sys.exit(1)
     else:
+        emit_event("breaker_check", SESSION_ID, level="full", open=False)
         sys.exit(0)
 
 
 if __name__ == "__main__":
-    main()
+    # SAGE_PROFILE=cpu|mem 설정 시 STATE_DIR에 프로파일 덤프
+    try:
+        from sage_loop.profiling import run_profiled
+    except ImportError:
+        main()
+    else:
+        run_profiled("circuit_breaker", main)
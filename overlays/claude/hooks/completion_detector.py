@@ -90,4 +90,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # SAGE_PROFILE=cpu|mem 설정 시 STATE_DIR에 프로파일 덤프
+    try:
+        from sage_loop.profiling import run_profiled
+    except ImportError:
+        main()
+    else:
+        run_profiled("completion_detector", main)
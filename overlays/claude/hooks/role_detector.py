@@ -12,6 +12,12 @@ import os
 import sys
 from pathlib import Path
 
+try:
+    from sage_loop.hotstate import read_hot
+except ImportError:  # sage_loop 미설치 - 항상 세션 파일 파싱
+    def read_hot(session_file):
+        return None
+
 # 상태 파일 경로
 STATE_DIR = Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
 SESSION_ID = os.environ.get("SAGE_SESSION_ID", "")
@@ -39,15 +45,24 @@ def load_state():
     return {}
 
 
+def load_hot():
+    """hot 필드 sidecar (sage_loop.hotstate, 없거나 오래됐으면 None)"""
+    state_file = get_state_file()
+    return read_hot(state_file) if state_file else None
+
+
 def get_current_role():
     """현재 활성 역할 반환"""
+    hot = load_hot()
+    if hot is not None:
+        return hot["current_role"]
     state = load_state()
     return state.get("current_role", "")
 
 
 def is_sage_active():
     """sage 루프가 활성 상태인지 확인"""
-    state = load_state()
+    state = load_hot() or load_state()
     return state.get("active", False) and state.get("chain_type") is not None
 
 
@@ -65,6 +80,15 @@ def get_next_role():
 
 def get_chain_progress():
     """체인 진행 상황 반환"""
+    hot = load_hot()
+    if hot is not None:
+        return {
+            "total": hot["total_roles"],
+            "completed": hot["completed_roles"],
+            "current": hot["current_role"],
+            "remaining": hot["total_roles"] - hot["completed_roles"],
+            "chain_type": hot["chain_type"] or "",
+        }
     state = load_state()
     chain_roles = state.get("chain_roles", [])
     completed = state.get("completed_roles", [])
@@ -120,4 +144,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # SAGE_PROFILE=cpu|mem 설정 시 STATE_DIR에 프로파일 덤프
+    try:
+        from sage_loop.profiling import run_profiled
+    except ImportError:
+        main()
+    else:
+        run_profiled("role_detector", main)
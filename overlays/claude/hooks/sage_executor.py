@@ -32,6 +32,7 @@ from sage_loop.schemas import (
 from sage_loop.services.state_service import StateService
 from sage_loop.engine.chain_executor import ChainExecutor
 from sage_loop.engine.role_runner import RoleRunner
+from sage_loop.hotstate import clear_hot, write_hot
 
 # 파일 시스템 상태 경로 (stop-hook.sh와 호환)
 STATE_DIR = Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
@@ -110,6 +111,7 @@ class FileStateSync:
         """세션 정리"""
         if self.state_file.exists():
             self.state_file.unlink()
+        clear_hot(self.state_file)
 
     def _load(self) -> dict:
         """상태 로드"""
@@ -121,8 +123,9 @@ class FileStateSync:
         return {}
 
     def _save(self, state: dict) -> None:
-        """상태 저장"""
+        """상태 저장 (hot 필드 sidecar 포함)"""
         self.state_file.write_text(json.dumps(state, ensure_ascii=False, indent=2))
+        write_hot(self.state_file, state)
 
 
 class SageExecutor:
@@ -313,4 +316,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # SAGE_PROFILE=cpu|mem 설정 시 STATE_DIR에 프로파일 덤프
+    try:
+        from sage_loop.profiling import run_profiled
+    except ImportError:
+        asyncio.run(main())
+    else:
+        run_profiled("sage_executor", lambda: asyncio.run(main()), verb="execute")
@@ -14,6 +14,21 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from sage_loop.events import emit as emit_event
+except ImportError:  # sage_loop 미설치 환경에서도 훅은 동작해야 함
+    def emit_event(ev, session_id="", level="basic", **fields):
+        pass
+
+try:
+    from sage_loop.hotstate import clear_hot, write_hot
+except ImportError:  # sidecar 없이 동작 - 이전 sidecar는 지워 stop-hook이 세션 파일을 읽게 함
+    def write_hot(session_file, state):
+        session_file.with_suffix(".hot").unlink(missing_ok=True)
+
+    def clear_hot(session_file):
+        session_file.with_suffix(".hot").unlink(missing_ok=True)
+
 # 상태 파일 경로
 STATE_DIR = Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
 PROJECT_ROOT = Path(os.environ.get("SAGE_PROJECT_ROOT", str(Path.home() / "Dyarchy-v3")))
@@ -62,9 +77,10 @@ def load_state(session_id=None):
 
 
 def save_state(state, session_id=None):
-    """상태 저장"""
+    """상태 저장 (hot 필드 sidecar 포함 - stop-hook은 sidecar만 읽음)"""
     state_file = get_state_file(session_id)
     state_file.write_text(json.dumps(state, ensure_ascii=False, indent=2))
+    write_hot(state_file, state)
 
 
 def init_session(task: str, chain_type: str = "FULL"):
@@ -88,6 +104,7 @@ def init_session(task: str, chain_type: str = "FULL"):
     }
 
     save_state(state, session_id)
+    emit_event("session_init", session_id, chain=chain_type, roles=len(chain_roles))
     return state
 
 
@@ -97,6 +114,7 @@ def start_role(role: str, session_id=None):
     state["current_role"] = role
     state["loop_count"] = state.get("loop_count", 0) + 1
     save_state(state, session_id)
+    emit_event("role_start", session_id or get_session_id(), role=role, loop_count=state["loop_count"])
     return state
 
 
@@ -129,6 +147,7 @@ def complete_role(role: str, output: dict = None, session_id=None):
         state["completed_at"] = datetime.now().isoformat()
 
     save_state(state, session_id)
+    emit_event("session_role_complete", session_id or get_session_id(), role=role, next_role=next_role)
     return state
 
 
@@ -151,6 +170,7 @@ def set_exit_signal(reason: str = "완료", session_id=None):
     state["exit_reason"] = reason
     state["active"] = False
     save_state(state, session_id)
+    emit_event("exit_signal", session_id or get_session_id(), reason=reason)
     return state
 
 
@@ -178,11 +198,13 @@ def cleanup_session(session_id=None):
     state_file = get_state_file(session_id)
     if state_file.exists():
         state_file.unlink()
+    clear_hot(state_file)
 
     # circuit breaker도 정리
     breaker_file = STATE_DIR / f"sage_circuit_breaker_{session_id or get_session_id()}.json"
-    if breaker_file.exists():
-        breaker_file.unlink()
+    for path in (breaker_file, breaker_file.with_suffix(".ring")):  # .ring: sage_loop.breaker 회로
+        if path.exists():
+            path.unlink()
 
 
 def main():
@@ -266,4 +288,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # SAGE_PROFILE=cpu|mem 설정 시 STATE_DIR에 프로파일 덤프
+    try:
+        from sage_loop.profiling import run_profiled
+    except ImportError:
+        main()
+    else:
+        run_profiled("sage_state_manager", main)
@@ -14,8 +14,11 @@
 #   SAGE_PROJECT_ROOT: 프로젝트 루트 (기본: ~/Dyarchy-v3)
 #   SAGE_MAX_LOOPS: 최대 루프 횟수 (기본: 50)
 #   SAGE_SESSION_TIMEOUT: 세션 타임아웃 초 (기본: 3600)
-#   SAGE_SESSION_ID: 세션 ID (없으면 자동 생성)
+#   SAGE_SESSION_ID: 세션 ID (없으면 네임스페이스 포인터 → 자동 생성)
+#   SAGE_NAMESPACE: cwd|tty|global|이름 - 현재 세션 포인터 네임스페이스 (기본: cwd)
 #   SAGE_DEBUG: 디버그 모드 (기본: 0)
+#   SAGE_EVENTS: off|basic|full - 구조화 이벤트 로그 (기본: basic)
+#   SAGE_PROFILE: cpu|mem - 훅이 호출하는 Python 스크립트별 프로파일 덤프 (기본: 비활성)
 
 set -e
 
@@ -41,18 +44,28 @@ if [[ -z "$SAGE_SESSION_ID" ]]; then
   SAGE_SESSION_ID=$(python3 -c "
 import sys, time, hashlib
 sys.path.insert(0, '$PROJECT_ROOT')
+sid = ''
 try:
-    from src.sage.session import get_session_id
-    print(get_session_id())
-except:
-    print(hashlib.md5(str(time.time()).encode()).hexdigest()[:8])
+    from sage_loop.registry import read_current  # 현재 네임스페이스(SAGE_NAMESPACE)의 체인
+    sid = read_current()
+except Exception:
+    pass
+if not sid:
+    try:
+        from src.sage.session import get_session_id
+        sid = get_session_id()
+    except Exception:
+        sid = hashlib.md5(str(time.time()).encode()).hexdigest()[:8]
+print(sid)
 " 2>/dev/null || echo "$(date +%s | md5sum | head -c 8)")
   export SAGE_SESSION_ID
 fi
 
 SESSION_FILE="${STATE_DIR}/sage_session_${SAGE_SESSION_ID}.json"
+HOT_FILE="${STATE_DIR}/sage_session_${SAGE_SESSION_ID}.hot"
 LOOP_FILE="${STATE_DIR}/sage_loop_state_${SAGE_SESSION_ID}.json"
 ERROR_LOG="${STATE_DIR}/sage_errors_${SAGE_SESSION_ID}.log"
+EVENT_LOG="${STATE_DIR}/sage_events_${SAGE_SESSION_ID}.jsonl"
 
 # 디버그 로그 함수
 debug_log() {
@@ -61,10 +74,52 @@ debug_log() {
   fi
 }
 
-# 세션 cleanup 함수
+# 구조화 이벤트 기록 (sage_loop.events와 같은 JSONL 형식, 회전은 Python 측에서 처리)
+# 사용법: log_event <ev> [key value]...
+log_event() {
+  [[ "${SAGE_EVENTS:-basic}" == "off" ]] && return 0
+  local ev="$1" fields="" mono key val
+  shift
+  read -r mono _ < /proc/uptime 2>/dev/null || mono=0
+  while [[ $# -ge 2 ]]; do
+    key="$1"
+    val="${2//\\/\\\\}"
+    val="${val//\"/\\\"}"
+    val="${val//$'\n'/\\n}"
+    fields+=",\"$key\":\"$val\""
+    shift 2
+  done
+  printf '{"ts":%s,"mono":%s,"sid":"%s","pid":%d,"src":"stop-hook","ev":"%s"%s}\n' \
+    "${EPOCHREALTIME:-$(date +%s)}" "$mono" "$SAGE_SESSION_ID" "$$" "$ev" "$fields" \
+    >> "$EVENT_LOG" 2>/dev/null || true
+}
+
+# 세션 hot 필드 로드 → is_active exit_signal completed_roles total_roles chain_type current_role
+# sidecar(sage_loop.hotstate, 고정 128바이트)가 세션 파일보다 오래되지 않았으면 read 한 번,
+# 아니면 세션 파일을 jq로 한 번만 파싱
+load_hot() {
+  local magic loops
+  if [[ -f "$HOT_FILE" && ! "$SESSION_FILE" -nt "$HOT_FILE" ]] \
+     && read -r magic is_active exit_signal completed_roles total_roles loops chain_type current_role < "$HOT_FILE" \
+     && [[ "$magic" == "SAGEHOT1" ]]; then
+    [[ "$chain_type" == "-" ]] && chain_type="FULL"
+    [[ "$current_role" == "-" ]] && current_role=""
+    return 0
+  fi
+  debug_log "No fresh hot sidecar. Parsing session file."
+  IFS=$'\t' read -r is_active exit_signal completed_roles total_roles chain_type current_role < <(
+    jq -r '[(.active // false), (.exit_signal // false), (.completed_roles | length),
+            (.chain_roles | length), (.chain_type // "FULL"), (.current_role // "")] | @tsv' \
+      "$SESSION_FILE" 2>/dev/null || printf 'false\tfalse\t0\t0\tFULL\t\n'
+  ) || true
+  [[ -n "$is_active" ]] || is_active="false"
+}
+
+# 세션 cleanup 함수 (이벤트 로그는 사후 분석을 위해 보존)
+# 오케스트레이터 상태/체크포인트(sage_checkpoint_*)는 지우지 않음 → sage-orchestrator --resume SESSION
 cleanup_session() {
-  rm -f "$SESSION_FILE" "$LOOP_FILE" 2>/dev/null || true
-  rm -f "${STATE_DIR}/sage_circuit_breaker_${SAGE_SESSION_ID}.json" 2>/dev/null || true
+  rm -f "$SESSION_FILE" "$HOT_FILE" "$LOOP_FILE" 2>/dev/null || true
+  rm -f "${STATE_DIR}/sage_circuit_breaker_${SAGE_SESSION_ID}.json" "${STATE_DIR}/sage_circuit_breaker_${SAGE_SESSION_ID}.ring" 2>/dev/null || true
   [[ "${SAGE_DEBUG:-0}" != "1" ]] && rm -f "$ERROR_LOG" 2>/dev/null || true
 }
 
@@ -79,7 +134,7 @@ if [[ ! -f "$SESSION_FILE" ]]; then
   exit 0
 fi
 
-is_active=$(jq -r '.active // false' "$SESSION_FILE" 2>/dev/null || echo "false")
+load_hot
 if [[ "$is_active" != "true" ]]; then
   debug_log "Session not active. Normal exit."
   exit 0
@@ -100,6 +155,7 @@ fi
 # 하드 리미트 체크
 if [[ $loop_count -ge $MAX_LOOPS ]]; then
   debug_log "MAX_LOOPS ($MAX_LOOPS) reached. Allowing exit."
+  log_event hook_decision decision allow reason max_loops loop_count "$loop_count"
   cleanup_session
   exit 0
 fi
@@ -118,7 +174,8 @@ except:
   elapsed=$((current_time - start_time))
 
   if [[ $elapsed -ge $SESSION_TIMEOUT ]]; then
-    debug_log "Timeout (${SESSION_TIMEOUT}s). Allowing exit."
+    debug_log "Timeout (${SESSION_TIMEOUT}s). Allowing exit. Resume: sage-orchestrator --resume $SAGE_SESSION_ID"
+    log_event hook_decision decision allow reason timeout elapsed "$elapsed"
     cleanup_session
     exit 0
   fi
@@ -128,12 +185,12 @@ fi
 # 3. 완료 신호 확인
 # ═══════════════════════════════════════════════════════════════
 
-exit_signal=$(jq -r '.exit_signal // false' "$SESSION_FILE" 2>/dev/null || echo "false")
 pending_feedback=$(python3 "$PROJECT_ROOT/.claude/hooks/feedback_checker.py" 2>>"$ERROR_LOG" || echo "0")
 
 if [[ "$exit_signal" == "true" ]] && [[ "$pending_feedback" == "0" ]]; then
   exit_reason=$(jq -r '.exit_reason // "체인 완료"' "$SESSION_FILE" 2>/dev/null || echo "체인 완료")
   debug_log "EXIT_SIGNAL: true. Reason: $exit_reason"
+  log_event hook_decision decision allow reason exit_signal exit_reason "$exit_reason"
   cleanup_session
   exit 0
 fi
@@ -144,6 +201,7 @@ fi
 
 if ! python3 "$PROJECT_ROOT/.claude/hooks/circuit_breaker_check.py" 2>>"$ERROR_LOG"; then
   debug_log "Circuit breaker open. Allowing exit."
+  log_event hook_decision decision allow reason circuit_breaker
   cleanup_session
   exit 0
 fi
@@ -152,13 +210,18 @@ fi
 # 5. 현재 역할 자동 완료 처리 (v3)
 # ═══════════════════════════════════════════════════════════════
 
-current_role=$(jq -r '.current_role // ""' "$SESSION_FILE" 2>/dev/null || echo "")
-completed_list=$(jq -r '.completed_roles[]? // empty' "$SESSION_FILE" 2>/dev/null || echo "")
-
-# 현재 역할이 있고 아직 완료되지 않았으면 자동 완료 처리
+# 현재 역할이 있고 아직 완료되지 않았으면 자동 완료 처리 (완료 목록은 현재 역할이 있을 때만 파싱)
+if [[ -n "$current_role" ]]; then
+  completed_list=$(jq -r '.completed_roles[]? // empty' "$SESSION_FILE" 2>/dev/null || echo "")
+fi
 if [[ -n "$current_role" ]] && ! echo "$completed_list" | grep -q "^${current_role}#"; then
   debug_log "Auto-completing role: $current_role"
-  python3 -m sage_loop.cli.orchestrator --complete "$current_role" --result "auto-complete by stop-hook" 2>>"$ERROR_LOG" || true
+  auto_rc=0
+  python3 -m sage_loop.cli.orchestrator --complete "$current_role" --result "auto-complete by stop-hook" 2>>"$ERROR_LOG" || auto_rc=$?
+  log_event auto_complete role "$current_role" rc "$auto_rc"
+  if [[ $auto_rc -ne 0 ]]; then
+    log_event error kind auto_complete role "$current_role" rc "$auto_rc"
+  fi
 fi
 
 # ═══════════════════════════════════════════════════════════════
@@ -167,13 +230,9 @@ fi
 
 # 세션 정보 재로드 (완료 처리 후)
 next_role=$(python3 "$PROJECT_ROOT/.claude/hooks/role_detector.py" --next 2>/dev/null || echo "")
-current_role=$(jq -r '.current_role // ""' "$SESSION_FILE" 2>/dev/null || echo "")
-chain_type=$(jq -r '.chain_type // "FULL"' "$SESSION_FILE" 2>/dev/null || echo "FULL")
-task=$(jq -r '.task // ""' "$SESSION_FILE" 2>/dev/null || echo "")
+load_hot
 
 # 진행 상황 계산
-total_roles=$(jq -r '.chain_roles | length' "$SESSION_FILE" 2>/dev/null || echo "0")
-completed_roles=$(jq -r '.completed_roles | length' "$SESSION_FILE" 2>/dev/null || echo "0")
 progress="${completed_roles}/${total_roles}"
 
 # 루프 카운터 증가
@@ -193,8 +252,10 @@ debug_log "Loop $new_count: current=$current_role, next=$next_role, progress=$pr
 if [[ -n "$next_role" ]]; then
   # 다음 역할이 있으면 계속 진행 신호
   reason="[SAGE $chain_type] Loop $new_count/$MAX_LOOPS: '$current_role' → '$next_role' ($progress)"
+  log_event hook_decision decision block reason next_role current_role "$current_role" next_role "$next_role" loop_count "$new_count" progress "$progress"
   output_continue "$reason" "$next_role" "$progress"
 else
+  log_event hook_decision decision allow reason chain_done loop_count "$new_count" progress "$progress"
   # 다음 역할이 없으면 완료 처리
   python3 "$PROJECT_ROOT/.claude/hooks/sage_state_manager.py" exit --reason "모든 역할 완료" 2>/dev/null || true
   cleanup_session
@@ -0,0 +1,443 @@
+"""
+Orchestrator API - 프로세스 내장용 체인 관리
+
+CLI(sage-orchestrator)와 달리 SAGE_SESSION_ID / sage_current_session을 읽거나
+쓰지 않는다. 모든 호출은 세션 ID를 명시하므로 한 프로세스가 여러 체인을
+동시에 다룰 수 있다.
+
+    from sage_loop.api import Orchestrator, MemoryStateStore
+
+    orch = Orchestrator()                       # 파일 저장소 (CLI/hook과 같은 형식)
+    state = orch.start("로그인 기능 구현", chain="QUICK")
+    state = orch.complete(state.session_id, "sagawon", result="pass")
+    state = orch.wait_for_change(state.session_id, timeout=30)
+    state, decision = orch.fail(state.session_id, "dohwaseo", "503 overloaded")   # retry 정책
+    state = orch.resume(session_id)             # 끊긴 체인 재개 (상태 파일 → 체크포인트)
+
+    async def run():
+        state = await orch.start_async("리뷰")
+        await orch.complete_async(state.session_id, ["amhaeng", "gyoseogwan"])
+
+저장소:
+    FileStateStore: {directory}/sage_state_{session}.json + .lock (기본: SAGE_STATE_DIR)
+                    + sage_checkpoint_{session}.json (checkpoint.py)
+                    wait는 inotify / FIFO로 기다린다 (watch.py, SAGE_WATCH)
+    MemoryStateStore: 프로세스 메모리 (서비스/테스트용, 결과도 MemoryBlobStore)
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import copy
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import yaml
+
+from . import breaker, checkpoint, durability, snapshot, watch
+from .blobs import BLOB_DIR_NAME, BlobStore, MemoryBlobStore, get_blob_store
+from .memo import MemoryResultCache, ResultCache, memo_enabled
+from .cli.orchestrator import (
+    ChainState,
+    RoleResult,
+    _complete_role_impl,
+    _fail_role_impl,
+    _record_complete,
+    _resume_impl,
+    _transition_snapshot,
+    announce_start,
+    emit_completion_events,
+    emit_resume_event,
+    file_lock,
+    is_terminal,
+    load_config,
+    new_chain_state,
+    read_state_file,
+    select_chain,
+    write_state_file,
+)
+from .retry import RetryDecision, RetryPolicies
+from .session import generate_session_id
+from .trace import recording_enabled
+
+# wait_for_change 기본 폴링 간격 (초)
+POLL_INTERVAL = 0.05
+
+
+# =============================================================================
+# State Stores
+# =============================================================================
+
+class StateStore(abc.ABC):
+    """상태 저장소 인터페이스
+
+    load / save / delete / lock / version은 구현해야 한다 (나머지는 기본 동작이 있음).
+    version()은 상태가 바뀔 때마다 달라지는 비교용 토큰을 돌려준다
+    (없으면 None). 기본 wait()는 version()을 폴링한다. watcher()가 fd를 주는
+    저장소면 wait_for_change_async도 폴링 대신 그 fd를 이벤트 루프에 등록한다.
+    """
+
+    @abc.abstractmethod
+    def load(self, session_id: str) -> Optional[ChainState]:
+        ...
+
+    @abc.abstractmethod
+    def save(self, state: ChainState) -> None:
+        ...
+
+    @abc.abstractmethod
+    def delete(self, session_id: str) -> None:
+        ...
+
+    @abc.abstractmethod
+    def lock(self, session_id: str):
+        """세션 배타 락 (context manager)"""
+
+    @abc.abstractmethod
+    def version(self, session_id: str) -> object:
+        ...
+
+    def load_checkpoint(self, session_id: str) -> Optional[ChainState]:
+        """마지막 실행 중 상태 (체크포인트가 없는 저장소면 None)"""
+        return None
+
+    def clear_checkpoint(self, session_id: str) -> None:
+        """정상 종료 시 체크포인트 삭제"""
+
+    def watcher(self, session_id: str) -> Optional[watch.Watcher]:
+        """변경 대기 fd (없으면 None → 폴링)"""
+        return None
+
+    def wait(self, session_id: str, version: object, timeout: Optional[float] = None) -> bool:
+        """version과 달라질 때까지 대기 → 변경 여부"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.version(session_id) == version:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_INTERVAL)
+        return True
+
+
+class FileStateStore(StateStore):
+    """파일 저장소 (CLI/hook과 같은 파일 형식과 락 규약)"""
+
+    def __init__(self, directory: Optional[Path] = None, max_retries: int = 3):
+        self.directory = Path(directory or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+        self.max_retries = max_retries
+
+    def path_for(self, session_id: str) -> Path:
+        return self.directory / f"sage_state_{session_id}.json"
+
+    def blob_store(self) -> BlobStore:
+        """같은 디렉토리의 결과 원문 저장소 (directory를 지정해도 SAGE_STATE_DIR와 섞이지 않음)"""
+        return BlobStore(self.directory / BLOB_DIR_NAME)
+
+    def load(self, session_id: str) -> Optional[ChainState]:
+        return read_state_file(self.path_for(session_id))
+
+    def save(self, state: ChainState) -> None:
+        write_state_file(self.path_for(state.session_id), state)
+
+    def delete(self, session_id: str) -> None:
+        path = self.path_for(session_id)
+        path.unlink(missing_ok=True)
+        path.with_suffix(".lock").unlink(missing_ok=True)
+        durability.sync_path(path).unlink(missing_ok=True)
+        checkpoint.remove(path)
+        snapshot.remove(path)
+        watch.notify(path)
+
+    def lock(self, session_id: str):
+        return file_lock(self.path_for(session_id).with_suffix(".lock"), session_id, self.max_retries)
+
+    def version(self, session_id: str) -> object:
+        # temp → rename 저장이므로 inode가 매번 바뀐다
+        return watch.state_version(self.path_for(session_id))
+
+    def wait(self, session_id: str, version: object, timeout: Optional[float] = None) -> bool:
+        return watch.wait_for_change(self.path_for(session_id), version, timeout)
+
+    def watcher(self, session_id: str) -> Optional[watch.Watcher]:
+        return watch.Watcher(self.path_for(session_id))
+
+    def load_checkpoint(self, session_id: str) -> Optional[ChainState]:
+        return read_state_file(checkpoint.checkpoint_for(self.path_for(session_id)))
+
+    def clear_checkpoint(self, session_id: str) -> None:
+        checkpoint.remove(self.path_for(session_id))
+
+
+class MemoryStateStore(StateStore):
+    """메모리 저장소 (저장 시 대기자에게 즉시 통지)"""
+
+    def __init__(self):
+        self._states: dict[str, ChainState] = {}
+        self._versions: dict[str, int] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._changed = threading.Condition()
+
+    def load(self, session_id: str) -> Optional[ChainState]:
+        state = self._states.get(session_id)
+        return copy.deepcopy(state) if state is not None else None
+
+    def save(self, state: ChainState) -> None:
+        with self._changed:
+            self._states[state.session_id] = copy.deepcopy(state)
+            self._versions[state.session_id] = self._versions.get(state.session_id, 0) + 1
+            self._changed.notify_all()
+
+    def delete(self, session_id: str) -> None:
+        with self._changed:
+            if self._states.pop(session_id, None) is not None:
+                self._versions[session_id] = self._versions.get(session_id, 0) + 1
+            self._locks.pop(session_id, None)
+            self._changed.notify_all()
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        with self._changed:
+            lock = self._locks.setdefault(session_id, threading.Lock())
+        with lock:
+            yield
+
+    def version(self, session_id: str) -> object:
+        return self._versions.get(session_id) if session_id in self._states else None
+
+    def wait(self, session_id: str, version: object, timeout: Optional[float] = None) -> bool:
+        with self._changed:
+            return self._changed.wait_for(lambda: self.version(session_id) != version, timeout)
+
+
+# =============================================================================
+# Orchestrator
+# =============================================================================
+
+class Orchestrator:
+    """세션 명시형 체인 관리자
+
+    Args:
+        config: 설정 dict 또는 YAML 경로 (기본: CLI와 같은 config.yaml)
+        store: 상태 저장소 (기본: FileStateStore)
+        blob_store: 결과 원문 저장소 (기본: FileStateStore는 같은 디렉토리의 sage_blobs/,
+            MemoryStateStore는 MemoryBlobStore, 그 외는 SAGE_STATE_DIR의 파일 저장소)
+        memo: 역할 결과 캐시 (기본: config memo.enabled면 FileStateStore는 같은 디렉토리의
+            sage_memo.json, 그 외는 MemoryResultCache)
+    """
+
+    def __init__(self, config: Union[dict, str, Path, None] = None,
+                 store: Optional[StateStore] = None, blob_store: Optional[BlobStore] = None,
+                 memo: Optional[ResultCache] = None):
+        if config is None:
+            config = load_config()
+        elif not isinstance(config, dict):
+            config = yaml.safe_load(Path(config).read_text()) or {}
+        self.config = config
+        self.store = store or FileStateStore()
+        if blob_store is None:
+            if isinstance(self.store, FileStateStore):
+                blob_store = self.store.blob_store()
+            elif isinstance(self.store, MemoryStateStore):
+                blob_store = MemoryBlobStore()
+            else:
+                blob_store = get_blob_store()
+        self.blobs = blob_store
+        self.retry_policies = RetryPolicies(self.config)
+        if memo is None and memo_enabled(self.config):
+            if isinstance(self.store, FileStateStore):
+                memo = ResultCache.from_config(self.config, self.store.directory)
+            else:
+                memo = MemoryResultCache(**ResultCache.settings(self.config))
+        self.memo = memo
+
+    # --- 동기 ---
+
+    def start(self, task: str, chain: Optional[str] = None, session_id: Optional[str] = None) -> ChainState:
+        """새 체인 시작 (chain 생략 시 키워드 기반 자동 선택)"""
+        if chain and chain not in self.config.get("chains", {}):
+            raise ValueError(f"Unknown chain: {chain}")
+        started = time.perf_counter()
+        session_id = session_id or generate_session_id()
+        state = new_chain_state(session_id, task, chain or select_chain(task, self.config), self.config,
+                                memo=self.memo, blob_store=self.blobs)
+        with self.store.lock(session_id):
+            self.store.save(state)
+        announce_start(state, self.config, forced=bool(chain), started=started)
+        return state
+
+    def complete(self, session_id: str, roles: Union[str, list[str]],
+                 results: "Optional[dict[str, str | RoleResult]]" = None, result: str = "pass") -> ChainState:
+        """역할 완료 (roles: "a,b" 또는 리스트, results에 없는 역할은 result)
+
+        Raises:
+            ValueError: 세션이 없거나 이미 종료됨
+            RuntimeError: (파일 저장소) 락 획득 실패
+        """
+        if isinstance(roles, str):
+            roles = [r.strip() for r in roles.split(",") if r.strip()]
+        results = {**{role: result for role in roles}, **(results or {})}
+
+        started = time.perf_counter()
+        with self.store.lock(session_id):
+            state = self.store.load(session_id)
+            if state is None:
+                raise ValueError(f"No active session: {session_id}")
+            if is_terminal(state):
+                raise ValueError(f"Chain already finished: {state.status}")
+            before = _transition_snapshot(state)
+            state = _complete_role_impl(state, roles, results, self.config, blob_store=self.blobs,
+                                        memo=self.memo)
+            self.store.save(state)
+            if is_terminal(state):
+                self.store.clear_checkpoint(session_id)
+        emit_completion_events(before, state, roles, results)
+        if isinstance(self.store, FileStateStore):
+            breaker.record_success(session_id, roles, self.store.directory)
+        if recording_enabled():
+            _record_complete(session_id, roles, results, started, state=state)
+        return state
+
+    def fail(self, session_id: str, role: str, error: str = "",
+             retryable: Optional[bool] = None) -> tuple[ChainState, RetryDecision]:
+        """역할 실패 (config retry 정책으로 재시도 / 건너뛰기 / 종료)
+
+        파일 저장소면 CLI와 같은 circuit breaker 파일에 결과를 기록한다.
+
+        Raises:
+            ValueError: 세션이 없거나 이미 종료됨, 또는 role이 실행 중이 아님
+            RuntimeError: (파일 저장소) 락 획득 실패
+        """
+        state_dir = self.store.directory if isinstance(self.store, FileStateStore) else None
+        breaker_open = state_dir is not None and not breaker.allow(session_id, role, state_dir)
+        with self.store.lock(session_id):
+            state = self.store.load(session_id)
+            if state is None:
+                raise ValueError(f"No active session: {session_id}")
+            if is_terminal(state):
+                raise ValueError(f"Chain already finished: {state.status}")
+            before = _transition_snapshot(state)
+            state, decision = _fail_role_impl(
+                state, role, error, self.config, retryable=retryable,
+                breaker_open=breaker_open,
+                policies=self.retry_policies, blob_store=self.blobs,
+            )
+            self.store.save(state)
+            if is_terminal(state):
+                self.store.clear_checkpoint(session_id)
+        if state_dir is not None:
+            if decision.action == "retry":
+                breaker.record_retry(session_id, role, error, state_dir)
+            else:
+                breaker.record_error(session_id, error, role, state_dir)
+        if decision.action == "skip":
+            emit_completion_events(before, state, [role], {role: f"FAILED: {error}"})
+        return state, decision
+
+    def resume(self, session_id: str) -> ChainState:
+        """끊긴 체인 재개 - 완료가 기록되지 않은 역할만 다시 배출
+
+        저장된 상태가 없거나 (감독 timeout 등으로) 종료됐으면 체크포인트에서 복원한다.
+
+        Raises:
+            ValueError: 재개할 실행 중 상태가 없을 때
+        """
+        with self.store.lock(session_id):
+            state, source = self.store.load(session_id), "state"
+            if state is None or is_terminal(state):
+                state, source = self.store.load_checkpoint(session_id), "checkpoint"
+            if state is None or is_terminal(state):
+                raise ValueError(f"Nothing to resume: {session_id}")
+            state = _resume_impl(state, blob_store=self.blobs)
+            self.store.save(state)
+        emit_resume_event(state, source)
+        return state
+
+    def status(self, session_id: str) -> Optional[ChainState]:
+        """현재 상태 (없으면 None)"""
+        return self.store.load(session_id)
+
+    def result(self, session_id: str, role: str) -> Optional[str]:
+        """역할 결과 원문"""
+        state = self.store.load(session_id)
+        return state.get_result(role, self.blobs) if state else None
+
+    def reset(self, session_id: str) -> None:
+        with self.store.lock(session_id):
+            self.store.delete(session_id)
+
+    def version(self, session_id: str) -> object:
+        """wait_for_change 비교용 토큰"""
+        return self.store.version(session_id)
+
+    def wait_for_change(self, session_id: str, version: object = ...,
+                        timeout: Optional[float] = None) -> Optional[ChainState]:
+        """상태가 version 이후 바뀔 때까지 대기 → 새 상태 (시간 초과 시 None)
+
+        version 생략 시 호출 시점의 상태를 기준으로 한다. 놓치는 변경 없이
+        기다리려면 version()으로 받은 토큰을 넘긴다.
+        """
+        if version is ...:
+            version = self.store.version(session_id)
+        if not self.store.wait(session_id, version, timeout):
+            return None
+        return self.store.load(session_id)
+
+    # --- asyncio ---
+
+    async def start_async(self, task: str, chain: Optional[str] = None,
+                          session_id: Optional[str] = None) -> ChainState:
+        return await asyncio.to_thread(self.start, task, chain, session_id)
+
+    async def complete_async(self, session_id: str, roles: Union[str, list[str]],
+                             results: "Optional[dict[str, str | RoleResult]]" = None,
+                             result: str = "pass") -> ChainState:
+        return await asyncio.to_thread(self.complete, session_id, roles, results, result)
+
+    async def fail_async(self, session_id: str, role: str, error: str = "",
+                         retryable: Optional[bool] = None) -> tuple[ChainState, RetryDecision]:
+        return await asyncio.to_thread(self.fail, session_id, role, error, retryable)
+
+    async def status_async(self, session_id: str) -> Optional[ChainState]:
+        return await asyncio.to_thread(self.status, session_id)
+
+    async def wait_for_change_async(self, session_id: str, version: object = ...,
+                                    timeout: Optional[float] = None,
+                                    poll: float = POLL_INTERVAL) -> Optional[ChainState]:
+        """wait_for_change의 asyncio 버전 (대기자마다 스레드를 점유하지 않도록
+        저장소의 watcher fd를 이벤트 루프에 등록, 없으면 폴링)"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        watcher = self.store.watcher(session_id)
+        try:
+            if version is ...:
+                version = self.store.version(session_id)
+            fd = watcher.fileno() if watcher is not None else None
+            wakeup = asyncio.Event()
+            if fd is not None:
+                loop.add_reader(fd, wakeup.set)
+            try:
+                while self.store.version(session_id) == version:
+                    remaining = None if deadline is None else deadline - loop.time()
+                    if remaining is not None and remaining <= 0:
+                        return None
+                    if fd is None:
+                        await asyncio.sleep(poll if remaining is None else min(poll, remaining))
+                        continue
+                    step = watch.FALLBACK_INTERVAL if remaining is None else min(watch.FALLBACK_INTERVAL, remaining)
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), step)
+                    except asyncio.TimeoutError:
+                        continue
+                    wakeup.clear()
+                    watcher.drain()
+            finally:
+                if fd is not None:
+                    loop.remove_reader(fd)
+        finally:
+            if watcher is not None:
+                watcher.close()
+        return await self.status_async(session_id)
@@ -0,0 +1,234 @@
+"""
+Content-Addressed Blob Store - 역할 결과 원문 저장소
+
+ChainState.role_results에는 결과 원문 대신 참조만 저장한다:
+    {"hash": sha256 hex, "size": 원문 바이트 수, "z": zlib 압축 여부}
+
+원문은 해시 이름 파일로 한 번만 기록되고(동일 내용 중복 제거), 필요할 때
+ChainState.get_result()로 지연 로드한다. 상태 파일 크기는 결과 분량과
+무관하게 역할 수에만 비례한다.
+
+환경 변수:
+    SAGE_STATE_DIR: 저장 위치 상위 디렉토리 (기본: /tmp → /tmp/sage_blobs)
+    SAGE_BLOB_COMPRESS: zlib 압축 레벨 0-9 (기본: 6, 0이면 비압축)
+    SAGE_BLOB_MIN_COMPRESS: 압축 최소 크기 바이트 (기본: 1024)
+
+파일 배치:
+    {STATE_DIR}/sage_blobs/{hash[:2]}/{hash}      (비압축)
+    {STATE_DIR}/sage_blobs/{hash[:2]}/{hash}.z    (zlib)
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+BLOB_DIR_NAME = "sage_blobs"
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, dict) and "hash" in value and "size" in value
+
+
+def make_ref(digest: str, size: int, compressed: bool) -> dict:
+    return {"hash": digest, "size": size, "z": compressed}
+
+
+# =============================================================================
+# Blob Stores
+# =============================================================================
+
+class BlobStore:
+    """파일 기반 content-addressed 저장소"""
+
+    def __init__(self, root: Optional[Path] = None, level: Optional[int] = None,
+                 min_compress: Optional[int] = None):
+        self.root = root or Path(os.environ.get("SAGE_STATE_DIR", "/tmp")) / BLOB_DIR_NAME
+        self.level = int(os.environ.get("SAGE_BLOB_COMPRESS", "6")) if level is None else level
+        self.min_compress = (int(os.environ.get("SAGE_BLOB_MIN_COMPRESS", "1024"))
+                             if min_compress is None else min_compress)
+
+    def path_for(self, ref: dict) -> Path:
+        digest = ref["hash"]
+        return self.root / digest[:2] / (digest + (".z" if ref.get("z") else ""))
+
+    def put(self, text: str) -> dict:
+        """텍스트 저장 → 참조"""
+        return self.put_bytes(text.encode("utf-8"))
+
+    def put_bytes(self, data: bytes) -> dict:
+        digest = hashlib.sha256(data).hexdigest()
+        compress = self.level > 0 and len(data) >= self.min_compress
+        ref = make_ref(digest, len(data), compress)
+        self._write(ref, zlib.compress(data, self.level) if compress else data)
+        return ref
+
+    def open_writer(self) -> "BlobWriter":
+        """스트리밍 기록기 (원문 전체를 메모리에 두지 않음)"""
+        return BlobWriter(self)
+
+    def _write(self, ref: dict, payload: bytes) -> None:
+        if self._touch(ref):
+            return
+        sink, tmp_path = self._open_temp()
+        try:
+            with sink:
+                sink.write(payload)
+        except Exception:
+            self._discard(tmp_path)
+            raise
+        self._commit(sink, tmp_path, ref)
+
+    def _touch(self, ref: dict) -> bool:
+        """이미 있으면 정리 기준(mtime)만 갱신하고 True"""
+        path = self.path_for(ref)
+        if not path.exists():
+            return False
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def _open_temp(self) -> tuple[BinaryIO, Optional[str]]:
+        # 해시를 모르는 상태로 기록하므로 같은 파일시스템의 root에 임시 파일 생성
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        return os.fdopen(fd, "wb"), tmp_path
+
+    def _commit(self, sink: BinaryIO, tmp_path: Optional[str], ref: dict) -> None:
+        if self._touch(ref):
+            self._discard(tmp_path)
+            return
+        path = self.path_for(ref)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(tmp_path, path)  # 동시 기록 시에도 내용은 동일
+        except Exception:
+            self._discard(tmp_path)
+            raise
+
+    def _discard(self, tmp_path: Optional[str]) -> None:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def get_bytes(self, ref: dict) -> bytes:
+        """참조 → 원문 바이트 (없으면 FileNotFoundError)"""
+        payload = self.path_for(ref).read_bytes()
+        return zlib.decompress(payload) if ref.get("z") else payload
+
+    def get(self, ref: dict) -> str:
+        return self.get_bytes(ref).decode("utf-8")
+
+    def exists(self, ref: dict) -> bool:
+        return self.path_for(ref).exists()
+
+
+class MemoryBlobStore(BlobStore):
+    """메모리 저장소 (시뮬레이터/재생/테스트용, 디스크 기록 없음)"""
+
+    def __init__(self, level: int = 0, min_compress: int = 1024):
+        super().__init__(level=level, min_compress=min_compress)
+        self._blobs: dict[str, bytes] = {}
+
+    def _write(self, ref: dict, payload: bytes) -> None:
+        self._blobs.setdefault(ref["hash"], payload)
+
+    def _open_temp(self) -> tuple[BinaryIO, Optional[str]]:
+        return _KeepOpenBytesIO(), None
+
+    def _commit(self, sink: BinaryIO, tmp_path: Optional[str], ref: dict) -> None:
+        self._blobs.setdefault(ref["hash"], sink.getvalue())
+
+    def get_bytes(self, ref: dict) -> bytes:
+        try:
+            payload = self._blobs[ref["hash"]]
+        except KeyError:
+            raise FileNotFoundError(ref["hash"]) from None
+        return zlib.decompress(payload) if ref.get("z") else payload
+
+    def exists(self, ref: dict) -> bool:
+        return ref["hash"] in self._blobs
+
+
+class _KeepOpenBytesIO(io.BytesIO):
+    """close() 후에도 getvalue() 가능한 BytesIO (MemoryBlobStore 기록용)"""
+
+    def close(self) -> None:
+        pass
+
+
+# =============================================================================
+# Streaming Writer
+# =============================================================================
+
+class BlobWriter:
+    """청크 단위 해시/압축 기록기
+
+    min_compress 바이트까지는 버퍼링해 작은 결과는 put_bytes()와 같은 형식으로
+    저장하고, 그 이상이면 임시 파일에 zlib 스트림으로 기록한 뒤 해시 이름으로
+    rename한다.
+    """
+
+    def __init__(self, store: BlobStore):
+        self.store = store
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._head = bytearray()
+        self._sink: Optional[BinaryIO] = None
+        self._tmp_path: Optional[str] = None
+        self._z = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        self._hash.update(data)
+        self._size += len(data)
+        if self._sink is None:
+            self._head += data
+            if len(self._head) < max(self.store.min_compress, 1):
+                return
+            self._sink, self._tmp_path = self.store._open_temp()
+            if self.store.level > 0:
+                self._z = zlib.compressobj(self.store.level)
+            data, self._head = bytes(self._head), bytearray()
+        self._sink.write(self._z.compress(data) if self._z else data)
+
+    def close(self) -> dict:
+        """기록 완료 → 참조"""
+        if self._sink is None:
+            return self.store.put_bytes(bytes(self._head))
+        if self._z:
+            self._sink.write(self._z.flush())
+        self._sink.close()
+        ref = make_ref(self._hash.hexdigest(), self._size, self._z is not None)
+        self.store._commit(self._sink, self._tmp_path, ref)
+        return ref
+
+    def abort(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+            self.store._discard(self._tmp_path)
+
+
+_blob_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """프로세스 단위 기본 파일 저장소"""
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = BlobStore()
+    return _blob_store
@@ -0,0 +1,602 @@
+"""
+Circuit Breaker State - 역할별 슬라이딩 윈도우 오류율 + half-open 복구
+
+역할마다 회로 하나를 두고, 최근 window 초를 buckets개 시간 버킷으로 나눈 링 버퍼에
+오류/성공 수를 누적한다 (합계를 함께 유지하므로 이벤트당 O(1), 오래된 버킷은
+시계가 넘어갈 때 비운다).
+
+    closed    → 윈도우 내 호출 ≥ min_calls 이고 오류율 ≥ error_rate 이면 open
+    open      → cooldown 동안 거부, 지나면 다음 allow()가 half-open으로 전환
+                (allow()를 거치지 않는 hook은 cooldown 뒤 첫 record_error가 탐침 실패로 재트립)
+    half_open → 탐침(probe) 1건만 통과, 성공하면 closed / 실패하면 다시 open
+
+cooldown은 적응형이다: 복구 직후(윈도우 안) 다시 트립되거나 탐침이 실패할
+때마다 두 배가 되고(max_cooldown 상한), 윈도우 이상 정상 동작한 뒤의 트립은
+기본값부터 다시 시작한다.
+
+오케스트레이터는 역할 실패 처리 결과를 여기에 기록한다:
+
+    재시도 예약        → record_retry   (오류율에 넣지 않음)
+    재시도 소진/영구 오류 → record_error (오류 +1, 트립 판정)
+    역할 완료          → record_success (성공 +1, half-open이면 closed)
+
+파일 (.lock으로 직렬화):
+    sage_circuit_breaker_{session}.ring  회로 (고정 레이아웃, 아래)
+    sage_circuit_breaker_{session}.json  Stop hook(circuit_breaker_check.py)이 쓰는
+                                         role_loop_counts 등 - 이 모듈은 status()에서만 읽음
+
+.ring 레이아웃 (정수 / 실수는 little endian, 시각은 epoch 초, 없으면 NaN):
+
+    헤더  HEADER (매직 b"SAGEBRK1", 버전, 버킷 수, 슬롯 수, 사용 슬롯 수, 연속 오류 수,
+          마지막 오류 시각, 가장 늦은 open_until, 그 역할의 트립 오류율, 그 역할 이름)
+          + 마지막 오류 메시지 MESSAGE_BYTES
+    슬롯  SLOT (역할 이름, 상태, trips, 재시도 수, head, err, ok, trip_rate,
+          open_until, probe_at, closed_at) + 오류 버킷 u32 × N + 성공 버킷 u32 × N
+
+슬롯은 역할 이름 crc32로 찾는 open addressing 해시 테이블이다 (선형 탐사, 4분의 3이
+차면 두 배로 다시 만듦). 기록은 락 아래에서 헤더와 해당 역할 슬롯만 pread / pwrite
+하므로 비용이 세션의 역할 수와 무관하다. 세션 전체의 tripped는 헤더의 가장 늦은
+open_until과 비교한다 (open이 아닌 회로의 open_until은 이미 지났으므로 같은 판정).
+버킷 수(SAGE_BREAKER_BUCKETS)가 바뀌거나 이전 형식이면 회로를 새로 시작한다.
+
+환경 변수 (훅과 공유):
+    SAGE_BREAKER_WINDOW: 오류율 윈도우 (초, 기본: 60)
+    SAGE_BREAKER_BUCKETS: 윈도우 버킷 수 (기본: 12)
+    SAGE_BREAKER_ERROR_RATE: 트립 오류율 (0-1, 기본: 0.5)
+    SAGE_BREAKER_MIN_CALLS: 트립 판정 최소 호출 수 (기본: SAGE_MAX_ERRORS 또는 3)
+    SAGE_COOLDOWN: 첫 트립 cooldown (초, 기본: 60)
+    SAGE_BREAKER_MAX_COOLDOWN: cooldown 상한 (초, 기본: 900)
+    SAGE_STATE_DIR: 상태 디렉토리 (기본: /tmp)
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import math
+import os
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .events import emit as emit_event
+
+# 역할 없이 기록된 오류/성공 (훅 등)
+SESSION_ROLE = "*"
+
+RING_SUFFIX = ".ring"
+MAGIC = b"SAGEBRK1"
+RING_VERSION = 1
+ROLE_BYTES = 48
+MESSAGE_BYTES = 256
+HEADER = struct.Struct(f"<8sHHIIIddf{ROLE_BYTES}s")
+HEADER_SIZE = HEADER.size + MESSAGE_BYTES
+SLOT = struct.Struct(f"<{ROLE_BYTES}sBxHIqIIfddd")
+SLOT_STATE = ROLE_BYTES  # 슬롯 내 상태 바이트 위치 (0이면 빈 슬롯)
+INITIAL_SLOTS = 32
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+_CODES = {CircuitState.CLOSED: 1, CircuitState.OPEN: 2, CircuitState.HALF_OPEN: 3}
+_STATES = {code: name for name, code in _CODES.items()}
+
+
+@dataclass(frozen=True)
+class BreakerSettings:
+    window_s: float = 60.0
+    buckets: int = 12
+    error_rate: float = 0.5
+    min_calls: int = 3
+    cooldown_s: float = 60.0
+    max_cooldown_s: float = 900.0
+
+    @classmethod
+    def from_env(cls) -> "BreakerSettings":
+        env = os.environ.get
+        return cls(
+            window_s=max(1.0, float(env("SAGE_BREAKER_WINDOW", "60"))),
+            buckets=min(0xFFFF, max(1, int(env("SAGE_BREAKER_BUCKETS", "12")))),
+            error_rate=float(env("SAGE_BREAKER_ERROR_RATE", "0.5")),
+            min_calls=max(1, int(env("SAGE_BREAKER_MIN_CALLS", env("SAGE_MAX_ERRORS", "3")))),
+            cooldown_s=float(env("SAGE_COOLDOWN", "60")),
+            max_cooldown_s=float(env("SAGE_BREAKER_MAX_COOLDOWN", "900")),
+        )
+
+    @property
+    def bucket_s(self) -> float:
+        return self.window_s / self.buckets
+
+    def cooldown(self, trips: int) -> float:
+        """trips번째 연속 트립의 cooldown (1부터)"""
+        return min(self.max_cooldown_s, self.cooldown_s * 2 ** max(0, trips - 1))
+
+
+def breaker_path(session_id: str, state_dir: Optional[Path] = None) -> Path:
+    directory = Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    if session_id:
+        return directory / f"sage_circuit_breaker_{session_id}.json"
+    return directory / "sage_circuit_breaker.json"
+
+
+def ring_path(session_id: str, state_dir: Optional[Path] = None) -> Path:
+    return breaker_path(session_id, state_dir).with_suffix(RING_SUFFIX)
+
+
+def _initial() -> dict:
+    return {
+        "consecutive_errors": 0,
+        "role_loop_counts": {},
+        "last_error_time": None,
+        "tripped": False,
+        "trip_reason": None,
+    }
+
+
+def load(session_id: str, state_dir: Optional[Path] = None) -> dict:
+    """훅과 공유하는 JSON 상태 (role_loop_counts 등, 회로는 .ring)"""
+    try:
+        return json.loads(breaker_path(session_id, state_dir).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return _initial()
+
+
+# =============================================================================
+# .ring 파일
+# =============================================================================
+
+def _role_key(role: str) -> bytes:
+    key = role.encode("utf-8")
+    if len(key) > ROLE_BYTES:  # 긴 이름은 앞부분 + crc로 고정 길이
+        key = key[:ROLE_BYTES - 9] + f"~{zlib.crc32(key):08x}".encode()
+    return key
+
+
+def _time(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _nan(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+class _Ring:
+    """회로 파일 (fd는 호출자가 .lock을 잡은 상태로 연다)"""
+
+    def __init__(self, fd: int, buckets: int, writable: bool):
+        self.fd = fd
+        self.buckets = buckets
+        self.ring = struct.Struct(f"<{2 * buckets}I")
+        self.slot_size = SLOT.size + self.ring.size
+        self._slots: dict[str, int] = {}
+        raw = os.pread(fd, HEADER_SIZE, 0)
+        fields = HEADER.unpack_from(raw) if len(raw) == HEADER_SIZE else None
+        if fields is None or fields[0] != MAGIC or fields[1] != RING_VERSION or fields[2] != buckets:
+            self.capacity = self.used = self.consecutive_errors = 0
+            self.last_error_time = self.open_until = math.nan
+            self.trip_rate, self.trip_role, self.last_error = 0.0, "", None
+            if writable:
+                self._format(INITIAL_SLOTS)
+            return
+        (_, _, _, self.capacity, self.used, self.consecutive_errors, self.last_error_time,
+         self.open_until, self.trip_rate, trip_role) = fields
+        self.trip_role = trip_role.rstrip(b"\0").decode("utf-8", "replace")
+        message = raw[HEADER.size:].rstrip(b"\0")
+        self.last_error = message.decode("utf-8", "replace") if message else None
+
+    def _offset(self, index: int) -> int:
+        return HEADER_SIZE + index * self.slot_size
+
+    def _format(self, capacity: int) -> None:
+        """빈 슬롯 capacity개로 다시 만듦 (헤더 값은 유지)"""
+        os.ftruncate(self.fd, 0)
+        os.ftruncate(self.fd, self._offset(capacity))
+        self.capacity, self.used = capacity, 0
+        self._slots = {}
+        self.write_header()
+
+    def write_header(self) -> None:
+        message = (self.last_error or "").encode("utf-8")[:MESSAGE_BYTES]
+        os.pwrite(self.fd, HEADER.pack(MAGIC, RING_VERSION, self.buckets, self.capacity, self.used,
+                                       self.consecutive_errors, self.last_error_time, self.open_until,
+                                       self.trip_rate, _role_key(self.trip_role))
+                  + message.ljust(MESSAGE_BYTES, b"\0"), 0)
+
+    # --- 슬롯 ---
+
+    def _find(self, key: bytes) -> tuple[int, Optional[bytes]]:
+        """key의 슬롯 (번호, 기록) - 없으면 (삽입할 빈 슬롯 번호, None)"""
+        if not self.capacity:
+            return -1, None
+        index = zlib.crc32(key) % self.capacity
+        for _ in range(self.capacity):
+            raw = os.pread(self.fd, self.slot_size, self._offset(index))
+            if len(raw) < self.slot_size or raw[SLOT_STATE] == 0:
+                return index, None
+            if raw[:ROLE_BYTES].rstrip(b"\0") == key:
+                return index, raw
+            index = (index + 1) % self.capacity
+        return -1, None
+
+    def _decode(self, raw: bytes) -> dict:
+        (_, code, trips, retries, head, err, ok, trip_rate,
+         open_until, probe_at, closed_at) = SLOT.unpack_from(raw)
+        counts = self.ring.unpack_from(raw, SLOT.size)
+        return {
+            "state": _STATES.get(code, CircuitState.CLOSED),
+            "head": head,
+            "e": list(counts[:self.buckets]),
+            "s": list(counts[self.buckets:]),
+            "err": err,
+            "ok": ok,
+            "trips": trips,
+            "retries": retries,
+            "trip_rate": round(trip_rate, 3),
+            "open_until": open_until,
+            "probe_at": _time(probe_at),
+            "closed_at": _time(closed_at),
+        }
+
+    def _encode(self, role: str, circuit: dict) -> bytes:
+        return SLOT.pack(_role_key(role), _CODES[circuit["state"]], min(circuit["trips"], 0xFFFF),
+                         circuit.get("retries", 0), circuit["head"], circuit["err"], circuit["ok"],
+                         circuit.get("trip_rate", 0.0), circuit["open_until"],
+                         _nan(circuit["probe_at"]), _nan(circuit["closed_at"])) \
+            + self.ring.pack(*circuit["e"], *circuit["s"])
+
+    def get(self, role: str) -> Optional[dict]:
+        index, raw = self._find(_role_key(role))
+        if raw is None:
+            return None
+        self._slots[role] = index
+        return self._decode(raw)
+
+    def put(self, role: str, circuit: dict) -> None:
+        index = self._slots.get(role)
+        if index is None:
+            index, raw = self._find(_role_key(role))
+            if raw is None:
+                if (self.used + 1) * 4 > self.capacity * 3:
+                    self._grow()
+                    index, _ = self._find(_role_key(role))
+                self.used += 1
+                self.write_header()
+            self._slots[role] = index
+        os.pwrite(self.fd, self._encode(role, circuit), self._offset(index))
+
+    def _grow(self) -> None:
+        circuits = list(self.items())
+        self._format(max(INITIAL_SLOTS, self.capacity * 2))
+        for role, circuit in circuits:
+            self.put(role, circuit)
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        """모든 회로 (테이블 한 번에 읽음 - status 등 읽기 전용 경로)"""
+        table = os.pread(self.fd, self.capacity * self.slot_size, HEADER_SIZE) if self.capacity else b""
+        for offset in range(0, len(table) - self.slot_size + 1, self.slot_size):
+            raw = table[offset:offset + self.slot_size]
+            if raw[SLOT_STATE]:
+                yield raw[:ROLE_BYTES].rstrip(b"\0").decode("utf-8", "replace"), self._decode(raw)
+
+    # --- 세션 요약 ---
+
+    def tripped(self, now: float) -> bool:
+        return not math.isnan(self.open_until) and now < self.open_until
+
+    def trip_reason(self, now: float) -> Optional[str]:
+        if not self.tripped(now):
+            return None
+        return (f"역할 '{self.trip_role}' 오류율 {self.trip_rate:.0%} "
+                f"(cooldown {self.open_until - now:.0f}s)")
+
+    def summary(self, now: float) -> dict:
+        return {"tripped": self.tripped(now), "trip_reason": self.trip_reason(now),
+                "consecutive_errors": self.consecutive_errors}
+
+
+@contextmanager
+def _ring(session_id: str, state_dir: Optional[Path], settings: "BreakerSettings",
+          write: bool = True) -> Iterator[Optional[_Ring]]:
+    """.lock 아래에서 회로 파일 열기 (write면 배타 락 + 없으면 생성, 아니면 공유 락 / 없으면 None)"""
+    path = ring_path(session_id, state_dir)
+    if not write and not path.exists():
+        yield None
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(breaker_path(session_id, state_dir).with_suffix(".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+        try:
+            try:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT if write else os.O_RDONLY, 0o644)
+            except FileNotFoundError:
+                yield None
+                return
+            try:
+                yield _Ring(fd, settings.buckets, write)
+            finally:
+                os.close(fd)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# =============================================================================
+# 역할 회로 (링 버퍼)
+# =============================================================================
+
+def _circuit(ring: _Ring, role: str, settings: BreakerSettings, now: float) -> dict:
+    """역할 회로 (없으면 새로 만듦) + 현재 버킷까지 전진 (저장은 ring.put)"""
+    circuit = ring.get(role)
+    if circuit is None:
+        circuit = {
+            "state": CircuitState.CLOSED,
+            "head": int(now // settings.bucket_s),
+            "e": [0] * settings.buckets,
+            "s": [0] * settings.buckets,
+            "err": 0,
+            "ok": 0,
+            "trips": 0,
+            "retries": 0,
+            "open_until": 0.0,
+            "probe_at": None,
+            "closed_at": None,
+        }
+    _advance(circuit, int(now // settings.bucket_s))
+    return circuit
+
+
+def _advance(circuit: dict, bucket: int) -> None:
+    """head 다음부터 bucket까지의 버킷을 비움 (버킷 수 이하의 상수 시간)"""
+    head = circuit["head"]
+    if bucket <= head:
+        return
+    errors, successes = circuit["e"], circuit["s"]
+    size = len(errors)
+    if bucket - head >= size:
+        errors[:] = [0] * size
+        successes[:] = [0] * size
+        circuit["err"] = circuit["ok"] = 0
+    else:
+        for index in range(head + 1, bucket + 1):
+            slot = index % size
+            circuit["err"] -= errors[slot]
+            circuit["ok"] -= successes[slot]
+            errors[slot] = successes[slot] = 0
+    circuit["head"] = bucket
+
+
+def _error_rate(circuit: dict) -> float:
+    calls = circuit["err"] + circuit["ok"]
+    return circuit["err"] / calls if calls else 0.0
+
+
+def _open(circuit: dict, settings: BreakerSettings, now: float) -> float:
+    """open 전환 → cooldown 반환"""
+    flapping = circuit["state"] == CircuitState.HALF_OPEN or (
+        circuit["closed_at"] is not None and now - circuit["closed_at"] < settings.window_s
+    )
+    circuit["trips"] = circuit["trips"] + 1 if flapping else 1
+    cooldown = settings.cooldown(circuit["trips"])
+    circuit["state"] = CircuitState.OPEN
+    circuit["open_until"] = now + cooldown
+    circuit["probe_at"] = None
+    return cooldown
+
+
+def _close(circuit: dict, now: float) -> None:
+    """탐침 성공 → closed (트립 전 오류가 곧바로 재트립시키지 않도록 윈도우 초기화)"""
+    size = len(circuit["e"])
+    circuit["state"] = CircuitState.CLOSED
+    circuit["e"], circuit["s"] = [0] * size, [0] * size
+    circuit["err"] = circuit["ok"] = 0
+    circuit["probe_at"] = None
+    circuit["closed_at"] = now
+
+
+def _probe_pending(circuit: dict, settings: BreakerSettings, now: float) -> bool:
+    """half-open 탐침이 진행 중인지 (직전 cooldown보다 오래되면 유실로 간주)"""
+    probe_at = circuit.get("probe_at")
+    return probe_at is not None and now - probe_at < settings.cooldown(circuit["trips"])
+
+
+def _denies(circuit: dict, settings: BreakerSettings, now: float) -> bool:
+    if circuit["state"] == CircuitState.OPEN:
+        return now < circuit["open_until"]
+    if circuit["state"] == CircuitState.HALF_OPEN:
+        return _probe_pending(circuit, settings, now)
+    return False
+
+
+def _note_trip(ring: _Ring, role: str, circuit: dict) -> None:
+    """세션 tripped 판정용 헤더 갱신 (가장 늦게 끝나는 open 회로)"""
+    if math.isnan(ring.open_until) or circuit["open_until"] >= ring.open_until:
+        ring.open_until = circuit["open_until"]
+        ring.trip_rate = circuit.get("trip_rate", 1.0)
+        ring.trip_role = role
+
+
+# =============================================================================
+# 기록
+# =============================================================================
+
+def record_error(session_id: str, message: str = "", role: str = "",
+                 state_dir: Optional[Path] = None, now: Optional[float] = None,
+                 settings: Optional[BreakerSettings] = None) -> dict:
+    """복구되지 않은 역할 실패 (윈도우 오류 +1, 트립 판정) → 세션 요약"""
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    role = role or SESSION_ROLE
+    tripped: dict = {}
+
+    with _ring(session_id, state_dir, settings) as ring:
+        circuit = _circuit(ring, role, settings, now)
+        slot = circuit["head"] % settings.buckets
+        circuit["e"][slot] += 1
+        circuit["err"] += 1
+        ring.consecutive_errors += 1
+        ring.last_error_time = now
+        ring.last_error = message
+        rate = _error_rate(circuit)
+        if circuit["state"] == CircuitState.OPEN and now >= circuit["open_until"]:
+            # allow()를 거치지 않는 호출자(hook)의 오류 = cooldown 뒤의 탐침 실패
+            circuit["state"] = CircuitState.HALF_OPEN
+        if circuit["state"] == CircuitState.HALF_OPEN or (
+            circuit["state"] == CircuitState.CLOSED
+            and circuit["err"] + circuit["ok"] >= settings.min_calls
+            and rate >= settings.error_rate
+        ):
+            probe = circuit["state"] == CircuitState.HALF_OPEN
+            circuit["trip_rate"] = round(rate, 3)
+            tripped.update(cooldown=_open(circuit, settings, now), rate=rate, probe=probe,
+                           calls=circuit["err"] + circuit["ok"], trips=circuit["trips"])
+            _note_trip(ring, role, circuit)
+        ring.put(role, circuit)
+        ring.write_header()
+        state = ring.summary(now)
+
+    if tripped:
+        emit_event("breaker_trip", session_id, reason=state["trip_reason"], role=role,
+                   error_rate=round(tripped["rate"], 3), calls=tripped["calls"], probe=tripped["probe"],
+                   trips=tripped["trips"], cooldown_s=round(tripped["cooldown"], 1))
+    emit_event("error", session_id, kind="role", role=role, message=message[:500],
+               consecutive=state["consecutive_errors"], tripped=state["tripped"])
+    return state
+
+
+def record_retry(session_id: str, role: str, message: str = "",
+                 state_dir: Optional[Path] = None, now: Optional[float] = None,
+                 settings: Optional[BreakerSettings] = None) -> dict:
+    """재시도 예약된 일시적 오류 (오류율에 넣지 않고 역할 재시도 수만 +1) → 세션 요약"""
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    with _ring(session_id, state_dir, settings) as ring:
+        circuit = _circuit(ring, role, settings, now)
+        circuit["retries"] = circuit.get("retries", 0) + 1
+        ring.put(role, circuit)
+        return ring.summary(now)
+
+
+def record_success(session_id: str, roles: Optional[list[str]] = None,
+                   state_dir: Optional[Path] = None, now: Optional[float] = None,
+                   settings: Optional[BreakerSettings] = None) -> dict:
+    """역할 완료 (윈도우 성공 +1, half-open이면 closed) → 세션 요약
+
+    오류도 재시도도 없었던 세션은 파일을 만들지 않는다. 성공만 있는 윈도우는
+    트립 판정에 영향이 없으므로 완료마다 쓰기 비용을 치르지 않는다.
+    """
+    if not ring_path(session_id, state_dir).exists():
+        return {"tripped": False, "trip_reason": None, "consecutive_errors": 0}
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    closed: list[str] = []
+
+    with _ring(session_id, state_dir, settings) as ring:
+        for role in roles or [SESSION_ROLE]:
+            circuit = _circuit(ring, role, settings, now)
+            if circuit["state"] == CircuitState.HALF_OPEN:
+                _close(circuit, now)
+                closed.append(role)
+            circuit["s"][circuit["head"] % settings.buckets] += 1
+            circuit["ok"] += 1
+            ring.put(role, circuit)
+        if ring.consecutive_errors or ring.last_error is not None:
+            ring.consecutive_errors = 0
+            ring.last_error = None
+            ring.write_header()
+        state = ring.summary(now)
+
+    for role in closed:
+        emit_event("breaker_close", session_id, role=role)
+    return state
+
+
+# =============================================================================
+# 판정
+# =============================================================================
+
+def allow(session_id: str, role: str, state_dir: Optional[Path] = None,
+          now: Optional[float] = None, settings: Optional[BreakerSettings] = None) -> bool:
+    """role 실행(재시도 포함)을 허용하는지
+
+    cooldown이 끝난 open 회로는 여기서 half-open으로 전환되고, 호출자가
+    탐침 1건을 받는다. 전환이 없으면 파일을 쓰지 않는다.
+    """
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    with _ring(session_id, state_dir, settings, write=False) as ring:
+        circuit = ring.get(role) if ring is not None else None
+    if circuit is None or circuit["state"] == CircuitState.CLOSED:
+        return True
+    if _denies(circuit, settings, now):
+        return False
+
+    granted: dict = {}
+    with _ring(session_id, state_dir, settings) as ring:
+        current = ring.get(role)
+        if current is None or current["state"] == CircuitState.CLOSED:
+            granted["ok"] = True
+        elif not _denies(current, settings, now):
+            current["state"] = CircuitState.HALF_OPEN
+            current["probe_at"] = now
+            ring.put(role, current)
+            granted["ok"] = granted["probe"] = True
+    if granted.get("probe"):
+        emit_event("breaker_half_open", session_id, role=role, trips=circuit["trips"])
+    return bool(granted.get("ok"))
+
+
+def is_open(session_id: str, role: Optional[str] = None, state_dir: Optional[Path] = None,
+            now: Optional[float] = None, settings: Optional[BreakerSettings] = None) -> bool:
+    """거부 중인지 (읽기 전용, role 생략 시 cooldown 중인 역할이 하나라도 있으면 True)"""
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    with _ring(session_id, state_dir, settings, write=False) as ring:
+        if ring is None:
+            return False
+        if role is None:
+            return ring.tripped(now)
+        circuit = ring.get(role)
+    return circuit is not None and _denies(circuit, settings, now)
+
+
+def status(session_id: str, state_dir: Optional[Path] = None, now: Optional[float] = None,
+           settings: Optional[BreakerSettings] = None) -> dict:
+    """세션 / 역할별 회로 요약"""
+    settings = settings or BreakerSettings.from_env()
+    now = time.time() if now is None else now
+    roles, retries = {}, {}
+    summary = {"tripped": False, "trip_reason": None, "consecutive_errors": 0}
+    with _ring(session_id, state_dir, settings, write=False) as ring:
+        if ring is not None:
+            summary = ring.summary(now)
+            circuits = list(ring.items())
+        else:
+            circuits = []
+    for role, circuit in circuits:
+        _advance(circuit, int(now // settings.bucket_s))
+        if circuit["retries"]:
+            retries[role] = circuit["retries"]
+        roles[role] = {
+            "state": circuit["state"],
+            "errors": circuit["err"],
+            "successes": circuit["ok"],
+            "error_rate": round(_error_rate(circuit), 3),
+            "trips": circuit["trips"],
+            "open_for_s": round(max(0.0, circuit["open_until"] - now), 1)
+            if circuit["state"] == CircuitState.OPEN else 0.0,
+        }
+    return {
+        **summary,
+        "role_loop_counts": load(session_id, state_dir).get("role_loop_counts", {}),
+        "role_retries": retries,
+        "roles": roles,
+    }
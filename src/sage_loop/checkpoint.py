@@ -0,0 +1,86 @@
+"""
+Chain Checkpoints - 실행 중 체인의 크래시 안전 스냅샷
+
+상태 파일은 전이마다 temp → rename으로 교체되고, 체인이 종료(승인/거부)되거나
+--reset / 감독 루프 timeout이 일어나면 그 세션의 진행 내용은 되살릴 수 없다.
+체크포인트는 "마지막으로 기록된 실행 중 상태"를 별도 이름으로 유지한다:
+
+    {STATE_DIR}/sage_checkpoint_{session}.json
+
+상태 파일을 쓸 때(write_state_file) 실행 중 상태면 rename 직전의 temp 파일을
+체크포인트 이름에 하드 링크한다. 내용을 다시 쓰지 않으므로 추가 비용은 링크와
+rename 한 번이고, 상태 파일이 종료 상태로 교체되거나 삭제되어도 체크포인트는
+직전 inode를 계속 가리킨다. 하드 링크를 지원하지 않는 파일 시스템이면 복사한다.
+
+정상 종료(역할 결과로 승인/거부) 시에는 오케스트레이터가 체크포인트를 지운다.
+감독 루프 timeout이나 프로세스 종료로 끊긴 체인은 남아 있으므로
+`sage-orchestrator --resume SESSION`으로 이어서 실행할 수 있다.
+
+환경 변수:
+    SAGE_CHECKPOINT: off 이면 체크포인트를 남기지 않음 (기본: on)
+
+fsync 여부는 상태 파일과 같이 SAGE_DURABILITY를 따른다 (durability.py).
+none 모드는 temp 파일이 없으므로 같은 내용을 체크포인트에 한 번 더 쓴다.
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+STATE_PREFIX = "sage_state_"
+CHECKPOINT_PREFIX = "sage_checkpoint_"
+
+
+def checkpoint_enabled() -> bool:
+    return os.environ.get("SAGE_CHECKPOINT", "on").strip().lower() not in ("0", "off", "false", "no")
+
+
+def checkpoint_for(state_path: Path) -> Path:
+    """상태 파일 경로 → 짝이 되는 체크포인트 경로"""
+    name = state_path.name
+    if name.startswith(STATE_PREFIX):
+        name = name[len(STATE_PREFIX):]
+    return state_path.with_name(CHECKPOINT_PREFIX + name)
+
+
+def checkpoint_path(session_id: str, state_dir: Optional[Path] = None) -> Path:
+    directory = Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    return directory / f"{CHECKPOINT_PREFIX}{session_id}.json"
+
+
+def snapshot(src: Path, dest: Path) -> None:
+    """src(완성된 temp 파일)를 dest에 원자적으로 게시 (하드 링크, 불가하면 복사)"""
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def remove(state_path: Path) -> None:
+    """정상 종료 / --reset 시 체크포인트 삭제"""
+    checkpoint_for(state_path).unlink(missing_ok=True)
+
+
+def list_checkpoints(state_dir: Optional[Path] = None) -> list[str]:
+    """체크포인트가 남아 있는 세션 ID (최근 것부터)"""
+    directory = Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    try:
+        entries = [entry for entry in os.scandir(directory)
+                   if entry.name.startswith(CHECKPOINT_PREFIX) and entry.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
+    found = []
+    for entry in entries:
+        try:
+            found.append((entry.stat().st_mtime, entry.name[len(CHECKPOINT_PREFIX):-len(".json")]))
+        except FileNotFoundError:  # 확인 사이 삭제됨
+            continue
+    return [session_id for _, session_id in sorted(found, reverse=True)]
@@ -19,20 +19,43 @@ Sage Orchestrator v4 - 병렬 실행 지원
 from __future__ import annotations
 
 import argparse
+import copy
 import fcntl
 import json
 import os
+import select
 import sys
-import tempfile
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 import yaml
 
+from ..blobs import BlobStore, get_blob_store, is_blob_ref
+from ..events import get_event_log
+from ..heartbeat import beat, clear_beats
+from ..ingest import (
+    CONDITION_PATTERNS,
+    RoleResult,
+    conditions_for,
+    ingest_file,
+    ingest_stream,
+    parse_result_files,
+    read_results_jsonl,
+    verdict_keywords,
+)
+from .. import breaker
+from .. import checkpoint, codec, durability, snapshot, watch
+from ..deps import dependencies, inputs_digest, select_inputs
+from ..memo import ResultCache, get_result_cache, result_digest, task_digest
+from ..profiling import profiled
+from ..registry import clear_current, current_namespace, list_current, read_current, write_current
+from ..retry import RetryDecision, RetryPolicies, decide
+from ..trace import config_digest, normalize_state, record_call, recording_enabled
 # 세션 ID 생성은 session.py에서 통합 관리
 from ..session import generate_session_id as _generate_session_id
 
@@ -43,7 +66,7 @@ from ..session import generate_session_id as _generate_session_id
 
 STATE_DIR = Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
 CONFIG_PATH = Path(__file__).resolve().parent / "config.yaml"
-CURRENT_SESSION_FILE = STATE_DIR / "sage_current_session"
+CURRENT_SESSION_FILE = STATE_DIR / "sage_current_session"  # SAGE_NAMESPACE=global 포인터
 
 
 class ChainStatus(str, Enum):
@@ -103,6 +126,8 @@ class PhaseItem:
     index: int
     roles: list[str]  # 단일 역할이면 [role], 병렬이면 [role1, role2]
     is_parallel: bool = False
+    max_concurrency: int = 0  # 병렬 그룹 동시 실행 수 (0이면 전부)
+    stagger_ms: int = 0  # 함께 배출된 역할 간 시작 간격
 
     @property
     def display_name(self) -> str:
@@ -124,15 +149,17 @@ class ChainState:
 
     # 완료 추적
     completed_phases: list[int] = field(default_factory=list)
-    pending_roles: list[str] = field(default_factory=list)  # 병렬 대기 중
+    pending_roles: list[str] = field(default_factory=list)  # 실행 중 (병렬이면 max_concurrency 이하)
+    queued_roles: list[str] = field(default_factory=list)  # 병렬 중 아직 배출되지 않은 것
     completed_parallel: list[str] = field(default_factory=list)  # 병렬 중 완료된 것
+    released_roles: list[str] = field(default_factory=list)  # 직전 전이에서 새로 실행 시작된 것
 
     # 분기 상태
     branch_active: Optional[str] = None
     branch_return_phase: Optional[int] = None
     branch_loops: dict = field(default_factory=dict)
 
-    # 역할별 결과 저장
+    # 역할별 결과 참조 {"hash", "size", "z"} (원문은 blobs.py, 구버전 상태는 원문 문자열)
     role_results: dict = field(default_factory=dict)
 
     # 조건부 승인 조건 수집 (방안 B)
@@ -142,91 +169,172 @@ class ChainState:
     started_at: str = ""
     exit_reason: str = ""
 
+    # 대기 역할별 시작 시각 (epoch 초, 이벤트 로그의 역할 소요 시간 계산용)
+    # stagger_ms가 있으면 함께 배출된 역할은 간격만큼 늦은 예정 시각
+    role_started_at: dict = field(default_factory=dict)
+
+    # 실행 중 역할별 supervisor reissue 횟수 (완료 시 제거)
+    role_attempts: dict = field(default_factory=dict)
+    # 실행 중 역할별 --fail 재시도 횟수 (retry 정책, 완료 시 제거) - reissue와 별도 예산
+    role_retries: dict = field(default_factory=dict)
+
+    # 직전 전이에서 결과 캐시 적중으로 즉시 완료된 역할 (memo.py)
+    memo_hits: list = field(default_factory=list)
+    # 세션 누적 캐시 조회/적중 수 {"lookups": n, "hits": n}
+    memo_stats: dict = field(default_factory=dict)
+
+    # (페이즈, 역할)별 마지막 실행의 입력 다이제스트 {"페이즈:역할": digest} (deps.py)
+    # 분기 복귀 시 입력이 그대로인 역할은 다시 실행하지 않고 기존 결과를 재사용
+    role_inputs: dict = field(default_factory=dict)
+    # 직전 전이에서 입력 불변으로 재사용된 역할
+    reused_roles: list = field(default_factory=list)
+
     def to_dict(self) -> dict:
         return asdict(self)
 
+    def result_ref(self, role: str) -> Optional[dict]:
+        """역할 결과 참조 (구버전 원문 문자열이면 None)"""
+        value = self.role_results.get(role)
+        return value if is_blob_ref(value) else None
+
+    def get_result(self, role: str, store: Optional[BlobStore] = None) -> Optional[str]:
+        """역할 결과 원문 (참조면 저장소에서 지연 로드)"""
+        value = self.role_results.get(role)
+        if value is None or isinstance(value, str):
+            return value
+        return (store or get_blob_store()).get(value)
+
     @classmethod
     def from_dict(cls, data: dict) -> "ChainState":
         return cls(**data)
 
 
+def _contains(result: "str | RoleResult", keyword: str) -> bool:
+    """판정 키워드 포함 여부 (문자열 결과는 호출자가 미리 소문자화)"""
+    if isinstance(result, RoleResult):
+        return keyword.lower() in result.matched
+    return keyword.lower() in result
+
+
+def _result_size(result: "str | RoleResult") -> int:
+    if isinstance(result, RoleResult):
+        return result.size
+    return len(result.encode("utf-8"))
+
+
 # =============================================================================
 # Session Management
 # =============================================================================
 
 
+# 이 프로세스가 시작/사용 중인 세션 (환경 변수 대신, 다른 체인의 포인터 교체에 영향받지 않음)
+_active_session: str = ""
+
+
 def get_session_id(create_new: bool = False) -> str:
-    """세션 ID 획득"""
+    """세션 ID 획득
+
+    우선순위: SAGE_SESSION_ID → 이 프로세스의 활성 세션 → 네임스페이스 포인터 → 새 ID
+    """
+    global _active_session
     if not create_new:
-        # 1. 환경 변수
-        env_id = os.environ.get("SAGE_SESSION_ID")
-        if env_id:
-            return env_id
+        current = peek_session_id()
+        if current:
+            return current
+
+    # 새 ID 생성 (프로세스 안에서만 유지, 포인터는 start_chain에서 기록)
+    _active_session = _generate_session_id()
+    return _active_session
 
-        # 2. 세션 파일
-        if CURRENT_SESSION_FILE.exists():
-            stored = CURRENT_SESSION_FILE.read_text().strip()
-            if stored:
-                return stored
 
-    # 3. 새 ID 생성
-    new_id = _generate_session_id()
-    os.environ["SAGE_SESSION_ID"] = new_id
-    return new_id
+def peek_session_id() -> str:
+    """현재 세션 ID 조회 (없으면 "" - 새 ID를 만들지 않음)"""
+    return os.environ.get("SAGE_SESSION_ID") or _active_session or read_current(state_dir=STATE_DIR)
 
 
 def set_session(session_id: str) -> None:
-    CURRENT_SESSION_FILE.write_text(session_id)
-    os.environ["SAGE_SESSION_ID"] = session_id
+    """현재 네임스페이스의 세션 포인터 교체 (SAGE_NAMESPACE, registry.py)"""
+    global _active_session
+    write_current(session_id, state_dir=STATE_DIR)
+    _active_session = session_id
 
 
-def clear_session() -> None:
-    if CURRENT_SESSION_FILE.exists():
-        CURRENT_SESSION_FILE.unlink()
-    os.environ.pop("SAGE_SESSION_ID", None)
+def clear_session(session_id: Optional[str] = None) -> None:
+    """세션 포인터 해제 (session_id가 주어지면 그 세션을 가리킬 때만)"""
+    global _active_session
+    clear_current(session_id, state_dir=STATE_DIR)
+    if session_id is None or _active_session == session_id:
+        _active_session = ""
 
 
-def get_state_path() -> Path:
-    return STATE_DIR / f"sage_state_{get_session_id()}.json"
+def get_state_path(session_id: Optional[str] = None) -> Path:
+    """세션 상태 파일 경로 (session_id 생략 시 현재 세션)"""
+    return STATE_DIR / f"sage_state_{session_id or get_session_id()}.json"
 
 
 # =============================================================================
 # State Persistence (File Lock + Atomic Write)
 # =============================================================================
 
-def load_state_unsafe() -> Optional[ChainState]:
+def load_state_unsafe(session_id: Optional[str] = None) -> Optional[ChainState]:
     """락 없이 상태 읽기 (내부용)"""
-    path = get_state_path()
+    return read_state_file(get_state_path(session_id))
+
+
+def read_state_file(path: Path) -> Optional[ChainState]:
+    """상태 파일 → ChainState (없거나 손상되면 None, 형식 자동 판별 - codec.py)"""
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text())
+        data = codec.decode(path.read_bytes())
         return ChainState.from_dict(data)
-    except (json.JSONDecodeError, TypeError):
+    except (ValueError, TypeError):
+        return None
+
+
+def read_state_fields(path: Path, names: tuple) -> Optional[dict]:
+    """상태 파일의 일부 필드만 읽기 (바이너리 형식이면 role_results를 디코딩하지 않음)
+
+    SAGE_SNAPSHOT이 켜져 있으면 mmap 스냅샷에서 먼저 읽는다 (snapshot.py).
+    """
+    found = snapshot.read_fields(path, names)
+    if found is not None:
+        return found
+    try:
+        return codec.read_fields(path, names)
+    except (FileNotFoundError, ValueError):
         return None
 
 
-def load_state() -> Optional[ChainState]:
+def load_state(session_id: Optional[str] = None) -> Optional[ChainState]:
     """상태 읽기 (외부용, 호환성 유지)"""
-    return load_state_unsafe()
+    return load_state_unsafe(session_id)
 
 
-def save_state_atomic(state: ChainState) -> None:
+def save_state_atomic(state: ChainState, session_id: Optional[str] = None) -> None:
     """원자적 저장 (temp → rename)"""
-    path = get_state_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
+    write_state_file(get_state_path(session_id), state)
 
-    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
-    try:
-        with os.fdopen(fd, 'w') as f:
-            json.dump(state.to_dict(), f, ensure_ascii=False, indent=2)
-        os.rename(tmp_path, path)  # POSIX에서 원자적
-    except Exception:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+
+def write_state_file(path: Path, state: ChainState) -> None:
+    """ChainState → 상태 파일 (SAGE_DURABILITY: 기본은 temp → rename, full이면 group commit fsync)
+
+    형식은 SAGE_STATE_FORMAT을 따른다 (codec.py). 실행 중 상태면 같은 내용을
+    체크포인트로도 게시한다 (checkpoint.py, 하드 링크). SAGE_SNAPSHOT이 켜져 있으면
+    바이너리 형식으로 mmap 스냅샷도 갱신한다 (snapshot.py). 기록 후 FIFO
+    대기자를 깨운다 (watch.py).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = state.to_dict()
+    encoded = codec.encode(data)
+    link = checkpoint.checkpoint_for(path) if checkpoint.checkpoint_enabled() and not is_terminal(state) else None
+    shared = snapshot.snapshot_for(path)
+    if shared is not None:  # rename 후 게시까지의 구간을 줄이도록 미리 인코딩
+        payload = encoded if codec.detect(encoded) == "binary" else codec.encode(data, "binary")
+    durability.publish(path, encoded, link)
+    if shared is not None:
+        snapshot.publish(shared, payload, os.stat(path))
+    watch.notify(path)
 
 
 def save_state(state: ChainState) -> None:
@@ -234,15 +342,101 @@ def save_state(state: ChainState) -> None:
     save_state_atomic(state)
 
 
+@dataclass
+class LockStats:
+    """상태 락 통계 (프로세스 단위 누적, 경합 측정용)"""
+    calls: int = 0
+    acquired: int = 0
+    failures: int = 0
+    retries: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    last_wait: float = 0.0
+    last_attempts: int = 0
+
+    def record(self, attempts: int, wait: float, acquired: bool) -> None:
+        self.calls += 1
+        self.retries += attempts - 1
+        self.last_attempts = attempts
+        self.last_wait = wait
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        if acquired:
+            self.acquired += 1
+        else:
+            self.failures += 1
+
+
+LOCK_STATS = LockStats()
+
+
+@contextmanager
+def state_lock(session_id: Optional[str] = None, max_retries: int = 3) -> Iterator[str]:
+    """세션 상태 파일 배타 락 (비차단 시도 + 재시도)
+
+    락을 잡은 동안 읽기-수정-쓰기를 여러 번 수행할 수 있다 (--batch의
+    연속 완료 묶음). 잡은 세션 ID를 반환한다.
+
+    Raises:
+        RuntimeError: 락 획득 실패 시
+    """
+    session_id = session_id or get_session_id()
+    with file_lock(get_state_path(session_id).with_suffix('.lock'), session_id, max_retries):
+        yield session_id
+
+
+@contextmanager
+def file_lock(lock_path: Path, session_id: str, max_retries: int = 3) -> Iterator[None]:
+    """state_lock 본체 (락 파일 경로 지정, api.FileStateStore와 공유)
+
+    락 안의 상태 기록 fsync는 락을 놓은 뒤 group commit한다 (durability.py).
+    """
+    with durability.deferred():
+        yield from _file_lock(lock_path, session_id, max_retries)
+
+
+def _file_lock(lock_path: Path, session_id: str, max_retries: int) -> Iterator[None]:
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    for attempt in range(max_retries):
+        lock_file = open(lock_path, 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            if attempt < max_retries - 1:
+                time.sleep(0.1 * (attempt + 1))  # 100ms, 200ms, 300ms
+                continue
+            waited = time.perf_counter() - started
+            LOCK_STATS.record(max_retries, waited, acquired=False)
+            get_event_log().emit("error", session_id, kind="lock",
+                                 attempts=max_retries, wait_ms=round(waited * 1000, 3))
+            raise RuntimeError(f"Failed to acquire state lock after {max_retries} attempts")
+
+        waited = time.perf_counter() - started
+        LOCK_STATS.record(attempt + 1, waited, acquired=True)
+        get_event_log().emit("lock_wait", session_id, level="full",
+                             attempts=attempt + 1, wait_ms=round(waited * 1000, 3))
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+        return
+
+
 def atomic_state_update(
     update_fn: Callable[[ChainState], ChainState],
-    max_retries: int = 3
+    max_retries: int = 3,
+    session_id: Optional[str] = None,
 ) -> ChainState:
     """원자적 상태 업데이트 (파일 락 + atomic write)
 
     Args:
         update_fn: 상태를 받아 수정된 상태를 반환하는 함수
         max_retries: 락 획득 최대 재시도 횟수
+        session_id: 대상 세션 (기본: 현재 세션)
 
     Returns:
         업데이트된 ChainState
@@ -251,46 +445,68 @@ def atomic_state_update(
         ValueError: 활성 세션이 없을 때
         RuntimeError: 락 획득 실패 시
     """
-    path = get_state_path()
-    lock_path = path.with_suffix('.lock')
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with state_lock(session_id, max_retries) as session_id:
+        # Read current state
+        state = load_state_unsafe(session_id)
+        if state is None:
+            raise ValueError("No active session")
 
-    for attempt in range(max_retries):
-        try:
-            with open(lock_path, 'w') as lock_file:
-                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                try:
-                    # Read current state
-                    state = load_state_unsafe()
-                    if state is None:
-                        raise ValueError("No active session")
-
-                    # Apply update
-                    state = update_fn(state)
-
-                    # Atomic write
-                    save_state_atomic(state)
-                    return state
-                finally:
-                    fcntl.flock(lock_file, fcntl.LOCK_UN)
-        except BlockingIOError:
-            if attempt < max_retries - 1:
-                time.sleep(0.1 * (attempt + 1))  # 100ms, 200ms, 300ms
-            else:
-                raise RuntimeError(f"Failed to acquire state lock after {max_retries} attempts")
+        # Apply update
+        state = update_fn(state)
 
-    # Should not reach here
-    raise RuntimeError("Unexpected error in atomic_state_update")
+        # Atomic write
+        save_state_atomic(state, session_id)
+        return state
 
 
-def clear_state() -> None:
-    """상태 파일 삭제"""
-    path = get_state_path()
+def clear_state(session_id: Optional[str] = None) -> None:
+    """상태 파일 삭제 (체크포인트 포함)"""
+    path = get_state_path(session_id)
     lock_path = path.with_suffix('.lock')
-    if path.exists():
-        path.unlink()
-    if lock_path.exists():
-        lock_path.unlink()
+    path.unlink(missing_ok=True)
+    lock_path.unlink(missing_ok=True)
+    durability.sync_path(path).unlink(missing_ok=True)
+    checkpoint.remove(path)
+    snapshot.remove(path)
+    watch.notify(path)
+
+
+def clear_checkpoint(session_id: Optional[str] = None) -> None:
+    """정상 종료 시 체크포인트 삭제 (감독 timeout / 프로세스 종료로 끊긴 체인은 남김)"""
+    checkpoint.remove(get_state_path(session_id))
+
+
+def migrate_state_files(fmt: str) -> dict[str, int]:
+    """STATE_DIR의 상태 / 체크포인트 파일을 fmt 형식으로 다시 기록 (codec.py)
+
+    세션 락 아래에서 읽고 같은 내용을 새 형식으로 게시한다. 읽기는 형식을 자동
+    판별하므로 실행 중 세션도 변환할 수 있다.
+
+    Returns:
+        {"migrated": 변환 수, "skipped": 이미 fmt 형식, "failed": 락 실패 / 손상}
+    """
+    counts = {"migrated": 0, "skipped": 0, "failed": 0}
+    paths = [(path, path.name[len(prefix):-len(".json")])
+             for prefix in (checkpoint.STATE_PREFIX, checkpoint.CHECKPOINT_PREFIX)
+             for path in sorted(STATE_DIR.glob(f"{prefix}*.json"))]
+    for path, session_id in paths:
+        try:
+            with state_lock(session_id):
+                raw = path.read_bytes()
+                if codec.detect(raw) == fmt:
+                    counts["skipped"] += 1
+                    continue
+                durability.publish(path, codec.encode(codec.decode(raw), fmt))
+        except FileNotFoundError:  # 그 사이 종료 / 삭제됨
+            continue
+        except (ValueError, RuntimeError):
+            counts["failed"] += 1
+            continue
+        counts["migrated"] += 1
+        if path.name.startswith(checkpoint.CHECKPOINT_PREFIX):
+            # 체크포인트는 평소 하드 링크로만 갱신됨 → commit이 끝난 group commit 카운터는 불필요
+            durability.sync_path(path).unlink(missing_ok=True)
+    return counts
 
 
 # =============================================================================
@@ -310,7 +526,7 @@ def load_config() -> dict:
     return {}
 
 
-def parse_chain_roles(roles_config: list) -> list[PhaseItem]:
+def parse_chain_roles(roles_config: list, defaults: Optional[dict] = None) -> list[PhaseItem]:
     """
     체인 설정을 PhaseItem 리스트로 변환
 
@@ -318,7 +534,11 @@ def parse_chain_roles(roles_config: list) -> list[PhaseItem]:
     - "role"                    → 순차 실행
     - ["role1", "role2"]        → 병렬 실행
     - {"parallel": ["r1", "r2"]} → 명시적 병렬
+    - {"parallel": [...], "max_concurrency": 3, "stagger_ms": 500} → 동시 실행 제한
+
+    defaults: 체인 단위 max_concurrency / stagger_ms (페이즈 설정이 없는 병렬 그룹에 적용)
     """
+    defaults = defaults or {}
     phases = []
     idx = 0
 
@@ -332,7 +552,11 @@ def parse_chain_roles(roles_config: list) -> list[PhaseItem]:
         elif isinstance(item, dict):
             # 명시적 parallel 키
             if "parallel" in item:
-                phases.append(PhaseItem(index=idx, roles=item["parallel"], is_parallel=True))
+                phases.append(PhaseItem(
+                    index=idx, roles=item["parallel"], is_parallel=True,
+                    max_concurrency=int(item.get("max_concurrency", 0)),
+                    stagger_ms=int(item.get("stagger_ms", 0)),
+                ))
             elif "sequential" in item:
                 # 순차 그룹 (개별 phase로 분리)
                 for role in item["sequential"]:
@@ -341,9 +565,25 @@ def parse_chain_roles(roles_config: list) -> list[PhaseItem]:
                 continue
         idx += 1
 
+    for phase in phases:
+        if phase.is_parallel:
+            phase.max_concurrency = phase.max_concurrency or int(defaults.get("max_concurrency", 0))
+            phase.stagger_ms = phase.stagger_ms or int(defaults.get("stagger_ms", 0))
     return phases
 
 
+def split_phase_roles(phase: PhaseItem) -> tuple[list[str], list[str]]:
+    """페이즈 진입 시 (실행, 대기열) 분할"""
+    limit = phase.max_concurrency if phase.is_parallel else 0
+    if limit <= 0 or limit >= len(phase.roles):
+        return phase.roles.copy(), []
+    return phase.roles[:limit], phase.roles[limit:]
+
+
+def _enter_phase(state: ChainState, phase: PhaseItem) -> None:
+    state.pending_roles, state.queued_roles = split_phase_roles(phase)
+
+
 def select_chain(task: str, config: dict) -> str:
     """작업에 맞는 체인 선택
 
@@ -385,13 +625,14 @@ def select_chain(task: str, config: dict) -> str:
 # Branch Logic
 # =============================================================================
 
-def check_branch(role: str, result: str, config: dict, chain_name: str) -> Optional[dict]:
+def check_branch(role: str, result: "str | RoleResult", config: dict, chain_name: str) -> Optional[dict]:
     """분기 조건 확인"""
     chains = config.get("chains", {})
     chain = chains.get(chain_name, {})
     branches = chain.get("branches", [])
 
-    result_lower = result.lower()
+    if not isinstance(result, RoleResult):
+        result = result.lower()
     for branch in branches:
         if branch.get("from") != role:
             continue
@@ -400,25 +641,26 @@ def check_branch(role: str, result: str, config: dict, chain_name: str) -> Optio
         if isinstance(conditions, str):
             conditions = [conditions]
 
-        if any(c.lower() in result_lower for c in conditions):
+        if any(_contains(result, c) for c in conditions):
             return branch
 
     return None
 
 
-def check_exit(role: str, result: str, config: dict, chain_name: str) -> Optional[dict]:
+def check_exit(role: str, result: "str | RoleResult", config: dict, chain_name: str) -> Optional[dict]:
     """즉시 종료 조건 확인"""
     chains = config.get("chains", {})
     chain = chains.get(chain_name, {})
     exits = chain.get("exit_conditions", [])
 
-    result_lower = result.lower()
+    if not isinstance(result, RoleResult):
+        result = result.lower()
     for cond in exits:
         if cond.get("role") != role:
             continue
 
         keywords = cond.get("keywords", [])
-        if any(kw.lower() in result_lower for kw in keywords):
+        if any(_contains(result, kw) for kw in keywords):
             return cond
 
     return None
@@ -436,15 +678,53 @@ def start_chain(task: str, config: dict, force_chain: str = None) -> ChainState:
         config: 설정
         force_chain: 강제 체인 이름 (None이면 자동 선택)
     """
+    started = time.perf_counter()
     session_id = _generate_session_id()
     set_session(session_id)
 
     chain_name = force_chain if force_chain else select_chain(task, config)
+    state = new_chain_state(session_id, task, chain_name, config, memo=get_result_cache(config))
+
+    save_state(state)
+    announce_start(state, config, forced=bool(force_chain), started=started)
+    if is_terminal(state):
+        clear_checkpoint()
+        clear_session(session_id)
+    return state
+
+
+def announce_start(state: ChainState, config: dict, forced: bool, started: float) -> None:
+    """chain_start 이벤트 + 시작 기록 (SAGE_RECORD)"""
+    get_event_log().emit(
+        "chain_start", state.session_id,
+        chain=state.chain_name, forced=forced, phases=len(state.phases),
+        pending=state.pending_roles, task=state.task[:200],
+    )
+    _emit_memo_events(state)
+    if recording_enabled():
+        record_call(
+            state.session_id, "start",
+            task=state.task, chain=state.chain_name, forced=forced,
+            config_digest=config_digest(config),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            state=normalize_state(state.to_dict()),
+        )
+
+
+def new_chain_state(session_id: str, task: str, chain_name: str, config: dict,
+                    now: Optional[float] = None, memo: Optional[ResultCache] = None,
+                    blob_store: Optional[BlobStore] = None) -> ChainState:
+    """초기 ChainState 생성 (저장/세션 포인터 변경 없음)
+
+    start_chain()과 오프라인 도구(시뮬레이터 등)가 공유한다.
+    now: 역할 시작 시각 기준 (기본: time.time(), 시뮬레이터는 가상 시계)
+    memo: 결과 캐시 (주면 첫 페이즈부터 적중한 역할을 즉시 완료)
+    """
     chains = config.get("chains", {})
     chain_cfg = chains.get(chain_name, {})
     roles_config = chain_cfg.get("roles", [])
 
-    phases = parse_chain_roles(roles_config)
+    phases = parse_chain_roles(roles_config, chain_cfg)
 
     state = ChainState(
         session_id=session_id,
@@ -459,45 +739,187 @@ def start_chain(task: str, config: dict, force_chain: str = None) -> ChainState:
     # 첫 phase 설정
     if phases:
         first = phases[0]
+        _enter_phase(state, first)
         if first.is_parallel:
-            state.pending_roles = first.roles.copy()
             state.status = ChainStatus.WAITING_PARALLEL.value
-        else:
-            state.pending_roles = first.roles.copy()
+        if memo is not None:
+            state = _serve_cached(state, config, blob_store or get_blob_store(), memo)
+    if is_terminal(state):
+        return state
 
-    save_state(state)
+    now = time.time() if now is None else now
+    state.released_roles = state.pending_roles.copy()
+    state.role_started_at = _stagger(state, state.released_roles, now)
     return state
 
 
+def _stagger(state: ChainState, roles: list[str], now: float) -> dict:
+    """새로 배출된 역할의 (예정) 시작 시각 - 현재 페이즈 stagger_ms 간격"""
+    stagger = _stagger_ms(state) / 1000.0
+    return {role: now + i * stagger for i, role in enumerate(roles)}
+
+
 def _extract_conditions(result: str) -> list[str]:
     """조건부 승인에서 조건들을 추출"""
-    import re
     conditions = []
-    # 패턴: "조건부승인: 조건1, 조건2" 또는 "conditional: cond1, cond2"
-    patterns = [
-        r"조건부\s*승인[:\s]+(.+?)(?:\n|$)",
-        r"conditional[:\s]+(.+?)(?:\n|$)",
-        r"조건[:\s]+(.+?)(?:\n|$)",
-    ]
-    for pattern in patterns:
-        matches = re.findall(pattern, result, re.IGNORECASE)
-        for match in matches:
-            # 쉼표나 세미콜론으로 분리
-            parts = re.split(r"[,;]", match)
-            conditions.extend([p.strip() for p in parts if p.strip()])
+    for pattern in CONDITION_PATTERNS:
+        conditions.extend(conditions_for(pattern, result))
     return conditions
 
 
-def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str, str], config: dict) -> ChainState:
-    """역할 완료 처리 (내부 구현, 저장 없음)"""
+TERMINAL_STATUSES = (ChainStatus.APPROVED.value, ChainStatus.REJECTED.value)
+
+
+def is_terminal(state: ChainState) -> bool:
+    """체인이 종료 상태(승인/거부)인지 확인"""
+    return state.status in TERMINAL_STATUSES
+
+
+def _complete_role_impl(state: ChainState, roles: list[str], results: "dict[str, str | RoleResult]",
+                        config: dict, now: Optional[float] = None, blob_store: Optional[BlobStore] = None,
+                        memo: Optional[ResultCache] = None) -> ChainState:
+    """역할 완료 처리 (내부 구현, 상태 저장 없음)
+
+    순수 상태 전이만 수행한다. 세션 포인터 정리 등 부수 효과는 호출자가
+    is_terminal()로 판단해 처리한다. 결과 원문은 blob_store에 기록되고
+    상태에는 참조만 남는다 (동일 내용은 재기록하지 않음).
+
+    now: 새로 대기 상태가 된 역할의 시작 시각 (기본: time.time())
+    blob_store: 결과 저장소 (기본: get_blob_store(), 시뮬레이터/재생은 MemoryBlobStore)
+    memo: 결과 캐시 (주면 완료 결과를 저장하고, 새로 실행 대상이 된 역할 중
+        적중한 것은 즉시 완료해 memo_hits에 남김)
+
+    분기 복귀로 다시 실행 대상이 된 역할 중 입력(role_inputs)이 그대로인 것은
+    memo와 무관하게 기존 결과로 즉시 완료해 reused_roles에 남긴다.
+    """
+    was_pending = set(state.pending_roles)
+    previous = state.role_started_at
+    store = blob_store or get_blob_store()
+    keys = _memo_keys(state, [role for role in roles if role in results], memo, config) if memo else {}
+    runnable = {(state.current_phase, role) for role in state.pending_roles + state.queued_roles}
+    state = _apply_completion(state, roles, results, config, store)
+
+    state.memo_hits = []
+    state.reused_roles = []
+    if memo is not None:
+        memo.put_many({key: (role, state.role_results[role]) for role, key in keys.items()
+                       if is_blob_ref(state.role_results.get(role))})
+    state = _serve_cached(state, config, store, memo, looked=runnable)
+
+    for role in roles + state.memo_hits + state.reused_roles:
+        state.role_attempts.pop(role, None)
+        state.role_retries.pop(role, None)
+    if is_terminal(state):
+        state.released_roles = []
+        state.role_started_at = {}
+        return state
+
+    # 계속 실행 중인 역할(병렬 그룹의 나머지)은 기존 시작 시각 유지
+    now = time.time() if now is None else now
+    continuing = {role for role in state.pending_roles
+                  if role in was_pending and role not in roles and role in previous}
+    state.released_roles = [role for role in state.pending_roles if role not in continuing]
+    started = _stagger(state, state.released_roles, now)
+    state.role_started_at = {role: previous[role] if role in continuing else started[role]
+                             for role in state.pending_roles}
+    return state
+
+
+def _upstream_digests(state: ChainState) -> dict[str, str]:
+    """현재 페이즈 밖 역할들의 결과 해시 (현재 페이즈 역할의 이전 결과는 제외)"""
+    current = set(state.phases[state.current_phase]["roles"]) if state.current_phase < len(state.phases) else set()
+    return {role: result_digest(value) for role, value in state.role_results.items() if role not in current}
+
+
+def _role_inputs(state: ChainState, config: dict, roles: list[str]) -> dict[str, dict]:
+    """{역할: {상위 역할: 결과 해시}} - 체인 depends_on으로 좁힌 입력"""
+    upstream = _upstream_digests(state)
+    return {role: select_inputs(upstream, dependencies(config, state.chain_name, role)) for role in roles}
+
+
+def _input_key(state: ChainState, role: str) -> str:
+    return f"{state.current_phase}:{role}"
+
+
+def _memo_keys(state: ChainState, roles: list[str], memo: ResultCache, config: dict) -> dict[str, str]:
+    """{역할: 캐시 키} - 제외 역할과 분기 대상(재작업 요청)은 캐시하지 않음"""
+    roles = [role for role in roles if role != state.branch_active and memo.cacheable(role)]
+    if not roles:
+        return {}
+    task = task_digest(state.task)
+    return {role: memo.key(role, task, inputs) for role, inputs in _role_inputs(state, config, roles).items()}
+
+
+def _reusable(state: ChainState, config: dict, roles: list[str], store: BlobStore) -> dict[str, str]:
+    """입력이 마지막 실행과 같은 역할의 기존 결과 {역할: 원문} (분기 복귀 재실행 생략)"""
+    roles = [role for role in roles if role != state.branch_active and role in state.role_results
+             and _input_key(state, role) in state.role_inputs]
+    texts = {}
+    for role, inputs in _role_inputs(state, config, roles).items():
+        if state.role_inputs[_input_key(state, role)] != inputs_digest(inputs):
+            continue
+        try:
+            texts[role] = state.get_result(role, store)
+        except FileNotFoundError:  # 원문이 정리되었으면 다시 실행
+            continue
+    return texts
+
+
+def _serve_cached(state: ChainState, config: dict, store: BlobStore, memo: Optional[ResultCache],
+                  looked: Optional[set] = None) -> ChainState:
+    """실행 대상 역할 중 입력 불변(재사용) / 캐시 적중을 즉시 완료 (다음 페이즈도 이어서 진행)
+
+    looked: 이미 조회한 (페이즈, 역할) - 전이 전부터 실행 대상이던 역할은 다시 조회하지 않음
+    """
+    looked = set() if looked is None else looked
+    stats = state.memo_stats
+    while not is_terminal(state):
+        candidates = [role for role in state.pending_roles + state.queued_roles
+                      if (state.current_phase, role) not in looked]
+        if not candidates:
+            break
+        looked.update((state.current_phase, role) for role in candidates)
+        texts = _reusable(state, config, candidates, store)
+        reused = list(texts)
+        keys = _memo_keys(state, [role for role in candidates if role not in texts], memo, config) if memo else {}
+        if keys:
+            for role, ref in memo.get_many(keys).items():
+                try:
+                    texts[role] = store.get(ref)
+                except FileNotFoundError:  # 원문이 정리된 항목은 미스로 취급
+                    continue
+            stats["lookups"] = stats.get("lookups", 0) + len(keys)
+            stats["hits"] = stats.get("hits", 0) + len(texts) - len(reused)
+        if not texts:
+            break
+        hits = [role for role in candidates if role in texts]
+        state = _apply_completion(state, hits, texts, config, store)
+        state.reused_roles.extend(role for role in hits if role in reused)
+        state.memo_hits.extend(role for role in hits if role not in reused)
+    return state
+
+
+def _apply_completion(state: ChainState, roles: list[str], results: "dict[str, str | RoleResult]",
+                      config: dict, blob_store: BlobStore) -> ChainState:
+    """_complete_role_impl의 상태 전이 본체"""
     phase_data = state.phases[state.current_phase]
     phase = PhaseItem(**phase_data)
 
+    # 입력 다이제스트 기록 (분기 대상은 재작업이므로 재사용 대상 아님)
+    recorded = [role for role in results if role != state.branch_active]
+    for role, inputs in _role_inputs(state, config, recorded).items():
+        state.role_inputs[_input_key(state, role)] = inputs_digest(inputs)
+
     # 결과 저장 + 조건부 승인 조건 수집 (방안 B)
     for role, result in results.items():
-        state.role_results[role] = result
-        # 조건부 승인 조건 추출
-        conditions = _extract_conditions(result)
+        if isinstance(result, RoleResult):
+            # 스트리밍 수집 시 이미 저장/추출됨
+            state.role_results[role] = result.ref
+            conditions = result.conditions
+        else:
+            state.role_results[role] = blob_store.put(result)
+            # 조건부 승인 조건 추출
+            conditions = _extract_conditions(result)
         if conditions:
             for cond in conditions:
                 state.pending_conditions.append({
@@ -512,7 +934,6 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
         if exit_cond:
             state.status = ChainStatus.REJECTED.value
             state.exit_reason = exit_cond.get("reason", f"{role} 종료 조건")
-            clear_session()
             return state
 
         # 분기 조건 체크
@@ -529,24 +950,32 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
             if current_loops > max_loops:
                 state.status = ChainStatus.REJECTED.value
                 state.exit_reason = f"분기 최대 횟수 초과: {loop_key} ({current_loops}/{max_loops})"
-                clear_session()
                 return state
 
-            # 분기 활성화
+            # 분기 활성화 (재작업을 요청한 역할은 복귀 후 반드시 다시 실행)
+            state.role_inputs.pop(_input_key(state, role), None)
             state.branch_active = branch_to
             state.branch_return_phase = state.current_phase
             state.status = ChainStatus.BRANCHING.value
             state.pending_roles = [branch_to]
+            state.queued_roles = []
             return state
 
     # 병렬 그룹 처리
     if phase.is_parallel:
         for role in roles:
-            if role in state.pending_roles:
-                state.pending_roles.remove(role)
-                state.completed_parallel.append(role)
-
-        # 아직 대기 중인 역할이 있으면 유지
+            for waiting in (state.pending_roles, state.queued_roles):
+                if role in waiting:
+                    waiting.remove(role)
+                    state.completed_parallel.append(role)
+                    break
+
+        # 완료된 자리만큼 대기열에서 배출
+        limit = phase.max_concurrency or len(phase.roles)
+        while state.queued_roles and len(state.pending_roles) < limit:
+            state.pending_roles.append(state.queued_roles.pop(0))
+
+        # 아직 실행 중인 역할이 있으면 유지
         if state.pending_roles:
             return state
 
@@ -561,7 +990,7 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
         # 원래 phase 재실행
         phase_data = state.phases[state.current_phase]
         phase = PhaseItem(**phase_data)
-        state.pending_roles = phase.roles.copy()
+        _enter_phase(state, phase)
         state.status = ChainStatus.RUNNING.value
         return state
 
@@ -573,7 +1002,6 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
     if state.current_phase >= len(state.phases):
         state.status = ChainStatus.APPROVED.value
         state.exit_reason = "모든 역할 완료"
-        clear_session()
         return state
 
     # 다음 phase 설정
@@ -588,12 +1016,11 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
         if state.current_phase >= len(state.phases):
             state.status = ChainStatus.APPROVED.value
             state.exit_reason = "모든 역할 완료"
-            clear_session()
             return state
         next_phase_data = state.phases[state.current_phase]
         next_phase = PhaseItem(**next_phase_data)
 
-    state.pending_roles = next_phase.roles.copy()
+    _enter_phase(state, next_phase)
 
     if next_phase.is_parallel:
         state.status = ChainStatus.WAITING_PARALLEL.value
@@ -603,28 +1030,264 @@ def _complete_role_impl(state: ChainState, roles: list[str], results: dict[str,
     return state
 
 
-def complete_role_atomic(roles: list[str], results: dict[str, str], config: dict) -> ChainState:
+def _fail_role_impl(state: ChainState, role: str, error: str, config: dict,
+                    retryable: Optional[bool] = None, breaker_open: bool = False,
+                    now: Optional[float] = None, policies: Optional[RetryPolicies] = None,
+                    blob_store: Optional[BlobStore] = None) -> tuple[ChainState, RetryDecision]:
+    """역할 실패 처리 (상태 저장 없음)
+
+    retry 정책에 따라:
+        retry  - 시도 횟수 +1, 백오프 후 시각을 시작 시각으로 두고 재실행 대상으로 배출
+        skip   - "FAILED: ..." 결과로 완료 처리
+        reject - 체인 종료
+
+    Raises:
+        ValueError: role이 실행 중이 아님
+    """
+    if role not in state.pending_roles:
+        raise ValueError(f"Role not running: {role}")
+    policy = (policies or RetryPolicies(config)).for_role(state.chain_name, role)
+    attempt = state.role_retries.get(role, 0) + 1
+    decision = decide(policy, role, attempt, error, retryable=retryable, breaker_open=breaker_open)
+    now = time.time() if now is None else now
+
+    if decision.action == "retry":
+        state.role_retries[role] = attempt
+        state.role_started_at[role] = now + decision.delay_s
+        state.released_roles = [role]
+    elif decision.action == "skip":
+        state = _complete_role_impl(state, [role], {role: f"FAILED: {error}"}, config,
+                                    now=now, blob_store=blob_store)
+    else:
+        state.status = ChainStatus.REJECTED.value
+        state.exit_reason = f"역할 실패: {role} ({decision.reason}: {error[:200]})"
+        state.role_started_at = {}
+    return state, decision
+
+
+def fail_role_atomic(role: str, error: str, config: dict,
+                     retryable: Optional[bool] = None) -> tuple[ChainState, RetryDecision]:
+    """역할 실패 처리 (원자적) + circuit breaker 기록
+
+    재시도로 넘긴 일시적 오류는 breaker의 연속 오류로 세지 않고, 재시도 소진
+    또는 영구 오류만 연속 오류로 기록한다.
+    """
+    session_id = peek_session_id()
+    # 락 재시도로 여러 번 불려도 half-open 탐침은 한 번만 받도록 밖에서 판정
+    breaker_open = bool(session_id) and not breaker.allow(session_id, role, STATE_DIR)
+    outcome: dict = {}
+
+    def do_fail(state: ChainState) -> ChainState:
+        outcome["before"] = _transition_snapshot(state)
+        state, outcome["decision"] = _fail_role_impl(
+            state, role, error, config, retryable=retryable, breaker_open=breaker_open,
+        )
+        return state
+
+    state = atomic_state_update(do_fail, session_id=session_id or None)
+    decision: RetryDecision = outcome["decision"]
+    get_event_log().emit(
+        "role_fail", state.session_id, role=role, action=decision.action,
+        attempt=decision.attempt, max_attempts=decision.max_attempts, retryable=decision.retryable,
+        delay_ms=round(decision.delay_s * 1000, 1), reason=decision.reason, message=error[:500],
+    )
+    if decision.action == "retry":
+        breaker.record_retry(state.session_id, role, error, STATE_DIR)
+    else:
+        breaker.record_error(state.session_id, error, role, STATE_DIR)
+        if decision.action == "skip":
+            emit_completion_events(outcome["before"], state, [role], {role: f"FAILED: {error}"})
+        else:
+            get_event_log().emit("chain_end", state.session_id, status=state.status,
+                                 reason=state.exit_reason, phases_completed=len(state.completed_phases))
+    if is_terminal(state):
+        clear_checkpoint(session_id or None)
+        clear_session(state.session_id)
+    return state, decision
+
+
+def complete_role_atomic(roles: list[str], results: "dict[str, str | RoleResult]", config: dict) -> ChainState:
     """역할 완료 처리 (원자적, 파일 락 적용)
 
     병렬 역할이 동시에 완료되어도 안전하게 상태 업데이트.
     """
+    before: dict = {}
+    memo = get_result_cache(config)
+
     def do_complete(state: ChainState) -> ChainState:
-        return _complete_role_impl(state, roles, results, config)
+        before.update(_transition_snapshot(state))
+        return _complete_role_impl(state, roles, results, config, memo=memo)
 
-    return atomic_state_update(do_complete)
+    started = time.perf_counter()
+    try:
+        state = atomic_state_update(do_complete)
+    except (ValueError, RuntimeError) as e:
+        if recording_enabled():
+            _record_complete(peek_session_id(), roles, results, started, error=f"{type(e).__name__}: {e}")
+        raise
+    emit_completion_events(before, state, roles, results)
+    if recording_enabled():
+        _record_complete(state.session_id, roles, results, started, state=state)
+    breaker.record_success(state.session_id, roles, STATE_DIR)
+    if is_terminal(state):
+        clear_checkpoint()
+        clear_session(state.session_id)
+    return state
 
 
-def complete_role(state: ChainState, roles: list[str], results: dict[str, str], config: dict) -> ChainState:
+def complete_role(state: ChainState, roles: list[str], results: "dict[str, str | RoleResult]",
+                  config: dict) -> ChainState:
     """역할 완료 처리 (레거시 호환용)
 
     주의: 이 함수는 호환성을 위해 유지되지만, 병렬 실행 시
     complete_role_atomic()을 사용해야 합니다.
     """
-    state = _complete_role_impl(state, roles, results, config)
+    started = time.perf_counter()
+    before = _transition_snapshot(state)
+    state = _complete_role_impl(state, roles, results, config, memo=get_result_cache(config))
     save_state(state)
+    emit_completion_events(before, state, roles, results)
+    if recording_enabled():
+        _record_complete(state.session_id, roles, results, started, state=state)
+    if is_terminal(state):
+        clear_checkpoint()
+        clear_session(state.session_id)
+    return state
+
+
+def _resume_impl(state: ChainState, blob_store: Optional[BlobStore] = None,
+                 now: Optional[float] = None) -> ChainState:
+    """끊긴 체인 재개 (내부 구현, 상태 저장 없음)
+
+    완료가 기록된 역할(이전 페이즈, completed_parallel)은 그대로 두고 실행 중이던
+    역할(pending_roles)만 다시 배출한다. 병렬 그룹에서 완료는 기록됐지만 결과 원문이
+    저장소에 없는 역할(원문 기록 전 종료)도 다시 실행한다.
+
+    다시 배출하는 역할은 새로 시작하는 것이므로 감독 재발행 수(role_attempts)와
+    --fail 재시도 수(role_retries)를 지운다 - 끊기기 전 재발행 때문에 재개 후 첫
+    정체에서 바로 timeout되지 않도록.
+    """
+    store = blob_store or get_blob_store()
+    lost = [role for role in state.completed_parallel
+            if state.result_ref(role) is not None and not store.exists(state.result_ref(role))]
+    if lost:
+        state.completed_parallel = [role for role in state.completed_parallel if role not in lost]
+        state.pending_roles = lost + [role for role in state.pending_roles if role not in lost]
+        for role in lost:
+            state.role_results.pop(role, None)
+            state.role_inputs.pop(f"{state.current_phase}:{role}", None)
+
+    state.memo_hits = []
+    state.reused_roles = []
+    now = time.time() if now is None else now
+    state.released_roles = state.pending_roles.copy()
+    state.role_started_at = _stagger(state, state.released_roles, now)
+    for role in state.released_roles:
+        state.role_attempts.pop(role, None)
+        state.role_retries.pop(role, None)
     return state
 
 
+def resume_chain(session_id: str) -> tuple[ChainState, str]:
+    """끊긴 체인을 상태 파일(없거나 종료됐으면 체크포인트)에서 재개 → (상태, 출처)
+
+    Raises:
+        ValueError: 재개할 실행 중 상태가 없을 때
+        RuntimeError: 락 획득 실패 시
+    """
+    with state_lock(session_id):
+        path = get_state_path(session_id)
+        state, source = read_state_file(path), "state"
+        if state is None or is_terminal(state):
+            state, source = read_state_file(checkpoint.checkpoint_for(path)), "checkpoint"
+        if state is None or is_terminal(state):
+            raise ValueError(f"Nothing to resume: {session_id}")
+        state = _resume_impl(state)
+        save_state_atomic(state, session_id)
+    set_session(session_id)
+    clear_beats(session_id, state_dir=STATE_DIR)  # 끊기기 전 하트비트로 정체 판정하지 않도록
+    emit_resume_event(state, source)
+    return state, source
+
+
+def emit_resume_event(state: ChainState, source: str) -> None:
+    get_event_log().emit("chain_resume", state.session_id, chain=state.chain_name, source=source,
+                         phase=state.current_phase + 1, pending=state.pending_roles,
+                         completed_parallel=state.completed_parallel)
+
+
+def _record_complete(session_id: str, roles: list[str], results: "dict[str, str | RoleResult]",
+                     started: float, state: Optional[ChainState] = None, error: str = "") -> None:
+    """--complete 호출 기록 (SAGE_RECORD, sage-replay 입력)
+
+    스트리밍 수집 결과는 원문 대신 {"blob": 참조}로 기록한다 (재생 시 저장소에서 로드).
+    """
+    fields = {
+        "roles": roles,
+        "results": {role: {"blob": r.ref} if isinstance(r, RoleResult) else r for role, r in results.items()},
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        "lock_attempts": LOCK_STATS.last_attempts,
+    }
+    if state is not None:
+        fields["state"] = normalize_state(state.to_dict())
+    if error:
+        fields["error"] = error
+    record_call(session_id or "nosession", "complete", **fields)
+
+
+def _transition_snapshot(state: ChainState) -> dict:
+    """전이 이벤트 계산용 이전 상태 요약"""
+    return {
+        "phase": state.current_phase,
+        "status": state.status,
+        "branch": state.branch_active,
+        "started": dict(state.role_started_at),
+    }
+
+
+def emit_completion_events(before: dict, state: ChainState, roles: list[str],
+                           results: "dict[str, str | RoleResult]") -> None:
+    """역할 완료 / 상태 전이 / 체인 종료 이벤트 기록
+
+    role_complete 레코드의 role/duration 필드는 sage-simulate --history 입력으로
+    그대로 사용할 수 있다.
+    """
+    log = get_event_log()
+    now = time.time()
+    sid = state.session_id
+    for role in roles:
+        started = before.get("started", {}).get(role)
+        log.emit(
+            "role_complete", sid,
+            chain=state.chain_name, role=role, phase=before.get("phase", 0) + 1,
+            duration=round(now - started, 3) if started else None,
+            result_bytes=_result_size(results.get(role, "")),
+        )
+    _emit_memo_events(state)
+
+    if (before.get("phase") != state.current_phase or before.get("status") != state.status
+            or before.get("branch") != state.branch_active):
+        log.emit(
+            "transition", sid,
+            from_phase=before.get("phase", 0) + 1, to_phase=state.current_phase + 1,
+            from_status=before.get("status"), to_status=state.status,
+            branch=state.branch_active, pending=state.pending_roles,
+        )
+
+    if is_terminal(state):
+        log.emit("chain_end", sid, status=state.status, reason=state.exit_reason,
+                 phases_completed=len(state.completed_phases))
+
+
+def _emit_memo_events(state: ChainState) -> None:
+    """재사용 / 캐시 적중으로 완료된 역할 (role_complete와 구분 - 시뮬레이터 이력에 섞이지 않음)"""
+    if state.reused_roles:
+        get_event_log().emit("role_reused", state.session_id, chain=state.chain_name, roles=state.reused_roles)
+    if state.memo_hits:
+        get_event_log().emit("memo_hit", state.session_id, chain=state.chain_name, roles=state.memo_hits,
+                             hits=state.memo_stats.get("hits", 0), lookups=state.memo_stats.get("lookups", 0))
+
+
 # =============================================================================
 # Output Formatting
 # =============================================================================
@@ -665,12 +1328,19 @@ def print_status(state: ChainState) -> None:
 
     if state.status == ChainStatus.WAITING_PARALLEL.value:
         print(f"PENDING_PARALLEL: {', '.join(state.pending_roles)}")
+        if state.queued_roles:
+            print(f"QUEUED: {', '.join(state.queued_roles)}")
         if state.completed_parallel:
             print(f"COMPLETED_PARALLEL: {', '.join(state.completed_parallel)}")
 
     if state.branch_active:
         print(f"BRANCH_ACTIVE: {state.branch_active}")
 
+    lookups = state.memo_stats.get("lookups", 0)
+    if lookups:
+        hits = state.memo_stats.get("hits", 0)
+        print(f"MEMO: {hits}/{lookups} ({hits / lookups:.0%})")
+
     if state.status in (ChainStatus.APPROVED.value, ChainStatus.REJECTED.value):
         print(f"REASON: {state.exit_reason}")
     elif state.pending_roles:
@@ -680,6 +1350,26 @@ def print_status(state: ChainState) -> None:
             print(f"NEXT: {state.pending_roles[0]}")
 
 
+def _stagger_ms(state: ChainState) -> int:
+    if state.branch_active or state.current_phase >= len(state.phases):
+        return 0
+    return state.phases[state.current_phase].get("stagger_ms", 0)
+
+
+def _print_next(state: ChainState, roles: list[str]) -> None:
+    """NEXT / NEXT_PARALLEL (+ 대기열, 시차) 출력"""
+    if not roles:
+        return
+    if len(roles) > 1:
+        print(f"NEXT_PARALLEL: {', '.join(roles)}")
+        if _stagger_ms(state):
+            print(f"STAGGER_MS: {_stagger_ms(state)}")
+    else:
+        print(f"NEXT: {roles[0]}")
+    if state.queued_roles and roles is state.pending_roles:
+        print(f"QUEUED: {', '.join(state.queued_roles)}")
+
+
 def print_start(state: ChainState) -> None:
     """시작 출력"""
     phases = [PhaseItem(**p) for p in state.phases]
@@ -688,18 +1378,116 @@ def print_start(state: ChainState) -> None:
     print(f"CHAIN: {state.chain_name}")
     print(f"TOTAL_PHASES: {len(phases)}")
 
-    if state.pending_roles:
-        if len(state.pending_roles) > 1:
-            print(f"NEXT_PARALLEL: {', '.join(state.pending_roles)}")
-        else:
-            print(f"NEXT: {state.pending_roles[0]}")
+    if is_terminal(state):
+        print_complete(state)
+    else:
+        if state.memo_hits:
+            print(f"CACHED: {', '.join(state.memo_hits)}")
+        _print_next(state, state.pending_roles)
 
     print("TODO_REQUIRED:")
     print(json.dumps({"todos": generate_todos(phases)}, ensure_ascii=False))
 
 
+def print_resume(state: ChainState, source: str) -> None:
+    """--resume 출력 (다시 실행할 역할만 NEXT)"""
+    print(f"SESSION: {state.session_id}")
+    print(f"CHAIN: {state.chain_name}")
+    print(f"RESUMED: {source} (phase {state.current_phase + 1}/{len(state.phases)})")
+    if state.completed_parallel:
+        print(f"COMPLETED_PARALLEL: {', '.join(state.completed_parallel)}")
+    if state.branch_active:
+        print(f"BRANCH_ACTIVE: {state.branch_active}")
+    _print_next(state, state.pending_roles)
+
+
+# --wait-for-change / --watch 출력에서 값 하나의 최대 길이
+DELTA_VALUE_CHARS = 160
+
+
+def _delta_value(value) -> str:
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return text if len(text) <= DELTA_VALUE_CHARS else text[:DELTA_VALUE_CHARS - 1] + "…"
+
+
+def state_delta(old: Optional[dict], new: Optional[dict]) -> list[str]:
+    """두 상태 dict의 차이 → 출력 줄 (role_results 같은 dict 필드는 키 단위 +추가 / -삭제 / ~변경)"""
+    if old is None or new is None:
+        if old is new:
+            return []
+        before = "none" if old is None else old.get("status")
+        after = "none" if new is None else new.get("status")
+        return [f"state: {before} → {after}"]
+    lines = []
+    for key in [*new, *(k for k in old if k not in new)]:
+        before, after = old.get(key), new.get(key)
+        if before == after:
+            continue
+        if isinstance(before, dict) and isinstance(after, dict):
+            marks = ([f"+{k}" for k in after if k not in before]
+                     + [f"-{k}" for k in before if k not in after]
+                     + [f"~{k}" for k in after if k in before and after[k] != before[k]])
+            lines.append(f"{key}: {' '.join(marks)}")
+        else:
+            lines.append(f"{key}: {_delta_value(before)} → {_delta_value(after)}")
+    return lines
+
+
+def _state_dict(path: Path) -> Optional[dict]:
+    state = read_state_file(path)
+    return state.to_dict() if state else None
+
+
+def watch_state(session_id: str, timeout: Optional[float] = None, follow: bool = False) -> int:
+    """상태 파일이 바뀔 때까지 대기하고 차이 출력 (watch.py) → 종료 코드
+
+    follow면 체인이 끝나거나(승인/거부) 상태 파일이 지워질 때까지 변경마다 출력한다.
+    timeout은 변경 없이 기다릴 최대 시간 (초과 시 TIMEOUT, 종료 코드 2).
+    version만 바뀌고 내용이 같으면 계속 기다린다.
+    """
+    path = get_state_path(session_id)
+    with watch.Watcher(path) as watcher:
+        version = watch.state_version(path)
+        before = _state_dict(path)
+        while True:
+            if not watcher.wait(version, timeout):
+                print(f"TIMEOUT: no change in {timeout:g}s", flush=True)
+                return 2
+            version = watch.state_version(path)
+            after = _state_dict(path)
+            delta = state_delta(before, after)
+            before = after
+            if not delta:
+                continue
+            print(f"VERSION: {':'.join(map(str, version)) if version else 'none'}")
+            for line in delta:
+                print(f"CHANGED: {line}")
+            sys.stdout.flush()
+            if not follow:
+                return 0
+            if after is None or after.get("status") in TERMINAL_STATUSES:
+                print(f"WATCH: end ({after['status'] if after else 'removed'})", flush=True)
+                return 0
+
+
+def print_fail(state: ChainState, decision: RetryDecision) -> None:
+    """--fail 출력"""
+    if decision.action == "retry":
+        print(f"RETRY: {decision.role}")
+        print(f"ATTEMPT: {decision.attempt + 1}/{decision.max_attempts}")
+        print(f"RETRY_AFTER_MS: {round(decision.delay_s * 1000)}")
+        return
+    print(f"FAILED: {decision.role} ({decision.reason})")
+    print_complete(state)
+
+
 def print_complete(state: ChainState) -> None:
     """완료 후 출력"""
+    if state.reused_roles:
+        print(f"REUSED: {', '.join(state.reused_roles)}")
+    if state.memo_hits:
+        print(f"CACHED: {', '.join(state.memo_hits)}")
+
     if state.status == ChainStatus.APPROVED.value:
         print("APPROVED: 모든 역할 완료")
         return
@@ -719,14 +1507,17 @@ def print_complete(state: ChainState) -> None:
         if state.completed_parallel:
             print(f"PARALLEL_PROGRESS: {', '.join(state.completed_parallel)} 완료")
         print(f"PENDING: {', '.join(state.pending_roles)}")
+        if state.queued_roles:
+            print(f"QUEUED: {', '.join(state.queued_roles)}")
+        if state.completed_parallel:
+            # 대기열에서 새로 배출된 역할만 실행 대상
+            _print_next(state, state.released_roles)
+        elif _stagger_ms(state) and len(state.pending_roles) > 1:
+            print(f"STAGGER_MS: {_stagger_ms(state)}")
         return
 
     # 일반 진행
-    if state.pending_roles:
-        if len(state.pending_roles) > 1:
-            print(f"NEXT_PARALLEL: {', '.join(state.pending_roles)}")
-        else:
-            print(f"NEXT: {state.pending_roles[0]}")
+    _print_next(state, state.pending_roles)
 
     # 방안 B: 조건부 승인 조건 출력
     if state.pending_conditions and "constraint-enforcer" in state.pending_roles:
@@ -735,6 +1526,358 @@ def print_complete(state: ChainState) -> None:
             print(f"  - [{cond['from_role']}] {cond['condition']}")
 
 
+# =============================================================================
+# Batch Mode
+# =============================================================================
+
+# 한 번에 묶어 처리할 최대 명령 수 (이미 도착한 줄만 묶음)
+BATCH_WINDOW = 256
+BATCH_READ_CHUNK = 64 * 1024
+
+
+def state_summary(state: ChainState) -> dict:
+    """--batch 응답용 상태 요약 (print_status와 같은 정보)"""
+    terminal = is_terminal(state)
+    summary = {
+        "session": state.session_id,
+        "chain": state.chain_name,
+        "status": state.status,
+        "phase": min(state.current_phase + 1, len(state.phases)),
+        "phases": len(state.phases),
+        "pending": [] if terminal else state.pending_roles,
+    }
+    if state.queued_roles and not terminal:
+        summary["queued"] = state.queued_roles
+    if state.released_roles and state.released_roles != state.pending_roles:
+        summary["released"] = state.released_roles
+    if state.completed_parallel:
+        summary["completed_parallel"] = state.completed_parallel
+    if state.branch_active:
+        summary["branch"] = state.branch_active
+        summary["loop"] = list(state.branch_loops.values())[-1] if state.branch_loops else 1
+    if state.pending_conditions:
+        summary["conditions"] = state.pending_conditions
+    if state.reused_roles:
+        summary["reused"] = state.reused_roles
+    if state.memo_hits:
+        summary["cached"] = state.memo_hits
+    if state.memo_stats:
+        summary["memo"] = state.memo_stats
+    if terminal:
+        summary["reason"] = state.exit_reason
+    return summary
+
+
+def _command_windows(fd: int, limit: int = BATCH_WINDOW) -> Iterator[list[str]]:
+    """입력 fd → 명령 줄 묶음
+
+    대화형 드라이버(명령 1개 쓰고 응답 대기)를 막지 않도록 새 데이터를
+    기다리는 것은 버퍼가 비었을 때뿐이고, 그 외에는 이미 도착한 줄만 묶는다.
+    """
+    pending: list[bytes] = []
+    tail = b""
+    eof = False
+    while True:
+        while not eof and len(pending) < limit:
+            if pending and not select.select([fd], [], [], 0)[0]:
+                break
+            chunk = os.read(fd, BATCH_READ_CHUNK)
+            if not chunk:
+                eof = True
+                if tail:
+                    pending.append(tail)
+                break
+            *lines, tail = (tail + chunk).split(b"\n")
+            pending.extend(lines)
+        if not pending:
+            if eof:
+                return
+            continue
+        window, pending = pending[:limit], pending[limit:]
+        yield [line.decode("utf-8", errors="replace") for line in window]
+
+
+class BatchRunner:
+    """--batch: JSONL 명령을 한 프로세스에서 실행
+
+    명령 (한 줄에 하나, "id"는 응답에 그대로 복사):
+        {"op": "start", "task": "...", "chain": "QUICK"}
+        {"op": "complete", "roles": "a,b" | ["a", "b"], "result": "pass",
+         "results": {"a": "text" | {"path": "..."}}, "result_file": "...", "session": "..."}
+        {"op": "status", "session": "..."}
+        {"op": "query", "role": "critic" | "fields": ["status", ...], "session": "..."}
+        {"op": "reset", "session": "..."}
+
+    응답 (명령마다 한 줄): {"id", "op", "ok": true, ...} 또는
+    {"id", "op", "ok": false, "kind": "input|state|lock", "error": "..."}
+
+    설정은 한 번만 읽고, 상태는 파일 (inode, mtime, size)가 그대로면 캐시를
+    재사용한다. 같은 세션에 대한 연속 complete는 락 한 번 안에서 순서대로
+    적용하고 한 번만 기록한다.
+    """
+
+    OPS = ("start", "complete", "status", "query", "reset")
+
+    def __init__(self, config: dict, out=None):
+        self.config = config
+        self.out = out or sys.stdout
+        self.session = peek_session_id()
+        self.keywords: Optional[set] = None
+        self.errors = 0
+        self._states: dict[str, tuple[tuple, ChainState]] = {}
+
+    # --- 입출력 ---
+
+    def run(self, fd: int) -> int:
+        """입력이 끝날 때까지 실행 → 종료 코드 (실패한 명령이 있으면 1)"""
+        lineno = 0
+        for window in _command_windows(fd):
+            commands = []
+            for line in window:
+                lineno += 1
+                line = line.strip()
+                if line:
+                    commands.append(self._parse(line, lineno))
+            self._run_window(commands)
+            self.out.flush()
+        return 1 if self.errors else 0
+
+    def _parse(self, line: str, lineno: int) -> dict:
+        """명령 줄 → dict (잘못된 줄은 응답 순서 유지를 위해 "_error"로 표시)"""
+        try:
+            cmd = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {"_error": f"Invalid JSON at line {lineno}: {e}"}
+        if not isinstance(cmd, dict):
+            return {"_error": f"Command must be an object at line {lineno}"}
+        if cmd.get("op") not in self.OPS:
+            cmd["_error"] = f"Unknown op at line {lineno}: {cmd.get('op')}"
+        return cmd
+
+    def _respond(self, cmd: dict, **fields) -> None:
+        response = {"id": cmd["id"]} if "id" in cmd else {}
+        response["op"] = cmd.get("op")
+        response.update(fields)
+        self.out.write(json.dumps(response, ensure_ascii=False, separators=(",", ":"), default=str) + "\n")
+
+    def _fail(self, cmd: dict, kind: str, message: str) -> None:
+        self.errors += 1
+        self._respond(cmd, ok=False, kind=kind, error=message)
+
+    # --- 실행 ---
+
+    def _run_window(self, commands: list[dict]) -> None:
+        i = 0
+        while i < len(commands):
+            cmd = commands[i]
+            if "_error" in cmd:
+                self._fail(cmd, "input", cmd["_error"])
+                i += 1
+                continue
+            if cmd["op"] != "complete":
+                self._dispatch(cmd)
+                i += 1
+                continue
+            # 같은 세션에 대한 연속 complete → 락 한 번
+            sid = cmd.get("session") or self.session
+            group = [cmd]
+            for nxt in commands[i + 1:]:
+                if "_error" in nxt or nxt["op"] != "complete" or (nxt.get("session") or self.session) != sid:
+                    break
+                group.append(nxt)
+            self._complete_group(sid, group)
+            i += len(group)
+
+    def _dispatch(self, cmd: dict) -> None:
+        try:
+            getattr(self, f"_op_{cmd['op']}")(cmd)
+        except (OSError, ValueError) as e:
+            self._fail(cmd, "state", str(e))
+        except RuntimeError as e:
+            self._fail(cmd, "lock", str(e))
+
+    def _load(self, session_id: str) -> Optional[ChainState]:
+        """캐시된 상태 (파일이 바뀌었으면 다시 읽음, 호출자는 수정 금지)"""
+        try:
+            st = get_state_path(session_id).stat()
+        except FileNotFoundError:
+            self._states.pop(session_id, None)
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._states.get(session_id)
+        if cached and cached[0] == key:
+            return cached[1]
+        state = load_state_unsafe(session_id)
+        if state is not None:
+            self._states[session_id] = (key, state)
+        return state
+
+    def _remember(self, session_id: str, state: ChainState) -> None:
+        st = get_state_path(session_id).stat()
+        self._states[session_id] = ((st.st_ino, st.st_mtime_ns, st.st_size), state)
+
+    def _op_start(self, cmd: dict) -> None:
+        task = cmd.get("task")
+        if not task:
+            raise ValueError("Missing task")
+        chain = cmd.get("chain")
+        if chain and chain not in self.config.get("chains", {}):
+            raise ValueError(f"Unknown chain: {chain}")
+        state = start_chain(task, self.config, force_chain=chain)
+        self.session = state.session_id
+        self._remember(state.session_id, state)
+        self._respond(cmd, ok=True, **state_summary(state))
+
+    def _op_status(self, cmd: dict) -> None:
+        sid = cmd.get("session") or self.session
+        state = self._load(sid) if sid else None
+        if state is None:
+            self._respond(cmd, ok=True, session=sid or None, status=ChainStatus.IDLE.value)
+            return
+        self._respond(cmd, ok=True, **state_summary(state))
+
+    def _op_query(self, cmd: dict) -> None:
+        sid = cmd.get("session") or self.session
+        state = self._load(sid) if sid else None
+        if state is None:
+            raise ValueError("No active session")
+        role = cmd.get("role")
+        if role:
+            if role not in state.role_results:
+                raise ValueError(f"No result for {role}")
+            self._respond(cmd, ok=True, session=sid, role=role, result=state.get_result(role))
+            return
+        data = state.to_dict()
+        fields = cmd.get("fields")
+        if fields:
+            unknown = [f for f in fields if f not in data]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            data = {f: data[f] for f in fields}
+        self._respond(cmd, ok=True, session=sid, state=data)
+
+    def _op_reset(self, cmd: dict) -> None:
+        sid = cmd.get("session") or self.session
+        get_event_log().emit("reset", sid or "")
+        if sid:
+            clear_state(sid)
+            self._states.pop(sid, None)
+        # 포인터가 이 세션을 가리킬 때만 정리
+        clear_session(sid or None)
+        if sid == self.session:
+            self.session = ""
+        self._respond(cmd, ok=True, session=sid or None)
+
+    def _results_for(self, cmd: dict) -> tuple[list[str], dict]:
+        """complete 명령 → (역할 목록, 역할별 결과), 파일 결과는 락 전에 스트리밍 수집"""
+        spec = cmd.get("results") or {}
+        if not isinstance(spec, dict):
+            raise ValueError("results must be an object")
+        roles = cmd.get("roles") or cmd.get("role") or list(spec)
+        if isinstance(roles, str):
+            roles = [r.strip() for r in roles.split(",") if r.strip()]
+        if not roles:
+            raise ValueError("Missing roles")
+        unknown = [role for role in spec if role not in roles]
+        if unknown:
+            raise ValueError(f"Results for roles not in roles: {', '.join(unknown)}")
+
+        if self.keywords is None:
+            self.keywords = verdict_keywords(self.config)
+        results: dict = {}
+        for role, value in spec.items():
+            if isinstance(value, dict) and "path" in value:
+                results[role] = ingest_file(str(Path(value["path"]).expanduser()), self.config,
+                                            keywords=self.keywords)
+            elif isinstance(value, dict) and "result" in value:
+                results[role] = str(value["result"])
+            else:
+                results[role] = str(value)
+        if cmd.get("result_file") and any(role not in results for role in roles):
+            shared = ingest_file(str(Path(cmd["result_file"]).expanduser()), self.config,
+                                 keywords=self.keywords)
+            for role in roles:
+                results.setdefault(role, shared)
+        for role in roles:
+            results.setdefault(role, str(cmd.get("result", "pass")))
+        return roles, results
+
+    def _complete_group(self, sid: str, group: list[dict]) -> None:
+        """같은 세션 연속 complete: 락 1회, 상태 읽기/쓰기 1회"""
+        prepared = []
+        outcome: dict[int, tuple] = {}
+        for n, cmd in enumerate(group):
+            try:
+                prepared.append((n, cmd, *self._results_for(cmd)))
+            except (OSError, ValueError) as e:
+                outcome[n] = ("input", str(e))
+
+        applied = []  # (n, cmd, roles, results, before, state 사본, 시작 시각)
+        if prepared and not sid:
+            for n, *_ in prepared:
+                outcome[n] = ("state", "No active session")
+        elif prepared:
+            started = time.perf_counter()
+            try:
+                applied = self._apply_group(sid, prepared, outcome)
+            except RuntimeError as e:
+                for n, cmd, roles, results in prepared:
+                    outcome[n] = ("lock", str(e))
+                    if recording_enabled():
+                        _record_complete(sid, roles, results, started, error=f"RuntimeError: {e}")
+
+        # 이벤트/기록/응답은 락 해제 후
+        for n, cmd, roles, results, before, state, started in applied:
+            emit_completion_events(before, state, roles, results)
+            if recording_enabled():
+                _record_complete(sid, roles, results, started, state=state)
+            outcome[n] = ("ok", state)
+        if applied:  # half-open 회로 닫기 / 연속 오류 초기화 (breaker 파일 락 1회)
+            breaker.record_success(sid, [role for _, _, roles, *_ in applied for role in roles], STATE_DIR)
+        last = applied[-1][5] if applied else None
+        if last is not None and is_terminal(last):
+            clear_checkpoint(sid)
+            clear_session(sid)
+
+        for n, cmd in enumerate(group):
+            kind, value = outcome[n]
+            if kind == "ok":
+                self._respond(cmd, ok=True, **state_summary(value))
+            else:
+                if kind == "state":  # 락 실패는 state_lock에서 기록
+                    get_event_log().emit("error", sid, kind="state", roles=cmd.get("roles"), message=value)
+                self._fail(cmd, kind, value)
+
+    def _apply_group(self, sid: str, prepared: list, outcome: dict) -> list:
+        applied = []
+        with state_lock(sid):
+            cached = self._load(sid)
+            if cached is None:
+                for n, *_ in prepared:
+                    outcome[n] = ("state", "No active session")
+                return applied
+            state = copy.deepcopy(cached)
+            for n, cmd, roles, results in prepared:
+                started = time.perf_counter()
+                if is_terminal(state):
+                    outcome[n] = ("state", f"Chain already finished: {state.status}")
+                    continue
+                before = _transition_snapshot(state)
+                snapshot = copy.deepcopy(state)
+                try:
+                    state = _complete_role_impl(state, roles, results, self.config,
+                                                memo=get_result_cache(self.config))
+                except (IndexError, KeyError, TypeError, ValueError) as e:
+                    state = snapshot
+                    outcome[n] = ("state", f"{type(e).__name__}: {e}")
+                    continue
+                applied.append((n, cmd, roles, results, before, copy.deepcopy(state), started))
+            if applied:
+                save_state_atomic(state, sid)
+                self._remember(sid, state)
+        return applied
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -749,8 +1892,21 @@ def main() -> None:
   %(prog)s --chain FULL "작업 내용"    풀체인 강제
   %(prog)s --complete ideator          역할 완료
   %(prog)s --complete "left,right"     병렬 역할 완료
+  %(prog)s -c critic --result-file out.md                  결과 파일 (스트리밍)
+  %(prog)s -c a,b --result-file a=a.md --result-file b=b.md 병렬 역할별 결과
+  %(prog)s --results-jsonl results.jsonl                   역할별 결과 일괄
   %(prog)s --status                    상태 확인
+  %(prog)s --result-of critic          역할 결과 원문 출력
   %(prog)s --reset                     초기화
+  %(prog)s --sessions                  네임스페이스별 현재 세션 목록
+  %(prog)s --heartbeat executor-hojo   실행 중 역할 하트비트 (sage-supervisor)
+  %(prog)s --fail executor --error "503 overloaded"   역할 실패 (retry 정책으로 재시도/종료)
+  %(prog)s --batch cmds.jsonl          JSONL 명령 일괄 실행 (생략 또는 "-"면 stdin)
+  %(prog)s --memo-stats                역할 결과 캐시 지표 (적중/저장/제거)
+  %(prog)s --resume SESSION            끊긴 체인 재개 (완료 기록 없는 역할만 다시 실행)
+  %(prog)s --migrate-state binary      상태 파일 형식 일괄 변환 (SAGE_STATE_FORMAT)
+  %(prog)s --wait-for-change --timeout 30   상태가 바뀔 때까지 대기 → 바뀐 필드 (시간 초과 시 종료 코드 2)
+  %(prog)s --watch                     체인이 끝날 때까지 변경마다 바뀐 필드 출력 (SAGE_WATCH)
         """
     )
 
@@ -759,23 +1915,196 @@ def main() -> None:
                        help="완료된 역할 (쉼표로 구분)")
     parser.add_argument("--result", "-r", default="pass",
                        help="역할 실행 결과")
+    parser.add_argument("--result-file", action="append", metavar="[ROLE=]PATH",
+                       help="역할 결과 파일 (ROLE=PATH 반복 가능, PATH만 주면 나머지 역할 공통)")
+    parser.add_argument("--result-stdin", action="store_true",
+                       help="stdin을 역할 결과로 사용 (지정되지 않은 역할 공통)")
+    parser.add_argument("--results-jsonl", metavar="PATH",
+                       help='역할별 결과 JSONL {"role", "path"|"result"} ("-"는 stdin)')
     parser.add_argument("--status", "-s", action="store_true",
                        help="현재 상태 출력")
+    parser.add_argument("--sessions", action="store_true",
+                       help="네임스페이스별 현재 세션 목록 (SAGE_NAMESPACE)")
+    parser.add_argument("--result-of", metavar="ROLE",
+                       help="역할 결과 원문 출력 (저장소에서 로드)")
     parser.add_argument("--reset", action="store_true",
                        help="상태 초기화")
     parser.add_argument("--chain", choices=["FULL", "QUICK", "REVIEW", "DESIGN"],
                        help="체인 강제 지정 (기본: 키워드 기반 자동 선택)")
+    parser.add_argument("--fail", metavar="ROLE",
+                       help="역할 실패 보고 (config.yaml retry 정책: 재시도 / 건너뛰기 / 종료)")
+    parser.add_argument("--error", default="",
+                       help="--fail 오류 메시지 (재시도 가능 여부 분류에 사용)")
+    parser.add_argument("--error-kind", choices=["transient", "permanent"],
+                       help="--fail 오류 분류 지정 (기본: 메시지로 분류)")
+    parser.add_argument("--heartbeat", metavar="ROLES",
+                       help="실행 중인 역할 하트비트 갱신 (쉼표로 구분)")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="PATH",
+                       help="JSONL 명령 일괄 실행, 명령마다 JSONL 응답 (기본: stdin)")
+    parser.add_argument("--memo-stats", action="store_true",
+                       help="역할 결과 캐시 지표 출력 (config.yaml memo)")
+    parser.add_argument("--resume", nargs="?", const="", metavar="SESSION",
+                       help="끊긴 체인 재개 (생략 시 현재 세션, 없으면 체크포인트 목록)")
+    parser.add_argument("--migrate-state", nargs="?", const="", metavar="FORMAT",
+                       help="상태 / 체크포인트 파일을 json | compact | binary로 변환 (기본: SAGE_STATE_FORMAT)")
+    parser.add_argument("--wait-for-change", nargs="?", const="", metavar="SESSION",
+                       help="상태 파일이 바뀔 때까지 대기 후 바뀐 필드 출력 (생략 시 현재 세션, inotify / FIFO)")
+    parser.add_argument("--watch", nargs="?", const="", metavar="SESSION",
+                       help="체인이 끝날 때까지 변경마다 바뀐 필드 출력 (생략 시 현재 세션)")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS",
+                       help="--wait-for-change / --watch: 변경 없이 기다릴 최대 시간 (초과 시 종료 코드 2)")
 
     args = parser.parse_args()
+    get_event_log("orchestrator")
+    with profiled("orchestrator", _cli_verb(args), session=peek_session_id):
+        _run_cli(parser, args)
+
+
+def _cli_verb(args: argparse.Namespace) -> str:
+    """프로파일 덤프 파일명용 동사"""
+    if args.batch:
+        return "batch"
+    if args.reset:
+        return "reset"
+    if args.resume is not None:
+        return "resume"
+    if args.migrate_state is not None:
+        return "migrate"
+    if args.wait_for_change is not None or args.watch is not None:
+        return "watch"
+    if args.status or args.sessions or args.memo_stats:
+        return "status"
+    if args.result_of:
+        return "result"
+    if args.heartbeat:
+        return "heartbeat"
+    if args.fail:
+        return "fail"
+    if args.complete or args.results_jsonl:
+        return "complete"
+    if args.task:
+        return "start"
+    return "help"
+
+
+def _collect_results(args: argparse.Namespace, config: dict) -> "tuple[list[str], dict[str, str | RoleResult]]":
+    """--complete / --result* 인자 → (역할 목록, 역할별 결과)
+
+    우선순위: --results-jsonl > --result-file ROLE=PATH > --result-file PATH
+    > --result-stdin > --result. 파일/stdin 결과는 락 획득 전에 스트리밍으로
+    저장·판정해 두고 RoleResult로 넘긴다.
+    """
+    # 쉼표로 구분된 역할 파싱
+    roles = [r.strip() for r in args.complete.split(",")] if args.complete else []
+    results: dict = {}
+
+    if args.results_jsonl:
+        if args.result_stdin and args.results_jsonl == "-":
+            raise ValueError("--result-stdin and --results-jsonl - both read stdin")
+        if args.results_jsonl == "-":
+            results.update(read_results_jsonl(sys.stdin, config))
+        else:
+            with open(args.results_jsonl, encoding="utf-8") as f:
+                results.update(read_results_jsonl(f, config))
+        unknown = [role for role in results if roles and role not in roles]
+        if unknown:
+            raise ValueError(f"Results for roles not in --complete: {', '.join(unknown)}")
+        roles = roles or list(results)
+
+    if args.result_file:
+        ingested: dict = {}  # 같은 파일을 여러 역할이 공유하면 한 번만 읽음
+        for role, path in parse_result_files(args.result_file, roles).items():
+            if role not in results:
+                if path not in ingested:
+                    ingested[path] = ingest_file(path, config)
+                results[role] = ingested[path]
+
+    if args.result_stdin and any(role not in results for role in roles):
+        shared = ingest_stream(sys.stdin.buffer, config)
+        for role in roles:
+            results.setdefault(role, shared)
+
+    for role in roles:
+        results.setdefault(role, args.result)
+    return roles, results
+
+
+def _run_cli(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     config = load_config()
 
+    # 일괄 실행
+    if args.batch:
+        runner = BatchRunner(config)
+        if args.batch == "-":
+            code = runner.run(sys.stdin.fileno())
+        else:
+            try:
+                with open(args.batch, "rb") as f:
+                    code = runner.run(f.fileno())
+            except OSError as e:
+                print(f"ERROR: {e}")
+                sys.exit(1)
+        if code:
+            sys.exit(code)
+        return
+
     # 초기화
     if args.reset:
+        get_event_log().emit("reset", peek_session_id())
         clear_state()
         clear_session()
         print("RESET: OK")
         return
 
+    # 끊긴 체인 재개 (상태 파일 → 체크포인트)
+    if args.resume is not None:
+        session_id = args.resume or peek_session_id()
+        if not session_id:
+            resumable = checkpoint.list_checkpoints(STATE_DIR)
+            if not resumable:
+                print("ERROR: No checkpoints to resume")
+                sys.exit(1)
+            for sid in resumable:
+                info = read_state_fields(checkpoint.checkpoint_path(sid, STATE_DIR),
+                                         ("chain_name", "current_phase", "phases"))
+                if info and len(info) == 3:
+                    print(f"RESUMABLE: {sid}\t{info['chain_name']}\tphase {info['current_phase'] + 1}/{len(info['phases'])}")
+            return
+        try:
+            state, source = resume_chain(session_id)
+        except (ValueError, RuntimeError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        print_resume(state, source)
+        return
+
+    # 상태 파일 형식 변환 (codec.py)
+    if args.migrate_state is not None:
+        fmt = args.migrate_state or codec.state_format()
+        if fmt not in codec.FORMATS:
+            print(f"ERROR: Unknown state format: {fmt} ({' | '.join(codec.FORMATS)})")
+            sys.exit(1)
+        counts = migrate_state_files(fmt)
+        print(f"MIGRATED: {counts['migrated']} → {fmt} (skipped {counts['skipped']}, failed {counts['failed']})")
+        if counts["failed"]:
+            sys.exit(1)
+        return
+
+    # 상태 변경 대기 (--status 폴링 대신, watch.py)
+    if args.wait_for_change is not None or args.watch is not None:
+        follow = args.watch is not None
+        session_id = (args.watch if follow else args.wait_for_change) or peek_session_id()
+        if not session_id:
+            print("ERROR: No active session")
+            sys.exit(1)
+        try:
+            code = watch_state(session_id, args.timeout, follow)
+        except KeyboardInterrupt:
+            code = 130
+        if code:
+            sys.exit(code)
+        return
+
     # 상태 확인
     if args.status:
         state = load_state()
@@ -785,16 +2114,77 @@ def main() -> None:
             print("STATUS: idle")
         return
 
+    # 하트비트 (상태 파일은 읽지 않음)
+    if args.heartbeat:
+        session_id = peek_session_id()
+        if not session_id:
+            print("ERROR: No active session")
+            sys.exit(1)
+        for role in (r.strip() for r in args.heartbeat.split(",")):
+            if role:
+                beat(session_id, role)
+        print("HEARTBEAT: OK")
+        return
+
+    # 네임스페이스별 세션 목록 (* = 현재 네임스페이스)
+    if args.sessions:
+        here = current_namespace()
+        for namespace, session_id in list_current(STATE_DIR).items():
+            info = read_state_fields(get_state_path(session_id), ("status",))
+            status = (info or {}).get("status", "missing")
+            print(f"{'*' if namespace == here else ' '} {namespace}\t{session_id}\t{status}")
+        return
+
+    # 결과 캐시 지표 (세션별 적중률은 --status MEMO)
+    if args.memo_stats:
+        memo = get_result_cache(config)
+        if memo is None:
+            print("MEMO: disabled")
+            return
+        print(json.dumps(memo.stats(), ensure_ascii=False))
+        return
+
+    # 역할 결과 조회
+    if args.result_of:
+        state = load_state()
+        if state is None or args.result_of not in state.role_results:
+            print(f"ERROR: No result for {args.result_of}")
+            sys.exit(1)
+        try:
+            sys.stdout.write(state.get_result(args.result_of))
+        except FileNotFoundError:
+            print(f"ERROR: Result blob missing for {args.result_of}")
+            sys.exit(1)
+        return
+
+    # 역할 실패 (재시도 정책 + circuit breaker)
+    if args.fail:
+        retryable = None if args.error_kind is None else args.error_kind == "transient"
+        try:
+            state, decision = fail_role_atomic(args.fail, args.error, config, retryable=retryable)
+        except ValueError as e:
+            get_event_log().emit("error", peek_session_id(), kind="state", roles=[args.fail], message=str(e))
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        except RuntimeError as e:
+            print(f"LOCK_ERROR: {e}")
+            sys.exit(1)
+        print_fail(state, decision)
+        return
+
     # 역할 완료 (원자적 업데이트)
-    if args.complete:
-        # 쉼표로 구분된 역할 파싱
-        roles = [r.strip() for r in args.complete.split(",")]
-        results = {role: args.result for role in roles}
+    if args.complete or args.results_jsonl:
+        try:
+            roles, results = _collect_results(args, config)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
 
         try:
             state = complete_role_atomic(roles, results, config)
             print_complete(state)
         except ValueError as e:
+            get_event_log().emit("error", peek_session_id(), kind="state", roles=roles, message=str(e))
             print(f"ERROR: {e}")
             sys.exit(1)
         except RuntimeError as e:
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Sage Session Replay - 기록된 세션을 상태 머신에 재생
+
+SAGE_RECORD=1로 기록한 호출 순서(sage_trace_{session}.jsonl, trace.py 참고)를
+현재 코드의 상태 머신에 다시 흘려 전이 후 상태와 호출별 소요 시간을 얻는다.
+두 코드 버전에서 각각 재생한 결과 파일을 diff하면 정확성/지연 회귀를
+실제 세션 기준으로 확인할 수 있다.
+
+재생 모드:
+  memory - new_chain_state / _complete_role_impl만 구동 (순수 전이 비용)
+  file   - start_chain / complete_role_atomic 구동 (락 + 원자적 저장 포함)
+           라이브 세션 포인터를 건드리지 않도록 임시 SAGE_STATE_DIR에서 실행
+           (기록된 결과 blob은 원래 SAGE_STATE_DIR의 저장소에서 읽음)
+
+결과 캐시(memo.py)는 재생에 쓰지 않는다 (run이 SAGE_MEMO=off로 실행 - 반복 재생끼리
+캐시를 공유하지 않도록). 기록 중 캐시 적중(memo_hits)이 있었던 세션은 SAGE_MEMO=off로
+기록해야 재생 상태가 일치한다.
+
+사용법:
+  SAGE_RECORD=1 sage-orchestrator "작업"              기록
+  sage-replay list                                    기록 목록
+  sage-replay run trace.jsonl --out v1.json           재생 (전속력)
+  sage-replay run trace.jsonl --realtime --speed 10   기록 간격의 1/10로 재생
+  sage-replay diff v1.json v2.json                    두 버전 비교
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from ..blobs import BlobStore, MemoryBlobStore, get_blob_store
+from ..trace import FILE_PREFIX, config_digest, load_trace, normalize_state
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+MODES = ("memory", "file")
+LOCK_ERROR_PREFIX = "RuntimeError"  # 기록 시점 경합 결과 - 재생으로 재현 불가
+
+
+def _orchestrator():
+    """오케스트레이터 지연 import
+
+    STATE_DIR이 import 시점에 고정되므로 file 모드는 main()에서
+    SAGE_STATE_DIR을 임시 디렉토리로 바꾼 뒤 처음 import해야 한다.
+    """
+    from . import orchestrator
+    return orchestrator
+
+
+# =============================================================================
+# State Diff
+# =============================================================================
+
+def diff_states(expected: Optional[dict], actual: Optional[dict]) -> list[str]:
+    """필드 단위 상태 차이 (비교 제외 필드는 normalize_state 기준)"""
+    if expected is None or actual is None:
+        return [] if expected == actual else [f"state: {_short(expected)} -> {_short(actual)}"]
+    diffs = []
+    for key in sorted(set(expected) | set(actual)):
+        if expected.get(key) != actual.get(key):
+            diffs.append(f"{key}: {_short(expected.get(key))} -> {_short(actual.get(key))}")
+    return diffs
+
+
+def _short(value, limit: int = 120) -> str:
+    text = json.dumps(value, ensure_ascii=False, default=str)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+class Replayer:
+    """기록 1건을 지정 모드로 재생"""
+
+    def __init__(self, trace: list[dict], config: dict, mode: str = "memory",
+                 source_blobs: Optional[BlobStore] = None):
+        """source_blobs: 기록된 {"blob": ref} 결과를 읽을 저장소 (기본: get_blob_store())"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown replay mode: {mode}")
+        if not trace or trace[0].get("op") != "start":
+            raise ValueError("Trace must begin with a start record")
+        self.trace = trace
+        self.config = config
+        self.mode = mode
+        self.source_blobs = source_blobs or get_blob_store()
+
+    def run_once(self, realtime: bool = False, speed: float = 1.0) -> list[dict]:
+        """기록 전체를 1회 재생 → 단계별 결과"""
+        orch = _orchestrator()
+        self.blobs = MemoryBlobStore()
+        state = None
+        steps = []
+        origin_rec = self.trace[0].get("mono", 0.0)
+        origin = time.perf_counter()
+
+        for index, record in enumerate(self.trace):
+            if realtime:
+                target = origin + (record.get("mono", origin_rec) - origin_rec) / max(speed, 1e-9)
+                delay = target - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            step = {"index": index + 1, "op": record.get("op"), "roles": record.get("roles", [])}
+            if record.get("op") == "complete" and str(record.get("error", "")).startswith(LOCK_ERROR_PREFIX):
+                # 락 실패는 상태를 바꾸지 않았으므로 건너뜀
+                step.update(skipped=True, elapsed_ms=0.0, state=None, error=record["error"])
+                steps.append(step)
+                continue
+
+            error = ""
+            t0 = time.perf_counter()
+            try:
+                if record.get("op") == "start":
+                    state = self._start(orch, record)
+                elif record.get("op") == "complete":
+                    state = self._complete(orch, state, record)
+                else:
+                    raise ValueError(f"Unknown trace op: {record.get('op')}")
+            except Exception as e:  # 회귀로 인한 예외도 재생 결과로 기록
+                error = f"{type(e).__name__}: {e}"
+            elapsed = (time.perf_counter() - t0) * 1000
+
+            step.update(
+                elapsed_ms=round(elapsed, 4),
+                state=normalize_state(state.to_dict()) if state is not None and not error else None,
+                error=error,
+            )
+            steps.append(step)
+
+        if self.mode == "file":
+            self._cleanup(orch)
+        return steps
+
+    # -- memory mode ----------------------------------------------------------
+
+    def _chain_for(self, orch, record: dict) -> str:
+        if record.get("forced"):
+            return record["chain"]
+        return orch.select_chain(record.get("task", ""), self.config)
+
+    def _start(self, orch, record: dict):
+        if self.mode == "file":
+            self._cleanup(orch)
+            forced = record["chain"] if record.get("forced") else None
+            return orch.start_chain(record.get("task", ""), self.config, force_chain=forced)
+        return orch.new_chain_state(record.get("sid", "replay"), record.get("task", ""),
+                                    self._chain_for(orch, record), self.config, now=record.get("ts"))
+
+    def _complete(self, orch, state, record: dict):
+        roles = record.get("roles", [])
+        results = {role: self.source_blobs.get(r["blob"]) if isinstance(r, dict) else r
+                   for role, r in record.get("results", {}).items()}
+        if self.mode == "file":
+            return orch.complete_role_atomic(roles, results, self.config)
+        if state is None or orch.is_terminal(state):
+            raise ValueError("No active session")
+        return orch._complete_role_impl(state, roles, results, self.config, now=record.get("ts"),
+                                        blob_store=self.blobs)
+
+    # -- file mode --------------------------------------------------------------
+
+    def _cleanup(self, orch) -> None:
+        """이전 재생 세션 파일 정리 (명시적 경로 - 공유 포인터에 의존하지 않음)"""
+        session_id = orch.peek_session_id()
+        if session_id:
+            path = orch.STATE_DIR / f"sage_state_{session_id}.json"
+            path.unlink(missing_ok=True)
+            path.with_suffix(".lock").unlink(missing_ok=True)
+        orch.clear_session()
+
+    def run(self, repeat: int = 1, realtime: bool = False, speed: float = 1.0) -> dict:
+        """repeat회 재생 후 단계별 중앙값 시간 + 기록 대비 상태 차이"""
+        runs = [self.run_once(realtime, speed) for _ in range(max(1, repeat))]
+        steps = []
+        for index, record in enumerate(self.trace):
+            samples = [run[index]["elapsed_ms"] for run in runs]
+            step = dict(runs[-1][index])
+            step["elapsed_ms"] = round(statistics.median(samples), 4)
+            step["samples_ms"] = samples
+            step["recorded_ms"] = record.get("elapsed_ms")
+            step["diff"] = []
+            if step.get("skipped"):
+                pass
+            elif "error" in record:
+                if not step["error"]:
+                    step["diff"].append(f"error: recorded {_short(record['error'])}, replay succeeded")
+            else:
+                step["diff"] = diff_states(record.get("state"), step["state"])
+                if step["error"]:
+                    step["diff"].append(f"error: {_short(step['error'])}")
+            # 반복 간 결과가 다르면 비결정성
+            if any(run[index].get("state") != step["state"] for run in runs):
+                step["diff"].append("nondeterministic: state differs across repeats")
+            steps.append(step)
+
+        start = self.trace[0]
+        return {
+            "session": start.get("sid"),
+            "chain": start.get("chain"),
+            "mode": self.mode,
+            "repeat": len(runs),
+            "realtime": realtime,
+            "config_digest": config_digest(self.config),
+            "recorded_config_digest": start.get("config_digest"),
+            "steps": steps,
+            "summary": {
+                "steps": len(steps),
+                "skipped": sum(1 for s in steps if s.get("skipped")),
+                "mismatches": sum(1 for s in steps if s["diff"]),
+                "total_ms": round(sum(s["elapsed_ms"] for s in steps), 4),
+                "recorded_total_ms": round(sum(r.get("elapsed_ms") or 0.0 for r in self.trace), 4),
+            },
+        }
+
+
+# =============================================================================
+# Result Diff
+# =============================================================================
+
+def diff_results(a: dict, b: dict, threshold_pct: float = 20.0) -> dict:
+    """두 재생 결과(코드 버전 A/B) 비교"""
+    steps = []
+    for sa, sb in zip(a.get("steps", []), b.get("steps", [])):
+        a_ms, b_ms = sa.get("elapsed_ms", 0.0), sb.get("elapsed_ms", 0.0)
+        delta = ((b_ms - a_ms) / a_ms * 100) if a_ms else 0.0
+        state_diff = diff_states(sa.get("state"), sb.get("state"))
+        if sa.get("error") != sb.get("error"):
+            state_diff.append(f"error: {_short(sa.get('error'))} -> {_short(sb.get('error'))}")
+        steps.append({
+            "index": sa.get("index"),
+            "op": sa.get("op"),
+            "roles": sa.get("roles", []),
+            "a_ms": a_ms,
+            "b_ms": b_ms,
+            "delta_pct": round(delta, 1),
+            "slower": delta > threshold_pct,
+            "state_diff": state_diff,
+        })
+
+    length_mismatch = len(a.get("steps", [])) != len(b.get("steps", []))
+    total_a = a.get("summary", {}).get("total_ms", 0.0)
+    total_b = b.get("summary", {}).get("total_ms", 0.0)
+    return {
+        "session": a.get("session"),
+        "modes": [a.get("mode"), b.get("mode")],
+        "length_mismatch": length_mismatch,
+        "state_diffs": sum(1 for s in steps if s["state_diff"]) + int(length_mismatch),
+        "slower_steps": sum(1 for s in steps if s["slower"]),
+        "total_a_ms": total_a,
+        "total_b_ms": total_b,
+        "total_delta_pct": round((total_b - total_a) / total_a * 100, 1) if total_a else 0.0,
+        "steps": steps,
+    }
+
+
+# =============================================================================
+# Output Formatting
+# =============================================================================
+
+def _roles_label(roles: list[str], limit: int = 36) -> str:
+    label = ",".join(roles) if roles else "-"
+    return label if len(label) <= limit else label[:limit - 3] + "..."
+
+
+def print_run(result: dict) -> None:
+    s = result["summary"]
+    print(f"SESSION: {result['session']}")
+    print(f"CHAIN: {result['chain']}")
+    print(f"MODE: {result['mode']} x{result['repeat']}{' (realtime)' if result['realtime'] else ''}")
+    if result["recorded_config_digest"] and result["recorded_config_digest"] != result["config_digest"]:
+        print(f"CONFIG_CHANGED: {result['recorded_config_digest']} -> {result['config_digest']}")
+    print(f"{'STEP':>4}  {'OP':<9} {'ROLES':<36} {'REC_MS':>9} {'REPLAY_MS':>10}  RESULT")
+    for step in result["steps"]:
+        rec = step.get("recorded_ms")
+        outcome = "skipped" if step.get("skipped") else ("MISMATCH" if step["diff"] else "ok")
+        print(f"{step['index']:>4}  {step['op']:<9} {_roles_label(step['roles']):<36} "
+              f"{rec if rec is not None else '-':>9} {step['elapsed_ms']:>10}  {outcome}")
+        for line in step["diff"]:
+            print(f"        {line}")
+    print(f"MISMATCHES: {s['mismatches']}/{s['steps']}")
+    print(f"TOTAL_MS: replay={s['total_ms']} recorded={s['recorded_total_ms']}")
+
+
+def print_diff(report: dict) -> None:
+    print(f"SESSION: {report['session']}")
+    print(f"MODES: {report['modes'][0]} -> {report['modes'][1]}")
+    print(f"{'STEP':>4}  {'OP':<9} {'ROLES':<36} {'A_MS':>10} {'B_MS':>10} {'DELTA':>8}")
+    for step in report["steps"]:
+        flag = " *" if step["slower"] else ""
+        print(f"{step['index']:>4}  {step['op']:<9} {_roles_label(step['roles']):<36} "
+              f"{step['a_ms']:>10} {step['b_ms']:>10} {step['delta_pct']:>7}%{flag}")
+        for line in step["state_diff"]:
+            print(f"        {line}")
+    if report["length_mismatch"]:
+        print("LENGTH_MISMATCH: results cover different step counts")
+    print(f"STATE_DIFFS: {report['state_diffs']}")
+    print(f"SLOWER_STEPS: {report['slower_steps']}")
+    print(f"TOTAL_MS: {report['total_a_ms']} -> {report['total_b_ms']} ({report['total_delta_pct']:+}%)")
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sage Session Replay - 기록 세션 재생/비교",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  SAGE_RECORD=1 sage-orchestrator "작업"              세션 기록
+  %(prog)s list                                      기록 목록
+  %(prog)s run trace.jsonl --repeat 20 --out a.json  재생 (단계별 중앙값)
+  %(prog)s run trace.jsonl --mode file --realtime    파일/락 경로, 기록 간격 유지
+  %(prog)s diff a.json b.json                        코드 버전 간 비교
+        """
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    ls = sub.add_parser("list", help="기록 목록")
+    ls.add_argument("--dir", help="기록 디렉토리 (기본: SAGE_STATE_DIR)")
+
+    run = sub.add_parser("run", help="기록 재생")
+    run.add_argument("trace", help="sage_trace_{session}.jsonl 경로")
+    run.add_argument("--mode", choices=MODES, default="memory", help="재생 모드 (기본: memory)")
+    run.add_argument("--repeat", type=int, default=1, help="반복 횟수 (단계별 중앙값)")
+    run.add_argument("--realtime", action="store_true", help="기록된 호출 간격 유지")
+    run.add_argument("--speed", type=float, default=1.0, help="--realtime 배속 (기본: 1.0)")
+    run.add_argument("--config", help="체인 설정 파일 (기본: 내장 config.yaml)")
+    run.add_argument("--out", help="재생 결과 JSON 저장 경로 (diff 입력)")
+    run.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    df = sub.add_parser("diff", help="재생 결과 비교")
+    df.add_argument("a", help="기준 결과 JSON")
+    df.add_argument("b", help="비교 결과 JSON")
+    df.add_argument("--threshold", type=float, default=20.0, help="지연 회귀 표시 기준 %% (기본: 20)")
+    df.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        directory = Path(args.dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+        for path in sorted(directory.glob(f"{FILE_PREFIX}*.jsonl")):
+            records = load_trace(path)
+            start = records[0] if records else {}
+            print(f"{start.get('sid', '?')}\t{start.get('chain', '?')}\t{len(records)}\t{path}")
+        return
+
+    if args.command == "run":
+        os.environ.pop("SAGE_RECORD", None)  # 재생 중 재기록 방지
+        os.environ["SAGE_MEMO"] = "off"  # file 모드 start_chain / complete_role_atomic의 캐시 적중 방지
+        source_blobs = BlobStore()  # 기록 시 결과가 저장된 곳 (임시 디렉토리로 바꾸기 전에 고정)
+        if args.mode == "file":
+            os.environ["SAGE_STATE_DIR"] = tempfile.mkdtemp(prefix="sage-replay-")
+            os.environ.pop("SAGE_SESSION_ID", None)
+        orch = _orchestrator()
+        if args.config:
+            config = yaml.safe_load(Path(args.config).read_text(encoding="utf-8")) or {}
+        else:
+            config = orch.load_config()
+
+        try:
+            replayer = Replayer(load_trace(Path(args.trace)), config, args.mode, source_blobs)
+            result = replayer.run(args.repeat, args.realtime, args.speed)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+        result["trace"] = args.trace
+
+        if args.out:
+            Path(args.out).write_text(json.dumps(result, ensure_ascii=False, indent=2))
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print_run(result)
+            if args.out:
+                print(f"SAVED: {args.out}")
+        sys.exit(1 if result["summary"]["mismatches"] else 0)
+
+    if args.command == "diff":
+        a = json.loads(Path(args.a).read_text())
+        b = json.loads(Path(args.b).read_text())
+        report = diff_results(a, b, args.threshold)
+        if args.json:
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+        else:
+            print_diff(report)
+        sys.exit(1 if report["state_diffs"] else 0)
+
+    parser.print_help()
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Sage Chain Simulator - 체인 구성별 makespan / 임계 경로 예측
+
+config.yaml 변경(6조 그룹 분리, 검토 기관 추가 등) 전에 지연 영향을
+오프라인으로 예측한다. 오케스트레이터의 실제 상태 머신
+(_complete_role_impl)을 메모리에서 그대로 구동하는 몬테카를로 시뮬레이션.
+
+사양 파일 (YAML/JSON):
+  chain: FULL
+  runs: 1000
+  seed: 42
+  durations:                       # 초 단위, fnmatch 패턴 지원
+    default: {dist: lognormal, median: 60, sigma: 0.5}
+    sage: {dist: fixed, value: 30}
+    "ideator-*": {dist: uniform, low: 20, high: 90}
+  branches:                        # 역할별 분기/종료 확률
+    sagawon: {branch: 0.2}
+    saheonbu: {exit: 0.01}
+  history: sage_history.jsonl      # 선택: {"role":..., "duration":...} JSONL
+
+사용법:
+  sage-simulate --chain FULL --runs 2000
+  sage-simulate --spec sim.yaml --config proposed.yaml --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import math
+import random
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from ..blobs import MemoryBlobStore
+from .orchestrator import (
+    ChainState,
+    PhaseItem,
+    _complete_role_impl,
+    is_terminal,
+    load_config,
+    new_chain_state,
+    split_phase_roles,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_DURATION = {"dist": "lognormal", "median": 60.0, "sigma": 0.5}
+MAX_STEPS = 10_000  # 분기 루프 폭주 방지
+PASS_RESULT = "pass"
+
+
+# =============================================================================
+# Duration Model
+# =============================================================================
+
+class DurationModel:
+    """역할별 소요 시간 분포
+
+    우선순위: 명시 사양(정확 일치 → 패턴) → 이력 샘플 → default
+    """
+
+    def __init__(self, specs: Optional[dict] = None, history: Optional[dict[str, list[float]]] = None):
+        self.specs = dict(specs or {})
+        self.default = self.specs.pop("default", DEFAULT_DURATION)
+        self.history = history or {}
+
+    def spec_for(self, role: str) -> dict:
+        if role in self.specs:
+            return self.specs[role]
+        for pattern, spec in self.specs.items():
+            if fnmatch.fnmatchcase(role, pattern):
+                return spec
+        samples = self.history.get(role)
+        if samples:
+            return {"dist": "empirical", "samples": samples}
+        return self.default
+
+    def sample(self, role: str, rng: random.Random) -> float:
+        return max(0.0, _sample(self.spec_for(role), rng))
+
+
+def _sample(spec: dict, rng: random.Random) -> float:
+    """단일 분포 샘플링"""
+    dist = spec.get("dist", "fixed")
+    if dist == "fixed":
+        return float(spec.get("value", 0.0))
+    if dist == "uniform":
+        return rng.uniform(float(spec["low"]), float(spec["high"]))
+    if dist == "normal":
+        return rng.gauss(float(spec["mean"]), float(spec.get("stddev", 0.0)))
+    if dist == "lognormal":
+        return rng.lognormvariate(math.log(float(spec["median"])), float(spec.get("sigma", 0.5)))
+    if dist == "exponential":
+        return rng.expovariate(1.0 / float(spec["mean"]))
+    if dist == "empirical":
+        return float(rng.choice(spec["samples"]))
+    raise ValueError(f"Unknown duration distribution: {dist}")
+
+
+def load_history(path: Path) -> dict[str, list[float]]:
+    """역할별 소요 시간 이력 로드
+
+    JSONL 각 줄에서 "role"과 "duration"(초)이 모두 있는 레코드만 사용한다.
+    """
+    history: dict[str, list[float]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            role = record.get("role")
+            duration = record.get("duration")
+            if role and isinstance(duration, (int, float)):
+                history.setdefault(role, []).append(float(duration))
+    return history
+
+
+# =============================================================================
+# Verdict Model
+# =============================================================================
+
+def build_result(role: str, chain_name: str, config: dict, probs: dict, rng: random.Random) -> str:
+    """분기/종료 확률에 따라 역할 결과 텍스트 생성
+
+    설정의 실제 조건 키워드를 사용하므로 check_branch/check_exit이
+    실 운영과 동일하게 판정한다.
+    """
+    role_probs = probs.get(role, {})
+    chain = config.get("chains", {}).get(chain_name, {})
+
+    exit_p = float(role_probs.get("exit", 0.0))
+    if exit_p and rng.random() < exit_p:
+        for cond in chain.get("exit_conditions", []):
+            if cond.get("role") == role and cond.get("keywords"):
+                return cond["keywords"][0]
+
+    branch_p = float(role_probs.get("branch", 0.0))
+    if branch_p and rng.random() < branch_p:
+        for branch in chain.get("branches", []):
+            if branch.get("from") != role:
+                continue
+            conditions = branch.get("condition", [])
+            if isinstance(conditions, str):
+                conditions = [conditions]
+            if conditions:
+                return conditions[0]
+
+    return PASS_RESULT
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+
+@dataclass
+class SegmentStats:
+    """페이즈(또는 분기) 구간 누적 통계"""
+    label: str
+    width: int
+    runs: int = 0
+    span_total: float = 0.0
+    busy_total: float = 0.0
+    critical: dict = field(default_factory=dict)  # role -> 임계 횟수
+
+    def utilisation(self) -> float:
+        capacity = self.span_total * self.width
+        return self.busy_total / capacity if capacity > 0 else 0.0
+
+
+@dataclass
+class RunResult:
+    """단일 시뮬레이션 결과"""
+    makespan: float
+    status: str
+    exit_reason: str
+    steps: int
+
+
+class ChainSimulator:
+    """오케스트레이터 상태 머신 기반 몬테카를로 시뮬레이터"""
+
+    def __init__(self, config: dict, chain_name: str, durations: DurationModel,
+                 probs: Optional[dict] = None, seed: Optional[int] = None):
+        if chain_name not in config.get("chains", {}):
+            raise ValueError(f"Unknown chain: {chain_name}")
+        self.config = config
+        self.chain_name = chain_name
+        self.durations = durations
+        self.probs = probs or {}
+        self.rng = random.Random(seed)
+        self.blobs = MemoryBlobStore()  # 결과 원문은 디스크에 기록하지 않음
+        self.segments: dict[str, SegmentStats] = {}
+        self.results: list[RunResult] = []
+
+    def _segment_key(self, state: ChainState) -> tuple[str, int]:
+        if state.branch_active:
+            return f"branch:{state.branch_active}", 1
+        phase = PhaseItem(**state.phases[state.current_phase])
+        return f"{phase.index + 1}:{phase.display_name}", len(split_phase_roles(phase)[0])
+
+    def _segment(self, key: tuple[str, int]) -> SegmentStats:
+        label, width = key
+        if label not in self.segments:
+            self.segments[label] = SegmentStats(label=label, width=width)
+        return self.segments[label]
+
+    def run_once(self, index: int) -> RunResult:
+        state = new_chain_state(f"sim-{index}", "simulation", self.chain_name, self.config, now=0.0)
+        now = 0.0
+        inflight: dict[str, tuple[float, float]] = {}  # role -> (start, end)
+        seg_key = self._segment_key(state) if state.phases else None
+        seg_start = 0.0
+        seg_busy = 0.0
+        steps = 0
+
+        while not is_terminal(state) and state.pending_roles and steps < MAX_STEPS:
+            # 분기로 무효화된 실행 취소 (부분 실행 시간은 가동으로 집계)
+            for role in list(inflight):
+                if role not in state.pending_roles:
+                    seg_busy += now - inflight.pop(role)[0]
+            for role in state.pending_roles:
+                if role not in inflight:
+                    inflight[role] = (now, now + self.durations.sample(role, self.rng))
+
+            role, (start, end) = min(inflight.items(), key=lambda item: item[1][1])
+            del inflight[role]
+            now = end
+            seg_busy += end - start
+            steps += 1
+
+            result = build_result(role, state.chain_name, self.config, self.probs, self.rng)
+            before = (state.current_phase, state.branch_active, state.status)
+            state = _complete_role_impl(state, [role], {role: result}, self.config, now=now,
+                                           blob_store=self.blobs)
+
+            if (state.current_phase, state.branch_active, state.status) != before or is_terminal(state):
+                seg = self._segment(seg_key)
+                seg.runs += 1
+                seg.span_total += now - seg_start
+                # 진행 중이던 나머지 역할의 가동 시간 반영
+                seg_busy += sum(now - s for s, _ in inflight.values())
+                inflight = {r: (now, e) for r, (_, e) in inflight.items()}
+                seg.busy_total += seg_busy
+                seg.critical[role] = seg.critical.get(role, 0) + 1
+                seg_start = now
+                seg_busy = 0.0
+                if not is_terminal(state) and state.current_phase < len(state.phases):
+                    seg_key = self._segment_key(state)
+
+        return RunResult(makespan=now, status=state.status, exit_reason=state.exit_reason, steps=steps)
+
+    def run(self, runs: int) -> dict:
+        for i in range(runs):
+            self.results.append(self.run_once(i))
+        return self.report()
+
+    def report(self) -> dict:
+        makespans = sorted(r.makespan for r in self.results)
+        outcomes: dict[str, int] = {}
+        for r in self.results:
+            outcomes[r.status] = outcomes.get(r.status, 0) + 1
+
+        phases = []
+        critical_path = []
+        for seg in self.segments.values():
+            top_role, top_count = max(seg.critical.items(), key=lambda kv: kv[1])
+            phases.append({
+                "phase": seg.label,
+                "executions": seg.runs,
+                "executions_per_run": round(seg.runs / len(self.results), 3),
+                "mean_span": round(seg.span_total / seg.runs, 3),
+                "utilisation": round(seg.utilisation(), 3),
+                "critical": {r: round(c / seg.runs, 3) for r, c in sorted(seg.critical.items(), key=lambda kv: -kv[1])},
+            })
+            critical_path.append({"phase": seg.label, "role": top_role,
+                                  "criticality": round(top_count / seg.runs, 3)})
+
+        return {
+            "chain": self.chain_name,
+            "runs": len(self.results),
+            "makespan": _summary(makespans),
+            "outcomes": outcomes,
+            "critical_path": critical_path,
+            "phases": phases,
+        }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo, hi = math.floor(k), math.ceil(k)
+    if lo == hi:
+        return sorted_values[int(k)]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def _summary(sorted_values: list[float]) -> dict:
+    if not sorted_values:
+        return {}
+    return {
+        "mean": round(sum(sorted_values) / len(sorted_values), 3),
+        "min": round(sorted_values[0], 3),
+        "p50": round(_percentile(sorted_values, 50), 3),
+        "p90": round(_percentile(sorted_values, 90), 3),
+        "p95": round(_percentile(sorted_values, 95), 3),
+        "p99": round(_percentile(sorted_values, 99), 3),
+        "max": round(sorted_values[-1], 3),
+    }
+
+
+# =============================================================================
+# Output Formatting
+# =============================================================================
+
+def print_report(report: dict) -> None:
+    """사람이 읽기 좋은 보고서 출력"""
+    ms = report["makespan"]
+    print(f"CHAIN: {report['chain']}")
+    print(f"RUNS: {report['runs']}")
+    print(f"MAKESPAN: mean={ms['mean']}s p50={ms['p50']}s p90={ms['p90']}s "
+          f"p99={ms['p99']}s max={ms['max']}s")
+    print(f"OUTCOMES: {', '.join(f'{k}={v}' for k, v in report['outcomes'].items())}")
+    print("CRITICAL_PATH:")
+    for item in report["critical_path"]:
+        print(f"  {item['phase']}: {item['role']} ({item['criticality']:.0%})")
+    print("PHASES:")
+    for p in report["phases"]:
+        print(f"  {p['phase']}: span={p['mean_span']}s x{p['executions_per_run']} "
+              f"util={p['utilisation']:.0%}")
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def load_spec(path: Optional[str]) -> dict:
+    if not path:
+        return {}
+    text = Path(path).read_text(encoding="utf-8")
+    return yaml.safe_load(text) or {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sage Chain Simulator - makespan/임계 경로 예측",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  %(prog)s --chain FULL --runs 2000              기본 분포로 시뮬레이션
+  %(prog)s --spec sim.yaml                       사양 파일 사용
+  %(prog)s --spec sim.yaml --config new.yaml     변경안 config 평가
+  %(prog)s --history events.jsonl --json         이력 기반, JSON 출력
+        """
+    )
+    parser.add_argument("--spec", help="시뮬레이션 사양 파일 (YAML/JSON)")
+    parser.add_argument("--config", help="체인 설정 파일 (기본: 내장 config.yaml)")
+    parser.add_argument("--chain", help="체인 이름 (사양 파일보다 우선)")
+    parser.add_argument("--runs", type=int, help="시뮬레이션 횟수 (기본: 1000)")
+    parser.add_argument("--seed", type=int, help="난수 시드")
+    parser.add_argument("--history", help="역할별 소요 시간 이력 JSONL")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    args = parser.parse_args()
+    spec = load_spec(args.spec)
+
+    if args.config:
+        config = yaml.safe_load(Path(args.config).read_text(encoding="utf-8")) or {}
+    else:
+        config = load_config()
+
+    history_path = args.history or spec.get("history")
+    history = load_history(Path(history_path)) if history_path else {}
+
+    chain_name = args.chain or spec.get("chain", "FULL")
+    runs = args.runs or int(spec.get("runs", 1000))
+    seed = args.seed if args.seed is not None else spec.get("seed")
+
+    try:
+        simulator = ChainSimulator(
+            config,
+            chain_name,
+            DurationModel(spec.get("durations"), history),
+            probs=spec.get("branches"),
+            seed=seed,
+        )
+        report = simulator.run(runs)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
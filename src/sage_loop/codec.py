@@ -0,0 +1,262 @@
+"""
+State Codec - 상태 파일 인코딩 (JSON / compact JSON / 바이너리)
+
+상태 파일은 Stop 이벤트마다 여러 번 통째로 파싱되지만, 대부분의 호출자는
+status / current_phase / pending_roles 같은 몇 개 필드만 필요하다.
+SAGE_STATE_FORMAT으로 기록 형식을 고르고, 읽기는 형식을 자동 판별한다.
+
+SAGE_STATE_FORMAT (기본: json):
+    json     들여쓰기 JSON (기존 형식, jq로 바로 읽음)
+    compact  공백 없는 JSON (jq 호환, 파싱 / 기록량 감소)
+    binary   헤더 + 필드별 오프셋 (hot 필드만 읽기 가능, jq는 sage-state로 변환)
+
+바이너리 형식 (정수는 little endian):
+
+    0   4   매직 b"SAGB"
+    4   2   스키마 버전 (SCHEMA_VERSION)
+    6   2   필드 수 N
+    8   4   본문 시작 오프셋 (= 헤더 길이)
+    12  ..  필드 테이블 N × [이름 길이 u8][이름 utf-8][본문 내 오프셋 u32][길이 u32]
+    ..  ..  본문: 필드 값마다 공백 없는 JSON (utf-8)
+
+본문은 HOT_FIELDS를 앞에, role_results를 맨 뒤에 둔다. read_fields()는 헤더와
+필요한 필드 구간만 pread하므로 role_results 크기와 무관하게 첫 페이지 안에서 끝난다.
+
+호환성:
+    - 읽기는 항상 자동 판별 (첫 바이트 "{" → JSON) - 형식을 바꿔도 기존 파일을 읽고
+      다음 기록부터 새 형식이 된다. 일괄 변환은 sage-orchestrator --migrate-state.
+    - 바이너리 파일의 스키마 버전이 이 코드보다 새로우면 ValueError (손상과 같게 처리).
+    - 파일 이름은 형식과 무관하게 sage_state_{session}.json을 유지한다.
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+FORMATS = ("json", "compact", "binary")
+DEFAULT_FORMAT = "json"
+
+MAGIC = b"SAGB"
+SCHEMA_VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<II")
+
+# 헤더 바로 뒤에 두는 필드 (훅 / 감독 루프가 role_results 없이 읽는 것)
+HOT_FIELDS = (
+    "session_id", "chain_name", "status", "current_phase", "pending_roles",
+    "queued_roles", "completed_parallel", "branch_active", "role_started_at", "exit_reason",
+)
+# 본문 맨 뒤에 두는 필드 (크기가 역할 수에 비례)
+COLD_FIELDS = ("role_results",)
+
+# read_fields()가 한 번에 읽는 헤더 + hot 필드 범위
+PEEK_BYTES = 4096
+
+
+def state_format() -> str:
+    fmt = os.environ.get("SAGE_STATE_FORMAT", DEFAULT_FORMAT).strip().lower()
+    return fmt if fmt in FORMATS else DEFAULT_FORMAT
+
+
+def detect(raw: bytes) -> str:
+    """기록된 바이트 → 형식 이름"""
+    if raw.startswith(MAGIC):
+        return "binary"
+    return "json" if raw[:2] == b"{\n" else "compact"
+
+
+# =============================================================================
+# Encode
+# =============================================================================
+
+def encode(data: dict, fmt: Optional[str] = None) -> bytes:
+    """상태 dict → 기록할 바이트"""
+    fmt = fmt or state_format()
+    if fmt == "json":
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    if fmt == "compact":
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _encode_binary(data)
+
+
+def _field_order(data: dict) -> list[str]:
+    hot = [name for name in HOT_FIELDS if name in data]
+    cold = [name for name in COLD_FIELDS if name in data]
+    return hot + [name for name in data if name not in hot and name not in cold] + cold
+
+
+def _encode_binary(data: dict) -> bytes:
+    table = []
+    body = []
+    offset = 0
+    for name in _field_order(data):
+        value = json.dumps(data[name], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        encoded = name.encode("utf-8")
+        table.append(bytes([len(encoded)]) + encoded + ENTRY.pack(offset, len(value)))
+        body.append(value)
+        offset += len(value)
+    table_bytes = b"".join(table)
+    header = HEADER.pack(MAGIC, SCHEMA_VERSION, len(table), HEADER.size + len(table_bytes))
+    return header + table_bytes + b"".join(body)
+
+
+# =============================================================================
+# Decode
+# =============================================================================
+
+def decode(raw: bytes) -> dict:
+    """기록된 바이트 → 상태 dict (형식 자동 판별)
+
+    Raises:
+        ValueError: 손상 / 지원하지 않는 스키마 버전 (json.JSONDecodeError 포함)
+    """
+    if not raw.startswith(MAGIC):
+        return json.loads(raw)
+    table, body_start = _parse_header(raw)
+    return {name: _value(raw, body_start + offset, length) for name, (offset, length) in table.items()}
+
+
+def _parse_header(raw: bytes) -> tuple[dict[str, tuple[int, int]], int]:
+    """헤더 → ({필드: (본문 내 오프셋, 길이)}, 본문 시작) (raw는 헤더 전체를 포함해야 함)"""
+    if len(raw) < HEADER.size:
+        raise ValueError("truncated state header")
+    magic, version, count, body_start = HEADER.unpack_from(raw, 0)
+    if magic != MAGIC:
+        raise ValueError("not a binary state file")
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"state schema v{version} is newer than supported v{SCHEMA_VERSION}")
+    if body_start > len(raw):
+        raise _ShortHeader(body_start)
+    table = {}
+    pos = HEADER.size
+    try:
+        for _ in range(count):
+            size = raw[pos]
+            name = bytes(raw[pos + 1:pos + 1 + size]).decode("utf-8")
+            table[name] = ENTRY.unpack_from(raw, pos + 1 + size)
+            pos += 1 + size + ENTRY.size
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"corrupt state header: {e}") from e
+    if pos != body_start:
+        raise ValueError("corrupt state header: table length mismatch")
+    return table, body_start
+
+
+class _ShortHeader(ValueError):
+    """헤더가 PEEK_BYTES보다 김 (read_fields가 다시 읽음)"""
+
+    def __init__(self, needed: int):
+        super().__init__(f"state header needs {needed} bytes")
+        self.needed = needed
+
+
+def _value(raw: bytes, start: int, length: int):
+    chunk = raw[start:start + length]
+    if len(chunk) != length:
+        raise ValueError("truncated state body")
+    return json.loads(bytes(chunk))
+
+
+def decode_fields(buf, names: Iterable[str]) -> dict:
+    """바이너리 버퍼(bytes / memoryview, 파일 전체)에서 지정한 필드만 디코딩
+
+    Raises:
+        ValueError: 손상 / 지원하지 않는 스키마 버전
+    """
+    table, body_start = _parse_header(buf)
+    return {name: _value(buf, body_start + table[name][0], table[name][1]) for name in names if name in table}
+
+
+def prefix_length(buf, names: Iterable[str]) -> int:
+    """바이너리 버퍼에서 헤더 + names 필드가 모두 들어가는 앞부분 길이 (HOT_FIELDS는 앞에 모여 있음)"""
+    table, body_start = _parse_header(buf)
+    ends = [offset + length for name, (offset, length) in table.items() if name in names]
+    return body_start + max(ends, default=0)
+
+
+def read_fields(path: Path, names: Iterable[str]) -> dict:
+    """상태 파일에서 지정한 필드만 읽기 (없는 필드는 결과에서 빠짐)
+
+    바이너리면 헤더와 해당 필드 구간만 읽고, JSON이면 전체를 파싱한다.
+
+    Raises:
+        FileNotFoundError: 파일 없음
+        ValueError: 손상 / 지원하지 않는 스키마 버전
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.pread(fd, PEEK_BYTES, 0)
+        if not head.startswith(MAGIC):
+            os.lseek(fd, len(head), os.SEEK_SET)
+            chunks = [head]
+            while chunk := os.read(fd, 1 << 16):
+                chunks.append(chunk)
+            data = json.loads(b"".join(chunks))
+            return {name: data[name] for name in names if name in data}
+        try:
+            table, body_start = _parse_header(head)
+        except _ShortHeader as e:
+            head = os.pread(fd, e.needed, 0)
+            table, body_start = _parse_header(head)
+        found = {}
+        for name in names:
+            if name not in table:
+                continue
+            offset, length = table[name]
+            start = body_start + offset
+            if start + length <= len(head):
+                found[name] = _value(head, start, length)
+            else:
+                found[name] = _value(os.pread(fd, length, start), 0, length)
+        return found
+    finally:
+        os.close(fd)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sage state file decoder (모든 형식 → JSON, jq 파이프용)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  %(prog)s /tmp/sage_state_sage-a1b2c3d4e5f6.json | jq .status
+  %(prog)s /tmp/sage_state_sage-a1b2c3d4e5f6.json --fields status,pending_roles
+  %(prog)s /tmp/sage_state_sage-a1b2c3d4e5f6.json --format
+        """
+    )
+    parser.add_argument("path", help="상태 / 체크포인트 파일")
+    parser.add_argument("--fields", help="출력할 필드 (쉼표로 구분, 바이너리면 해당 구간만 읽음)")
+    parser.add_argument("--format", action="store_true", help="기록 형식만 출력 (json | compact | binary)")
+    parser.add_argument("--pretty", action="store_true", help="들여쓰기 출력")
+
+    args = parser.parse_args()
+    path = Path(args.path)
+    try:
+        if args.format:
+            with open(path, "rb") as f:
+                print(detect(f.read(len(MAGIC))))
+            return
+        if args.fields:
+            data = read_fields(path, [name.strip() for name in args.fields.split(",") if name.strip()])
+        else:
+            data = decode(path.read_bytes())
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(data, ensure_ascii=False, indent=2 if args.pretty else None))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,9 @@ Sage Configuration - Feedback Loop Pattern
     SAGE_REDIS_PORT: Redis 포트 (기본: 6380, Sage 전용)
     SAGE_MODE: 실행 모드 (full-auto, plan-first, interactive)
     SAGE_CONFIG_PATH: 체인 설정 YAML 경로
-    SAGE_MONITOR_INTERVAL: 감독 루프 간격 (초)
-    SAGE_STALL_THRESHOLD: 정체 감지 임계값 (초)
+    SAGE_SUPERVISOR_MONITOR_INTERVAL: 감독 루프 상태 파일 확인 간격 (초, sage-supervisor)
+    SAGE_SUPERVISOR_STALL_THRESHOLD: 하트비트 없이 허용할 시간 (초, sage-supervisor)
+    SAGE_CHAIN_TIMEOUT_MINUTES: 역할 최대 실행 시간 (분, sage-supervisor)
 
 Hook 환경 변수 (Phase A 추가):
     SAGE_STATE_DIR: 상태 파일 디렉토리 (기본: /tmp)
@@ -17,6 +18,21 @@ Hook 환경 변수 (Phase A 추가):
     SAGE_SESSION_TIMEOUT: 세션 타임아웃 초 (기본: 3600)
     SAGE_STAGNATION_THRESHOLD: 정체 감지 임계값 (기본: 3)
     SAGE_DEBUG: 디버그 모드 (기본: 0)
+    SAGE_PROFILE: 진입점별 프로파일 덤프 (cpu | mem, 기본: 비활성)
+    SAGE_EVENTS: 구조화 이벤트 로그 (off | basic | full, 기본: basic)
+    SAGE_RECORD: 재생용 호출 기록 (1 | true | on, 기본: 비활성)
+    SAGE_NAMESPACE: 현재 세션 포인터 네임스페이스 (cwd | tty | global | 이름, 기본: cwd)
+    SAGE_PLATFORM: 역할 등급 분류에 쓸 overlays/{platform}/model_map.yaml (기본: claude)
+    SAGE_BLOB_COMPRESS: 역할 결과 저장소 zlib 레벨 (0-9, 기본: 6, 0이면 비압축)
+    SAGE_CHECKPOINT: 실행 중 체인 체크포인트 (off면 비활성, 기본: on, --resume으로 재개)
+    SAGE_DURABILITY: 상태 파일 기록 내구성 (none | rename | full, 기본: rename - full은 group commit fsync)
+    SAGE_STATE_FORMAT: 상태 파일 형식 (json | compact | binary, 기본: json - 읽기는 자동 판별)
+    SAGE_SNAPSHOT: 상태 mmap 스냅샷 (off | state | shm | 디렉토리, 기본: off - seqlock, 락 없이 읽기)
+    SAGE_WATCH: --wait-for-change / --watch 대기 방식 (auto | inotify | fifo | poll, 기본: auto)
+    SAGE_MEMO: 역할 결과 캐시 (on | off, 기본: config.yaml memo.enabled - 기본 설정은 off)
+    SAGE_BREAKER_WINDOW / SAGE_BREAKER_BUCKETS: circuit breaker 오류율 윈도우 (초, 기본: 60) / 버킷 수 (기본: 12)
+    SAGE_BREAKER_ERROR_RATE / SAGE_BREAKER_MIN_CALLS: 트립 오류율 (기본: 0.5) / 최소 호출 수 (기본: SAGE_MAX_ERRORS)
+    SAGE_COOLDOWN / SAGE_BREAKER_MAX_COOLDOWN: 첫 트립 cooldown (초, 기본: 60) / 상한 (기본: 900)
 
 포트:
     Sage: 6380 (오케스트레이터 상태)
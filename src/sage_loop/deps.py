@@ -0,0 +1,53 @@
+"""
+Role Dependencies - 역할 입력 의존성
+
+역할 결과가 어떤 상위 역할 결과로부터 만들어졌는지 선언하고, 역할 실행 시점의
+입력(상위 결과 해시)을 하나의 다이제스트로 요약한다. 오케스트레이터는 역할 완료마다
+(페이즈, 역할)별 입력 다이제스트를 ChainState.role_inputs에 남기고, 분기 복귀로
+페이즈를 다시 실행할 때 입력이 그대로인 역할은 이전 결과를 재사용한다.
+결과 캐시(memo.py) 키의 상위 결과 집합도 같은 의존성으로 좁힌다.
+
+설정 (config.yaml, 체인별):
+    depends_on:
+      saheonbu: [sage, doseungji]   # 접미사 -ijo 등은 자동 제거
+      hongmungwan: [sage]           # 의존 역할 이름은 접두 일치 (ideator → ideator-ijo, ...)
+
+선언하지 않은 역할은 현재 페이즈 밖 모든 역할 결과에 의존한다 (기존 동작).
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Optional
+
+
+def role_names(role: str) -> list[str]:
+    """역할 → 접미사를 하나씩 뗀 후보 (executor-hojo → executor-hojo, executor)"""
+    parts = role.split("-")
+    return ["-".join(parts[:n]) for n in range(len(parts), 0, -1)]
+
+
+def dependencies(config: dict, chain: str, role: str) -> Optional[tuple]:
+    """역할이 입력으로 쓰는 상위 역할 이름 (선언 없으면 None = 전체)"""
+    declared = ((config.get("chains") or {}).get(chain) or {}).get("depends_on") or {}
+    for name in role_names(role):
+        if name in declared:
+            return tuple(declared[name] or ())
+    return None
+
+
+def select_inputs(upstream: dict[str, str], deps: Optional[tuple]) -> dict[str, str]:
+    """{상위 역할: 결과 해시} 중 deps에 해당하는 것만"""
+    if deps is None:
+        return upstream
+    wanted = set(deps)
+    return {role: digest for role, digest in upstream.items()
+            if any(name in wanted for name in role_names(role))}
+
+
+def inputs_digest(inputs: dict[str, str]) -> str:
+    data = json.dumps(sorted(inputs.items()), separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
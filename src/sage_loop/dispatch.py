@@ -0,0 +1,303 @@
+"""
+Model-Tier Dispatcher - 모델 등급별 동시 실행/속도 제한
+
+overlays/{platform}/model_map.yaml의 역할별 모델을 opus / sonnet / haiku
+등급으로 분류하고, 병렬 역할을 내보낼 때 등급마다 별도의 동시 실행 한도와
+토큰 버킷 속도 제한을 적용한다. 같은 페이즈에서는 싼 등급을 먼저 내보낸다.
+
+등급 분류 (model_map 항목):
+    tier: 명시               → 그대로
+    haiku / mini / lite / nano → haiku
+    opus / -pro, 또는 thinking / reasoning_effort: high → opus
+    그 외 (모델 없음 포함)   → sonnet
+
+역할 해석 순서:
+    model_map의 역할 → 접미사 제거 (ideator-ijo → ideator) → dispatch.aliases → sonnet
+
+설정 (config.yaml):
+    dispatch:
+      platform: claude                       # SAGE_PLATFORM 우선
+      tiers:
+        opus: {concurrency: 2, rate_per_min: 20, burst: 2}
+      aliases: {sagawon: critic, ...}        # config.yaml 역할 → model_map 역할
+
+    from sage_loop.dispatch import Dispatcher
+
+    dispatcher = Dispatcher(config)
+    dispatcher.submit(session_id, state.pending_roles)
+    for item in dispatcher.release():        # 한도 안에서 싼 등급부터
+        run(item.role); dispatcher.done(item.session_id, item.role)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import yaml
+
+from .events import get_event_log
+
+# 비용 순 (싼 것 먼저)
+TIERS = ("haiku", "sonnet", "opus")
+DEFAULT_TIER = "sonnet"
+DEFAULT_PLATFORM = "claude"
+
+DEFAULT_LIMITS = {
+    "opus": {"concurrency": 2, "rate_per_min": 20, "burst": 2},
+    "sonnet": {"concurrency": 4, "rate_per_min": 60, "burst": 4},
+    "haiku": {"concurrency": 8, "rate_per_min": 240, "burst": 8},
+}
+
+# 대기 시간 통계에 유지할 최근 배출 수 (등급별)
+DELAY_SAMPLES = 1024
+
+_CHEAP_MARKERS = ("haiku", "mini", "lite", "nano")
+_EXPENSIVE_MARKERS = ("opus", "-pro")
+
+
+# =============================================================================
+# Model Map
+# =============================================================================
+
+def overlays_dir() -> Path:
+    """overlays 디렉토리 (설치본: sage_loop/overlays, 소스: 저장소 루트)"""
+    package_dir = Path(__file__).resolve().parent
+    for candidate in (package_dir / "overlays", package_dir.parent.parent / "overlays"):
+        if candidate.is_dir():
+            return candidate
+    return package_dir / "overlays"
+
+
+def load_model_map(platform: Optional[str] = None, path: Optional[Path] = None) -> dict:
+    """model_map.yaml의 models 섹션 ({역할: 항목}, 없으면 {})"""
+    if path is None:
+        platform = platform or os.environ.get("SAGE_PLATFORM") or DEFAULT_PLATFORM
+        path = overlays_dir() / platform / "model_map.yaml"
+    try:
+        data = yaml.safe_load(Path(path).read_text()) or {}
+    except FileNotFoundError:
+        return {}
+    return data.get("models", {}) or {}
+
+
+def classify_model(entry: dict) -> str:
+    """model_map 항목 → 등급"""
+    if entry.get("tier") in TIERS:
+        return entry["tier"]
+    model = str(entry.get("model", "")).lower()
+    if any(marker in model for marker in _CHEAP_MARKERS):
+        return "haiku"
+    if any(marker in model for marker in _EXPENSIVE_MARKERS):
+        return "opus"
+    if entry.get("thinking") or str(entry.get("reasoning_effort", "")).lower() == "high":
+        return "opus"
+    return DEFAULT_TIER
+
+
+class TierMap:
+    """역할 → 등급 해석 (결과 캐시)"""
+
+    def __init__(self, models: dict, aliases: Optional[dict] = None):
+        self.models = models
+        self.aliases = aliases or {}
+        self._cache: dict[str, str] = {}
+
+    def tier_for(self, role: str) -> str:
+        tier = self._cache.get(role)
+        if tier is None:
+            tier = self._cache[role] = self._resolve(role)
+        return tier
+
+    def _resolve(self, role: str) -> str:
+        # 접미사를 하나씩 떼며 model_map → aliases 순으로 조회
+        parts = role.split("-")
+        for n in range(len(parts), 0, -1):
+            name = "-".join(parts[:n])
+            for candidate in (name, self.aliases.get(name)):
+                entry = self.models.get(candidate) if candidate else None
+                if isinstance(entry, dict):
+                    return classify_model(entry)
+        return DEFAULT_TIER
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+class TokenBucket:
+    """토큰 버킷 (rate: 초당 토큰, burst: 최대 적립량, rate 0이면 무제한)"""
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float) -> bool:
+        if self.rate <= 0:
+            return True
+        self._refill(now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self, now: float) -> float:
+        """다음 토큰까지 남은 시간 (초)"""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+
+# =============================================================================
+# Dispatcher
+# =============================================================================
+
+@dataclass
+class Release:
+    """release()가 내보낸 역할"""
+    session_id: str
+    role: str
+    tier: str
+    queued_s: float
+
+
+@dataclass
+class _Pool:
+    tier: str
+    concurrency: int
+    bucket: TokenBucket
+    running: int = 0
+    released: int = 0
+    throttled: int = 0  # 동시 한도는 남았지만 속도 제한으로 보류된 횟수
+
+    def __post_init__(self):
+        self.queue: list[tuple[int, int, str, str, float]] = []  # (우선순위, seq, 세션, 역할, 입장 시각)
+        self.delays: deque[float] = deque(maxlen=DELAY_SAMPLES)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round((len(values) - 1) * pct / 100.0)))
+    return values[k]
+
+
+class Dispatcher:
+    """등급별 풀 (동시 실행 한도 + 토큰 버킷)
+
+    Args:
+        config: config.yaml (dispatch 섹션 사용)
+        models: model_map의 models (기본: dispatch.platform / SAGE_PLATFORM 오버레이)
+        clock: 시계 (시뮬레이션용 교체 가능)
+    """
+
+    def __init__(self, config: Optional[dict] = None, models: Optional[dict] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        cfg = (config or {}).get("dispatch", {}) or {}
+        if models is None:
+            models = load_model_map(os.environ.get("SAGE_PLATFORM") or cfg.get("platform"))
+        self.tiers = TierMap(models, cfg.get("aliases"))
+        self.clock = clock
+        now = clock()
+        self.pools: dict[str, _Pool] = {}
+        for tier in TIERS:
+            limits = {**DEFAULT_LIMITS[tier], **((cfg.get("tiers") or {}).get(tier) or {})}
+            self.pools[tier] = _Pool(
+                tier=tier,
+                concurrency=max(1, int(limits["concurrency"])),
+                bucket=TokenBucket(float(limits.get("rate_per_min", 0)) / 60.0, int(limits.get("burst", 1)), now),
+            )
+        self._known: dict[tuple[str, str], str] = {}  # 대기/실행 중 (세션, 역할) → 등급
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def submit(self, session_id: str, roles: list[str], priority: int = 0) -> None:
+        """역할 대기열 등록 (이미 대기/실행 중이면 무시)"""
+        now = self.clock()
+        with self._lock:
+            for role in roles:
+                key = (session_id, role)
+                if key in self._known:
+                    continue
+                tier = self.tiers.tier_for(role)
+                self._known[key] = tier
+                heapq.heappush(self.pools[tier].queue, (priority, next(self._seq), session_id, role, now))
+
+    def release(self) -> list[Release]:
+        """한도 안에서 내보낼 수 있는 역할 (싼 등급 먼저, 등급 안에서는 우선순위/도착 순)"""
+        now = self.clock()
+        released = []
+        with self._lock:
+            for tier in TIERS:
+                pool = self.pools[tier]
+                while pool.queue and pool.running < pool.concurrency:
+                    if not pool.bucket.try_acquire(now):
+                        pool.throttled += 1
+                        break
+                    _, _, session_id, role, queued_at = heapq.heappop(pool.queue)
+                    pool.running += 1
+                    pool.released += 1
+                    pool.delays.append(now - queued_at)
+                    released.append(Release(session_id, role, tier, now - queued_at))
+        for item in released:
+            get_event_log().emit("dispatch_release", item.session_id, level="full",
+                                 role=item.role, tier=item.tier, queued_ms=round(item.queued_s * 1000, 3))
+        return released
+
+    def done(self, session_id: str, role: str) -> None:
+        """실행 완료 → 등급 슬롯 반납"""
+        with self._lock:
+            tier = self._known.pop((session_id, role), None)
+            if tier is not None and self.pools[tier].running > 0:
+                self.pools[tier].running -= 1
+
+    def is_tracked(self, session_id: str, role: str) -> bool:
+        """대기 또는 실행 중인지"""
+        with self._lock:
+            return (session_id, role) in self._known
+
+    def next_release_in(self) -> Optional[float]:
+        """속도 제한으로 보류된 역할이 있을 때 다음 배출 가능 시각까지 (초), 없으면 None"""
+        now = self.clock()
+        with self._lock:
+            waits = [pool.bucket.wait_time(now) for pool in self.pools.values()
+                     if pool.queue and pool.running < pool.concurrency]
+        return min(waits) if waits else None
+
+    def stats(self) -> dict:
+        """등급별 실행/대기/대기 시간"""
+        with self._lock:
+            result = {}
+            for tier in TIERS:
+                pool = self.pools[tier]
+                delays = list(pool.delays)
+                result[tier] = {
+                    "concurrency": pool.concurrency,
+                    "rate_per_min": round(pool.bucket.rate * 60, 3),
+                    "running": pool.running,
+                    "queued": len(pool.queue),
+                    "released": pool.released,
+                    "throttled": pool.throttled,
+                    "queue_delay_s": {
+                        "p50": round(_percentile(delays, 50), 3),
+                        "p95": round(_percentile(delays, 95), 3),
+                        "max": round(max(delays, default=0.0), 3),
+                    },
+                }
+            return result
@@ -0,0 +1,197 @@
+"""
+State Durability - 상태 파일 기록의 내구성 모드 + group commit
+
+SAGE_DURABILITY (기본: rename):
+    none    같은 파일에 바로 덮어씀 (temp / rename / fsync 없음)
+            tmpfs + 단일 기록자용. 동시에 읽는 쪽이 기록 중인 내용을 볼 수 있다.
+    rename  temp 파일 → rename (원자적 교체, fsync 없음)
+            프로세스 종료에는 안전하지만 전원 차단 후에는 직전 내용이 사라질 수 있다.
+    full    rename + 파일 / 디렉토리 fsync (group commit)
+            기록마다 fsync 지연이 생기므로 전원 차단에도 남아야 할 때만 켠다.
+
+Group commit (full):
+    상태 락 안에서는 temp → rename으로 게시하고 세션별 기록 번호만 올린다.
+    fsync는 락을 놓은 뒤 commit()에서 {state}.sync 파일 락을 잡고 수행한다.
+    이미 내 기록 번호 이상이 fsync됐으면 그대로 반환하고(follower), 아니면 현재
+    최신 상태 파일과 디렉토리를 fsync한 뒤 그 번호를 남긴다(leader). 최신 상태는
+    앞선 전이를 모두 포함하므로, 동시에 완료된 전이들은 fsync 한 번을 공유한다.
+    호출자는 commit이 끝난 뒤에 반환하므로 완료 응답 시점의 내구성은 같다.
+
+    {state}.sync: [기록 번호 u64][fsync된 번호 u64] (little endian)
+
+    file_lock()이 deferred()로 감싸므로 락 안의 기록은 락 해제 후 commit되고,
+    락 밖의 기록(새 체인 시작 등)은 즉시 commit된다.
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .checkpoint import snapshot as _snapshot
+
+MODES = ("none", "rename", "full")
+DEFAULT_MODE = "rename"
+SYNC_SUFFIX = ".sync"
+
+
+def durability_mode() -> str:
+    mode = os.environ.get("SAGE_DURABILITY", DEFAULT_MODE).strip().lower()
+    return mode if mode in MODES else DEFAULT_MODE
+
+
+def fsync_dir(directory: Path) -> None:
+    """디렉토리 항목(rename / link) 영속화"""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def sync_path(path: Path) -> Path:
+    return path.with_suffix(SYNC_SUFFIX)
+
+
+@dataclass
+class CommitStats:
+    """group commit 통계 (프로세스 단위 누적, bench_durability.py)"""
+    commits: int = 0
+    leaders: int = 0
+    followers: int = 0
+    fsync_total: float = 0.0
+
+    def record(self, leader: bool, elapsed: float = 0.0) -> None:
+        self.commits += 1
+        if leader:
+            self.leaders += 1
+            self.fsync_total += elapsed
+        else:
+            self.followers += 1
+
+
+COMMIT_STATS = CommitStats()
+
+_local = threading.local()
+
+
+# =============================================================================
+# Publish
+# =============================================================================
+
+def publish(path: Path, data: bytes, snapshot: Optional[Path] = None,
+            mode: Optional[str] = None) -> None:
+    """data를 path에 기록 (snapshot: 같은 내용을 게시할 체크포인트 경로)"""
+    mode = mode or durability_mode()
+    if mode == "none":
+        _write_in_place(path, data)
+        if snapshot is not None:
+            _write_in_place(snapshot, data)
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if snapshot is not None:
+            _snapshot(Path(tmp_path), snapshot)
+        os.rename(tmp_path, path)  # POSIX에서 원자적
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if mode == "full":
+        _schedule(path, _bump(path), snapshot)
+
+
+def _write_in_place(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _bump(path: Path) -> int:
+    """기록 번호 +1 → 새 번호 (상태 락 안에서 호출되므로 기록자끼리는 직렬)"""
+    fd = os.open(sync_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        raw = os.pread(fd, 8, 0)
+        gen = (int.from_bytes(raw, "little") if len(raw) == 8 else 0) + 1
+        os.pwrite(fd, gen.to_bytes(8, "little"), 0)
+        return gen
+    finally:
+        os.close(fd)
+
+
+# =============================================================================
+# Group Commit
+# =============================================================================
+
+@contextmanager
+def deferred() -> Iterator[None]:
+    """블록 안의 full 기록을 블록이 끝날 때 commit (중첩 시 가장 바깥에서)"""
+    depth = getattr(_local, "depth", 0)
+    if depth == 0:
+        _local.pending = {}
+    _local.depth = depth + 1
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        if depth == 0:
+            pending, _local.pending = _local.pending, {}
+            for path, (gen, snapshot) in pending.items():
+                commit(path, gen, snapshot)
+
+
+def _schedule(path: Path, gen: int, snapshot: Optional[Path]) -> None:
+    if getattr(_local, "depth", 0):
+        _local.pending[path] = (gen, snapshot)
+    else:
+        commit(path, gen, snapshot)
+
+
+def commit(path: Path, gen: int, snapshot: Optional[Path] = None) -> bool:
+    """기록 번호 gen까지 fsync 보장 → 직접 fsync했는지 (leader)"""
+    fd = os.open(sync_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        raw = os.pread(fd, 16, 0)
+        written = int.from_bytes(raw[:8], "little") if len(raw) >= 8 else gen
+        synced = int.from_bytes(raw[8:16], "little") if len(raw) == 16 else 0
+        if synced >= gen:
+            COMMIT_STATS.record(leader=False)
+            return False
+
+        # written 이하의 기록은 이미 rename됨 → 지금의 최신 파일이 모두 포함
+        started = time.perf_counter()
+        target = max(written, gen)
+        for file in (path, snapshot):
+            if file is None:
+                continue
+            try:
+                file_fd = os.open(file, os.O_RDONLY)
+            except FileNotFoundError:  # 그 사이 삭제 / 교체됨
+                continue
+            try:
+                os.fsync(file_fd)
+            finally:
+                os.close(file_fd)
+        fsync_dir(path.parent)
+        os.pwrite(fd, target.to_bytes(8, "little"), 8)
+        COMMIT_STATS.record(leader=True, elapsed=time.perf_counter() - started)
+        return True
+    finally:
+        os.close(fd)  # flock도 함께 해제
@@ -0,0 +1,246 @@
+"""
+Structured Event Log - 세션별 JSONL 이벤트 기록
+
+훅 판정, 상태 전이, 락 대기, 오류를 구조화된 JSONL로 남겨 운영 중 사고를
+재실행 없이 재구성할 수 있게 한다. 레코드는 버퍼링되어 프로세스 종료 시
+(또는 버퍼가 차거나 오류 이벤트 발생 시) 한 번의 append로 기록된다.
+
+환경 변수:
+    SAGE_EVENTS: off | basic | full (기본: basic)
+        basic - 상태 전이, 훅 판정, 오류 (상시 사용 가능한 저비용 모드)
+        full  - basic + 락 대기 등 상세 이벤트
+    SAGE_EVENTS_MAX_BYTES: 회전 기준 크기 (기본: 1048576)
+    SAGE_EVENTS_BACKUPS: 보존할 회전 파일 수 (기본: 3)
+    SAGE_STATE_DIR: 로그 디렉토리 (기본: /tmp)
+
+레코드 형식:
+    {"ts": 벽시계(초), "mono": 단조 시계(초, CLOCK_BOOTTIME), "sid": 세션,
+     "pid": PID, "src": 발생원, "ev": 이벤트, ...필드}
+
+mono는 /proc/uptime과 같은 시계를 사용하므로 stop-hook.sh가 직접 기록한
+레코드와 프로세스를 넘어 정렬할 수 있다.
+
+Hook에서도 import되므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import fcntl
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+LEVELS = {"off": 0, "basic": 1, "full": 2}
+FILE_PREFIX = "sage_events_"
+FLUSH_RECORDS = 64
+FLUSH_BYTES = 64 * 1024
+
+_CLOCK = getattr(time, "CLOCK_BOOTTIME", None)
+
+
+def monotonic() -> float:
+    """프로세스 간 비교 가능한 단조 시계 (초)"""
+    if _CLOCK is not None:
+        return time.clock_gettime(_CLOCK)
+    return time.monotonic()
+
+
+def events_level() -> int:
+    return LEVELS.get(os.environ.get("SAGE_EVENTS", "basic").strip().lower(), 1)
+
+
+def event_log_path(session_id: str, directory: Optional[Path] = None) -> Path:
+    directory = directory or Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    return directory / f"{FILE_PREFIX}{session_id or 'nosession'}.jsonl"
+
+
+# =============================================================================
+# Event Log
+# =============================================================================
+
+class EventLog:
+    """세션별 버퍼링 JSONL 로거 (크기 기반 회전)"""
+
+    def __init__(self, source: str = "", directory: Optional[Path] = None):
+        self.source = source or Path(sys.argv[0]).stem or "python"
+        self.directory = directory
+        self.max_bytes = int(os.environ.get("SAGE_EVENTS_MAX_BYTES", str(1024 * 1024)))
+        self.backups = int(os.environ.get("SAGE_EVENTS_BACKUPS", "3"))
+        self._buffers: dict[str, list[str]] = {}
+        self._buffered_bytes = 0
+
+    def emit(self, ev: str, session_id: str = "", level: str = "basic", **fields) -> None:
+        """이벤트 기록 (버퍼링)"""
+        if LEVELS.get(level, 1) > events_level():
+            return
+        sid = session_id or os.environ.get("SAGE_SESSION_ID", "")
+        record = {
+            "ts": round(time.time(), 6),
+            "mono": round(monotonic(), 6),
+            "sid": sid,
+            "pid": os.getpid(),
+            "src": self.source,
+            "ev": ev,
+        }
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        self._buffers.setdefault(sid, []).append(line)
+        self._buffered_bytes += len(line) + 1
+
+        records = sum(len(b) for b in self._buffers.values())
+        if ev == "error" or records >= FLUSH_RECORDS or self._buffered_bytes >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼를 세션별 파일에 append (세션당 write 1회)"""
+        buffers, self._buffers = self._buffers, {}
+        self._buffered_bytes = 0
+        for sid, lines in buffers.items():
+            if not lines:
+                continue
+            path = event_log_path(sid, self.directory)
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            except OSError:
+                continue
+            try:
+                os.write(fd, data)
+                if os.fstat(fd).st_size > self.max_bytes:
+                    self._rotate(fd, path)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def _rotate(self, fd: int, path: Path) -> None:
+        """path → path.1 → path.2 ... (다른 프로세스가 회전 중이면 생략)"""
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return
+        try:
+            # 락 획득 사이 다른 프로세스가 이미 회전했으면 생략
+            if not path.exists() or os.stat(path).st_ino != os.fstat(fd).st_ino:
+                return
+            if self.backups <= 0:
+                path.unlink(missing_ok=True)
+                return
+            for i in range(self.backups - 1, 0, -1):
+                src = path.with_name(f"{path.name}.{i}")
+                if src.exists():
+                    os.replace(src, path.with_name(f"{path.name}.{i + 1}"))
+            os.replace(path, path.with_name(f"{path.name}.1"))
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+_event_log: EventLog | None = None
+
+
+def get_event_log(source: str = "") -> EventLog:
+    """프로세스 단위 EventLog 싱글턴 (종료 시 자동 flush)"""
+    global _event_log
+    if _event_log is None:
+        _event_log = EventLog(source)
+        atexit.register(_event_log.flush)
+    elif source and _event_log.source != source:
+        _event_log.source = source
+    return _event_log
+
+
+def emit(ev: str, session_id: str = "", level: str = "basic", **fields) -> None:
+    """get_event_log().emit() 단축"""
+    get_event_log().emit(ev, session_id, level, **fields)
+
+
+def reset_event_log() -> None:
+    """싱글턴 리셋 (테스트/벤치마크용, 버퍼는 flush)"""
+    global _event_log
+    if _event_log is not None:
+        _event_log.flush()
+    _event_log = None
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def iter_events(session_id: str, directory: Optional[Path] = None) -> Iterator[dict]:
+    """회전 파일 포함 세션 이벤트를 오래된 순서로 반환 (mono 기준 정렬)"""
+    path = event_log_path(session_id, directory)
+    files = sorted(path.parent.glob(f"{path.name}.*"),
+                   key=lambda p: -int(p.suffix[1:]) if p.suffix[1:].isdigit() else 0)
+    files.append(path)
+    records = []
+    for file in files:
+        if not file.exists():
+            continue
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    records.sort(key=lambda r: (r.get("mono", 0), r.get("ts", 0)))
+    yield from records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sage structured event log",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  %(prog)s show sage-a1b2c3d4e5f6                    세션 이벤트 (시간순)
+  %(prog)s show sage-a1b2c3d4e5f6 --ev role_complete --json
+  %(prog)s emit --src wrapper --ev deploy key=value  외부 스크립트에서 기록
+        """
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    show = sub.add_parser("show", help="세션 이벤트 출력")
+    show.add_argument("session", help="세션 ID")
+    show.add_argument("--ev", action="append", help="이벤트 필터 (반복 가능)")
+    show.add_argument("--json", action="store_true", help="JSONL 원본 출력")
+
+    em = sub.add_parser("emit", help="이벤트 기록")
+    em.add_argument("--session", default="", help="세션 ID (기본: SAGE_SESSION_ID)")
+    em.add_argument("--src", default="cli", help="발생원")
+    em.add_argument("--ev", required=True, help="이벤트 이름")
+    em.add_argument("fields", nargs="*", help="key=value 필드")
+
+    args = parser.parse_args()
+
+    if args.command == "show":
+        for record in iter_events(args.session):
+            if args.ev and record.get("ev") not in args.ev:
+                continue
+            if args.json:
+                print(json.dumps(record, ensure_ascii=False))
+                continue
+            extra = {k: v for k, v in record.items() if k not in ("ts", "mono", "sid", "pid", "src", "ev")}
+            stamp = time.strftime("%H:%M:%S", time.localtime(record.get("ts", 0)))
+            print(f"{stamp} {record.get('mono', 0):>14.6f} {record.get('src', ''):<18} "
+                  f"{record.get('ev', ''):<16} {json.dumps(extra, ensure_ascii=False)}")
+        return
+
+    if args.command == "emit":
+        fields = dict(f.split("=", 1) for f in args.fields if "=" in f)
+        get_event_log(args.src).emit(args.ev, args.session, **fields)
+        return
+
+    parser.print_help()
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Role Heartbeats - 실행 중인 역할의 생존 신호
+
+역할(또는 역할을 실행하는 드라이버)이 주기적으로 역할별 파일의 mtime을
+갱신한다. 내용은 쓰지 않으므로 비용은 utime 한 번이다. 감독 루프
+(supervisor.py)는 mtime으로 정체 여부를 판단한다.
+
+    from sage_loop.heartbeat import beat
+    beat(session_id, "executor-hojo")
+
+    $ sage-orchestrator --heartbeat executor-hojo
+
+파일 배치:
+    {STATE_DIR}/sage_heartbeats/{session}/{role}
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+HEARTBEAT_DIR_NAME = "sage_heartbeats"
+
+
+def heartbeat_dir(session_id: str, state_dir: Optional[Path] = None) -> Path:
+    directory = Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    return directory / HEARTBEAT_DIR_NAME / session_id
+
+
+def beat(session_id: str, role: str, state_dir: Optional[Path] = None,
+         now: Optional[float] = None) -> None:
+    """역할 하트비트 갱신 (없으면 생성)"""
+    path = heartbeat_dir(session_id, state_dir) / role
+    times = None if now is None else (now, now)
+    try:
+        os.utime(path, times)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        if times is not None:
+            os.utime(path, times)
+
+
+def last_beat(session_id: str, role: str, state_dir: Optional[Path] = None) -> Optional[float]:
+    """마지막 하트비트 시각 (epoch 초, 보낸 적 없으면 None)"""
+    try:
+        return (heartbeat_dir(session_id, state_dir) / role).stat().st_mtime
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def beats(session_id: str, state_dir: Optional[Path] = None) -> dict[str, float]:
+    """{역할: 마지막 하트비트}"""
+    directory = heartbeat_dir(session_id, state_dir)
+    try:
+        return {entry.name: entry.stat().st_mtime for entry in os.scandir(directory) if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def clear_beats(session_id: str, roles: Optional[list[str]] = None,
+                state_dir: Optional[Path] = None) -> None:
+    """하트비트 삭제 (roles 생략 시 세션 전체)"""
+    directory = heartbeat_dir(session_id, state_dir)
+    if roles is None:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    for role in roles:
+        (directory / role).unlink(missing_ok=True)
+
+
+def age(session_id: str, role: str, state_dir: Optional[Path] = None) -> Optional[float]:
+    """마지막 하트비트 이후 경과 시간 (초)"""
+    last = last_beat(session_id, role, state_dir)
+    return None if last is None else time.time() - last
@@ -0,0 +1,125 @@
+"""
+Session Hot Fields - 훅 세션 파일의 고정 크기 sidecar
+
+Stop hook은 매 호출마다 sage_session_{session}.json에서 active / exit_signal /
+current_role / 완료 역할 수만 확인하지만, jq / json.loads는 role_outputs까지
+파일 전체를 파싱한다. 세션 파일을 쓰는 쪽(sage_state_manager.py, sage_executor.py)이
+같은 내용의 hot 필드를 고정 크기 레코드로 함께 남긴다:
+
+    {STATE_DIR}/sage_session_{session}.hot   (RECORD_SIZE 바이트, 한 줄 텍스트)
+
+    SAGEHOT1 <active> <exit_signal> <completed> <total> <loop_count> <chain_type> <current_role>
+
+    - active / exit_signal: true | false (jq -r 출력과 같음)
+    - completed / total: completed_roles / chain_roles 길이
+    - chain_type / current_role: 없으면 "-"
+    - 공백으로 채워 RECORD_SIZE - 1 바이트 + 개행
+
+읽기는 pread 한 번 (셸은 `read -r ... < FILE`)이고 세션 결과 크기와 무관하다.
+sidecar는 세션 파일을 쓴 뒤 temp → rename으로 교체되므로 찢어진 레코드를 읽지 않는다.
+
+신선도:
+    세션 파일이 sidecar보다 새로우면(sidecar를 모르는 쓰기, 수동 편집) 읽는 쪽은
+    sidecar를 버리고 세션 파일을 파싱한다. 필드 값에 공백이 있거나 레코드가
+    RECORD_SIZE를 넘으면 sidecar를 지워 항상 세션 파일로 돌아가게 한다.
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+MAGIC = "SAGEHOT1"
+RECORD_SIZE = 128
+HOT_SUFFIX = ".hot"
+
+
+def hot_path(session_file: Path) -> Path:
+    return session_file.with_suffix(HOT_SUFFIX)
+
+
+def _token(value) -> str:
+    if value is None or value == "":
+        return "-"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def encode_hot(state: dict) -> Optional[bytes]:
+    """세션 dict → 고정 크기 레코드 (담을 수 없으면 None)"""
+    tokens = [
+        MAGIC,
+        _token(bool(state.get("active", False))),
+        _token(bool(state.get("exit_signal", False))),
+        str(len(state.get("completed_roles") or ())),
+        str(len(state.get("chain_roles") or ())),
+        str(int(state.get("loop_count") or 0)),
+        _token(state.get("chain_type")),
+        _token(state.get("current_role")),
+    ]
+    if any(not token or any(c.isspace() for c in token) for token in tokens):
+        return None
+    line = " ".join(tokens).encode("utf-8")
+    if len(line) >= RECORD_SIZE:
+        return None
+    return line.ljust(RECORD_SIZE - 1) + b"\n"
+
+
+def write_hot(session_file: Path, state: dict) -> None:
+    """세션 파일을 쓴 직후 호출 - hot 필드 sidecar 교체 (담을 수 없으면 삭제)"""
+    path = hot_path(session_file)
+    record = encode_hot(state)
+    if record is None:
+        path.unlink(missing_ok=True)
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(record)
+        os.rename(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def read_hot(session_file: Path) -> Optional[dict]:
+    """sidecar → hot 필드 (없거나 세션 파일보다 오래됐거나 손상되면 None → 세션 파일을 읽을 것)"""
+    try:
+        fd = os.open(hot_path(session_file), os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        hot_mtime = os.fstat(fd).st_mtime_ns
+        raw = os.pread(fd, RECORD_SIZE, 0)
+    finally:
+        os.close(fd)
+    try:
+        if os.stat(session_file).st_mtime_ns > hot_mtime:
+            return None
+    except FileNotFoundError:
+        return None
+    tokens = raw.decode("utf-8", "replace").split()
+    if len(tokens) != 8 or tokens[0] != MAGIC:
+        return None
+    try:
+        completed, total, loop_count = int(tokens[3]), int(tokens[4]), int(tokens[5])
+    except ValueError:
+        return None
+    return {
+        "active": tokens[1] == "true",
+        "exit_signal": tokens[2] == "true",
+        "completed_roles": completed,
+        "total_roles": total,
+        "loop_count": loop_count,
+        "chain_type": None if tokens[6] == "-" else tokens[6],
+        "current_role": "" if tokens[7] == "-" else tokens[7],
+    }
+
+
+def clear_hot(session_file: Path) -> None:
+    hot_path(session_file).unlink(missing_ok=True)
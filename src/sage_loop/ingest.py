@@ -0,0 +1,235 @@
+"""
+Streamed Result Ingestion - 파일/stdin 역할 결과 수집
+
+--result(argv 문자열) 대신 파일·stdin·JSONL로 역할 결과를 받는다. 결과는
+청크 단위로 읽으며 동시에
+  - 저장소에 기록 (sha256 + zlib 스트리밍, blobs.BlobWriter)
+  - 판정 키워드 증분 탐색 (청크 경계는 최장 키워드 길이만큼 겹쳐 검사)
+  - 조건부 승인 조건 줄 단위 추출 (_extract_conditions와 동일 패턴)
+을 수행하므로 원문 전체를 메모리에 여러 벌 두지 않는다.
+결과는 RoleResult로 반환되어 check_branch/check_exit에 그대로 쓰인다.
+
+오케스트레이터가 import하므로 오케스트레이터를 import하지 않는다
+(python -m 실행 시 모듈이 두 번 로드되는 것을 방지).
+
+JSONL 형식 (--results-jsonl):
+  {"role": "sagawon", "path": "/tmp/sagawon.md"}
+  {"role": "gyoseogwan", "result": "pass"}
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+from .blobs import BlobStore, get_blob_store
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CHUNK_SIZE = 64 * 1024
+PREVIEW_CHARS = 200
+MAX_LINE_CHARS = 64 * 1024  # 개행 없는 초대형 줄은 이 길이에서 끊어 조건 추출
+
+# 조건부 승인 조건 패턴: "조건부승인: 조건1, 조건2" 또는 "conditional: cond1, cond2"
+CONDITION_PATTERNS = [
+    r"조건부\s*승인[:\s]+(.+?)(?:\n|$)",
+    r"conditional[:\s]+(.+?)(?:\n|$)",
+    r"조건[:\s]+(.+?)(?:\n|$)",
+]
+
+# CONDITION_PATTERNS의 머리말만 있고 내용이 다음 줄에 오는 경우
+# ("조건부 승인:\n  a, b") 다음 줄과 이어 붙여 같은 결과를 얻는다.
+_CONDITION_HEADER_RE = re.compile(r"(조건부\s*승인|conditional|조건)[:\s]*$", re.IGNORECASE)
+_SEPARATOR_RE = re.compile(r"[:\s]*")  # 머리말과 내용 사이 구분자만 있는 줄
+
+
+@dataclass
+class RoleResult:
+    """스트리밍으로 수집된 역할 결과
+
+    원문 대신 저장소 참조와 수집 중 미리 판정한 정보만 가진다.
+    check_branch/check_exit은 원문 문자열과 동일하게 취급한다.
+    """
+    ref: dict  # {"hash", "size", "z"}
+    matched: set = field(default_factory=set)  # 결과에 등장한 판정 키워드 (소문자)
+    conditions: list = field(default_factory=list)  # _extract_conditions와 동일한 결과
+    preview: str = ""  # 앞부분 (로그용)
+
+    @property
+    def size(self) -> int:
+        return self.ref.get("size", 0)
+
+
+def conditions_for(pattern: str, result: str) -> list[str]:
+    """단일 패턴 조건 추출"""
+    conditions = []
+    for match in re.findall(pattern, result, re.IGNORECASE):
+        # 쉼표나 세미콜론으로 분리
+        parts = re.split(r"[,;]", match)
+        conditions.extend([p.strip() for p in parts if p.strip()])
+    return conditions
+
+
+def verdict_keywords(config: dict) -> set[str]:
+    """설정 전체의 분기 조건/종료 키워드 (소문자)
+
+    체인 이름을 모르는 상태(락 획득 전)에서 수집하므로 모든 체인을 대상으로 한다.
+    """
+    keywords: set[str] = set()
+    for chain in config.get("chains", {}).values():
+        for branch in chain.get("branches", []) or []:
+            conditions = branch.get("condition", [])
+            if isinstance(conditions, str):
+                conditions = [conditions]
+            keywords.update(c.lower() for c in conditions if c)
+        for cond in chain.get("exit_conditions", []) or []:
+            keywords.update(k.lower() for k in cond.get("keywords", []) if k)
+    return keywords
+
+
+# =============================================================================
+# Verdict Scanner
+# =============================================================================
+
+class VerdictScanner:
+    """청크 단위 판정 키워드 / 조건 추출기"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = {k.lower() for k in keywords if k}
+        self.overlap = max((len(k) for k in self.keywords), default=1) - 1
+        self.matched: set[str] = set()
+        # _extract_conditions와 같은 순서(패턴 우선)를 위해 패턴별로 수집
+        self._conditions: list[list[str]] = [[] for _ in CONDITION_PATTERNS]
+        self.preview = ""
+        self._tail = ""
+        self._line = ""
+        self._pending = ""
+
+    def feed(self, text: str) -> None:
+        if not text:
+            return
+        if len(self.preview) < PREVIEW_CHARS:
+            self.preview += text[:PREVIEW_CHARS - len(self.preview)]
+
+        # 키워드: 이전 청크 끝(overlap)과 이어 검사
+        window = self._tail + text.lower()
+        for keyword in self.keywords - self.matched:
+            if keyword in window:
+                self.matched.add(keyword)
+        self._tail = window[-self.overlap:] if self.overlap else ""
+
+        # 조건: 완성된 줄 단위
+        lines = (self._line + text).split("\n")
+        self._line = lines.pop()
+        for line in lines:
+            self._feed_line(line, newline=True)
+        if len(self._line) > MAX_LINE_CHARS:
+            self._feed_line(self._line, newline=False)
+            self._line = ""
+
+    def _feed_line(self, line: str, newline: bool) -> None:
+        candidate = self._pending + line + ("\n" if newline else "")
+        if newline and len(candidate) <= MAX_LINE_CHARS and (
+                _CONDITION_HEADER_RE.search(line) or (self._pending and _SEPARATOR_RE.fullmatch(line))):
+            self._pending = candidate
+            return
+        self._pending = ""
+        for bucket, pattern in zip(self._conditions, CONDITION_PATTERNS):
+            bucket.extend(conditions_for(pattern, candidate))
+
+    def finish(self) -> list[str]:
+        if self._line or self._pending:
+            self._feed_line(self._line, newline=False)
+            self._line = ""
+        return [cond for bucket in self._conditions for cond in bucket]
+
+
+# =============================================================================
+# Ingestion
+# =============================================================================
+
+def ingest_stream(stream: BinaryIO, config: dict, store: Optional[BlobStore] = None,
+                  keywords: Optional[set[str]] = None) -> RoleResult:
+    """바이너리 스트림 → RoleResult (저장 + 판정 정보)"""
+    scanner = VerdictScanner(verdict_keywords(config) if keywords is None else keywords)
+    writer = (store or get_blob_store()).open_writer()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+            scanner.feed(decoder.decode(chunk))
+        scanner.feed(decoder.decode(b"", final=True))
+    except BaseException:
+        writer.abort()
+        raise
+    ref = writer.close()
+    return RoleResult(ref=ref, matched=scanner.matched, conditions=scanner.finish(),
+                      preview=scanner.preview)
+
+
+def ingest_file(path: str, config: dict, store: Optional[BlobStore] = None,
+                keywords: Optional[set[str]] = None) -> RoleResult:
+    with open(path, "rb") as f:
+        return ingest_stream(f, config, store, keywords)
+
+
+def ingest_text(text: str, config: dict, store: Optional[BlobStore] = None,
+                keywords: Optional[set[str]] = None) -> RoleResult:
+    return ingest_stream(io.BytesIO(text.encode("utf-8")), config, store, keywords)
+
+
+def parse_result_files(specs: list[str], roles: list[str]) -> dict[str, str]:
+    """--result-file 사양 → {role: path}
+
+    "ROLE=PATH"는 해당 역할, "PATH"는 지정되지 않은 나머지 모든 역할에 적용.
+    """
+    mapping: dict[str, str] = {}
+    shared: Optional[str] = None
+    for spec in specs:
+        role, sep, path = spec.partition("=")
+        if sep and role in roles:
+            mapping[role] = path
+        elif shared is None:
+            shared = spec
+        else:
+            raise ValueError(f"Multiple result files without role: {shared}, {spec}")
+    if shared is not None:
+        for role in roles:
+            mapping.setdefault(role, shared)
+    return mapping
+
+
+def read_results_jsonl(stream: Iterable[str], config: dict, store: Optional[BlobStore] = None
+                       ) -> dict[str, RoleResult]:
+    """JSONL 일괄 결과 → {role: RoleResult} (입력 순서 유지)"""
+    keywords = verdict_keywords(config)
+    results: dict[str, RoleResult] = {}
+    for lineno, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at line {lineno}: {e}") from None
+        role = record.get("role")
+        if not role:
+            raise ValueError(f"Missing role at line {lineno}")
+        if "path" in record:
+            results[role] = ingest_file(str(Path(record["path"]).expanduser()), config, store, keywords)
+        elif "result" in record:
+            results[role] = ingest_text(str(record["result"]), config, store, keywords)
+        else:
+            raise ValueError(f"Missing path/result for {role} at line {lineno}")
+    return results
@@ -0,0 +1,267 @@
+"""
+Role Result Memo - 입력이 같은 역할 결과 재사용
+
+분기 복귀로 페이즈를 다시 실행하거나 같은 작업을 다른 세션에서 반복할 때,
+입력이 같은 역할은 다시 실행하지 않고 이전 결과로 즉시 완료한다.
+
+키:
+    sha256(역할, 작업 해시, 스킬 버전, 상위 결과 해시들)
+
+    - 스킬 버전: {skills_dir}/{역할}/SKILL.md 또는 {역할}.md 내용 해시 (접미사 -ijo
+      등은 자동 제거, 파일이 없으면 "")
+    - 상위 결과: 현재 페이즈 밖 역할들의 결과 해시 (depends_on 선언 시 그 역할만,
+      deps.py / 오케스트레이터가 계산)
+
+값은 결과 원문이 아니라 blobs.py 참조다. 원문은 이미 content-addressed 저장소에
+있으므로 캐시는 작은 인덱스 파일 하나로 유지된다:
+
+    {STATE_DIR}/sage_memo.json   {"entries": {키: [역할, 해시, 크기, z, 저장 시각]}, ...}
+
+entries는 삽입 순서가 곧 LRU 순서다 (적중 시 끝으로 이동). max_entries 또는
+max_mb를 넘으면 앞에서부터 제거하고, ttl_s가 지난 항목은 조회 시 버린다.
+
+설정 (config.yaml):
+    memo:
+      enabled: false                # 키에 작업 트리가 없으므로 기본은 끔
+      ttl_s: 3600
+      max_entries: 512
+      max_mb: 64                    # 참조된 결과 원문 크기 합
+      skills_dir: ~/.claude/skills
+      exclude: [executor, ...]      # 부수 효과가 있는 역할 (접미사 자동 제거)
+
+환경 변수:
+    SAGE_MEMO: on / off 로 config memo.enabled 덮어쓰기 (기본: config, 기본 설정은 off)
+    SAGE_STATE_DIR: 인덱스 위치 (기본: /tmp)
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .blobs import is_blob_ref, make_ref
+from .deps import role_names as _role_names
+
+MEMO_FILE_NAME = "sage_memo.json"
+INDEX_VERSION = 1
+
+DEFAULT_TTL_S = 3600.0
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_MB = 64
+# 작업 트리 변경 / 기록 파일 작성처럼 결과 텍스트만으로 재현되지 않는 역할
+DEFAULT_EXCLUDE = ("executor", "chunchugwan", "seungmunwon", "gyujanggak")
+
+
+def task_digest(task: str) -> str:
+    return hashlib.sha256(task.encode("utf-8")).hexdigest()
+
+
+def result_digest(value) -> str:
+    """role_results 값 → 내용 해시 (구버전 원문 문자열이면 직접 해시)"""
+    if is_blob_ref(value):
+        return value["hash"]
+    return hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+
+
+def memo_enabled(config: dict) -> bool:
+    setting = os.environ.get("SAGE_MEMO", "").strip().lower()
+    if setting in ("0", "off", "false", "no"):
+        return False
+    if setting in ("1", "on", "true", "yes"):
+        return True
+    return bool((config.get("memo") or {}).get("enabled", False))
+
+
+def _empty_index() -> dict:
+    return {"v": INDEX_VERSION, "entries": {}, "bytes": 0,
+            "stats": {"hits": 0, "stores": 0, "evictions": 0, "expired": 0}}
+
+
+class ResultCache:
+    """파일 기반 결과 캐시 (LRU + 크기 상한 + TTL)"""
+
+    def __init__(self, path: Optional[Path] = None, ttl_s: float = DEFAULT_TTL_S,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 exclude: tuple = DEFAULT_EXCLUDE, skills_dir: Optional[Path] = None,
+                 clock: Callable[[], float] = time.time):
+        self.path = path or Path(os.environ.get("SAGE_STATE_DIR", "/tmp")) / MEMO_FILE_NAME
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.exclude = set(exclude)
+        self.skills_dir = skills_dir or Path("~/.claude/skills").expanduser()
+        self.clock = clock
+        self._versions: dict[str, str] = {}
+
+    @classmethod
+    def settings(cls, config: dict) -> dict:
+        """config memo 섹션 → 생성자 인자"""
+        cfg = config.get("memo") or {}
+        return {
+            "ttl_s": float(cfg.get("ttl_s", DEFAULT_TTL_S)),
+            "max_entries": int(cfg.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            "max_bytes": int(float(cfg.get("max_mb", DEFAULT_MAX_MB)) * 1024 * 1024),
+            "exclude": tuple(cfg.get("exclude", DEFAULT_EXCLUDE) or ()),
+            "skills_dir": Path(cfg["skills_dir"]).expanduser() if cfg.get("skills_dir") else None,
+        }
+
+    @classmethod
+    def from_config(cls, config: dict, state_dir: Optional[Path] = None) -> "ResultCache":
+        path = Path(state_dir) / MEMO_FILE_NAME if state_dir else None
+        return cls(path=path, **cls.settings(config))
+
+    # --- 키 ---
+
+    def cacheable(self, role: str) -> bool:
+        return not any(name in self.exclude for name in _role_names(role))
+
+    def skill_version(self, role: str) -> str:
+        """역할 스킬 파일 내용 해시 (프로세스 단위 캐시, 없으면 "")"""
+        version = self._versions.get(role)
+        if version is None:
+            version = ""
+            for name in _role_names(role):
+                for path in (self.skills_dir / name / "SKILL.md", self.skills_dir / f"{name}.md"):
+                    try:
+                        version = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+                    except OSError:
+                        continue
+                    break
+                if version:
+                    break
+            self._versions[role] = version
+        return version
+
+    def key(self, role: str, task_hash: str, upstream: dict[str, str]) -> str:
+        data = json.dumps([role, task_hash, self.skill_version(role), sorted(upstream.items())],
+                          separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    # --- 조회 / 저장 ---
+
+    def get_many(self, keys: dict[str, str]) -> dict[str, dict]:
+        """{역할: 키} → 적중한 {역할: 결과 참조}"""
+        found: dict[str, dict] = {}
+        if not keys:
+            return found
+
+        def apply(index: dict) -> bool:
+            entries = index["entries"]
+            now = self.clock()
+            changed = False
+            for role, key in keys.items():
+                entry = entries.pop(key, None)
+                if entry is None:
+                    continue
+                changed = True
+                if now - entry[4] > self.ttl_s:
+                    index["bytes"] -= entry[2]
+                    index["stats"]["expired"] += 1
+                    continue
+                entries[key] = entry  # LRU: 끝으로 이동
+                index["stats"]["hits"] += 1
+                found[role] = make_ref(entry[1], entry[2], entry[3])
+            return changed
+
+        self._transact(apply, create=False)
+        return found
+
+    def put_many(self, items: dict[str, tuple[str, dict]]) -> None:
+        """{키: (역할, 결과 참조)} 저장 후 상한 초과분 제거"""
+        if not items:
+            return
+
+        def apply(index: dict) -> bool:
+            entries = index["entries"]
+            now = self.clock()
+            for key, (role, ref) in items.items():
+                old = entries.pop(key, None)
+                if old is not None:
+                    index["bytes"] -= old[2]
+                entries[key] = [role, ref["hash"], ref["size"], bool(ref.get("z")), now]
+                index["bytes"] += ref["size"]
+                index["stats"]["stores"] += 1
+            while entries and (len(entries) > self.max_entries or index["bytes"] > self.max_bytes):
+                oldest = next(iter(entries))
+                index["bytes"] -= entries.pop(oldest)[2]
+                index["stats"]["evictions"] += 1
+            return True
+
+        self._transact(apply, create=True)
+
+    def stats(self) -> dict:
+        """전역 지표 (세션별 적중률은 ChainState.memo_stats)"""
+        index = self._read()
+        return {"entries": len(index["entries"]), "bytes": index["bytes"], **index["stats"]}
+
+    def clear(self) -> None:
+        def apply(index: dict) -> bool:
+            index.update(_empty_index())
+            return True
+
+        self._transact(apply, create=False)
+
+    # --- 인덱스 저장 ---
+
+    def _read(self) -> dict:
+        try:
+            index = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return _empty_index()
+        return index if index.get("v") == INDEX_VERSION else _empty_index()
+
+    def _transact(self, fn: Callable[[dict], bool], create: bool) -> None:
+        """락 아래에서 읽기 → fn → (변경 시) temp/rename 저장"""
+        if not create and not self.path.exists():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                index = self._read()
+                if not fn(index):
+                    return
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".", suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(index, f, separators=(",", ":"))
+                os.rename(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class MemoryResultCache(ResultCache):
+    """메모리 캐시 (MemoryStateStore / 테스트용, 디스크 기록 없음)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._index = _empty_index()
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        return self._index
+
+    def _transact(self, fn: Callable[[dict], bool], create: bool) -> None:
+        with self._lock:
+            fn(self._index)
+
+
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache(config: dict) -> Optional[ResultCache]:
+    """프로세스 단위 기본 파일 캐시 (비활성이면 None)"""
+    global _result_cache
+    if not memo_enabled(config):
+        return None
+    if _result_cache is None:
+        _result_cache = ResultCache(**ResultCache.settings(config))
+    return _result_cache
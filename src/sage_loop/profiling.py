@@ -0,0 +1,265 @@
+"""
+Opt-in Profiling - CLI/Hook 진입점용 cProfile / tracemalloc 덤프
+
+환경 변수:
+    SAGE_PROFILE: cpu | mem (미설정 시 비활성, 오버헤드 없음)
+    SAGE_STATE_DIR: 덤프 디렉토리 (기본: /tmp)
+    SAGE_SESSION_ID: 파일명에 포함할 세션 ID
+
+덤프 파일:
+    {STATE_DIR}/sage_profile_{session}.{entry}.{verb}.{pid}.{ts}.pstats
+    {STATE_DIR}/sage_profile_{session}.{entry}.{verb}.{pid}.{ts}.tracemalloc
+
+Hook 스크립트는 sage_loop 설치 여부와 무관하게 동작해야 하므로
+이 모듈은 표준 라이브러리만 사용한다 (pydantic 등 무거운 import 없음).
+
+집계:
+    sage-profile list
+    sage-profile merge --verb complete --top 30
+    sage-profile merge --kind mem --session sage-a1b2c3d4e5f6
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+PROFILE_ENV = "SAGE_PROFILE"
+FILE_PREFIX = "sage_profile_"
+SUFFIXES = {"cpu": ".pstats", "mem": ".tracemalloc"}
+_SAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def profile_mode() -> str:
+    """활성 프로파일 모드 ("cpu", "mem" 또는 "")"""
+    mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+    return mode if mode in SUFFIXES else ""
+
+
+def profile_dir() -> Path:
+    return Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
+
+
+def _safe(value: str, default: str) -> str:
+    value = _SAFE_RE.sub("", value)[:32]
+    return value or default
+
+
+def argv_verb(default: str = "run") -> str:
+    """argv에서 동사 추출 (첫 --옵션 또는 첫 위치 인자)"""
+    for token in sys.argv[1:]:
+        if token.startswith("--"):
+            return _safe(token[2:].split("=", 1)[0], default)
+    if len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
+        return _safe(sys.argv[1], default)
+    return default
+
+
+def dump_path(entry: str, verb: str, mode: str, session_id: str = "") -> Path:
+    session = _safe(session_id or os.environ.get("SAGE_SESSION_ID", ""), "nosession")
+    name = (f"{FILE_PREFIX}{session}.{_safe(entry, 'entry')}.{_safe(verb, 'run')}"
+            f".{os.getpid()}.{time.time_ns()}{SUFFIXES[mode]}")
+    return profile_dir() / name
+
+
+# =============================================================================
+# Profiling Context
+# =============================================================================
+
+@contextmanager
+def profiled(entry: str, verb: str = "run",
+             session: Optional[Callable[[], str]] = None) -> Iterator[None]:
+    """SAGE_PROFILE 설정 시 블록을 프로파일링하고 덤프
+
+    SystemExit 등 예외로 빠져나와도 덤프는 기록된다.
+    세션 ID는 블록 시작 시점 값을 우선 사용하고, 없으면 종료 시점 값을 쓴다
+    (체인 시작 명령은 블록 안에서 세션이 생성됨).
+
+    Args:
+        entry: 진입점 이름 (orchestrator, role_detector, ...)
+        verb: 동사 (complete, status, ...)
+        session: 환경변수에 세션 ID가 없을 때 사용할 조회 함수
+    """
+    mode = profile_mode()
+    if not mode:
+        yield
+        return
+
+    session_id = _resolve_session(session)
+    if mode == "cpu":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path = dump_path(entry, verb, mode, session_id or _resolve_session(session))
+            _ensure_dir(path)
+            profiler.dump_stats(str(path))
+    else:
+        import tracemalloc
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(int(os.environ.get("SAGE_PROFILE_FRAMES", "10")))
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            if started_here:
+                tracemalloc.stop()
+            path = dump_path(entry, verb, mode, session_id or _resolve_session(session))
+            _ensure_dir(path)
+            snapshot.dump(str(path))
+
+
+def _resolve_session(session: Optional[Callable[[], str]]) -> str:
+    env_id = os.environ.get("SAGE_SESSION_ID", "")
+    if env_id or session is None:
+        return env_id
+    try:
+        return session() or ""
+    except OSError:
+        return ""
+
+
+def _ensure_dir(path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass
+
+
+def run_profiled(entry: str, fn: Callable[[], object], verb: Optional[str] = None) -> object:
+    """진입점 함수를 profiled()로 감싸 실행 (__main__ 블록용)"""
+    with profiled(entry, verb or argv_verb()):
+        return fn()
+
+
+# =============================================================================
+# Aggregation
+# =============================================================================
+
+def find_dumps(kind: str, session: str = "", entry: str = "", verb: str = "",
+               directory: Optional[Path] = None) -> list[Path]:
+    """조건에 맞는 덤프 파일 목록"""
+    directory = directory or profile_dir()
+    suffix = SUFFIXES[kind]
+    dumps = []
+    for path in sorted(directory.glob(f"{FILE_PREFIX}*{suffix}")):
+        sid, ent, vb = parse_dump_name(path)
+        if session and sid != session:
+            continue
+        if entry and ent != entry:
+            continue
+        if verb and vb != verb:
+            continue
+        dumps.append(path)
+    return dumps
+
+
+def parse_dump_name(path: Path) -> tuple[str, str, str]:
+    """파일명 → (session, entry, verb)"""
+    parts = path.name[len(FILE_PREFIX):].split(".")
+    if len(parts) < 6:
+        return "", "", ""
+    return parts[0], parts[1], parts[2]
+
+
+def merge_cpu(paths: list[Path], top: int, sort: str, out: Optional[str]) -> None:
+    import pstats
+
+    stats = pstats.Stats(str(paths[0]), stream=sys.stdout)
+    for path in paths[1:]:
+        stats.add(str(path))
+    if out:
+        stats.dump_stats(out)
+        print(f"SAVED: {out}")
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+
+
+def merge_mem(paths: list[Path], top: int, out: Optional[str]) -> None:
+    import tracemalloc
+
+    totals: dict[str, list[int]] = {}  # 위치 -> [size, count]
+    for path in paths:
+        snapshot = tracemalloc.Snapshot.load(str(path))
+        for stat in snapshot.statistics("lineno"):
+            key = str(stat.traceback[0])
+            entry = totals.setdefault(key, [0, 0])
+            entry[0] += stat.size
+            entry[1] += stat.count
+
+    ranked = sorted(totals.items(), key=lambda kv: -kv[1][0])[:top]
+    lines = [f"{'SIZE(KiB)':>12} {'COUNT':>8}  LOCATION"]
+    for location, (size, count) in ranked:
+        lines.append(f"{size / 1024:>12.1f} {count:>8}  {location}")
+    report = "\n".join(lines)
+    print(f"DUMPS: {len(paths)}")
+    print(report)
+    if out:
+        Path(out).write_text(report + "\n")
+        print(f"SAVED: {out}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sage profile dump aggregation",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  SAGE_PROFILE=cpu sage-orchestrator --status       덤프 생성
+  %(prog)s list                                     덤프 목록
+  %(prog)s merge --verb complete --top 30           CPU 덤프 병합
+  %(prog)s merge --kind mem --entry role_detector   메모리 덤프 병합
+        """
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    for name in ("list", "merge"):
+        p = sub.add_parser(name, help="덤프 목록" if name == "list" else "덤프 병합")
+        p.add_argument("--kind", choices=list(SUFFIXES), default="cpu", help="덤프 종류")
+        p.add_argument("--session", default="", help="세션 ID 필터")
+        p.add_argument("--entry", default="", help="진입점 필터 (orchestrator, role_detector, ...)")
+        p.add_argument("--verb", default="", help="동사 필터 (complete, status, ...)")
+        p.add_argument("--dir", help="덤프 디렉토리 (기본: SAGE_STATE_DIR)")
+        if name == "merge":
+            p.add_argument("--top", type=int, default=25, help="출력 항목 수")
+            p.add_argument("--sort", default="cumulative", help="pstats 정렬 키")
+            p.add_argument("--out", help="병합 결과 저장 경로")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    directory = Path(args.dir) if args.dir else None
+    paths = find_dumps(args.kind, args.session, args.entry, args.verb, directory)
+
+    if args.command == "list":
+        for path in paths:
+            session, entry, verb = parse_dump_name(path)
+            print(f"{session}\t{entry}\t{verb}\t{path.stat().st_size}\t{path}")
+        return
+
+    if not paths:
+        print("NO_DUMPS", file=sys.stderr)
+        sys.exit(1)
+    if args.kind == "cpu":
+        merge_cpu(paths, args.top, args.sort, args.out)
+    else:
+        merge_mem(paths, args.top, args.out)
+
+
+if __name__ == "__main__":
+    main()
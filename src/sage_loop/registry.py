@@ -0,0 +1,168 @@
+"""
+Session Registry - 네임스페이스별 현재 세션 포인터
+
+단일 sage_current_session 파일 대신 네임스페이스마다 포인터를 두어, 다른
+프로젝트/터미널에서 시작한 체인이 서로의 "현재 세션"을 덮어쓰지 않게 한다.
+
+환경 변수:
+    SAGE_NAMESPACE: 네임스페이스 결정 방식 (기본: cwd)
+        cwd     - 프로젝트 루트 (.git / .claude가 있는 가장 가까운 상위 디렉토리, 없으면 cwd)
+        tty     - 제어 터미널 (없으면 프로세스 세션)
+        global  - 호스트 전체 단일 포인터 (기존 sage_current_session 동작)
+        그 외   - 명시적 이름
+    SAGE_STATE_DIR: 상태 디렉토리 (기본: /tmp)
+
+파일 배치:
+    {STATE_DIR}/sage_sessions/{namespace}   (내용: 세션 ID)
+    {STATE_DIR}/sage_current_session        (global)
+
+포인터는 temp → rename으로 교체하고, 해제는 락 아래에서 자신이 가리키는
+세션일 때만 지운다 (다른 체인이 이미 교체한 포인터를 지우지 않음).
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+NAMESPACE_ENV = "SAGE_NAMESPACE"
+GLOBAL_NAMESPACE = "global"
+REGISTRY_DIR_NAME = "sage_sessions"
+LEGACY_POINTER_NAME = "sage_current_session"
+
+# 프로젝트 루트 표식 (cwd 네임스페이스)
+PROJECT_MARKERS = (".git", ".claude")
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _state_dir(state_dir: Optional[Path] = None) -> Path:
+    return Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()[:12]
+
+
+def project_root(start: Optional[Path] = None) -> Path:
+    """표식 디렉토리가 있는 가장 가까운 상위 디렉토리 (없으면 start)"""
+    start = Path(start or os.getcwd()).resolve()
+    for directory in (start, *start.parents):
+        if any((directory / marker).exists() for marker in PROJECT_MARKERS):
+            return directory
+    return start
+
+
+def _terminal() -> str:
+    for fd in (0, 1, 2):
+        try:
+            return os.ttyname(fd)
+        except OSError:
+            continue
+    return f"sid{os.getsid(0)}"
+
+
+def current_namespace() -> str:
+    """SAGE_NAMESPACE → 파일명으로 쓸 수 있는 네임스페이스 키"""
+    mode = os.environ.get(NAMESPACE_ENV, "").strip() or "cwd"
+    if mode == GLOBAL_NAMESPACE:
+        return GLOBAL_NAMESPACE
+    if mode == "cwd":
+        root = project_root()
+        return f"cwd-{_UNSAFE_RE.sub('_', root.name)[:32]}-{_digest(str(root))}"
+    if mode == "tty":
+        return f"tty-{_digest(_terminal())}"
+    name = _UNSAFE_RE.sub("_", mode)
+    if name != mode or len(name) > 64:
+        name = f"{name[:32]}-{_digest(mode)}"
+    return f"ns-{name}"
+
+
+def pointer_path(namespace: Optional[str] = None, state_dir: Optional[Path] = None) -> Path:
+    namespace = namespace or current_namespace()
+    directory = _state_dir(state_dir)
+    if namespace == GLOBAL_NAMESPACE:
+        return directory / LEGACY_POINTER_NAME
+    return directory / REGISTRY_DIR_NAME / namespace
+
+
+@contextmanager
+def _pointer_lock(path: Path) -> Iterator[None]:
+    lock_path = path.with_name(path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_current(namespace: Optional[str] = None, state_dir: Optional[Path] = None) -> str:
+    """네임스페이스의 현재 세션 ID (없으면 "")"""
+    try:
+        return pointer_path(namespace, state_dir).read_text().strip()
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
+
+
+def write_current(session_id: str, namespace: Optional[str] = None,
+                  state_dir: Optional[Path] = None) -> Path:
+    """현재 세션 포인터 교체 (원자적)"""
+    path = pointer_path(namespace, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _pointer_lock(path):
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(session_id)
+            os.rename(tmp_path, path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    return path
+
+
+def clear_current(session_id: Optional[str] = None, namespace: Optional[str] = None,
+                  state_dir: Optional[Path] = None) -> bool:
+    """포인터 해제 → 지웠는지 여부
+
+    session_id가 주어지면 포인터가 그 세션을 가리킬 때만 지운다.
+    """
+    path = pointer_path(namespace, state_dir)
+    if not path.exists():
+        return False
+    with _pointer_lock(path):
+        if session_id is not None and read_current(namespace, state_dir) != session_id:
+            return False
+        path.unlink(missing_ok=True)
+    return True
+
+
+def list_current(state_dir: Optional[Path] = None) -> dict[str, str]:
+    """{네임스페이스: 세션 ID} (global 포함)"""
+    directory = _state_dir(state_dir)
+    sessions = {}
+    legacy = read_current(GLOBAL_NAMESPACE, directory)
+    if legacy:
+        sessions[GLOBAL_NAMESPACE] = legacy
+    registry = directory / REGISTRY_DIR_NAME
+    if registry.is_dir():
+        for path in sorted(registry.iterdir()):
+            if path.name.endswith((".lock", ".tmp")) or path.name.startswith("."):
+                continue
+            session_id = read_current(path.name, directory)
+            if session_id:
+                sessions[path.name] = session_id
+    return sessions
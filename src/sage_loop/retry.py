@@ -0,0 +1,153 @@
+"""
+Role Retry Policy - 역할 실패 재시도 / 지수 백오프
+
+역할 실패를 오류 메시지로 분류(일시적 / 영구적)하고, 체인·역할별 정책에 따라
+재시도 여부와 대기 시간을 정한다. 상태 전이는 오케스트레이터가
+(_fail_role_impl), 결과 누적은 circuit breaker(breaker.py)가 맡는다.
+
+설정 (config.yaml):
+    retry:
+      max_attempts: 3              # 최초 실행 포함
+      base_delay_ms: 1000
+      max_delay_ms: 30000
+      multiplier: 2.0
+      jitter: full                 # full | equal | none
+      on_exhausted: reject         # reject (체인 종료) | skip (FAILED 결과로 완료)
+      retryable: [timeout, "rate limit", ...]   # 정규식 (대소문자 무시)
+      permanent: ["permission denied", ...]     # retryable보다 우선
+      chains: {QUICK: {max_attempts: 2}}
+      roles: {executor: {base_delay_ms: 5000}}  # 접미사 -ijo 등은 자동 제거
+
+우선순위: 역할 > 체인 > retry 기본값 > 내장 기본값
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass, field, fields, replace
+from typing import Optional
+
+JITTER_MODES = ("full", "equal", "none")
+EXHAUSTED_ACTIONS = ("reject", "skip")
+
+DEFAULT_RETRYABLE = (
+    r"time(d)?[ -]?out", r"rate[ -]?limit", r"\b429\b", r"\b5\d\d\b", r"overloaded",
+    r"connection (reset|refused|aborted)", r"temporarily unavailable", r"try again",
+)
+DEFAULT_PERMANENT = (
+    r"permission denied", r"invalid api key", r"unauthori[sz]ed", r"context length",
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay_ms: float = 1000.0
+    max_delay_ms: float = 30000.0
+    multiplier: float = 2.0
+    jitter: str = "full"
+    on_exhausted: str = "reject"
+    retryable: tuple = DEFAULT_RETRYABLE
+    permanent: tuple = DEFAULT_PERMANENT
+    _patterns: tuple = field(default=(), compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.jitter not in JITTER_MODES:
+            raise ValueError(f"Unknown jitter mode: {self.jitter}")
+        if self.on_exhausted not in EXHAUSTED_ACTIONS:
+            raise ValueError(f"Unknown on_exhausted action: {self.on_exhausted}")
+        compiled = (
+            tuple(re.compile(p, re.IGNORECASE) for p in self.permanent),
+            tuple(re.compile(p, re.IGNORECASE) for p in self.retryable),
+        )
+        object.__setattr__(self, "_patterns", compiled)
+
+    def classify(self, error: str) -> bool:
+        """일시적(재시도 가능) 오류인지"""
+        permanent, retryable = self._patterns
+        if any(p.search(error) for p in permanent):
+            return False
+        return any(p.search(error) for p in retryable)
+
+    def delay_s(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """attempt번째 실패 후 대기 시간 (초, attempt는 1부터)"""
+        ceiling = min(self.max_delay_ms, self.base_delay_ms * self.multiplier ** max(0, attempt - 1))
+        rng = rng or random
+        if self.jitter == "full":
+            delay = rng.uniform(0, ceiling)
+        elif self.jitter == "equal":
+            delay = ceiling / 2 + rng.uniform(0, ceiling / 2)
+        else:
+            delay = ceiling
+        return delay / 1000.0
+
+
+_POLICY_KEYS = {f.name for f in fields(RetryPolicy) if not f.name.startswith("_")}
+
+
+def _merge(base: RetryPolicy, overrides: dict) -> RetryPolicy:
+    values = {key: value for key, value in overrides.items() if key in _POLICY_KEYS}
+    for key in ("retryable", "permanent"):
+        if key in values:
+            values[key] = tuple(values[key] or ())
+    return replace(base, **values) if values else base
+
+
+class RetryPolicies:
+    """(체인, 역할) → RetryPolicy (결과 캐시)"""
+
+    def __init__(self, config: dict):
+        self.cfg = config.get("retry", {}) or {}
+        self.default = _merge(RetryPolicy(), self.cfg)
+        self._cache: dict[tuple[str, str], RetryPolicy] = {}
+
+    def for_role(self, chain: str, role: str) -> RetryPolicy:
+        key = (chain, role)
+        policy = self._cache.get(key)
+        if policy is None:
+            policy = _merge(self.default, (self.cfg.get("chains") or {}).get(chain) or {})
+            roles = self.cfg.get("roles") or {}
+            parts = role.split("-")
+            for n in range(len(parts), 0, -1):
+                name = "-".join(parts[:n])
+                if name in roles:
+                    policy = _merge(policy, roles[name] or {})
+                    break
+            self._cache[key] = policy
+        return policy
+
+
+@dataclass
+class RetryDecision:
+    """역할 실패 1건의 처리 결과"""
+    role: str
+    action: str  # retry | reject | skip
+    attempt: int  # 방금 실패한 실행 번호 (1부터)
+    max_attempts: int
+    retryable: bool
+    delay_s: float = 0.0
+    reason: str = ""
+
+
+def decide(policy: RetryPolicy, role: str, attempt: int, error: str,
+           retryable: Optional[bool] = None, breaker_open: bool = False,
+           rng: Optional[random.Random] = None) -> RetryDecision:
+    """실패한 attempt번째 실행에 대한 결정
+
+    retryable: 호출자가 분류를 지정 (None이면 메시지로 분류)
+    breaker_open: circuit breaker가 열려 있으면 재시도하지 않음
+    """
+    retryable = policy.classify(error) if retryable is None else retryable
+    if breaker_open:
+        reason = "circuit breaker open"
+    elif not retryable:
+        reason = "permanent error"
+    elif attempt >= policy.max_attempts:
+        reason = f"attempts exhausted ({attempt}/{policy.max_attempts})"
+    else:
+        return RetryDecision(role, "retry", attempt, policy.max_attempts, True,
+                             delay_s=policy.delay_s(attempt, rng))
+    return RetryDecision(role, policy.on_exhausted, attempt, policy.max_attempts, retryable, reason=reason)
@@ -0,0 +1,266 @@
+"""
+Chain Scheduler - 우선순위 기반 다중 체인 실행 슬롯 관리
+
+api.Orchestrator 위에서 동시에 실행할 체인 수(slots)를 제한하고, 대기 중인
+체인을 우선순위 순으로 입장시킨다. 실행 가능한 역할도 우선순위 순으로
+내준다.
+
+    from sage_loop.api import Orchestrator
+    from sage_loop.scheduler import Scheduler
+
+    sched = Scheduler(Orchestrator(), slots=4)
+    sched.submit("결제 버그 hotfix")            # QUICK → 우선순위 0
+    sched.submit("신규 대시보드 개발")          # FULL  → 우선순위 3
+    for ticket, role in sched.dispatch():
+        ...                                      # 역할 실행
+        sched.complete(ticket, role, result)
+
+선점: 슬롯이 모두 찼고 더 높은 우선순위 체인이 대기 중이면, 낮은 우선순위
+체인은 페이즈 경계(진행 중인 역할 없이 다음 페이즈로 넘어간 시점)에서
+일시 정지되어 대기열로 돌아간다. 상태는 저장소에 남아 있으므로 재입장 시
+그 페이즈부터 이어서 진행한다.
+
+dispatcher(dispatch.Dispatcher)를 주면 역할은 모델 등급별 동시 실행/속도
+한도를 통과한 것만 내준다.
+
+설정 (config.yaml):
+    scheduler:
+      slots: 4
+      preempt: true
+      priorities: {QUICK: 0, REVIEW: 1, ...}   # 낮을수록 먼저
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+
+from .api import Orchestrator
+from .cli.orchestrator import ChainState, RoleResult, is_terminal, select_chain
+from .dispatch import Dispatcher
+from .events import get_event_log
+
+DEFAULT_SLOTS = 4
+DEFAULT_PRIORITY = 5
+DEFAULT_PRIORITIES = {"QUICK": 0, "REVIEW": 1, "RESEARCH": 2, "DESIGN": 2, "FULL": 3}
+
+# 대기 시간 통계에 유지할 최근 입장 수
+WAIT_SAMPLES = 1024
+
+
+class TicketStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    PAUSED = "paused"
+    DONE = "done"
+
+
+@dataclass
+class Ticket:
+    """스케줄러에 제출된 체인 1개"""
+    task: str
+    chain: str
+    priority: int
+    seq: int
+    submitted_at: float
+    session_id: str = ""
+    status: str = TicketStatus.QUEUED
+    queued_since: float = 0.0  # 현재 대기(입장 전 또는 일시 정지) 시작 시각
+    wait_s: float = 0.0  # 누적 대기 시간
+    phase: int = 0  # 마지막으로 본 current_phase (페이즈 경계 감지)
+    dispatched: set = field(default_factory=set)  # 실행 중으로 내준 역할
+    preemptions: int = 0
+    outcome: str = ""
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round((len(values) - 1) * pct / 100.0)))
+    return values[k]
+
+
+class Scheduler:
+    """슬롯 제한 + 우선순위 입장 + 페이즈 경계 선점
+
+    Args:
+        orchestrator: 체인 상태를 다루는 Orchestrator
+        slots: 동시 실행 체인 수 (기본: config scheduler.slots 또는 4)
+        priorities: 체인별 우선순위 덮어쓰기 (낮을수록 먼저)
+        preempt: 페이즈 경계 선점 여부 (기본: config scheduler.preempt 또는 True)
+        dispatcher: 모델 등급별 풀 (기본: 없음 - 실행 가능한 역할을 모두 내줌)
+        clock: 대기 시간 측정용 시계
+    """
+
+    def __init__(self, orchestrator: Orchestrator, slots: Optional[int] = None,
+                 priorities: Optional[dict[str, int]] = None, preempt: Optional[bool] = None,
+                 dispatcher: Optional[Dispatcher] = None, clock: Callable[[], float] = time.monotonic):
+        cfg = orchestrator.config.get("scheduler", {}) or {}
+        self.orch = orchestrator
+        self.slots = max(1, int(slots or cfg.get("slots", DEFAULT_SLOTS)))
+        self.priorities = {**DEFAULT_PRIORITIES, **(cfg.get("priorities") or {}), **(priorities or {})}
+        self.preempt = bool(cfg.get("preempt", True) if preempt is None else preempt)
+        self.dispatcher = dispatcher
+        self.clock = clock
+
+        self._waiting: list[tuple[int, int, int, Ticket]] = []  # (우선순위, 신규=1/재개=0, seq, 티켓)
+        self._running: dict[str, Ticket] = {}
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._waits: deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.admitted = 0
+        self.completed = 0
+        self.preemptions = 0
+
+    # --- 제출 / 입장 ---
+
+    def submit(self, task: str, chain: Optional[str] = None, priority: Optional[int] = None) -> Ticket:
+        """체인 제출 (슬롯이 비어 있으면 바로 시작)"""
+        chain = chain or select_chain(task, self.orch.config)
+        now = self.clock()
+        ticket = Ticket(
+            task=task, chain=chain,
+            priority=self.priorities.get(chain, DEFAULT_PRIORITY) if priority is None else priority,
+            seq=next(self._seq), submitted_at=now, queued_since=now,
+        )
+        with self._lock:
+            heapq.heappush(self._waiting, (ticket.priority, 1, ticket.seq, ticket))
+            self._admit()
+        return ticket
+
+    def _admit(self) -> None:
+        while self._waiting and len(self._running) < self.slots:
+            _, _, _, ticket = heapq.heappop(self._waiting)
+            now = self.clock()
+            waited = now - ticket.queued_since
+            ticket.wait_s += waited
+            self._waits.append(waited)
+            if ticket.status == TicketStatus.QUEUED:
+                state = self.orch.start(ticket.task, chain=ticket.chain)
+                ticket.session_id = state.session_id
+                ticket.phase = state.current_phase
+                if is_terminal(state):  # 모든 역할이 결과 캐시 적중
+                    ticket.status = TicketStatus.DONE
+                    ticket.outcome = state.status
+                    self.completed += 1
+                    continue
+            ticket.status = TicketStatus.RUNNING
+            self._running[ticket.session_id] = ticket
+            self.admitted += 1
+            get_event_log().emit("sched_admit", ticket.session_id, chain=ticket.chain,
+                                 priority=ticket.priority, wait_ms=round(waited * 1000, 3),
+                                 resumed=ticket.preemptions > 0)
+
+    # --- 역할 배분 ---
+
+    def runnable(self) -> list[tuple[Ticket, str]]:
+        """실행 가능한 (티켓, 역할) - 체인 우선순위 순, 이미 내준 역할 제외"""
+        with self._lock:
+            tickets = sorted(self._running.values(), key=lambda t: (t.priority, t.seq))
+        pairs = []
+        for ticket in tickets:
+            state = self.orch.status(ticket.session_id)
+            if state is None or is_terminal(state):
+                continue
+            pairs.extend((ticket, role) for role in state.pending_roles if role not in ticket.dispatched)
+        return pairs
+
+    def dispatch(self, limit: Optional[int] = None) -> list[tuple[Ticket, str]]:
+        """runnable() 중 limit개를 실행 중으로 표시하고 반환
+
+        dispatcher가 있으면 실행 가능한 역할을 모두 등급별 대기열에 넣고,
+        한도 안에서 배출된 것만 반환한다 (limit 무시).
+        """
+        pairs = self.runnable()
+        if self.dispatcher is None:
+            pairs = pairs[:limit]
+        else:
+            offered = {ticket.session_id: ticket for ticket, _ in pairs}
+            for ticket, role in pairs:
+                self.dispatcher.submit(ticket.session_id, [role], ticket.priority)
+            pairs = []
+            for item in self.dispatcher.release():
+                ticket = self._running.get(item.session_id) or offered.get(item.session_id)
+                if ticket is None:
+                    self.dispatcher.done(item.session_id, item.role)
+                    continue
+                pairs.append((ticket, item.role))
+        with self._lock:
+            for ticket, role in pairs:
+                ticket.dispatched.add(role)
+        return pairs
+
+    def complete(self, ticket: Ticket, roles: Union[str, list[str]],
+                 results: "Optional[dict[str, str | RoleResult]]" = None, result: str = "pass") -> ChainState:
+        """역할 완료 → 종료 시 슬롯 반납, 페이즈 경계면 선점 검사"""
+        if isinstance(roles, str):
+            roles = [r.strip() for r in roles.split(",") if r.strip()]
+        state = self.orch.complete(ticket.session_id, roles, results, result)
+        if self.dispatcher is not None:
+            for role in roles:
+                self.dispatcher.done(ticket.session_id, role)
+        with self._lock:
+            ticket.dispatched.difference_update(roles)
+            if is_terminal(state):
+                ticket.status = TicketStatus.DONE
+                ticket.outcome = state.status
+                self._running.pop(ticket.session_id, None)
+                self.completed += 1
+            elif state.current_phase != ticket.phase and not ticket.dispatched:
+                ticket.phase = state.current_phase
+                self._maybe_preempt(ticket)
+            else:
+                ticket.phase = state.current_phase
+            self._admit()
+        return state
+
+    def _maybe_preempt(self, ticket: Ticket) -> None:
+        """페이즈 경계의 ticket보다 높은 우선순위가 대기 중이면 일시 정지"""
+        if not self.preempt or not self._waiting or len(self._running) < self.slots:
+            return
+        if self._waiting[0][0] >= ticket.priority:
+            return
+        ticket.status = TicketStatus.PAUSED
+        ticket.preemptions += 1
+        ticket.queued_since = self.clock()
+        self._running.pop(ticket.session_id, None)
+        heapq.heappush(self._waiting, (ticket.priority, 0, ticket.seq, ticket))
+        self.preemptions += 1
+        get_event_log().emit("sched_preempt", ticket.session_id, chain=ticket.chain,
+                             priority=ticket.priority, phase=ticket.phase + 1,
+                             by_priority=self._waiting[0][0])
+
+    # --- 지표 ---
+
+    def stats(self) -> dict:
+        """대기열 깊이 / 대기 시간 / 처리량 지표"""
+        with self._lock:
+            now = self.clock()
+            waiting = [entry[3] for entry in self._waiting]
+            waits = list(self._waits)
+            depth: dict[int, int] = {}
+            for ticket in waiting:
+                depth[ticket.priority] = depth.get(ticket.priority, 0) + 1
+            return {
+                "slots": self.slots,
+                "running": len(self._running),
+                "queue_depth": len(waiting),
+                "queued": sum(1 for t in waiting if t.status == TicketStatus.QUEUED),
+                "paused": sum(1 for t in waiting if t.status == TicketStatus.PAUSED),
+                "depth_by_priority": dict(sorted(depth.items())),
+                "oldest_wait_s": round(max((now - t.queued_since for t in waiting), default=0.0), 3),
+                "wait_s": {
+                    "p50": round(_percentile(waits, 50), 3),
+                    "p95": round(_percentile(waits, 95), 3),
+                    "max": round(max(waits, default=0.0), 3),
+                },
+                "admitted": self.admitted,
+                "completed": self.completed,
+                "preemptions": self.preemptions,
+            }
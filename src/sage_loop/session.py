@@ -5,11 +5,23 @@ Session Management for Sage Feedback Loop
 동시 실행 시 세션 격리를 위해 고유 ID 사용.
 """
 
+import json
 import os
 import time
 import uuid
+from pathlib import Path
+from typing import Optional
 
+from . import codec
+from .blobs import BLOB_DIR_NAME, is_blob_ref
+from .checkpoint import CHECKPOINT_PREFIX
 from .config import get_hook_config
+from .durability import SYNC_SUFFIX
+from .hotstate import HOT_SUFFIX
+from .memo import MEMO_FILE_NAME
+from .registry import read_current
+from .snapshot import SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX, snapshot_dir
+from .watch import WATCH_PREFIX, WATCH_SUFFIX
 
 
 def generate_session_id() -> str:
@@ -29,8 +41,9 @@ def get_session_id() -> str:
 
     우선순위:
     1. 환경변수 SAGE_SESSION_ID
-    2. 기존 세션 파일에서 조회
-    3. 새로 생성
+    2. 현재 네임스페이스의 세션 포인터 (registry.py, SAGE_NAMESPACE)
+    3. 기존 세션 파일에서 조회
+    4. 새로 생성
 
     Returns:
         8자리 세션 ID
@@ -40,8 +53,13 @@ def get_session_id() -> str:
     if env_session:
         return env_session
 
-    # 2. 기존 세션 파일 확인 (가장 최근 것)
+    # 2. 네임스페이스 포인터
     config = get_hook_config()
+    current = read_current(state_dir=config.state_dir)
+    if current:
+        return current
+
+    # 3. 기존 세션 파일 확인 (가장 최근 것)
     session_files = list(config.state_dir.glob("sage_state_*.json"))
     if session_files:
         # 가장 최근 파일에서 세션 ID 추출
@@ -50,7 +68,7 @@ def get_session_id() -> str:
         if session_id and len(session_id) == 8:
             return session_id
 
-    # 3. 새로 생성
+    # 4. 새로 생성
     new_id = generate_session_id()
     os.environ["SAGE_SESSION_ID"] = new_id
     return new_id
@@ -66,8 +84,14 @@ def cleanup_session(session_id: str) -> None:
 
     patterns = [
         f"sage_state_{session_id}.json",
+        f"sage_state_{session_id}.lock",
+        f"sage_state_{session_id}{SYNC_SUFFIX}",
+        f"{CHECKPOINT_PREFIX}{session_id}.json",
         f"sage_circuit_breaker_{session_id}.json",
+        f"sage_circuit_breaker_{session_id}.ring",
+        f"sage_circuit_breaker_{session_id}.lock",
         f"sage_errors_{session_id}.log",
+        f"sage_session_{session_id}{HOT_SUFFIX}",
     ]
 
     for pattern in patterns:
@@ -95,12 +119,32 @@ def cleanup_old_sessions(max_age_hours: int = 24) -> int:
     # 모든 Sage 관련 임시 파일 검색
     patterns = [
         "sage_state_*.json",
+        "sage_state_*.lock",  # 락은 잡을 때마다 'w'로 열려 mtime이 갱신됨
+        f"sage_state_*{SYNC_SUFFIX}",
+        f"{CHECKPOINT_PREFIX}*.json",  # 강제 종료된 체인 (정상 종료 / --reset이면 이미 삭제)
+        f"{CHECKPOINT_PREFIX}*{SYNC_SUFFIX}",
         "sage_circuit_breaker_*.json",
+        "sage_circuit_breaker_*.ring",
+        "sage_circuit_breaker_*.lock",
         "sage_errors_*.log",
+        f"sage_session_*{HOT_SUFFIX}",  # 훅 세션 파일의 sidecar (세션 파일은 훅이 정리)
+        "sage_profile_*.pstats",
+        "sage_profile_*.tracemalloc",
+        "sage_events_*.jsonl*",
+        "sage_trace_*.jsonl",
+        f"{BLOB_DIR_NAME}/*.tmp",  # 기록 중 종료된 임시 파일 (blob 자체는 _sweep_blobs)
+        "sage_sessions/*",
+        "sage_heartbeats/*/*",
+        f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}",
+        f"{WATCH_PREFIX}*{WATCH_SUFFIX}/*.fifo",  # 강제 종료된 대기자
     ]
+    searches = [(config.state_dir, pattern) for pattern in patterns]
+    shared_dir = snapshot_dir(config.state_dir)  # SAGE_SNAPSHOT=shm 등 별도 위치
+    if shared_dir is not None and shared_dir != config.state_dir:
+        searches.append((shared_dir, f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"))
 
-    for pattern in patterns:
-        for file_path in config.state_dir.glob(pattern):
+    for directory, pattern in searches:
+        for file_path in directory.glob(pattern):
             try:
                 if file_path.stat().st_mtime < cutoff_time:
                     file_path.unlink()
@@ -108,7 +152,72 @@ def cleanup_old_sessions(max_age_hours: int = 24) -> int:
             except OSError:
                 pass  # 파일 접근/삭제 실패 시 무시
 
-    return deleted_count
+    return deleted_count + _sweep_blobs(config.state_dir, cutoff_time)
+
+
+def _collect_refs(value, found: set[str]) -> None:
+    """JSON 값 안의 blob 참조 해시 수집"""
+    if is_blob_ref(value):
+        found.add(value["hash"])
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_refs(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_refs(item, found)
+
+
+def _referenced_blobs(state_dir: Path) -> Optional[set[str]]:
+    """남은 상태 / 체크포인트 / 결과 캐시 / 기록 파일이 참조하는 blob 해시
+
+    읽지 못한 파일이 있으면 None (참조를 모르므로 이번에는 blob을 지우지 않음)
+    """
+    found: set[str] = set()
+    try:
+        for pattern in ("sage_state_*.json", f"{CHECKPOINT_PREFIX}*.json"):
+            for path in state_dir.glob(pattern):
+                try:
+                    _collect_refs(codec.read_fields(path, ["role_results"]), found)
+                except FileNotFoundError:  # 그 사이 종료 / 삭제됨
+                    continue
+        memo = state_dir / MEMO_FILE_NAME
+        if memo.exists():
+            for entry in json.loads(memo.read_text()).get("entries", {}).values():
+                found.add(entry[1])  # [역할, 해시, 크기, z, 저장 시각]
+        for path in state_dir.glob("sage_trace_*.jsonl"):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        _collect_refs(json.loads(line), found)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return found
+
+
+def _sweep_blobs(state_dir: Path, cutoff_time: float) -> int:
+    """오래되고 아무도 참조하지 않는 blob 삭제 → 삭제 수
+
+    content-addressed라 같은 결과가 오래 쓰이면 mtime이 처음 기록 시각에 머물 수
+    있다 (put()이 다시 기록하면 갱신됨). 그래서 mtime만으로 지우지 않고, 앞에서
+    오래된 세션 파일을 정리한 뒤 남은 파일이 참조하는 blob은 남긴다.
+    """
+    blobs = list(state_dir.glob(f"{BLOB_DIR_NAME}/*/*"))
+    if not blobs:
+        return 0
+    referenced = _referenced_blobs(state_dir)
+    if referenced is None:
+        return 0
+    deleted = 0
+    for path in blobs:
+        if path.name.removesuffix(".z") in referenced:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff_time:
+                path.unlink()
+                deleted += 1
+        except OSError:
+            pass
+    return deleted
 
 
 def get_session_info(session_id: str | None = None) -> dict:
@@ -0,0 +1,232 @@
+"""
+State Snapshot - mmap 공유 스냅샷 (seqlock)
+
+감독 루프와 --sessions는 체인 상태 파일을 반복해서 열고 읽고 디코딩한다.
+SAGE_SNAPSHOT을 켜면 상태 파일을 쓸 때(write_state_file) 같은 내용을 바이너리
+형식(codec.py)으로 mmap 영역에도 게시하고, 읽는 쪽은 락 없이 매핑에서 필요한
+필드 구간만 디코딩한다.
+
+범위: 스냅샷은 체인 상태(sage_state_*)만 게시하고, 읽는 곳은 read_state_fields()
+(sage-supervisor 스캔, --sessions)다. 훅(stop-hook.sh, role_detector.py 등)은 체인
+상태가 아니라 훅 세션 파일(sage_session_*.json)을 읽으며, 그 hot 필드는 고정 크기
+sidecar(hotstate.py, pread 한 번)로 읽는다. 훅 세션 파일은 스냅샷으로 게시하지 않는다.
+
+SAGE_SNAPSHOT (기본: off):
+    off     게시하지 않음
+    state   {STATE_DIR}/sage_snap_{session}.shm
+    shm     /dev/shm/sage_snap_{session}.shm (tmpfs - 디스크 쓰기 없음)
+    경로    {경로}/sage_snap_{session}.shm
+
+영역 (정수는 little endian):
+
+    0   8   매직 b"SAGESNP1"
+    8   8   seq: 기록 중이면 홀수 (seqlock)
+    16  8   payload 길이
+    24  4   payload crc32
+    28  4   hot 구간 crc32 (payload 앞부분: 헤더 + codec.HOT_FIELDS)
+    32  8   상태 파일 st_ino        ┐ 게시 직후의 상태 파일 - 다르면 스냅샷이 뒤처진 것
+    40  8   상태 파일 st_mtime_ns   │ (스냅샷을 끈 기록자, 수동 편집)
+    48  8   상태 파일 st_size       ┘
+    56  8   hot 구간 길이
+    64  ..  payload (codec 바이너리 형식)
+
+기록 (상태 락 안, 세션당 기록자 하나):
+    seq를 홀수로 → payload / 길이 / crc / 상태 파일 stat 기록 → seq를 짝수로.
+    이전 기록자가 중간에 죽어 seq가 홀수로 남았으면 짝수로 맞춘 뒤 시작한다.
+    영역이 모자라면 ftruncate로 늘린다 (줄이지 않음).
+
+읽기:
+    seq(짝수) → 헤더 → 상태 파일 stat 비교 → crc 확인 → 필드 구간 디코딩 → seq 재확인.
+    seq가 바뀌었으면 다시 시도하고, 몇 번 실패하거나 스냅샷이 없거나 뒤처졌으면
+    None을 돌려 호출자가 상태 파일을 읽게 한다. crc는 메모리 순서가 약한 CPU에서도
+    찢어진 payload를 걸러 낸다. hot 필드만 읽으면 hot 구간 crc만 확인하므로 비용이
+    role_results 크기와 무관하다. 값은 매핑에서 바로 디코딩하므로 payload 복사는 없다.
+
+    상태 파일 rename과 스냅샷 갱신 사이에 읽으면 stat이 달라 상태 파일로 돌아간다
+    (기록자가 선점되면 이 구간이 길어짐 - bench_snapshot.py의 fallbacks).
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import codec
+
+MAGIC = b"SAGESNP1"
+HEADER_SIZE = 64
+SEQ = struct.Struct("<Q")
+META = struct.Struct("<QIIQQQQ")  # 길이, crc, hot crc, ino, mtime_ns, size, hot 구간 길이
+SNAPSHOT_PREFIX = "sage_snap_"
+SNAPSHOT_SUFFIX = ".shm"
+SHM_DIR = "/dev/shm"
+MAX_SPINS = 8
+
+
+def snapshot_dir(state_dir: Path) -> Optional[Path]:
+    """SAGE_SNAPSHOT → 스냅샷 디렉토리 (off면 None)"""
+    setting = os.environ.get("SAGE_SNAPSHOT", "off").strip()
+    if setting.lower() in ("", "0", "off", "false", "no"):
+        return None
+    if setting.lower() == "state":
+        return state_dir
+    if setting.lower() == "shm":
+        return Path(SHM_DIR)
+    return Path(setting).expanduser()
+
+
+def snapshot_for(state_path: Path) -> Optional[Path]:
+    """상태 파일 경로 → 짝이 되는 스냅샷 경로 (비활성이면 None)"""
+    directory = snapshot_dir(state_path.parent)
+    if directory is None:
+        return None
+    name = state_path.name
+    if name.startswith("sage_state_"):
+        name = name[len("sage_state_"):]
+    if name.endswith(".json"):
+        name = name[:-len(".json")]
+    return directory / f"{SNAPSHOT_PREFIX}{name}{SNAPSHOT_SUFFIX}"
+
+
+def _capacity(needed: int) -> int:
+    """payload 영역 크기 (페이지 단위, 두 배씩)"""
+    size = mmap.PAGESIZE
+    while size < needed:
+        size *= 2
+    return size
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+def publish(path: Path, payload: bytes, source: os.stat_result) -> None:
+    """payload(codec 바이너리)를 스냅샷 영역에 게시 (source: 방금 기록한 상태 파일 stat)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        if size < HEADER_SIZE + len(payload):
+            size = HEADER_SIZE + _capacity(HEADER_SIZE + len(payload))
+            os.ftruncate(fd, size)
+        hot_len = codec.prefix_length(payload, codec.HOT_FIELDS)
+        with mmap.mmap(fd, size) as region:
+            if region[:len(MAGIC)] != MAGIC:
+                region[:len(MAGIC)] = MAGIC
+            seq = SEQ.unpack_from(region, 8)[0]
+            seq += seq & 1  # 중단된 기록 → 짝수로
+            SEQ.pack_into(region, 8, seq + 1)
+            region[HEADER_SIZE:HEADER_SIZE + len(payload)] = payload
+            META.pack_into(region, 16, len(payload), zlib.crc32(payload), zlib.crc32(payload[:hot_len]),
+                           source.st_ino, source.st_mtime_ns, source.st_size, hot_len)
+            SEQ.pack_into(region, 8, seq + 2)
+    finally:
+        os.close(fd)
+
+
+def remove(state_path: Path) -> None:
+    path = snapshot_for(state_path)
+    if path is not None:
+        path.unlink(missing_ok=True)
+    _readers.pop(state_path, None)
+
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+class SnapshotReader:
+    """스냅샷 영역 매핑 (프로세스 안에서 재사용, 파일이 커지거나 교체되면 다시 매핑)"""
+
+    def __init__(self, path: Path, state_path: Path):
+        self.path = path
+        self.state_path = state_path
+        self._map: Optional[mmap.mmap] = None
+        self.retries = 0  # seq 변경으로 다시 읽은 횟수 (벤치마크용)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _mapped(self, needed: int = HEADER_SIZE) -> Optional[mmap.mmap]:
+        if self._map is not None and len(self._map) >= needed:
+            return self._map
+        self.close()
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            st = os.fstat(fd)
+            if st.st_size < max(needed, HEADER_SIZE):
+                return None
+            self._map = mmap.mmap(fd, st.st_size, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+        return self._map
+
+    def fields(self, names: Iterable[str]) -> Optional[dict]:
+        """일관된 스냅샷에서 지정한 필드만 디코딩 (없거나 뒤처졌으면 None)"""
+        names = tuple(names)
+        hot_only = set(names) <= set(codec.HOT_FIELDS)
+        for _ in range(MAX_SPINS):
+            region = self._mapped()
+            if region is None:
+                return None
+            seq = SEQ.unpack_from(region, 8)[0]
+            if seq & 1:
+                self.retries += 1
+                continue
+            length, crc, hot_crc, ino, mtime_ns, size, hot_len = META.unpack_from(region, 16)
+            if len(region) < HEADER_SIZE + length:
+                region = self._mapped(HEADER_SIZE + length)  # 기록자가 영역을 늘림
+                if region is None:
+                    return None
+                continue
+            try:
+                st = os.stat(self.state_path)
+            except FileNotFoundError:  # 종료 / --reset된 세션 → 매핑 해제
+                self.close()
+                return None
+            if (st.st_ino, st.st_mtime_ns, st.st_size) != (ino, mtime_ns, size):
+                if SEQ.unpack_from(region, 8)[0] != seq:
+                    self.retries += 1
+                    continue
+                self.close()  # 교체된 스냅샷 파일일 수 있음 → 다음 호출에서 다시 매핑
+                return None
+            view = memoryview(region)[HEADER_SIZE:HEADER_SIZE + length]
+            try:
+                intact = (zlib.crc32(view[:hot_len]) == hot_crc if hot_only and hot_len <= length
+                          else zlib.crc32(view) == crc)
+                found = codec.decode_fields(view, names) if intact else None
+            except ValueError:  # 기록 중 읽은 헤더
+                found = None
+            finally:
+                view.release()
+            if SEQ.unpack_from(region, 8)[0] == seq and found is not None:
+                return found
+            self.retries += 1
+        return None
+
+
+_readers: dict[Path, SnapshotReader] = {}
+
+
+def read_fields(state_path: Path, names: Iterable[str]) -> Optional[dict]:
+    """상태 파일의 스냅샷에서 필드 읽기 (비활성 / 없음 / 뒤처짐이면 None → 상태 파일을 읽을 것)"""
+    path = snapshot_for(state_path)
+    if path is None:
+        return None
+    reader = _readers.get(state_path)
+    if reader is None or reader.path != path:
+        reader = _readers[state_path] = SnapshotReader(path, state_path)
+    return reader.fields(names)
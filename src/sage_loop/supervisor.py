@@ -0,0 +1,481 @@
+"""
+Role Supervisor - 역할 시간 초과 / 정체 감지
+
+실행 중인 역할마다 마감 시각을 타이머 휠에 올려 두고, 마감이 된 역할만
+다시 확인한다. 세션 전체를 매 주기 읽지 않는다. 상태 파일은
+monitor_interval마다 stat으로 변경 여부만 보고, 바뀐 세션의 WATCH_FIELDS만 읽어 타이머를
+갱신한다.
+
+마감 시각 (역할별):
+    role_timeout_s      시작 후 최대 실행 시간 (하트비트와 무관)
+    heartbeat_timeout_s 마지막 하트비트 후 허용 시간
+                        (하트비트를 한 번도 보내지 않은 역할은 적용하지 않음)
+
+마감이 지난 역할은 on_stall 정책으로 처리한다:
+    reissue  시작 시각을 갱신하고 재실행 대상으로 내보냄 (max_reissues까지, 이후 timeout)
+    skip     "TIMEOUT: ..." 결과로 완료 처리하고 체인 계속
+    timeout  체인을 rejected로 종료
+
+기본값은 SupervisorConfig.stall_threshold / monitor_interval,
+ChainConfig.timeout_minutes (SAGE_SUPERVISOR_* / SAGE_CHAIN_* 환경 변수)에서
+읽고, 정책은 config.yaml에서 읽는다:
+
+    supervisor:
+      on_stall: reissue
+      max_reissues: 1
+      roles:
+        executor: {role_timeout_s: 5400, heartbeat_timeout_s: 900}
+        chunchugwan: {on_stall: skip}
+
+    $ sage-supervisor run            # 감독 루프
+    $ sage-supervisor run --once     # 한 번 검사 (cron)
+    $ sage-supervisor status         # 감시 중인 역할과 남은 시간
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Hashable, Optional
+
+from .api import FileStateStore
+from .cli.orchestrator import (
+    ChainState,
+    ChainStatus,
+    _complete_role_impl,
+    _transition_snapshot,
+    emit_completion_events,
+    is_terminal,
+    TERMINAL_STATUSES,
+    load_config,
+    read_state_fields,
+)
+from .events import get_event_log
+from .heartbeat import clear_beats, last_beat
+from .registry import clear_current, list_current
+
+try:
+    from .config import get_settings
+except ImportError:  # pydantic 미설치
+    get_settings = None
+
+STALL_POLICIES = ("reissue", "skip", "timeout")
+# 타이머 갱신에 필요한 상태 필드 (바이너리 형식이면 role_results를 읽지 않음, codec.py)
+WATCH_FIELDS = ("status", "pending_roles", "role_started_at")
+DEFAULT_TICK = 1.0
+DEFAULT_WHEEL_SLOTS = 512
+
+
+@dataclass(frozen=True)
+class RolePolicy:
+    heartbeat_timeout_s: float = 300.0
+    role_timeout_s: float = 3600.0
+    on_stall: str = "reissue"
+    max_reissues: int = 1
+
+
+def _settings_defaults() -> tuple[RolePolicy, float]:
+    """(기본 정책, monitor_interval) - pydantic 설정이 없으면 내장 기본값"""
+    if get_settings is None:
+        return RolePolicy(), 5.0
+    settings = get_settings()
+    policy = RolePolicy(
+        heartbeat_timeout_s=float(settings.supervisor.stall_threshold),
+        role_timeout_s=float(settings.chain.timeout_minutes * 60),
+    )
+    return policy, float(settings.supervisor.monitor_interval)
+
+
+class PolicyMap:
+    """역할 → RolePolicy (접미사를 떼며 supervisor.roles 조회)"""
+
+    def __init__(self, config: dict, base: RolePolicy):
+        cfg = config.get("supervisor", {}) or {}
+        self.default = self._merge(base, cfg)
+        self.roles = {name: self._merge(self.default, overrides or {})
+                      for name, overrides in (cfg.get("roles") or {}).items()}
+        self._cache: dict[str, RolePolicy] = {}
+
+    @staticmethod
+    def _merge(base: RolePolicy, overrides: dict) -> RolePolicy:
+        fields = {key: overrides[key] for key in ("heartbeat_timeout_s", "role_timeout_s",
+                                                  "on_stall", "max_reissues") if key in overrides}
+        policy = replace(base, **fields)
+        if policy.on_stall not in STALL_POLICIES:
+            raise ValueError(f"Unknown on_stall policy: {policy.on_stall}")
+        return policy
+
+    def for_role(self, role: str) -> RolePolicy:
+        policy = self._cache.get(role)
+        if policy is None:
+            parts = role.split("-")
+            names = ("-".join(parts[:n]) for n in range(len(parts), 0, -1))
+            policy = next((self.roles[name] for name in names if name in self.roles), self.default)
+            self._cache[role] = policy
+        return policy
+
+
+# =============================================================================
+# Timer Wheel
+# =============================================================================
+
+class TimerWheel:
+    """해시 타이머 휠
+
+    마감 시각을 tick 단위 절대 틱 번호로 바꿔 slots개 버킷에 나눠 담는다.
+    advance()는 지난 틱의 버킷만 훑으므로 타이머 수와 무관하게 틱당 비용이
+    일정하다. 한 바퀴(slots 틱)보다 먼 타이머는 같은 버킷에 남아 있다가 그
+    틱이 되었을 때 만료된다.
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK, slots: int = DEFAULT_WHEEL_SLOTS, now: float = 0.0):
+        self.tick = tick
+        self._buckets: list[dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._timers: dict[Hashable, int] = {}  # 키 → 절대 틱
+        self._cursor = int(now // tick)  # 처리 완료한 마지막 틱
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """key의 마감 시각 설정 (기존 타이머는 교체)"""
+        self.cancel(key)
+        at = max(int(-(-deadline // self.tick)), self._cursor + 1)  # 올림, 최소 다음 틱
+        self._timers[key] = at
+        self._buckets[at % len(self._buckets)][key] = at
+
+    def cancel(self, key: Hashable) -> None:
+        at = self._timers.pop(key, None)
+        if at is not None:
+            self._buckets[at % len(self._buckets)].pop(key, None)
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        at = self._timers.get(key)
+        return None if at is None else at * self.tick
+
+    def advance(self, now: float) -> list[Hashable]:
+        """now까지 만료된 키 (만료된 타이머는 제거)"""
+        target = int(now // self.tick)
+        expired: list[Hashable] = []
+        if target - self._cursor >= len(self._buckets):
+            # 한 바퀴 이상 밀렸으면 버킷을 한 번씩만 훑는다
+            ticks = range(len(self._buckets))
+        else:
+            ticks = range(self._cursor + 1, target + 1)
+        for tick in ticks:
+            bucket = self._buckets[tick % len(self._buckets)]
+            due = [key for key, at in bucket.items() if at <= target]
+            for key in due:
+                del bucket[key]
+                del self._timers[key]
+            expired.extend(due)
+        self._cursor = max(self._cursor, target)
+        return expired
+
+    def next_deadline(self) -> Optional[float]:
+        return min(self._timers.values()) * self.tick if self._timers else None
+
+
+# =============================================================================
+# Supervisor
+# =============================================================================
+
+@dataclass
+class Stall:
+    """마감이 지난 역할 1건과 처리 결과"""
+    session_id: str
+    role: str
+    reason: str
+    action: str  # reissue | skip | timeout | stale (이미 바뀜)
+
+
+class Supervisor:
+    """상태 디렉토리의 실행 중 역할 감독
+
+    Args:
+        config: config.yaml (기본: load_config())
+        state_dir: 상태 디렉토리 (기본: SAGE_STATE_DIR)
+        monitor_interval: 상태 파일 변경 확인 주기 (기본: SupervisorConfig.monitor_interval)
+        clock: 벽시계 (role_started_at / 하트비트 mtime과 같은 epoch 초)
+    """
+
+    def __init__(self, config: Optional[dict] = None, state_dir: Optional[Path] = None,
+                 monitor_interval: Optional[float] = None, tick: float = DEFAULT_TICK,
+                 clock: Callable[[], float] = time.time):
+        base, interval = _settings_defaults()
+        self.config = load_config() if config is None else config
+        self.policies = PolicyMap(self.config, base)
+        self.state_dir = Path(state_dir or os.environ.get("SAGE_STATE_DIR", "/tmp"))
+        self.store = FileStateStore(self.state_dir)
+        self.blobs = self.store.blob_store()
+        self.monitor_interval = interval if monitor_interval is None else monitor_interval
+        self.clock = clock
+        self.wheel = TimerWheel(tick, now=clock())
+        self._versions: dict[str, tuple] = {}  # 세션 → 상태 파일 (ino, mtime_ns, size)
+        self._watched: dict[str, dict[str, float]] = {}  # 세션 → {역할: 시작 시각}
+        self._last_scan = float("-inf")
+        self.stalls: list[Stall] = []
+
+    # --- 감시 대상 갱신 ---
+
+    def scan(self) -> None:
+        """상태 파일 변경 확인 → 바뀐 세션만 로드해 타이머 갱신"""
+        seen = set()
+        try:
+            entries = list(os.scandir(self.state_dir))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("sage_state_") and name.endswith(".json")):
+                continue
+            session_id = name[len("sage_state_"):-len(".json")]
+            seen.add(session_id)
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            version = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if self._versions.get(session_id) == version:
+                continue
+            self._versions[session_id] = version
+            self._sync(session_id, read_state_fields(Path(entry.path), WATCH_FIELDS))
+        for session_id in set(self._watched) - seen:
+            self._sync(session_id, None)
+            self._versions.pop(session_id, None)
+        self._last_scan = self.clock()
+
+    def sync(self, session_id: str, state: Optional[ChainState]) -> None:
+        """세션 상태에 맞춰 역할 타이머 추가/제거"""
+        self._sync(session_id, None if state is None else
+                   {name: getattr(state, name) for name in WATCH_FIELDS})
+
+    def _sync(self, session_id: str, fields: Optional[dict]) -> None:
+        """sync 본체 (fields: WATCH_FIELDS - scan은 상태 파일에서 이 필드만 읽음)"""
+        previous = self._watched.get(session_id, {})
+        if not fields or fields.get("status") in TERMINAL_STATUSES:
+            current: dict[str, float] = {}
+            if previous:
+                clear_beats(session_id, state_dir=self.state_dir)
+        else:
+            started = fields.get("role_started_at") or {}
+            current = {role: started.get(role, self.clock()) for role in fields.get("pending_roles") or ()}
+        for role in previous:
+            if role not in current:
+                self.wheel.cancel((session_id, role))
+        for role, started in current.items():
+            if previous.get(role) != started or (session_id, role) not in self.wheel:
+                self.wheel.schedule((session_id, role), self._deadline(session_id, role, started))
+        if current:
+            self._watched[session_id] = current
+        else:
+            self._watched.pop(session_id, None)
+
+    def _deadline(self, session_id: str, role: str, started: float) -> float:
+        policy = self.policies.for_role(role)
+        deadline = started + policy.role_timeout_s
+        beat = last_beat(session_id, role, self.state_dir)
+        if beat is not None and beat >= started:
+            deadline = min(deadline, beat + policy.heartbeat_timeout_s)
+        return deadline
+
+    def _reason(self, session_id: str, role: str, started: float, now: float) -> str:
+        policy = self.policies.for_role(role)
+        beat = last_beat(session_id, role, self.state_dir)
+        if beat is not None and beat >= started and now - beat >= policy.heartbeat_timeout_s:
+            return f"no heartbeat for {now - beat:.0f}s"
+        return f"running for {now - started:.0f}s (limit {policy.role_timeout_s:.0f}s)"
+
+    # --- 검사 ---
+
+    def check(self, now: Optional[float] = None) -> list[Stall]:
+        """만료된 타이머 확인 (하트비트가 갱신됐으면 다시 예약)"""
+        now = self.clock() if now is None else now
+        stalls = []
+        for session_id, role in self.wheel.advance(now):
+            started = self._watched.get(session_id, {}).get(role)
+            if started is None:
+                continue
+            deadline = self._deadline(session_id, role, started)
+            if deadline > now:
+                self.wheel.schedule((session_id, role), deadline)
+                continue
+            stalls.append(self._handle(session_id, role, started, self._reason(session_id, role, started, now), now))
+        self.stalls.extend(stalls)
+        return stalls
+
+    def sweep(self, now: Optional[float] = None) -> list[Stall]:
+        """타이머와 무관하게 감시 중인 역할 전체 확인 (단발 실행용, 틱 반올림 없음)"""
+        now = self.clock() if now is None else now
+        stalls = []
+        for session_id, roles in list(self._watched.items()):
+            for role, started in list(roles.items()):
+                if self._deadline(session_id, role, started) <= now:
+                    self.wheel.cancel((session_id, role))
+                    stalls.append(self._handle(session_id, role, started,
+                                               self._reason(session_id, role, started, now), now))
+        self.stalls.extend(stalls)
+        return stalls
+
+    def run_once(self, now: Optional[float] = None) -> list[Stall]:
+        now = self.clock() if now is None else now
+        if now - self._last_scan >= self.monitor_interval:
+            self.scan()
+        return self.check(now)
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """감독 루프 (다음 검사 시점까지 대기)"""
+        while not should_stop():
+            self.run_once()
+            now = self.clock()
+            wake = self._last_scan + self.monitor_interval
+            next_deadline = self.wheel.next_deadline()
+            if next_deadline is not None:
+                wake = min(wake, next_deadline)
+            time.sleep(max(self.wheel.tick / 10, min(wake - now, self.monitor_interval)))
+
+    # --- 정책 적용 ---
+
+    def _handle(self, session_id: str, role: str, started: float, reason: str, now: float) -> Stall:
+        policy = self.policies.for_role(role)
+        outcome = {"action": "stale"}
+
+        def apply(state: ChainState) -> ChainState:
+            # 락을 잡은 뒤 다시 확인: 그 사이 완료/재시작됐으면 건드리지 않음
+            if is_terminal(state) or role not in state.pending_roles \
+                    or state.role_started_at.get(role) != started:
+                return state
+            attempts = state.role_attempts.get(role, 0)
+            action = policy.on_stall
+            if action == "reissue" and attempts >= policy.max_reissues:
+                action = "timeout"
+            outcome["action"] = action
+            outcome["before"] = _transition_snapshot(state)
+            if action == "reissue":
+                state.role_attempts[role] = attempts + 1
+                state.role_started_at[role] = now
+                state.released_roles = [role]
+            elif action == "skip":
+                state = _complete_role_impl(state, [role], {role: f"TIMEOUT: {reason}"}, self.config, now=now,
+                                            blob_store=self.blobs)
+            else:
+                state.status = ChainStatus.REJECTED.value
+                state.exit_reason = f"역할 시간 초과: {role} ({reason})"
+                state.role_started_at = {}
+            return state
+
+        try:
+            with self.store.lock(session_id):
+                state = self.store.load(session_id)
+                if state is None:
+                    raise ValueError(f"No active session: {session_id}")
+                state = apply(state)
+                if outcome["action"] != "stale":
+                    self.store.save(state)
+        except (ValueError, RuntimeError) as e:
+            get_event_log().emit("error", session_id, kind="supervisor", role=role, message=str(e))
+            # 락 실패 등: 다음 주기에 다시 확인
+            self.wheel.schedule((session_id, role), now + self.monitor_interval)
+            return Stall(session_id, role, reason, "stale")
+
+        action = outcome["action"]
+        log = get_event_log()
+        if action == "reissue":
+            clear_beats(session_id, [role], self.state_dir)
+            log.emit("role_reissue", session_id, role=role, reason=reason,
+                     attempt=state.role_attempts.get(role, 0) + 1)
+        elif action == "skip":
+            log.emit("role_timeout", session_id, role=role, reason=reason, action=action)
+            emit_completion_events(outcome["before"], state, [role], {role: f"TIMEOUT: {reason}"})
+        elif action == "timeout":
+            log.emit("role_timeout", session_id, role=role, reason=reason, action=action)
+            log.emit("chain_end", session_id, status=state.status, reason=state.exit_reason,
+                     phases_completed=len(state.completed_phases))
+        if action != "stale":
+            self._after_update(session_id, state)
+        return Stall(session_id, role, reason, action)
+
+    def _after_update(self, session_id: str, state: ChainState) -> None:
+        if is_terminal(state):
+            # 이 세션을 가리키는 네임스페이스 포인터 정리
+            for namespace, current in list_current(self.state_dir).items():
+                if current == session_id:
+                    clear_current(session_id, namespace, self.state_dir)
+        self._versions.pop(session_id, None)
+        self.sync(session_id, state)
+
+    # --- 지표 ---
+
+    def watched(self, now: Optional[float] = None) -> list[dict]:
+        """감시 중인 역할 (마감 임박 순)"""
+        now = self.clock() if now is None else now
+        rows = []
+        for session_id, roles in self._watched.items():
+            for role, started in roles.items():
+                deadline = self.wheel.deadline((session_id, role))
+                beat = last_beat(session_id, role, self.state_dir)
+                rows.append({
+                    "session": session_id,
+                    "role": role,
+                    "running_s": round(now - started, 1),
+                    "heartbeat_age_s": None if beat is None else round(now - beat, 1),
+                    "deadline_in_s": None if deadline is None else round(deadline - now, 1),
+                    "on_stall": self.policies.for_role(role).on_stall,
+                })
+        return sorted(rows, key=lambda r: (r["deadline_in_s"] is None, r["deadline_in_s"]))
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sage role supervisor (timeouts / heartbeats)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="감독 루프 실행")
+    run.add_argument("--once", action="store_true", help="한 번만 검사하고 종료")
+    run.add_argument("--interval", type=float, help="상태 파일 변경 확인 주기 (초)")
+
+    status = sub.add_parser("status", help="감시 중인 역할 출력")
+    status.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    args = parser.parse_args()
+    get_event_log("supervisor")
+
+    if args.command == "status":
+        supervisor = Supervisor()
+        supervisor.scan()
+        rows = supervisor.watched()
+        if args.json:
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+            return
+        for row in rows:
+            beat = "-" if row["heartbeat_age_s"] is None else f"{row['heartbeat_age_s']}s"
+            print(f"{row['session']}\t{row['role']}\trunning={row['running_s']}s\theartbeat={beat}\t"
+                  f"deadline_in={row['deadline_in_s']}s\ton_stall={row['on_stall']}")
+        return
+
+    supervisor = Supervisor(monitor_interval=args.interval)
+    if args.once:
+        supervisor.scan()
+        stalls = supervisor.sweep()
+        for stall in stalls:
+            print(f"{stall.action.upper()}: {stall.session_id} {stall.role} ({stall.reason})")
+        sys.exit(0)
+    try:
+        supervisor.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
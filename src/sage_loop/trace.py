@@ -0,0 +1,95 @@
+"""
+Session Trace Recorder - 재현용 오케스트레이터 호출 기록
+
+SAGE_RECORD=1 설정 시 start_chain / --complete 호출마다 입력(작업, 역할, 결과
+원문), 소요 시간, 전이 후 상태를 JSONL로 남긴다. sage-replay가 이 기록을
+상태 머신에 다시 흘려 코드 버전 간 상태/지연을 비교한다.
+
+환경 변수:
+    SAGE_RECORD: 1 | true | on 이면 기록 (기본: 비활성)
+    SAGE_STATE_DIR: 기록 디렉토리 (기본: /tmp)
+
+기록 파일:
+    {STATE_DIR}/sage_trace_{session}.jsonl
+
+레코드:
+    {"op": "start", "ts", "mono", "sid", "task", "chain", "forced",
+     "config_digest", "elapsed_ms", "state"}
+    {"op": "complete", "ts", "mono", "sid", "roles", "results",
+     "elapsed_ms", "lock_attempts", "state" | "error"}
+
+이벤트 로그(events.py)와 달리 결과 원문을 포함하므로 기본 비활성이며,
+재생 정확도를 위해 버퍼링 없이 호출마다 즉시 append한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .events import monotonic
+
+RECORD_ENV = "SAGE_RECORD"
+FILE_PREFIX = "sage_trace_"
+
+# 재생 간 비교에서 제외할 필드 (세션/시각 의존, 입력으로부터 자명한 값)
+VOLATILE_FIELDS = ("session_id", "started_at", "role_started_at", "role_results", "memo_stats",
+                   "role_inputs")
+
+
+def recording_enabled() -> bool:
+    return os.environ.get(RECORD_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def trace_path(session_id: str, directory: Optional[Path] = None) -> Path:
+    directory = directory or Path(os.environ.get("SAGE_STATE_DIR", "/tmp"))
+    return directory / f"{FILE_PREFIX}{session_id}.jsonl"
+
+
+def config_digest(config: dict) -> str:
+    """설정 내용 해시 (재생 시 설정 변경 감지용)"""
+    data = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_state(state: dict) -> dict:
+    """비교용 상태 (VOLATILE_FIELDS 제외)"""
+    return {k: v for k, v in state.items() if k not in VOLATILE_FIELDS}
+
+
+def record_call(session_id: str, op: str, **fields) -> None:
+    """호출 1건 기록 (실패해도 오케스트레이터 동작에 영향 없음)"""
+    import time
+
+    record = {"op": op, "ts": round(time.time(), 6), "mono": round(monotonic(), 6), "sid": session_id}
+    record.update(fields)
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+    try:
+        fd = os.open(trace_path(session_id), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except OSError:
+        return
+    try:
+        os.write(fd, line.encode("utf-8"))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def load_trace(path: Path) -> list[dict]:
+    """기록 파일 로드 (시간순)"""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    records.sort(key=lambda r: r.get("mono", 0))
+    return records
@@ -0,0 +1,259 @@
+"""
+State Watch - 상태 파일 변경 대기 (inotify / FIFO)
+
+래퍼와 대시보드는 phase 변화를 보려고 sage-orchestrator --status를 반복 실행한다.
+매번 인터프리터를 띄우고 상태 파일을 파싱하는 대신, 상태 파일이 바뀔 때까지
+커널 이벤트에서 잠들었다가 version이 달라졌을 때만 깨어난다
+(sage-orchestrator --wait-for-change / --watch, api.Orchestrator.wait_for_change).
+
+version: 상태 파일 (st_ino, st_mtime_ns, st_size), 파일이 없으면 None.
+         temp → rename 저장이므로 기록마다 바뀐다 (SAGE_DURABILITY=none이면 mtime / 크기).
+
+SAGE_WATCH (기본: auto):
+    inotify  상태 디렉토리의 IN_CLOSE_WRITE / IN_MOVED_TO / IN_DELETE (Linux, ctypes)
+             - 어느 프로세스가 기록하든 깨어난다
+    fifo     {STATE_DIR}/sage_watch_{session}.d/{pid}.fifo 를 만들고 기다린다.
+             write_state_file / clear_state가 기록 후 그 디렉토리의 FIFO마다
+             1바이트를 쓴다 (notify()). 대기자가 없으면 디렉토리가 없어 stat 한 번으로 끝남.
+             inotify가 없는 플랫폼, 이벤트를 전달하지 않는 네트워크 / FUSE 파일시스템용
+    poll     POLL_INTERVAL마다 stat
+    auto     inotify → fifo → poll 중 처음 되는 것
+
+FIFO로는 notify()를 모르는 기록자(수동 편집, 이전 버전)를 알 수 없으므로 fifo 방식도
+FALLBACK_INTERVAL마다 version을 확인한다. 대기자는 자기 FIFO의 쓰기 끝도 열어 두어
+(기록자가 모두 닫아도 EOF로 계속 깨어나지 않도록) 죽은 대기자의 FIFO만 ENXIO가 되고,
+notify()가 그것을 지운다.
+
+깨어나는 이벤트는 신호일 뿐이고 판정은 항상 version 비교로 한다. watch를 건 뒤에
+version을 확인하므로 그 사이의 기록도 놓치지 않는다.
+
+Hook에서도 import될 수 있으므로 표준 라이브러리만 사용한다.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import select
+import time
+from pathlib import Path
+from typing import Optional
+
+MODES = ("auto", "inotify", "fifo", "poll")
+DEFAULT_MODE = "auto"
+
+# poll 방식 간격 / fifo 방식이 notify() 없는 기록을 확인하는 간격 (초)
+POLL_INTERVAL = 0.05
+FALLBACK_INTERVAL = 1.0
+
+WATCH_PREFIX = "sage_watch_"
+WATCH_SUFFIX = ".d"
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+
+def watch_mode() -> str:
+    mode = os.environ.get("SAGE_WATCH", DEFAULT_MODE).strip().lower()
+    return mode if mode in MODES else DEFAULT_MODE
+
+
+def state_version(path: Path) -> Optional[tuple[int, int, int]]:
+    """상태 파일 → 비교용 version (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def watch_dir(state_path: Path) -> Path:
+    """상태 파일 → FIFO 대기자 디렉토리"""
+    name = state_path.name
+    if name.startswith("sage_state_"):
+        name = name[len("sage_state_"):]
+    if name.endswith(".json"):
+        name = name[:-len(".json")]
+    return state_path.parent / f"{WATCH_PREFIX}{name}{WATCH_SUFFIX}"
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+def notify(state_path: Path) -> int:
+    """상태 파일을 기록 / 삭제한 뒤 호출 - FIFO 대기자 깨우기 → 깨운 수"""
+    try:
+        entries = list(os.scandir(watch_dir(state_path)))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    woken = 0
+    for entry in entries:
+        if not entry.name.endswith(".fifo"):
+            continue
+        try:
+            fd = os.open(entry.path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if e.errno == errno.ENXIO:  # 읽는 쪽이 없음 → 죽은 대기자
+                _unlink(entry.path)
+            continue
+        try:
+            os.write(fd, b"\0")
+            woken += 1
+        except BlockingIOError:  # 이미 깨울 바이트가 가득함
+            woken += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return woken
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+# =============================================================================
+# Waiter
+# =============================================================================
+
+_inotify = None
+
+
+def _libc_inotify():
+    """(inotify_init1, inotify_add_watch) (Linux가 아니면 None)"""
+    global _inotify
+    if _inotify is None:
+        try:
+            import ctypes
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            _inotify = (libc.inotify_init1, libc.inotify_add_watch)
+        except (OSError, AttributeError, ImportError):
+            _inotify = False
+    return _inotify or None
+
+
+class Watcher:
+    """상태 파일 하나의 변경 대기 (with 블록 또는 close())
+
+    fileno()는 이벤트가 오면 읽기 가능해지는 fd (poll 방식이면 None) - asyncio의
+    add_reader 등에 등록하고, 깨어나면 drain() 후 version을 다시 비교한다.
+    """
+
+    def __init__(self, state_path: Path, mode: Optional[str] = None):
+        self.path = state_path
+        self.mode = "poll"
+        self.wakeups = 0  # 이벤트로 깨어난 횟수 (벤치마크용)
+        self._fd: Optional[int] = None
+        self._keepalive: Optional[int] = None
+        self._fifo: Optional[Path] = None
+        mode = mode or watch_mode()
+        if mode in ("auto", "inotify") and self._open_inotify():
+            self.mode = "inotify"
+        elif mode in ("auto", "fifo") and self._open_fifo():
+            self.mode = "fifo"
+
+    def _open_inotify(self) -> bool:
+        calls = _libc_inotify()
+        if calls is None:
+            return False
+        init1, add_watch = calls
+        fd = init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        directory = os.fsencode(self.path.parent)
+        if add_watch(fd, directory, IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE) < 0:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def _open_fifo(self) -> bool:
+        directory = watch_dir(self.path)
+        fifo = directory / f"{os.getpid()}.{id(self):x}.fifo"
+        for _ in range(3):  # 마지막 대기자의 rmdir과 겹치면 다시 만든다
+            try:
+                directory.mkdir(exist_ok=True)
+                os.mkfifo(fifo, 0o600)
+                break
+            except FileNotFoundError:
+                continue
+            except (OSError, AttributeError):  # mkfifo 없는 플랫폼, 읽기 전용 디렉토리
+                return False
+        else:
+            return False
+        try:
+            self._fd = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+            self._keepalive = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:
+            self._fifo = fifo
+            self.close()
+            return False
+        self._fifo = fifo
+        return True
+
+    def fileno(self) -> Optional[int]:
+        return self._fd
+
+    def drain(self) -> None:
+        """쌓인 이벤트 비우기"""
+        if self._fd is None:
+            return
+        self.wakeups += 1
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait(self, version: object, timeout: Optional[float] = None) -> bool:
+        """상태 파일 version이 달라질 때까지 대기 → 변경 여부 (timeout 초 지나면 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while state_version(self.path) == version:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            if self._fd is None:
+                time.sleep(POLL_INTERVAL if remaining is None else min(POLL_INTERVAL, remaining))
+                continue
+            step = FALLBACK_INTERVAL if self.mode == "fifo" else None
+            if remaining is not None:
+                step = remaining if step is None else min(step, remaining)
+            ready, _, _ = select.select([self._fd], [], [], step)
+            if ready:
+                self.drain()
+        return True
+
+    def close(self) -> None:
+        for fd in (self._fd, self._keepalive):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._keepalive = None
+        if self._fifo is not None:
+            _unlink(str(self._fifo))
+            try:
+                self._fifo.parent.rmdir()  # 다른 대기자가 있으면 남음
+            except OSError:
+                pass
+            self._fifo = None
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def wait_for_change(state_path: Path, version: object, timeout: Optional[float] = None,
+                    mode: Optional[str] = None) -> bool:
+    """state_path의 version이 달라질 때까지 대기 → 변경 여부"""
+    with Watcher(state_path, mode) as watcher:
+        return watcher.wait(version, timeout)
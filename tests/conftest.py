@@ -0,0 +1,25 @@
+"""
+공통 fixture - 테스트마다 상태 디렉토리를 격리한다.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch) -> Iterator[Path]:
+    monkeypatch.setenv("SAGE_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("SAGE_EVENTS", "off")
+    monkeypatch.delenv("SAGE_SESSION_ID", raising=False)
+    from sage_loop.config import reset_hook_config
+
+    reset_hook_config()
+    yield tmp_path
+    reset_hook_config()
@@ -0,0 +1,40 @@
+"""
+sage_loop.api - 저장소 구성
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from sage_loop.blobs import MemoryBlobStore
+from sage_loop.api import FileStateStore, MemoryStateStore, Orchestrator, StateStore
+
+
+def test_state_store_is_abstract():
+    with pytest.raises(TypeError):
+        StateStore()
+
+
+def test_file_store_keeps_blobs_in_its_directory(tmp_path, state_dir):
+    custom = tmp_path / "custom"
+    orch = Orchestrator(store=FileStateStore(custom))
+    state = orch.start("작업", chain="QUICK")
+    role = state.pending_roles[0]
+    orch.complete(state.session_id, role, result="결과 원문")
+
+    assert orch.result(state.session_id, role) == "결과 원문"
+    assert list((custom / "sage_blobs").glob("*/*"))
+    assert not (state_dir / "sage_blobs").exists()
+
+
+def test_orchestrators_with_different_directories_do_not_share_blobs(tmp_path):
+    a = Orchestrator(store=FileStateStore(tmp_path / "a"))
+    b = Orchestrator(store=FileStateStore(tmp_path / "b"))
+    assert a.blobs.root != b.blobs.root
+
+
+def test_memory_store_defaults_to_memory_blobs():
+    orch = Orchestrator(store=MemoryStateStore())
+    state = orch.start("작업", chain="QUICK")
+    assert isinstance(orch.blobs, MemoryBlobStore)
+    assert orch.status(state.session_id) is not None
@@ -0,0 +1,87 @@
+"""
+sage_loop.breaker - 링 파일 회로의 트립 / half-open / 복구
+"""
+
+from __future__ import annotations
+
+from sage_loop import breaker
+from sage_loop.breaker import BreakerSettings
+
+SETTINGS = BreakerSettings(window_s=60, buckets=12, error_rate=0.5, min_calls=3,
+                           cooldown_s=60, max_cooldown_s=900)
+T0 = 1_000_000.0
+
+
+def _errors(count: int, now: float, role: str = "executor") -> dict:
+    state = {}
+    for _ in range(count):
+        state = breaker.record_error("s", "boom", role, now=now, settings=SETTINGS)
+    return state
+
+
+def _circuit(now: float, role: str = "executor") -> dict:
+    return breaker.status("s", now=now, settings=SETTINGS)["roles"][role]
+
+
+def test_trips_after_min_calls_at_error_rate():
+    assert not _errors(2, T0)["tripped"]
+    assert _errors(1, T0)["tripped"]
+    assert breaker.is_open("s", now=T0 + 1, settings=SETTINGS)
+    assert breaker.is_open("s", "executor", now=T0 + 1, settings=SETTINGS)
+    assert not breaker.allow("s", "executor", now=T0 + 1, settings=SETTINGS)
+
+
+def test_error_after_cooldown_trips_again_without_allow():
+    """hook 경로: allow() 없이 record_error / is_open만 호출"""
+    _errors(3, T0)
+    assert not breaker.is_open("s", now=T0 + 61, settings=SETTINGS)
+
+    state = _errors(1, T0 + 61)
+    assert state["tripped"]
+    assert breaker.is_open("s", now=T0 + 62, settings=SETTINGS)
+    circuit = _circuit(T0 + 62)
+    assert circuit["state"] == "open"
+    assert circuit["trips"] == 2
+    assert circuit["open_for_s"] == 119.0  # cooldown 두 배
+
+
+def test_half_open_probe_success_closes():
+    _errors(3, T0)
+    assert breaker.allow("s", "executor", now=T0 + 61, settings=SETTINGS)
+    assert not breaker.allow("s", "executor", now=T0 + 62, settings=SETTINGS)  # 탐침은 1건만
+    breaker.record_success("s", ["executor"], now=T0 + 63, settings=SETTINGS)
+    assert _circuit(T0 + 63)["state"] == "closed"
+    assert breaker.allow("s", "executor", now=T0 + 63, settings=SETTINGS)
+
+
+def test_half_open_probe_failure_doubles_cooldown():
+    _errors(3, T0)
+    assert breaker.allow("s", "executor", now=T0 + 61, settings=SETTINGS)
+    _errors(1, T0 + 62)
+    circuit = _circuit(T0 + 62)
+    assert circuit["state"] == "open"
+    assert circuit["open_for_s"] == 120.0
+
+
+def test_retries_do_not_count_as_errors():
+    for _ in range(5):
+        breaker.record_retry("s", "executor", "flaky", now=T0, settings=SETTINGS)
+    status = breaker.status("s", now=T0, settings=SETTINGS)
+    assert not status["tripped"]
+    assert status["role_retries"] == {"executor": 5}
+    assert status["roles"]["executor"]["errors"] == 0
+
+
+def test_roles_are_independent_and_table_grows():
+    for i in range(100):
+        breaker.record_retry("s", f"role-{i}", now=T0, settings=SETTINGS)
+    _errors(3, T0, role="role-42")
+    assert breaker.is_open("s", "role-42", now=T0 + 1, settings=SETTINGS)
+    assert not breaker.is_open("s", "role-7", now=T0 + 1, settings=SETTINGS)
+    assert len(breaker.status("s", now=T0 + 1, settings=SETTINGS)["roles"]) == 100
+
+
+def test_success_without_ring_file_writes_nothing(state_dir):
+    state = breaker.record_success("s", ["executor"], now=T0, settings=SETTINGS)
+    assert not state["tripped"]
+    assert not breaker.ring_path("s", state_dir).exists()
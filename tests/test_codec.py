@@ -0,0 +1,92 @@
+"""
+sage_loop.codec - 상태 파일 형식 round-trip과 필드 단위 읽기
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from sage_loop import codec
+from sage_loop.blobs import MemoryBlobStore
+from sage_loop.cli.orchestrator import (
+    _complete_role_impl,
+    load_config,
+    new_chain_state,
+    read_state_fields,
+    read_state_file,
+    write_state_file,
+)
+
+
+@pytest.fixture
+def state():
+    config = load_config()
+    blobs = MemoryBlobStore()
+    state = new_chain_state("codec", "기능 구현", "QUICK", config, now=1000.0, blob_store=blobs)
+    roles = list(state.pending_roles)
+    return _complete_role_impl(state, roles, {role: "결과 " * 500 for role in roles}, config,
+                               now=1001.0, blob_store=blobs)
+
+
+@pytest.mark.parametrize("fmt", codec.FORMATS)
+def test_round_trip(state, fmt):
+    raw = codec.encode(state.to_dict(), fmt)
+    assert codec.detect(raw) == fmt
+    assert codec.decode(raw) == state.to_dict()
+
+
+@pytest.mark.parametrize("fmt", codec.FORMATS)
+def test_state_file_round_trip(state, state_dir, monkeypatch, fmt):
+    monkeypatch.setenv("SAGE_STATE_FORMAT", fmt)
+    path = state_dir / "sage_state_codec.json"
+    write_state_file(path, state)
+
+    assert codec.detect(path.read_bytes()) == fmt
+    assert read_state_file(path).to_dict() == state.to_dict()
+
+
+@pytest.mark.parametrize("fmt", codec.FORMATS)
+def test_read_fields(state, state_dir, fmt):
+    path = state_dir / "sage_state_codec.json"
+    path.write_bytes(codec.encode(state.to_dict(), fmt))
+    names = ("status", "current_phase", "pending_roles", "missing")
+
+    found = codec.read_fields(path, names)
+    assert found == {name: state.to_dict()[name] for name in names[:3]}
+    assert read_state_fields(path, names) == found
+
+
+def test_binary_puts_hot_fields_first_and_results_last(state):
+    raw = codec.encode(state.to_dict(), "binary")
+    table, body_start = codec._parse_header(raw)
+    hot_end = codec.prefix_length(raw, codec.HOT_FIELDS)
+
+    assert hot_end <= codec.PEEK_BYTES
+    assert max(offset for offset, _ in table.values()) == table["role_results"][0]
+    assert codec.decode_fields(raw[:hot_end], ["status"]) == {"status": state.status}
+
+
+def test_long_header_is_reread(state_dir):
+    data = {f"field_{i:03d}_{'x' * 40}": i for i in range(120)}  # 헤더 > PEEK_BYTES
+    path = state_dir / "sage_state_wide.json"
+    path.write_bytes(codec.encode(data, "binary"))
+
+    name = next(reversed(data))
+    assert codec.read_fields(path, [name]) == {name: data[name]}
+
+
+@pytest.mark.parametrize("raw", [
+    codec.HEADER.pack(codec.MAGIC, codec.SCHEMA_VERSION + 1, 0, codec.HEADER.size),
+    codec.MAGIC + b"\x01",
+    b"{\n  \"status\": ",
+])
+def test_corrupt_or_newer_files_raise_value_error(raw):
+    with pytest.raises(ValueError):
+        codec.decode(raw)
+
+
+def test_corrupt_state_file_reads_as_missing(state_dir):
+    path = state_dir / "sage_state_bad.json"
+    path.write_bytes(codec.MAGIC + b"\x01")
+    assert read_state_file(path) is None
+    assert read_state_fields(path, ("status",)) is None
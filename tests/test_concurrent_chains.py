@@ -0,0 +1,33 @@
+"""
+동시 체인 회귀 테스트 - benchmarks/concurrent_chains.py 하네스 사용
+
+여러 체인을 CLI로 동시에 구동해 세션 포인터가 서로 덮어쓰이지 않는지 확인한다.
+요청 규모(50개)는 slow 표시 - 빠른 확인은 pytest -m "not slow".
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from concurrent_chains import run_chains  # noqa: E402
+
+ISOLATIONS = ("namespace", "cwd")
+
+
+@pytest.mark.parametrize("chains, isolation", [
+    *((8, isolation) for isolation in ISOLATIONS),
+    *(pytest.param(50, isolation, marks=pytest.mark.slow) for isolation in ISOLATIONS),
+])
+def test_concurrent_chains_are_isolated(chains, isolation):
+    summary, reports = run_chains(chains, "QUICK", isolation)
+
+    assert summary["clobbered"] == 0, reports
+    assert summary["approved"] == chains, reports
+    assert summary["errors"] == 0
+    assert summary["distinct_sessions"] == chains
+    assert summary["leftover_pointers"] == 0
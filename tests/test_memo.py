@@ -0,0 +1,91 @@
+"""
+sage_loop.memo - 결과 캐시 키 / 기본값 / 상한
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from sage_loop.api import MemoryStateStore, Orchestrator
+from sage_loop.blobs import make_ref
+from sage_loop.cli.orchestrator import load_config
+from sage_loop.memo import MemoryResultCache, memo_enabled, task_digest
+
+TASK = task_digest("기능 구현")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    skills = tmp_path / "skills"
+    (skills / "sagawon").mkdir(parents=True)
+    (skills / "sagawon" / "SKILL.md").write_text("v1")
+    return MemoryResultCache(skills_dir=skills)
+
+
+def test_key_covers_role_task_and_upstream(cache):
+    key = cache.key("sagawon", TASK, {"sage": "a", "dohwaseo": "b"})
+
+    assert key == cache.key("sagawon", TASK, {"dohwaseo": "b", "sage": "a"})  # 순서 무관
+    assert key != cache.key("saheonbu", TASK, {"sage": "a", "dohwaseo": "b"})
+    assert key != cache.key("sagawon", task_digest("다른 작업"), {"sage": "a", "dohwaseo": "b"})
+    assert key != cache.key("sagawon", TASK, {"sage": "a", "dohwaseo": "c"})
+    assert key != cache.key("sagawon", TASK, {"sage": "a"})
+
+
+def test_key_covers_skill_version(cache, tmp_path):
+    before = cache.key("sagawon", TASK, {})
+    (tmp_path / "skills" / "sagawon" / "SKILL.md").write_text("v2")
+
+    assert MemoryResultCache(skills_dir=tmp_path / "skills").key("sagawon", TASK, {}) != before
+
+
+def test_side_effecting_roles_are_not_cacheable(cache):
+    assert not cache.cacheable("executor")
+    assert not cache.cacheable("executor-ijo")
+    assert cache.cacheable("sagawon")
+
+
+def test_ttl_and_lru_bounds():
+    now = [0.0]
+    cache = MemoryResultCache(ttl_s=10, max_entries=2, clock=lambda: now[0])
+    refs = {name: make_ref(name * 64, 1, False) for name in "abc"}
+    cache.put_many({"ka": ("r", refs["a"]), "kb": ("r", refs["b"])})
+    assert cache.get_many({"r": "ka"}) == {"r": refs["a"]}  # ka가 가장 최근
+
+    cache.put_many({"kc": ("r", refs["c"])})  # 가장 오래된 kb 제거
+    assert cache.get_many({"r": "kb"}) == {}
+    assert cache.stats()["evictions"] == 1
+
+    now[0] = 11.0
+    assert cache.get_many({"r": "ka"}) == {}
+    assert cache.stats()["expired"] == 1
+
+
+def test_off_by_default_and_env_override(monkeypatch):
+    monkeypatch.delenv("SAGE_MEMO", raising=False)
+    config = load_config()
+    assert not memo_enabled(config)
+    assert not memo_enabled({})
+
+    monkeypatch.setenv("SAGE_MEMO", "on")
+    assert memo_enabled(config)
+    monkeypatch.setenv("SAGE_MEMO", "off")
+    assert not memo_enabled({"memo": {"enabled": True}})
+
+
+def test_repeated_task_is_served_from_cache(monkeypatch):
+    monkeypatch.setenv("SAGE_MEMO", "on")
+    orch = Orchestrator(load_config(), store=MemoryStateStore())
+    first = orch.start("기능 구현", chain="QUICK")
+    role = first.pending_roles[0]
+    state = first
+    while state.pending_roles and all(orch.memo.cacheable(r) for r in state.pending_roles):
+        state = orch.complete(first.session_id, list(state.pending_roles), result="검토 완료")
+
+    second = orch.start("기능 구현", chain="QUICK")
+    assert second.memo_stats["hits"] >= 1
+    assert second.current_phase == state.current_phase
+    assert orch.result(second.session_id, role) == "검토 완료"
+
+    other = orch.start("다른 작업", chain="QUICK")
+    assert other.memo_stats["hits"] == 0
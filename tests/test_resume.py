@@ -0,0 +1,51 @@
+"""
+--resume / Orchestrator.resume - 재배출 역할의 시도 수
+"""
+
+from __future__ import annotations
+
+import time
+
+from sage_loop.api import FileStateStore, Orchestrator
+from sage_loop.cli.orchestrator import _resume_impl, load_config, new_chain_state
+from sage_loop.supervisor import Supervisor
+
+
+def _config() -> dict:
+    config = load_config()
+    config["supervisor"] = {"on_stall": "reissue", "max_reissues": 1,
+                            "role_timeout_s": 10}
+    return config
+
+
+def test_resume_clears_attempts_of_redispatched_roles():
+    state = new_chain_state("r", "기능 구현", "QUICK", load_config(), now=1000.0)
+    role = state.pending_roles[0]
+    state.role_attempts = {role: 1}
+    state.role_retries = {role: 2}
+
+    state = _resume_impl(state, now=2000.0)
+    assert state.released_roles == [role]
+    assert role not in state.role_attempts
+    assert role not in state.role_retries
+
+
+def test_reissued_role_is_reissued_again_after_resume(state_dir):
+    config = _config()
+    orch = Orchestrator(config, store=FileStateStore(state_dir))
+    state = orch.start("기능 구현", chain="QUICK")
+    role = state.pending_roles[0]
+    clock = [time.time()]
+    supervisor = Supervisor(config, state_dir, monitor_interval=0, clock=lambda: clock[0])
+
+    def stall_actions() -> list[str]:
+        supervisor.scan()
+        clock[0] += 20
+        return [stall.action for stall in supervisor.check()]
+
+    assert stall_actions() == ["reissue"]
+    assert orch.status(state.session_id).role_attempts == {role: 1}
+
+    orch.resume(state.session_id)  # 크래시 후 재개
+    assert stall_actions() == ["reissue"]
+    assert orch.status(state.session_id).status == "running"
@@ -0,0 +1,86 @@
+"""
+sage_loop.session.cleanup_old_sessions - 오래된 세션 파일 정리
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from sage_loop.blobs import BLOB_DIR_NAME, BlobStore
+from sage_loop.memo import MEMO_FILE_NAME
+from sage_loop.session import cleanup_old_sessions
+
+OLD = time.time() - 48 * 3600
+
+
+def _make(directory: Path, name: str, old: bool = True) -> Path:
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+    if old:
+        os.utime(path, (OLD, OLD))
+    return path
+
+
+def test_sweeps_killed_chain_leftovers(state_dir):
+    names = [
+        "sage_state_s1.json", "sage_state_s1.lock", "sage_state_s1.sync",
+        "sage_checkpoint_s1.json", "sage_checkpoint_s1.sync",
+        "sage_circuit_breaker_s1.json", "sage_circuit_breaker_s1.ring", "sage_circuit_breaker_s1.lock",
+        "sage_session_s1.hot",
+    ]
+    paths = [_make(state_dir, name) for name in names]
+
+    assert cleanup_old_sessions(24) == len(names)
+    assert not any(path.exists() for path in paths)
+
+
+def test_keeps_recent_files(state_dir):
+    recent = [_make(state_dir, name, old=False)
+              for name in ("sage_state_s2.json", "sage_state_s2.lock", "sage_checkpoint_s2.json")]
+
+    assert cleanup_old_sessions(24) == 0
+    assert all(path.exists() for path in recent)
+
+
+def _old_blob(store: BlobStore, text: str) -> dict:
+    ref = store.put(text)
+    os.utime(store.path_for(ref), (OLD, OLD))
+    return ref
+
+
+def test_blobs_still_referenced_survive(state_dir):
+    store = BlobStore(state_dir / BLOB_DIR_NAME)
+    in_state, in_checkpoint, in_memo, orphan = (
+        _old_blob(store, text) for text in ("state", "checkpoint", "memo", "orphan"))
+    (state_dir / "sage_state_s3.json").write_text(json.dumps({"role_results": {"sage": in_state}}))
+    (state_dir / "sage_checkpoint_s4.json").write_text(json.dumps({"role_results": {"sage": in_checkpoint}}))
+    (state_dir / MEMO_FILE_NAME).write_text(json.dumps(
+        {"entries": {"k": ["sage", in_memo["hash"], in_memo["size"], False, time.time()]}}))
+
+    assert cleanup_old_sessions(24) == 1
+    assert not store.exists(orphan)
+    assert all(store.exists(ref) for ref in (in_state, in_checkpoint, in_memo))
+    assert store.get(in_state) == "state"
+
+
+def test_blobs_of_swept_states_are_removed(state_dir):
+    store = BlobStore(state_dir / BLOB_DIR_NAME)
+    ref = _old_blob(store, "stale")
+    _make(state_dir, "sage_state_s5.json").write_text(json.dumps({"role_results": {"sage": ref}}))
+    os.utime(state_dir / "sage_state_s5.json", (OLD, OLD))
+
+    assert cleanup_old_sessions(24) == 2
+    assert not store.exists(ref)
+
+
+def test_put_of_existing_blob_refreshes_mtime(state_dir):
+    store = BlobStore(state_dir / BLOB_DIR_NAME)
+    ref = _old_blob(store, "again")
+    store.put("again")
+
+    assert cleanup_old_sessions(24) == 0
+    assert store.exists(ref)
@@ -0,0 +1,139 @@
+"""
+sage_loop.snapshot - seqlock mmap 스냅샷 게시 / 읽기 / 상태 파일 폴백
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+
+from sage_loop import codec, snapshot
+from sage_loop.cli.orchestrator import (
+    ChainState,
+    load_config,
+    new_chain_state,
+    read_state_fields,
+    write_state_file,
+)
+
+FIELDS = ("status", "current_phase", "exit_reason")
+
+
+def _state(phase: int = 0, filler: int = 0) -> ChainState:
+    state = new_chain_state("snap", "기능 구현", "QUICK", load_config(), now=1000.0)
+    state.current_phase = phase
+    state.exit_reason = f"phase-{phase}"  # 같은 기록에서 나온 값인지 확인용
+    state.role_results = {f"r{i}": {"hash": f"{i:064x}", "size": i, "z": False} for i in range(filler)}
+    return state
+
+
+@pytest.fixture
+def state_path(state_dir, monkeypatch):
+    monkeypatch.setenv("SAGE_SNAPSHOT", "state")
+    return state_dir / "sage_state_snap.json"
+
+
+def test_reads_published_fields(state_path):
+    write_state_file(state_path, _state(3))
+
+    assert snapshot.snapshot_for(state_path).exists()
+    assert snapshot.read_fields(state_path, FIELDS) == {
+        "status": "running", "current_phase": 3, "exit_reason": "phase-3"}
+    assert read_state_fields(state_path, ("role_results",)) == {"role_results": {}}
+
+
+def test_off_by_default(state_dir, monkeypatch):
+    monkeypatch.delenv("SAGE_SNAPSHOT", raising=False)
+    path = state_dir / "sage_state_snap.json"
+    write_state_file(path, _state(1))
+
+    assert snapshot.read_fields(path, FIELDS) is None
+    assert not list(state_dir.glob("sage_snap_*"))
+    assert read_state_fields(path, FIELDS)["current_phase"] == 1
+
+
+def test_stale_snapshot_falls_back_to_state_file(state_path, monkeypatch):
+    write_state_file(state_path, _state(1))
+    monkeypatch.setenv("SAGE_SNAPSHOT", "off")
+    write_state_file(state_path, _state(2))  # 스냅샷을 모르는 기록자
+    monkeypatch.setenv("SAGE_SNAPSHOT", "state")
+
+    assert snapshot.read_fields(state_path, FIELDS) is None
+    assert read_state_fields(state_path, FIELDS)["current_phase"] == 2
+
+
+def test_interrupted_write_is_not_read_and_is_repaired(state_path):
+    write_state_file(state_path, _state(1))
+    shared = snapshot.snapshot_for(state_path)
+    with open(shared, "r+b") as f:  # 기록 중 죽은 기록자: seq 홀수로 남음
+        f.seek(8)
+        seq = snapshot.SEQ.unpack(f.read(8))[0]
+        f.seek(8)
+        f.write(snapshot.SEQ.pack(seq + 1))
+
+    assert snapshot.read_fields(state_path, FIELDS) is None
+    write_state_file(state_path, _state(2))
+    assert snapshot.read_fields(state_path, FIELDS)["current_phase"] == 2
+
+
+def test_corrupt_payload_is_rejected(state_path):
+    write_state_file(state_path, _state(1))
+    shared = snapshot.snapshot_for(state_path)
+    with open(shared, "r+b") as f:
+        f.seek(snapshot.HEADER_SIZE + 20)
+        byte = f.read(1)
+        f.seek(snapshot.HEADER_SIZE + 20)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    assert snapshot.read_fields(state_path, FIELDS) is None
+
+
+def test_region_grows_and_reader_remaps(state_path):
+    write_state_file(state_path, _state(1))
+    assert snapshot.read_fields(state_path, FIELDS)["current_phase"] == 1
+    size = snapshot.snapshot_for(state_path).stat().st_size
+
+    write_state_file(state_path, _state(2, filler=500))
+    assert snapshot.snapshot_for(state_path).stat().st_size > size
+    found = snapshot.read_fields(state_path, ("current_phase", "role_results"))
+    assert found["current_phase"] == 2
+    assert len(found["role_results"]) == 500
+
+
+def test_removed_with_state(state_path):
+    write_state_file(state_path, _state(1))
+    snapshot.remove(state_path)
+    assert not snapshot.snapshot_for(state_path).exists()
+    assert snapshot.read_fields(state_path, FIELDS) is None
+
+
+def _writer(path: Path, seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    phase = 0
+    while time.monotonic() < deadline:
+        phase += 1
+        write_state_file(path, _state(phase, filler=phase % 50))
+
+
+def test_concurrent_reads_are_consistent(state_path):
+    write_state_file(state_path, _state(0))
+    ctx = multiprocessing.get_context("fork")
+    writer = ctx.Process(target=_writer, args=(state_path, 1.0))
+    writer.start()
+    reads = inconsistent = 0
+    while writer.is_alive():
+        found = snapshot.read_fields(state_path, FIELDS)
+        if found is None:
+            continue
+        reads += 1
+        if found["exit_reason"] != f"phase-{found['current_phase']}":
+            inconsistent += 1
+    writer.join()
+
+    assert writer.exitcode == 0
+    assert reads > 0
+    assert inconsistent == 0
+    assert codec.read_fields(state_path, FIELDS)["exit_reason"].startswith("phase-")
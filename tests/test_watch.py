@@ -0,0 +1,153 @@
+"""
+sage_loop.watch - 상태 파일 변경 대기 (inotify / FIFO / poll)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from sage_loop import watch
+from sage_loop.api import FileStateStore, Orchestrator
+from sage_loop.cli.orchestrator import load_config, state_delta
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _write_later(path: Path, text: str, delay: float = 0.05, notify: bool = True) -> threading.Thread:
+    def run():
+        time.sleep(delay)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+        if notify:
+            watch.notify(path)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+@pytest.fixture(params=["inotify", "fifo", "poll"])
+def watcher(request, state_dir):
+    path = state_dir / "sage_state_w.json"
+    path.write_text("{}")
+    with watch.Watcher(path, request.param) as w:
+        if w.mode != request.param:
+            pytest.skip(f"{request.param} unavailable")
+        yield w
+
+
+def test_wakes_on_write(watcher):
+    version = watch.state_version(watcher.path)
+    writer = _write_later(watcher.path, '{"status": "approved"}')
+    started = time.monotonic()
+    assert watcher.wait(version, timeout=5)
+    writer.join()
+    assert time.monotonic() - started < 1
+    assert watch.state_version(watcher.path) != version
+
+
+def test_times_out_without_change(watcher):
+    assert not watcher.wait(watch.state_version(watcher.path), timeout=0.1)
+
+
+def test_returns_immediately_if_already_changed(watcher):
+    assert watcher.wait(("stale", 0, 0), timeout=0)
+
+
+def test_fifo_notify_counts_waiters_and_cleans_up(state_dir):
+    path = state_dir / "sage_state_f.json"
+    assert watch.notify(path) == 0
+    assert not watch.watch_dir(path).exists()
+
+    with watch.Watcher(path, "fifo") as first, watch.Watcher(path, "fifo"):
+        if first.mode != "fifo":
+            pytest.skip("fifo unavailable")
+        assert watch.notify(path) == 2
+    assert not watch.watch_dir(path).exists()
+
+
+def test_dead_fifo_waiter_is_removed(state_dir):
+    path = state_dir / "sage_state_d.json"
+    directory = watch.watch_dir(path)
+    directory.mkdir()
+    dead = directory / "999999.dead.fifo"
+    os.mkfifo(dead)
+
+    assert watch.notify(path) == 0
+    assert not dead.exists()
+
+
+def test_state_delta():
+    old = {"status": "running", "current_phase": 1, "role_results": {"a": 1, "b": 2}}
+    new = {"status": "approved", "current_phase": 1, "role_results": {"a": 1, "b": 3, "c": 4}}
+
+    assert state_delta(old, new) == ['status: "running" → "approved"', "role_results: +c ~b"]
+    assert state_delta(old, old) == []
+    assert state_delta(old, None) == ["state: running → none"]
+
+
+def test_orchestrator_wait_for_change(state_dir):
+    orch = Orchestrator(load_config(), store=FileStateStore(state_dir))
+    state = orch.start("기능 구현", chain="QUICK")
+    version = orch.version(state.session_id)
+    role = state.pending_roles[0]
+    threading.Timer(0.05, orch.complete, (state.session_id, role)).start()
+
+    changed = orch.wait_for_change(state.session_id, version, timeout=5)
+    assert changed is not None
+    assert role in changed.role_results
+    assert orch.wait_for_change(state.session_id, timeout=0.1) is None
+
+
+def test_orchestrator_wait_for_change_async(state_dir):
+    orch = Orchestrator(load_config(), store=FileStateStore(state_dir))
+    state = orch.start("기능 구현", chain="QUICK")
+    role = state.pending_roles[0]
+
+    async def run():
+        version = orch.version(state.session_id)
+        waiter = asyncio.create_task(orch.wait_for_change_async(state.session_id, version, timeout=5))
+        await asyncio.sleep(0.05)
+        await orch.complete_async(state.session_id, role)
+        return await waiter
+
+    changed = asyncio.run(run())
+    assert changed is not None and role in changed.role_results
+
+
+def test_cli_wait_for_change_timeout(state_dir):
+    env = {**os.environ, "SAGE_SESSION_ID": "cli-w", "PYTHONPATH": str(ROOT / "src")}
+    cli = [sys.executable, "-m", "sage_loop.cli.orchestrator"]
+    subprocess.run([*cli, "기능 구현", "--chain", "QUICK"], env=env, check=True, capture_output=True)
+
+    waited = subprocess.run([*cli, "--wait-for-change", "--timeout", "0.2"], env=env,
+                            capture_output=True, text=True)
+    assert waited.returncode == 2
+    assert waited.stdout.startswith("TIMEOUT:")
+
+
+def test_cli_wait_for_change_prints_changed_fields(state_dir):
+    env = {**os.environ, "SAGE_SESSION_ID": "cli-c", "PYTHONPATH": str(ROOT / "src")}
+    cli = [sys.executable, "-m", "sage_loop.cli.orchestrator"]
+    started = subprocess.run([*cli, "기능 구현", "--chain", "QUICK"], env=env, check=True,
+                             capture_output=True, text=True).stdout
+    role = next(line.split(": ", 1)[1] for line in started.splitlines() if line.startswith("NEXT: "))
+
+    waiter = subprocess.Popen([*cli, "--wait-for-change", "--timeout", "10"], env=env,
+                              stdout=subprocess.PIPE, text=True)
+    time.sleep(0.5)  # 대기자가 watch를 걸도록
+    subprocess.run([*cli, "--complete", role], env=env, check=True, capture_output=True)
+    out, _ = waiter.communicate(timeout=15)
+
+    assert waiter.returncode == 0
+    assert out.startswith("VERSION:")
+    assert f"CHANGED: role_results: +{role}" in out